@@ -0,0 +1,1370 @@
+package main
+
+import (
+	"fmt"
+	"strconv"
+	"strings"
+	"unicode/utf8"
+
+	"google.golang.org/protobuf/reflect/protoreflect"
+)
+
+// This file compiles the subset of CEL used by buf.validate rules into Python
+// expressions. Rules are parsed and type-checked against the message
+// descriptors at codegen time, so the generated validators are plain Python
+// with no CEL interpreter at runtime.
+//
+// Supported: literals, list literals, this, field selection, indexing with a
+// literal list index or a map key, ! && || ?:, comparisons, in, + - * on
+// numbers (and + on strings, bytes and lists), has(), size(), startsWith(),
+// endsWith(), contains(), matches(), int(), uint(), double(), string(), and
+// the all/exists/exists_one/filter/map macros. Anything else (timestamps,
+// durations, division, map literals, protovalidate extension functions) is
+// reported as an error and the rule stays a "not translated" comment.
+
+// celRule is a buf.validate CEL rule compiled to a Python expression.
+type celRule struct {
+	Expr     string   // Python expression over the rule's subject
+	Split    []string // Expr broken at its top-level operator, for long lines
+	Failed   string   // Python condition that is true when a bool rule fails
+	IsString bool     // the expression yields an error message ("" = valid) instead of a bool
+	Message  string   // Python string literal used as the ValueError message
+	Guarded  bool     // the expression indexes a list or map and may raise LookupError
+	UsesRe   bool     // the expression calls _re.search
+}
+
+// Python operator precedence levels used when printing compiled expressions.
+const (
+	pyCond = iota
+	pyOr
+	pyAnd
+	pyNot
+	pyCmp
+	pyAdd
+	pyMul
+	pyUnary
+	pyAtom
+)
+
+type celKind int
+
+const (
+	celBool celKind = iota
+	celInt
+	celUint
+	celDouble
+	celString
+	celBytes
+	celList
+	celMap
+	celMessage
+	celEnum
+	celOpaque // well-known types and values without CEL operators in this subset
+)
+
+type celType struct {
+	kind celKind
+	elem *celType // list element or map value
+	key  *celType // map key
+	msg  protoreflect.MessageDescriptor
+	enum protoreflect.EnumDescriptor
+}
+
+var celTypeNames = map[celKind]string{
+	celBool: "bool", celInt: "int", celUint: "uint", celDouble: "double",
+	celString: "string", celBytes: "bytes", celList: "list", celMap: "map",
+	celMessage: "message", celEnum: "enum", celOpaque: "well-known type",
+}
+
+func (t *celType) String() string { return celTypeNames[t.kind] }
+
+// ---------------------------------------------------------------------------
+// Lexer
+// ---------------------------------------------------------------------------
+
+type celTokenKind int
+
+const (
+	celTokEOF celTokenKind = iota
+	celTokIdent
+	celTokInt
+	celTokUint
+	celTokDouble
+	celTokString
+	celTokBytes
+	celTokOp
+)
+
+type celToken struct {
+	kind celTokenKind
+	text string // identifier, operator or literal source; decoded value for strings and bytes
+}
+
+var celOperators = []string{
+	"==", "!=", "<=", ">=", "&&", "||",
+	"<", ">", "!", "+", "-", "*", "/", "%", "?", ":", ".", ",", "(", ")", "[", "]", "{", "}",
+}
+
+func celLex(src string) ([]celToken, error) {
+	var toks []celToken
+	i := 0
+	for i < len(src) {
+		c := src[i]
+		switch {
+		case c == ' ' || c == '\t' || c == '\n' || c == '\r':
+			i++
+		case c == '/' && strings.HasPrefix(src[i:], "//"):
+			for i < len(src) && src[i] != '\n' {
+				i++
+			}
+		case isCelDigit(c) || (c == '.' && i+1 < len(src) && isCelDigit(src[i+1])):
+			tok, n, err := celLexNumber(src[i:])
+			if err != nil {
+				return nil, err
+			}
+			toks = append(toks, tok)
+			i += n
+		case isCelIdentStart(c):
+			j := i
+			for j < len(src) && (isCelIdentStart(src[j]) || isCelDigit(src[j])) {
+				j++
+			}
+			word := src[i:j]
+			if j < len(src) && (src[j] == '"' || src[j] == '\'') && isCelStringPrefix(word) {
+				tok, n, err := celLexString(src[j:], strings.ContainsAny(word, "rR"), strings.ContainsAny(word, "bB"))
+				if err != nil {
+					return nil, err
+				}
+				toks = append(toks, tok)
+				i = j + n
+				continue
+			}
+			toks = append(toks, celToken{celTokIdent, word})
+			i = j
+		case c == '"' || c == '\'':
+			tok, n, err := celLexString(src[i:], false, false)
+			if err != nil {
+				return nil, err
+			}
+			toks = append(toks, tok)
+			i += n
+		default:
+			matched := false
+			for _, op := range celOperators {
+				if strings.HasPrefix(src[i:], op) {
+					toks = append(toks, celToken{celTokOp, op})
+					i += len(op)
+					matched = true
+					break
+				}
+			}
+			if !matched {
+				return nil, fmt.Errorf("unexpected character %q", c)
+			}
+		}
+	}
+	return append(toks, celToken{kind: celTokEOF}), nil
+}
+
+func isCelDigit(c byte) bool { return c >= '0' && c <= '9' }
+
+func isCelIdentStart(c byte) bool {
+	return c == '_' || (c >= 'a' && c <= 'z') || (c >= 'A' && c <= 'Z')
+}
+
+func isCelStringPrefix(word string) bool {
+	switch strings.ToLower(word) {
+	case "r", "b", "rb", "br":
+		return true
+	}
+	return false
+}
+
+func celLexNumber(src string) (celToken, int, error) {
+	if strings.HasPrefix(src, "0x") || strings.HasPrefix(src, "0X") {
+		j := 2
+		for j < len(src) && strings.IndexByte("0123456789abcdefABCDEF", src[j]) >= 0 {
+			j++
+		}
+		v, err := strconv.ParseUint(src[2:j], 16, 64)
+		if err != nil {
+			return celToken{}, 0, fmt.Errorf("invalid hex literal %q", src[:j])
+		}
+		if j < len(src) && (src[j] == 'u' || src[j] == 'U') {
+			return celToken{celTokUint, strconv.FormatUint(v, 10)}, j + 1, nil
+		}
+		return celToken{celTokInt, strconv.FormatUint(v, 10)}, j, nil
+	}
+	j := 0
+	for j < len(src) && isCelDigit(src[j]) {
+		j++
+	}
+	isFloat := false
+	if j+1 < len(src) && src[j] == '.' && isCelDigit(src[j+1]) {
+		isFloat = true
+		j++
+		for j < len(src) && isCelDigit(src[j]) {
+			j++
+		}
+	}
+	if j < len(src) && (src[j] == 'e' || src[j] == 'E') {
+		k := j + 1
+		if k < len(src) && (src[k] == '+' || src[k] == '-') {
+			k++
+		}
+		if k < len(src) && isCelDigit(src[k]) {
+			isFloat = true
+			for k < len(src) && isCelDigit(src[k]) {
+				k++
+			}
+			j = k
+		}
+	}
+	text := src[:j]
+	if isFloat {
+		f, err := strconv.ParseFloat(text, 64)
+		if err != nil {
+			return celToken{}, 0, fmt.Errorf("invalid double literal %q", text)
+		}
+		return celToken{celTokDouble, formatPythonFloat(f)}, j, nil
+	}
+	v, err := strconv.ParseUint(text, 10, 64)
+	if err != nil {
+		return celToken{}, 0, fmt.Errorf("invalid int literal %q", text)
+	}
+	if j < len(src) && (src[j] == 'u' || src[j] == 'U') {
+		return celToken{celTokUint, strconv.FormatUint(v, 10)}, j + 1, nil
+	}
+	return celToken{celTokInt, strconv.FormatUint(v, 10)}, j, nil
+}
+
+// celLexString reads a quoted string starting at src[0] and returns its
+// decoded value.
+func celLexString(src string, raw, isBytes bool) (celToken, int, error) {
+	quote := src[:1]
+	if strings.HasPrefix(src, strings.Repeat(quote, 3)) {
+		quote = src[:3]
+	}
+	var b strings.Builder
+	i := len(quote)
+	for {
+		if i >= len(src) {
+			return celToken{}, 0, fmt.Errorf("unterminated string literal")
+		}
+		if strings.HasPrefix(src[i:], quote) {
+			i += len(quote)
+			break
+		}
+		c := src[i]
+		if len(quote) == 1 && (c == '\n' || c == '\r') {
+			return celToken{}, 0, fmt.Errorf("newline in string literal")
+		}
+		if c != '\\' || raw {
+			b.WriteByte(c)
+			i++
+			continue
+		}
+		n, err := celUnescape(&b, src[i:], isBytes)
+		if err != nil {
+			return celToken{}, 0, err
+		}
+		i += n
+	}
+	kind := celTokString
+	if isBytes {
+		kind = celTokBytes
+	}
+	return celToken{kind, b.String()}, i, nil
+}
+
+// celUnescape decodes the escape sequence at the start of src into b and
+// returns its length.
+func celUnescape(b *strings.Builder, src string, isBytes bool) (int, error) {
+	if len(src) < 2 {
+		return 0, fmt.Errorf("unterminated escape sequence")
+	}
+	simple := map[byte]byte{
+		'a': '\a', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t', 'v': '\v',
+		'\\': '\\', '\'': '\'', '"': '"', '`': '`', '?': '?',
+	}
+	if c, ok := simple[src[1]]; ok {
+		b.WriteByte(c)
+		return 2, nil
+	}
+	var digits, base int
+	switch src[1] {
+	case 'x', 'X':
+		digits, base = 2, 16
+	case 'u':
+		digits, base = 4, 16
+	case 'U':
+		digits, base = 8, 16
+	case '0', '1', '2', '3':
+		digits, base = 3, 8
+	default:
+		return 0, fmt.Errorf("invalid escape sequence %q", src[:2])
+	}
+	start := 2
+	if base == 8 {
+		start = 1
+	}
+	if len(src) < start+digits {
+		return 0, fmt.Errorf("invalid escape sequence %q", src)
+	}
+	v, err := strconv.ParseUint(src[start:start+digits], base, 32)
+	if err != nil {
+		return 0, fmt.Errorf("invalid escape sequence %q", src[:start+digits])
+	}
+	if isBytes && (src[1] == 'x' || src[1] == 'X' || base == 8) {
+		b.WriteByte(byte(v))
+	} else {
+		if !utf8.ValidRune(rune(v)) {
+			return 0, fmt.Errorf("invalid code point in %q", src[:start+digits])
+		}
+		b.WriteRune(rune(v))
+	}
+	return start + digits, nil
+}
+
+// ---------------------------------------------------------------------------
+// Parser
+// ---------------------------------------------------------------------------
+
+// celNode is a parsed CEL expression. op is "ident", "lit", "select", "call",
+// "index", "list", "!", "neg", a binary operator, or "?:".
+type celNode struct {
+	op     string
+	name   string     // identifier, selected field or function name
+	lit    celToken   // literal value
+	target *celNode   // select operand or method receiver
+	args   []*celNode // operands, call arguments or list elements
+}
+
+type celParser struct {
+	toks []celToken
+	pos  int
+}
+
+func parseCel(src string) (*celNode, error) {
+	toks, err := celLex(src)
+	if err != nil {
+		return nil, err
+	}
+	p := &celParser{toks: toks}
+	n, err := p.expr()
+	if err != nil {
+		return nil, err
+	}
+	if p.peek().kind != celTokEOF {
+		return nil, fmt.Errorf("unexpected %q", p.peek().text)
+	}
+	return n, nil
+}
+
+func (p *celParser) peek() celToken { return p.toks[p.pos] }
+
+func (p *celParser) next() celToken {
+	t := p.toks[p.pos]
+	if t.kind != celTokEOF {
+		p.pos++
+	}
+	return t
+}
+
+func (p *celParser) accept(op string) bool {
+	if t := p.peek(); t.kind == celTokOp && t.text == op {
+		p.pos++
+		return true
+	}
+	return false
+}
+
+func (p *celParser) expect(op string) error {
+	if !p.accept(op) {
+		return fmt.Errorf("expected %q", op)
+	}
+	return nil
+}
+
+func (p *celParser) expr() (*celNode, error) {
+	cond, err := p.binary(0)
+	if err != nil {
+		return nil, err
+	}
+	if !p.accept("?") {
+		return cond, nil
+	}
+	then, err := p.binary(0)
+	if err != nil {
+		return nil, err
+	}
+	if err := p.expect(":"); err != nil {
+		return nil, err
+	}
+	otherwise, err := p.expr()
+	if err != nil {
+		return nil, err
+	}
+	return &celNode{op: "?:", args: []*celNode{cond, then, otherwise}}, nil
+}
+
+// celBinaryLevels lists CEL's binary operators from loosest to tightest.
+var celBinaryLevels = [][]string{
+	{"||"},
+	{"&&"},
+	{"==", "!=", "<", "<=", ">", ">=", "in"},
+	{"+", "-"},
+	{"*", "/", "%"},
+}
+
+func (p *celParser) binary(level int) (*celNode, error) {
+	if level == len(celBinaryLevels) {
+		return p.unary()
+	}
+	left, err := p.binary(level + 1)
+	if err != nil {
+		return nil, err
+	}
+	for {
+		t := p.peek()
+		op := ""
+		for _, candidate := range celBinaryLevels[level] {
+			if (t.kind == celTokOp || t.kind == celTokIdent) && t.text == candidate {
+				op = candidate
+			}
+		}
+		if op == "" {
+			return left, nil
+		}
+		p.next()
+		right, err := p.binary(level + 1)
+		if err != nil {
+			return nil, err
+		}
+		left = &celNode{op: op, args: []*celNode{left, right}}
+	}
+}
+
+func (p *celParser) unary() (*celNode, error) {
+	for op, name := range map[string]string{"!": "!", "-": "neg"} {
+		if p.accept(op) {
+			operand, err := p.unary()
+			if err != nil {
+				return nil, err
+			}
+			return &celNode{op: name, args: []*celNode{operand}}, nil
+		}
+	}
+	return p.member()
+}
+
+func (p *celParser) member() (*celNode, error) {
+	n, err := p.primary()
+	if err != nil {
+		return nil, err
+	}
+	for {
+		switch {
+		case p.accept("."):
+			t := p.next()
+			if t.kind != celTokIdent {
+				return nil, fmt.Errorf("expected field name after '.'")
+			}
+			if p.accept("(") {
+				args, err := p.args(")")
+				if err != nil {
+					return nil, err
+				}
+				n = &celNode{op: "call", name: t.text, target: n, args: args}
+			} else {
+				n = &celNode{op: "select", name: t.text, target: n}
+			}
+		case p.accept("["):
+			index, err := p.expr()
+			if err != nil {
+				return nil, err
+			}
+			if err := p.expect("]"); err != nil {
+				return nil, err
+			}
+			n = &celNode{op: "index", target: n, args: []*celNode{index}}
+		default:
+			return n, nil
+		}
+	}
+}
+
+func (p *celParser) primary() (*celNode, error) {
+	t := p.next()
+	switch t.kind {
+	case celTokIdent:
+		if t.text == "true" || t.text == "false" || t.text == "null" {
+			return &celNode{op: "lit", lit: t}, nil
+		}
+		if p.accept("(") {
+			args, err := p.args(")")
+			if err != nil {
+				return nil, err
+			}
+			return &celNode{op: "call", name: t.text, args: args}, nil
+		}
+		return &celNode{op: "ident", name: t.text}, nil
+	case celTokInt, celTokUint, celTokDouble, celTokString, celTokBytes:
+		return &celNode{op: "lit", lit: t}, nil
+	case celTokOp:
+		switch t.text {
+		case "(":
+			n, err := p.expr()
+			if err != nil {
+				return nil, err
+			}
+			return n, p.expect(")")
+		case "[":
+			elems, err := p.args("]")
+			if err != nil {
+				return nil, err
+			}
+			return &celNode{op: "list", args: elems}, nil
+		case "{":
+			return nil, fmt.Errorf("map literals are not supported")
+		}
+	case celTokEOF:
+		return nil, fmt.Errorf("unexpected end of expression")
+	}
+	return nil, fmt.Errorf("unexpected %q", t.text)
+}
+
+// args parses a comma-separated list up to the closing token; a trailing
+// comma is allowed.
+func (p *celParser) args(closing string) ([]*celNode, error) {
+	var args []*celNode
+	for !p.accept(closing) {
+		arg, err := p.expr()
+		if err != nil {
+			return nil, err
+		}
+		args = append(args, arg)
+		if !p.accept(",") {
+			if err := p.expect(closing); err != nil {
+				return nil, err
+			}
+			break
+		}
+	}
+	return args, nil
+}
+
+// ---------------------------------------------------------------------------
+// Compiler
+// ---------------------------------------------------------------------------
+
+// celValue is a compiled sub-expression. A read of a field with presence
+// may be None in Python where CEL sees the default value zero.
+type celValue struct {
+	code     string
+	prec     int
+	typ      *celType
+	nullable bool     // code may be None (unset field with presence)
+	zero     string   // Python literal of the field default
+	intLit   *int64   // set for int literals, to compare them with str enums
+	negated  string   // logical negation of code when simpler than "not ..."
+	negPrec  int      // Python precedence of negated
+	split    []string // code broken at its top-level operator, for long lines
+}
+
+type celVar struct {
+	name, py string
+	typ      *celType
+}
+
+type celCompiler struct {
+	e       *generator
+	subject string
+	this    *celType
+	vars    []celVar
+	guarded bool
+	usesRe  bool
+}
+
+// compileCel compiles a CEL expression whose this is bound to the Python
+// name subject with type this.
+func (e *generator) compileCel(expression, subject string, this *celType) (*celRule, error) {
+	n, err := parseCel(expression)
+	if err != nil {
+		return nil, err
+	}
+	c := &celCompiler{e: e, subject: subject, this: this}
+	v, err := c.compile(n)
+	if err != nil {
+		return nil, err
+	}
+	v = c.value(v)
+	if v.typ.kind != celBool && v.typ.kind != celString {
+		return nil, fmt.Errorf("rule yields %s, want bool or string", v.typ)
+	}
+	failed := v.negated
+	if failed == "" {
+		failed = "not " + paren(v, pyNot)
+	}
+	return &celRule{
+		Expr:     v.code,
+		Split:    v.split,
+		Failed:   failed,
+		IsString: v.typ.kind == celString,
+		Guarded:  c.guarded,
+		UsesRe:   c.usesRe,
+	}, nil
+}
+
+// celFieldType returns the CEL type of a field as it is read from a message.
+func (e *generator) celFieldType(fd protoreflect.FieldDescriptor) *celType {
+	if fd.IsMap() {
+		return &celType{kind: celMap, key: e.celScalarType(fd.MapKey()), elem: e.celScalarType(fd.MapValue())}
+	}
+	if fd.IsList() {
+		return &celType{kind: celList, elem: e.celScalarType(fd)}
+	}
+	return e.celScalarType(fd)
+}
+
+func (e *generator) celScalarType(fd protoreflect.FieldDescriptor) *celType {
+	switch fd.Kind() {
+	case protoreflect.BoolKind:
+		return &celType{kind: celBool}
+	case protoreflect.Uint32Kind, protoreflect.Fixed32Kind, protoreflect.Uint64Kind, protoreflect.Fixed64Kind:
+		return &celType{kind: celUint}
+	case protoreflect.FloatKind, protoreflect.DoubleKind:
+		return &celType{kind: celDouble}
+	case protoreflect.StringKind:
+		return &celType{kind: celString}
+	case protoreflect.BytesKind:
+		return &celType{kind: celBytes}
+	case protoreflect.EnumKind:
+		return &celType{kind: celEnum, enum: fd.Enum()}
+	case protoreflect.MessageKind, protoreflect.GroupKind:
+		if _, ok := wellKnownTypes[string(fd.Message().FullName())]; ok {
+			return &celType{kind: celOpaque}
+		}
+		return &celType{kind: celMessage, msg: fd.Message()}
+	}
+	return &celType{kind: celInt}
+}
+
+// celZero returns the Python literal a CEL read of an unset field yields.
+func (e *generator) celZero(fd protoreflect.FieldDescriptor) string {
+	switch {
+	case fd.IsMap():
+		return "{}"
+	case fd.IsList():
+		return "[]"
+	}
+	switch t := e.celScalarType(fd); t.kind {
+	case celBool:
+		return "False"
+	case celInt, celUint:
+		return "0"
+	case celDouble:
+		return "0.0"
+	case celString:
+		return `""`
+	case celBytes:
+		return `b""`
+	case celEnum:
+		return e.celEnumLiteral(t.enum, 0)
+	}
+	return "None"
+}
+
+// celEnumLiteral returns the Python value a field of enum type holds for the
+// given number: the number itself with use_integers_for_enums, else the
+// generated value name.
+func (e *generator) celEnumLiteral(enum protoreflect.EnumDescriptor, number int64) string {
+	if !e.config.UseIntegersForEnums {
+		if v := enum.Values().ByNumber(protoreflect.EnumNumber(number)); v != nil {
+			return pyQuote(e.enumValueName(v))
+		}
+	}
+	return strconv.FormatInt(number, 10)
+}
+
+func paren(v celValue, min int) string {
+	if v.prec < min {
+		return "(" + v.code + ")"
+	}
+	return v.code
+}
+
+// value turns a scalar field read into an expression that is never None.
+// "x or zero" is exact: a falsy scalar already equals its default.
+func (c *celCompiler) value(v celValue) celValue {
+	if !v.nullable || v.zero == "None" {
+		return v
+	}
+	return celValue{
+		code:  paren(v, pyOr+1) + " or " + v.zero,
+		prec:  pyOr,
+		typ:   v.typ,
+		split: []string{paren(v, pyOr+1), "or " + v.zero},
+	}
+}
+
+// negatable returns v with its logical negation set.
+func negatable(v celValue, negated string) celValue {
+	v.negated, v.negPrec = negated, v.prec
+	return v
+}
+
+// chain builds "left op right" for a left-associative operator of the given
+// precedence, extending left's split when it is the same operator.
+func chain(left, right celValue, op string, prec int) celValue {
+	split := []string{paren(left, prec)}
+	if left.prec == prec && len(left.split) > 0 {
+		split = append([]string(nil), left.split...)
+	}
+	operand := paren(right, prec+1)
+	return celValue{
+		code:  paren(left, prec) + " " + op + " " + operand,
+		prec:  prec,
+		split: append(split, op+" "+operand),
+	}
+}
+
+func (c *celCompiler) compile(n *celNode) (celValue, error) {
+	switch n.op {
+	case "lit":
+		return c.literal(n.lit)
+	case "ident":
+		return c.ident(n.name)
+	case "select":
+		return c.selectField(n)
+	case "index":
+		return c.index(n)
+	case "list":
+		return c.list(n.args)
+	case "call":
+		return c.call(n)
+	case "!":
+		x, err := c.operand(n.args[0], celBool)
+		if err != nil {
+			return celValue{}, err
+		}
+		if x.negated != "" {
+			return celValue{code: x.negated, prec: x.negPrec, typ: x.typ, negated: x.code, negPrec: x.prec}, nil
+		}
+		return celValue{code: "not " + paren(x, pyNot), prec: pyNot, typ: x.typ, negated: x.code, negPrec: x.prec}, nil
+	case "neg":
+		x, err := c.compileValue(n.args[0])
+		if err != nil {
+			return celValue{}, err
+		}
+		if !c.isNumeric(x.typ) || x.typ.kind == celUint {
+			return celValue{}, fmt.Errorf("cannot negate %s", x.typ)
+		}
+		v := celValue{code: "-" + paren(x, pyUnary), prec: pyUnary, typ: x.typ}
+		if x.intLit != nil {
+			neg := -*x.intLit
+			v.intLit = &neg
+		}
+		return v, nil
+	case "&&", "||":
+		return c.logical(n)
+	case "==", "!=", "<", "<=", ">", ">=":
+		return c.compare(n)
+	case "in":
+		return c.in(n)
+	case "+", "-", "*":
+		return c.arithmetic(n)
+	case "?:":
+		return c.conditional(n)
+	}
+	return celValue{}, fmt.Errorf("operator %q is not supported", n.op)
+}
+
+func (c *celCompiler) compileValue(n *celNode) (celValue, error) {
+	v, err := c.compile(n)
+	if err != nil {
+		return celValue{}, err
+	}
+	return c.value(v), nil
+}
+
+func (c *celCompiler) operand(n *celNode, kind celKind) (celValue, error) {
+	v, err := c.compileValue(n)
+	if err != nil {
+		return celValue{}, err
+	}
+	if v.typ.kind != kind {
+		return celValue{}, fmt.Errorf("expected %s, got %s", celTypeNames[kind], v.typ)
+	}
+	return v, nil
+}
+
+func (c *celCompiler) literal(t celToken) (celValue, error) {
+	switch t.kind {
+	case celTokInt:
+		n, err := strconv.ParseInt(t.text, 10, 64)
+		if err != nil {
+			return celValue{}, fmt.Errorf("int literal %s out of range", t.text)
+		}
+		return celValue{code: t.text, prec: pyAtom, typ: &celType{kind: celInt}, intLit: &n}, nil
+	case celTokUint:
+		return celValue{code: t.text, prec: pyAtom, typ: &celType{kind: celUint}}, nil
+	case celTokDouble:
+		return celValue{code: t.text, prec: pyAtom, typ: &celType{kind: celDouble}}, nil
+	case celTokString:
+		return celValue{code: pyQuote(t.text), prec: pyAtom, typ: &celType{kind: celString}}, nil
+	case celTokBytes:
+		return celValue{code: pyBytesLiteral(t.text), prec: pyAtom, typ: &celType{kind: celBytes}}, nil
+	}
+	switch t.text {
+	case "true":
+		return celValue{code: "True", prec: pyAtom, typ: &celType{kind: celBool}}, nil
+	case "false":
+		return celValue{code: "False", prec: pyAtom, typ: &celType{kind: celBool}}, nil
+	}
+	return celValue{}, fmt.Errorf("null is not supported")
+}
+
+// pyBytesLiteral renders s as a Python bytes literal.
+func pyBytesLiteral(s string) string {
+	var b strings.Builder
+	b.WriteString(`b"`)
+	for i := 0; i < len(s); i++ {
+		switch c := s[i]; {
+		case c == '"' || c == '\\':
+			b.WriteByte('\\')
+			b.WriteByte(c)
+		case c >= 0x20 && c < 0x7f:
+			b.WriteByte(c)
+		default:
+			fmt.Fprintf(&b, `\x%02x`, c)
+		}
+	}
+	b.WriteByte('"')
+	return b.String()
+}
+
+func (c *celCompiler) ident(name string) (celValue, error) {
+	for i := len(c.vars) - 1; i >= 0; i-- {
+		if c.vars[i].name == name {
+			return celValue{code: c.vars[i].py, prec: pyAtom, typ: c.vars[i].typ}, nil
+		}
+	}
+	if name == "this" {
+		return celValue{code: c.subject, prec: pyAtom, typ: c.this}, nil
+	}
+	return celValue{}, fmt.Errorf("unknown identifier %q", name)
+}
+
+// field resolves a field selection on a message-typed operand.
+func (c *celCompiler) field(n *celNode) (celValue, protoreflect.FieldDescriptor, error) {
+	x, err := c.compile(n.target)
+	if err != nil {
+		return celValue{}, nil, err
+	}
+	if x.typ.kind != celMessage {
+		return celValue{}, nil, fmt.Errorf("cannot select %q from %s", n.name, x.typ)
+	}
+	fd := x.typ.msg.Fields().ByName(protoreflect.Name(n.name))
+	if fd == nil {
+		return celValue{}, nil, fmt.Errorf("%s has no field %q", x.typ.msg.FullName(), n.name)
+	}
+	name, _ := c.e.fieldName(fd)
+	v := celValue{
+		code:     paren(x, pyAtom) + "." + name,
+		prec:     pyAtom,
+		typ:      c.e.celFieldType(fd),
+		nullable: c.e.resolveDefault(fd) == "default=None",
+		zero:     c.e.celZero(fd),
+	}
+	if x.nullable {
+		// Reading through an unset message yields the field's unset value.
+		unset := v.zero
+		if v.nullable {
+			unset = "None"
+		}
+		v.code = "getattr(" + x.code + ", " + strconv.Quote(name) + ", " + unset + ")"
+	}
+	return v, fd, nil
+}
+
+func (c *celCompiler) selectField(n *celNode) (celValue, error) {
+	v, _, err := c.field(n)
+	return v, err
+}
+
+// has compiles has(x.f): presence for fields that track it, otherwise a
+// comparison with the default value.
+func (c *celCompiler) has(arg *celNode) (celValue, error) {
+	if arg.op != "select" {
+		return celValue{}, fmt.Errorf("has() needs a field selection")
+	}
+	v, fd, err := c.field(arg)
+	if err != nil {
+		return celValue{}, err
+	}
+	var test, negated string
+	switch {
+	case fd.IsList() || fd.IsMap():
+		test, negated = "len("+v.code+") > 0", "len("+v.code+") == 0"
+	case v.nullable && fd.HasPresence():
+		test, negated = v.code+" is not None", v.code+" is None"
+	case v.nullable:
+		test, negated = v.code+" not in (None, "+v.zero+")", v.code+" in (None, "+v.zero+")"
+	default:
+		test, negated = v.code+" != "+v.zero, v.code+" == "+v.zero
+	}
+	return negatable(celValue{code: test, prec: pyCmp, typ: &celType{kind: celBool}}, negated), nil
+}
+
+func (c *celCompiler) index(n *celNode) (celValue, error) {
+	x, err := c.compileValue(n.target)
+	if err != nil {
+		return celValue{}, err
+	}
+	key, err := c.compileValue(n.args[0])
+	if err != nil {
+		return celValue{}, err
+	}
+	switch x.typ.kind {
+	case celList:
+		// Python wraps negative indexes around; CEL rejects them.
+		if key.intLit == nil || *key.intLit < 0 {
+			return celValue{}, fmt.Errorf("list index must be a non-negative int literal")
+		}
+	case celMap:
+		if !c.comparable(x.typ.key, key.typ) {
+			return celValue{}, fmt.Errorf("cannot index %s keys with %s", x.typ.key, key.typ)
+		}
+	default:
+		return celValue{}, fmt.Errorf("cannot index %s", x.typ)
+	}
+	c.guarded = true
+	return celValue{code: paren(x, pyAtom) + "[" + key.code + "]", prec: pyAtom, typ: x.typ.elem}, nil
+}
+
+func (c *celCompiler) list(elems []*celNode) (celValue, error) {
+	codes := make([]string, len(elems))
+	var elem *celType
+	for i, n := range elems {
+		v, err := c.compileValue(n)
+		if err != nil {
+			return celValue{}, err
+		}
+		if elem != nil && !c.comparable(elem, v.typ) {
+			return celValue{}, fmt.Errorf("mixed %s and %s list elements", elem, v.typ)
+		}
+		elem = v.typ
+		codes[i] = v.code
+	}
+	if elem == nil {
+		elem = &celType{kind: celOpaque}
+	}
+	return celValue{code: "[" + strings.Join(codes, ", ") + "]", prec: pyAtom, typ: &celType{kind: celList, elem: elem}}, nil
+}
+
+func (c *celCompiler) isNumeric(t *celType) bool {
+	switch t.kind {
+	case celInt, celUint, celDouble:
+		return true
+	case celEnum:
+		return c.e.config.UseIntegersForEnums
+	}
+	return false
+}
+
+// comparable reports whether values of the two types can be compared for
+// equality or ordering.
+func (c *celCompiler) comparable(a, b *celType) bool {
+	if c.isNumeric(a) && c.isNumeric(b) {
+		return true
+	}
+	if a.kind != b.kind {
+		return false
+	}
+	switch a.kind {
+	case celMessage:
+		return a.msg.FullName() == b.msg.FullName()
+	case celEnum:
+		return a.enum.FullName() == b.enum.FullName()
+	case celOpaque:
+		return false
+	}
+	return true
+}
+
+// enumOperand rewrites an int literal compared with a string-valued enum into
+// the enum's value name.
+func (c *celCompiler) enumOperand(enum *celType, v celValue) (celValue, bool) {
+	if enum.kind != celEnum || c.e.config.UseIntegersForEnums || v.intLit == nil {
+		return v, false
+	}
+	return celValue{code: c.e.celEnumLiteral(enum.enum, *v.intLit), prec: pyAtom, typ: enum}, true
+}
+
+func (c *celCompiler) compare(n *celNode) (celValue, error) {
+	left, err := c.compileValue(n.args[0])
+	if err != nil {
+		return celValue{}, err
+	}
+	right, err := c.compileValue(n.args[1])
+	if err != nil {
+		return celValue{}, err
+	}
+	if v, ok := c.enumOperand(left.typ, right); ok {
+		right = v
+	} else if v, ok := c.enumOperand(right.typ, left); ok {
+		left = v
+	}
+	if !c.comparable(left.typ, right.typ) {
+		return celValue{}, fmt.Errorf("cannot compare %s and %s", left.typ, right.typ)
+	}
+	if n.op != "==" && n.op != "!=" {
+		switch left.typ.kind {
+		case celList, celMap, celMessage, celEnum:
+			if !c.isNumeric(left.typ) {
+				return celValue{}, fmt.Errorf("cannot order %s values", left.typ)
+			}
+		}
+	}
+	// Python chains comparisons, so comparison operands are parenthesized.
+	l, r := paren(left, pyCmp+1), paren(right, pyCmp+1)
+	v := celValue{code: l + " " + n.op + " " + r, prec: pyCmp, typ: &celType{kind: celBool}, split: []string{l, n.op + " " + r}}
+	// Only == and != are exact complements: ordering comparisons with NaN
+	// are all false.
+	switch n.op {
+	case "==":
+		return negatable(v, l+" != "+r), nil
+	case "!=":
+		return negatable(v, l+" == "+r), nil
+	}
+	return v, nil
+}
+
+func (c *celCompiler) in(n *celNode) (celValue, error) {
+	left, err := c.compileValue(n.args[0])
+	if err != nil {
+		return celValue{}, err
+	}
+	var right celValue
+	if n.args[1].op == "list" && left.typ.kind == celEnum {
+		// Rewrite int literals in the list like a comparison would.
+		codes := make([]string, len(n.args[1].args))
+		for i, elem := range n.args[1].args {
+			v, err := c.compileValue(elem)
+			if err != nil {
+				return celValue{}, err
+			}
+			v, _ = c.enumOperand(left.typ, v)
+			if !c.comparable(left.typ, v.typ) {
+				return celValue{}, fmt.Errorf("cannot compare %s and %s", left.typ, v.typ)
+			}
+			codes[i] = v.code
+		}
+		right = celValue{code: "[" + strings.Join(codes, ", ") + "]", prec: pyAtom, typ: &celType{kind: celList, elem: left.typ}}
+	} else {
+		right, err = c.compileValue(n.args[1])
+		if err != nil {
+			return celValue{}, err
+		}
+	}
+	var member *celType
+	switch right.typ.kind {
+	case celList:
+		member = right.typ.elem
+	case celMap:
+		member = right.typ.key
+	default:
+		return celValue{}, fmt.Errorf("cannot test membership in %s", right.typ)
+	}
+	if member.kind != celOpaque && !c.comparable(left.typ, member) {
+		return celValue{}, fmt.Errorf("cannot look up %s in %s", left.typ, right.typ)
+	}
+	l, r := paren(left, pyCmp+1), paren(right, pyCmp+1)
+	v := celValue{code: l + " in " + r, prec: pyCmp, typ: &celType{kind: celBool}, split: []string{l, "in " + r}}
+	return negatable(v, l+" not in "+r), nil
+}
+
+func (c *celCompiler) logical(n *celNode) (celValue, error) {
+	prec, word := pyAnd, "and"
+	if n.op == "||" {
+		prec, word = pyOr, "or"
+	}
+	left, err := c.operand(n.args[0], celBool)
+	if err != nil {
+		return celValue{}, err
+	}
+	right, err := c.operand(n.args[1], celBool)
+	if err != nil {
+		return celValue{}, err
+	}
+	v := chain(left, right, word, prec)
+	v.typ = left.typ
+	return v, nil
+}
+
+func (c *celCompiler) arithmetic(n *celNode) (celValue, error) {
+	left, err := c.compileValue(n.args[0])
+	if err != nil {
+		return celValue{}, err
+	}
+	right, err := c.compileValue(n.args[1])
+	if err != nil {
+		return celValue{}, err
+	}
+	prec := pyAdd
+	if n.op == "*" {
+		prec = pyMul
+	}
+	typ := left.typ
+	switch {
+	case c.isNumeric(left.typ) && c.isNumeric(right.typ) && left.typ.kind != celEnum && right.typ.kind != celEnum:
+		if left.typ.kind != right.typ.kind {
+			return celValue{}, fmt.Errorf("cannot mix %s and %s in arithmetic", left.typ, right.typ)
+		}
+	case n.op == "+" && left.typ.kind == right.typ.kind &&
+		(typ.kind == celString || typ.kind == celBytes || typ.kind == celList):
+	default:
+		return celValue{}, fmt.Errorf("cannot apply %q to %s and %s", n.op, left.typ, right.typ)
+	}
+	v := chain(left, right, n.op, prec)
+	v.typ = typ
+	return v, nil
+}
+
+func (c *celCompiler) conditional(n *celNode) (celValue, error) {
+	cond, err := c.operand(n.args[0], celBool)
+	if err != nil {
+		return celValue{}, err
+	}
+	then, err := c.compileValue(n.args[1])
+	if err != nil {
+		return celValue{}, err
+	}
+	otherwise, err := c.compileValue(n.args[2])
+	if err != nil {
+		return celValue{}, err
+	}
+	if v, ok := c.enumOperand(then.typ, otherwise); ok {
+		otherwise = v
+	} else if v, ok := c.enumOperand(otherwise.typ, then); ok {
+		then = v
+	}
+	if !c.comparable(then.typ, otherwise.typ) && then.typ.kind != otherwise.typ.kind {
+		return celValue{}, fmt.Errorf("conditional branches are %s and %s", then.typ, otherwise.typ)
+	}
+	split := []string{paren(then, pyCond+1), "if " + paren(cond, pyCond+1), "else " + paren(otherwise, pyCond)}
+	return celValue{code: strings.Join(split, " "), prec: pyCond, typ: then.typ, split: split}, nil
+}
+
+// celMacros maps a comprehension macro to the number of arguments it takes
+// after the iteration variable.
+var celMacros = map[string][]int{
+	"all": {1}, "exists": {1}, "exists_one": {1}, "filter": {1}, "map": {1, 2},
+}
+
+func (c *celCompiler) call(n *celNode) (celValue, error) {
+	if counts, ok := celMacros[n.name]; ok && n.target != nil {
+		for _, count := range counts {
+			if len(n.args) == count+1 {
+				return c.macro(n)
+			}
+		}
+		return celValue{}, fmt.Errorf("%s() takes a variable and %v arguments", n.name, counts)
+	}
+	args := n.args
+	if n.target != nil {
+		args = append([]*celNode{n.target}, args...)
+	}
+	if n.name == "has" && n.target == nil && len(args) == 1 {
+		return c.has(args[0])
+	}
+	values := make([]celValue, len(args))
+	for i, arg := range args {
+		v, err := c.compileValue(arg)
+		if err != nil {
+			return celValue{}, err
+		}
+		values[i] = v
+	}
+	boolean := &celType{kind: celBool}
+	switch {
+	case n.name == "size" && len(values) == 1:
+		switch values[0].typ.kind {
+		case celString, celBytes, celList, celMap:
+			return celValue{code: "len(" + values[0].code + ")", prec: pyAtom, typ: &celType{kind: celInt}}, nil
+		}
+	case len(values) == 2 && values[0].typ.kind == celString && values[1].typ.kind == celString:
+		s, arg := values[0], values[1]
+		switch n.name {
+		case "startsWith":
+			return celValue{code: paren(s, pyAtom) + ".startswith(" + arg.code + ")", prec: pyAtom, typ: boolean}, nil
+		case "endsWith":
+			return celValue{code: paren(s, pyAtom) + ".endswith(" + arg.code + ")", prec: pyAtom, typ: boolean}, nil
+		case "contains":
+			return celValue{code: paren(arg, pyCmp+1) + " in " + paren(s, pyCmp+1), prec: pyCmp, typ: boolean}, nil
+		case "matches":
+			// CEL matches() is an unanchored RE2 search.
+			c.usesRe = true
+			return celValue{code: "_re.search(" + arg.code + ", " + s.code + ") is not None", prec: pyCmp, typ: boolean}, nil
+		}
+	case len(values) == 1 && n.target == nil:
+		x := values[0]
+		switch {
+		case (n.name == "int" || n.name == "uint") && c.isNumeric(x.typ):
+			kind := celInt
+			if n.name == "uint" {
+				kind = celUint
+			}
+			return celValue{code: "int(" + x.code + ")", prec: pyAtom, typ: &celType{kind: kind}}, nil
+		case n.name == "double" && c.isNumeric(x.typ):
+			return celValue{code: "float(" + x.code + ")", prec: pyAtom, typ: &celType{kind: celDouble}}, nil
+		case n.name == "string" && x.typ.kind == celString:
+			return x, nil
+		case n.name == "string" && (x.typ.kind == celInt || x.typ.kind == celUint):
+			return celValue{code: "str(" + x.code + ")", prec: pyAtom, typ: &celType{kind: celString}}, nil
+		}
+	}
+	kinds := make([]string, len(values))
+	for i, v := range values {
+		kinds[i] = v.typ.String()
+	}
+	return celValue{}, fmt.Errorf("function %s(%s) is not supported", n.name, strings.Join(kinds, ", "))
+}
+
+// celReservedNames are the names, besides reservedNames, that a macro
+// variable must not shadow in the generated validator.
+var celReservedNames = map[string]bool{
+	"self": true, "cls": true, "value": true, "valid": true, "message": true, "all": true, "any": true,
+}
+
+func (c *celCompiler) macro(n *celNode) (celValue, error) {
+	target, err := c.compileValue(n.target)
+	if err != nil {
+		return celValue{}, err
+	}
+	var elem *celType
+	switch target.typ.kind {
+	case celList:
+		elem = target.typ.elem
+	case celMap:
+		elem = target.typ.key
+	default:
+		return celValue{}, fmt.Errorf("%s() needs a list or map, got %s", n.name, target.typ)
+	}
+	if n.args[0].op != "ident" {
+		return celValue{}, fmt.Errorf("%s() needs a variable name", n.name)
+	}
+	name := n.args[0].name
+	py := name
+	if reservedNames[py] || celReservedNames[py] || strings.HasPrefix(py, "_") {
+		py += "_"
+	}
+	c.vars = append(c.vars, celVar{name: name, py: py, typ: elem})
+	defer func() { c.vars = c.vars[:len(c.vars)-1] }()
+
+	loop := " for " + py + " in " + paren(target, pyOr)
+	var body, filter celValue
+	switch {
+	case n.name == "map":
+		if len(n.args) == 3 {
+			if filter, err = c.operand(n.args[1], celBool); err != nil {
+				return celValue{}, err
+			}
+			loop += " if " + paren(filter, pyOr)
+		}
+		if body, err = c.compileValue(n.args[len(n.args)-1]); err != nil {
+			return celValue{}, err
+		}
+		return celValue{code: "[" + body.code + loop + "]", prec: pyAtom, typ: &celType{kind: celList, elem: body.typ}}, nil
+	default:
+		if body, err = c.operand(n.args[1], celBool); err != nil {
+			return celValue{}, err
+		}
+	}
+	boolean := &celType{kind: celBool}
+	switch n.name {
+	case "all":
+		return celValue{code: "all(" + body.code + loop + ")", prec: pyAtom, typ: boolean}, nil
+	case "exists":
+		return celValue{code: "any(" + body.code + loop + ")", prec: pyAtom, typ: boolean}, nil
+	case "exists_one":
+		return celValue{code: "sum(1" + loop + " if " + paren(body, pyOr) + ") == 1", prec: pyCmp, typ: boolean}, nil
+	}
+	return celValue{
+		code: "[" + py + loop + " if " + paren(body, pyOr) + "]",
+		prec: pyAtom,
+		typ:  &celType{kind: celList, elem: elem},
+	}, nil
+}
+
+// indentEach prefixes every line with indent.
+func indentEach(lines []string, indent string) []string {
+	out := make([]string, len(lines))
+	for i, line := range lines {
+		out[i] = indent + line
+	}
+	return out
+}
+
+// celRuleLines renders the statements that check rules in order, raising
+// ValueError for the first one that fails. Statements wider than width
+// columns are wrapped the way ruff formats them.
+func celRuleLines(rules []*celRule, width int) []string {
+	var lines []string
+	for _, r := range rules {
+		name, fallback := "valid", "False"
+		if r.IsString {
+			name, fallback = "message", r.Message
+		}
+		var check []string
+		switch {
+		case r.Guarded:
+			// A missing list index or map key is a CEL evaluation error,
+			// reported as a failed rule.
+			check = append(check, "try:")
+			check = append(check, indentEach(celAssign(name, r, width-4), "    ")...)
+			check = append(check, "except LookupError:", "    "+name+" = "+fallback)
+		case r.IsString:
+			check = celAssign(name, r, width)
+		case utf8.RuneCountInString("if "+r.Failed+":") <= width:
+			lines = append(lines, "if "+r.Failed+":")
+			lines = append(lines, indentEach(celRaise(r.Message, width-4), "    ")...)
+			continue
+		default:
+			check = celAssign(name, r, width)
+		}
+		lines = append(lines, check...)
+		if r.IsString {
+			lines = append(lines, "if message:", "    raise ValueError(message)")
+		} else {
+			lines = append(lines, "if not valid:")
+			lines = append(lines, indentEach(celRaise(r.Message, width-4), "    ")...)
+		}
+	}
+	return lines
+}
+
+// celAssign renders "name = expr", wrapped in parentheses and then split at
+// the top-level operator when it does not fit in width columns.
+func celAssign(name string, r *celRule, width int) []string {
+	line := name + " = " + r.Expr
+	if utf8.RuneCountInString(line) <= width {
+		return []string{line}
+	}
+	lines := []string{name + " = ("}
+	if utf8.RuneCountInString(r.Expr)+4 <= width || len(r.Split) == 0 {
+		lines = append(lines, "    "+r.Expr)
+	} else {
+		lines = append(lines, indentEach(r.Split, "    ")...)
+	}
+	return append(lines, ")")
+}
+
+func celRaise(message string, width int) []string {
+	line := "raise ValueError(" + message + ")"
+	if utf8.RuneCountInString(line) <= width {
+		return []string{line}
+	}
+	return []string{"raise ValueError(", "    " + message, ")"}
+}
@@ -8,6 +8,7 @@ import (
 	"path/filepath"
 	"regexp"
 	"sort"
+	"strconv"
 	"strings"
 	"text/template"
 
@@ -26,6 +27,9 @@ var (
 	SupportedFeatures = uint64(pluginpb.CodeGeneratorResponse_FEATURE_PROTO3_OPTIONAL)
 	matchFirstCap     = regexp.MustCompile("([a-z0-9])([A-Z])")
 	matchAllCap       = regexp.MustCompile("([A-Z])([A-Z][a-z])")
+	// A single- or double-quoted string literal, or a dotted Python name.
+	matchAnnotationToken = regexp.MustCompile(`'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*`)
+	matchPythonModule    = regexp.MustCompile(`^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*$`)
 
 	tmpl *template.Template
 )
@@ -80,7 +84,7 @@ func formatScalarLiteral(fd protoreflect.FieldDescriptor, v protoreflect.Value)
 }
 
 func init() {
-	tmpl = template.Must(template.New("pydantic").Funcs(template.FuncMap{
+	tmpl = template.Must(template.New(backendPydantic).Funcs(template.FuncMap{
 		"pyQuote": pyQuote,
 		"dict": func(args ...interface{}) map[string]interface{} {
 			m := make(map[string]interface{}, len(args)/2)
@@ -90,6 +94,7 @@ func init() {
 			return m
 		},
 	}).Parse(modelTemplate))
+	template.Must(tmpl.New(backendMsgspec).Parse(msgspecTemplate))
 }
 
 func main() {
@@ -99,6 +104,15 @@ func main() {
 	useIntegersForEnums := flags.Bool("use_integers_for_enums", false, "")
 	disableFieldDescription := flags.Bool("disable_field_description", false, "")
 	useNoneUnionSyntaxInsteadOfOptional := flags.Bool("use_none_union_syntax_instead_of_optional", true, "")
+	runtimeModule := flags.String("runtime_module", "", "")
+	lazyInit := flags.Bool("lazy_init", false, "")
+	deferBuild := flags.Bool("defer_build", false, "")
+	useIntegerNanosForTime := flags.Bool("use_integer_nanos_for_time", false, "")
+	formatValidatorCacheSize := flags.Int("format_validator_cache_size", 0, "")
+	useDiscriminatedUnionsForOneofs := flags.Bool("use_discriminated_unions_for_oneofs", false, "")
+	backend := flags.String("backend", backendPydantic, "")
+	frozenModels := flags.Bool("frozen_models", false, "")
+	typedDicts := flags.Bool("typed_dicts", false, "")
 
 	opts := protogen.Options{
 		ParamFunc: flags.Set,
@@ -106,19 +120,41 @@ func main() {
 	opts.Run(func(gen *protogen.Plugin) error {
 		gen.SupportedFeatures = SupportedFeatures
 
+		if *runtimeModule != "" && !matchPythonModule.MatchString(*runtimeModule) {
+			return fmt.Errorf("runtime_module: %q is not a valid Python module path", *runtimeModule)
+		}
+		if *backend != backendPydantic && *backend != backendMsgspec {
+			return fmt.Errorf("backend: %q is not one of %q, %q", *backend, backendPydantic, backendMsgspec)
+		}
+		if *formatValidatorCacheSize < 0 {
+			return fmt.Errorf("format_validator_cache_size: %d is negative", *formatValidatorCacheSize)
+		}
+
 		e := NewGenerator(GeneratorConfig{
 			PreservingProtoFieldName:            *preservingProtoFieldName,
 			AutoTrimEnumPrefix:                  *autoTrimEnumPrefix,
 			UseIntegersForEnums:                 *useIntegersForEnums,
 			DisableFieldDescription:             *disableFieldDescription,
 			UseNoneUnionSyntaxInsteadOfOptional: *useNoneUnionSyntaxInsteadOfOptional,
+			RuntimeModule:                       *runtimeModule,
+			DeferBuild:                          *deferBuild,
+			UseIntegerNanosForTime:              *useIntegerNanosForTime,
+			UseDiscriminatedUnionsForOneofs:     *useDiscriminatedUnionsForOneofs,
+			Backend:                             *backend,
+			FrozenModels:                        *frozenModels,
+			TypedDicts:                          *typedDicts,
 		})
 		e.resolver = buildEnumValueOptionsResolver(gen)
 		e.customOptionFields = buildCustomOptionFields(gen)
-		e.fieldConstraintExt = buildFieldConstraintExt(gen)
+		e.fieldConstraintExt = findValidateExt(gen, "google.protobuf.FieldOptions", "field")
+		e.messageConstraintExt = findValidateExt(gen, "google.protobuf.MessageOptions", "message")
 
 		leafDirs := map[string]bool{}
+		leafExports := map[string]map[string]string{}
+		leafModels := map[string][]modelRef{}
 		protoTypeDirs := map[string]map[string]bool{}
+		usesProtoModel := false
+		usesNanos := false
 		for _, f := range gen.Files {
 			if !f.Generate {
 				continue
@@ -129,7 +165,7 @@ func main() {
 				return fmt.Errorf("processing %s: %w", f.Desc.Path(), err)
 			}
 
-			filename := f.GeneratedFilenamePrefix + "_pydantic.py"
+			filename := f.GeneratedFilenamePrefix + e.config.moduleSuffix() + ".py"
 			g := gen.NewGeneratedFile(filename, f.GoImportPath)
 			if err := e.Generate(g); err != nil {
 				return fmt.Errorf("failed to write to %s: %w", filename, err)
@@ -137,6 +173,27 @@ func main() {
 
 			dir := filepath.Dir(f.GeneratedFilenamePrefix)
 			leafDirs[dir] = true
+			if *lazyInit {
+				if leafExports[dir] == nil {
+					leafExports[dir] = map[string]string{}
+				}
+				module := "." + filepath.Base(f.GeneratedFilenamePrefix) + e.config.moduleSuffix()
+				for _, name := range e.exportedNames() {
+					// Proto package scoping makes clashes unlikely; keep the
+					// first definition so the output is deterministic.
+					if _, ok := leafExports[dir][name]; !ok {
+						leafExports[dir][name] = module
+					}
+				}
+			}
+			// msgspec.Struct classes have no schema to build ahead of time.
+			if *deferBuild && e.config.Backend == backendPydantic {
+				module := "." + filepath.Base(f.GeneratedFilenamePrefix) + e.config.moduleSuffix()
+				leafModels[dir] = appendModelRefs(leafModels[dir], module, e.messages)
+			}
+			if len(e.messages) > 0 && e.config.Backend == backendPydantic {
+				usesProtoModel = true
+			}
 			if len(e.runtimeImports) > 0 {
 				if protoTypeDirs[dir] == nil {
 					protoTypeDirs[dir] = map[string]bool{}
@@ -144,19 +201,40 @@ func main() {
 				for name := range e.runtimeImports {
 					protoTypeDirs[dir][name] = true
 				}
+				usesNanos = usesNanos || e.runtimeImports["ProtoTimestampNanos"] || e.runtimeImports["ProtoDurationNanos"]
 			}
 		}
 
 		for dir := range leafDirs {
 			initPath := filepath.Join(dir, "__init__.py")
 			g := gen.NewGeneratedFile(initPath, "")
-			g.P("# Generated by protoc-gen-pydantic.")
+			if len(leafExports[dir]) > 0 || len(leafModels[dir]) > 0 {
+				content := buildInitContent(leafExports[dir], sortModelRefs(leafModels[dir]))
+				g.P(strings.TrimRight(content, "\n"))
+			} else {
+				g.P("# Generated by protoc-gen-pydantic.")
+			}
 		}
 
 		for dir, needed := range protoTypeDirs {
 			path := filepath.Join(dir, "_proto_types.py")
 			g := gen.NewGeneratedFile(path, "")
-			g.P(strings.TrimRight(buildProtoTypesContent(needed), "\n"))
+			if e.config.Backend == backendMsgspec {
+				g.P(strings.TrimRight(msgspecProtoTypes, "\n"))
+				continue
+			}
+			g.P(strings.TrimRight(buildProtoTypesContent(needed, *formatValidatorCacheSize), "\n"))
+		}
+
+		// With runtime_module set, _ProtoModel and the ProtoWire codec are
+		// defined once at the output root instead of in every generated file
+		// and _proto_types.py.
+		if e.config.RuntimeModule != "" && usesProtoModel {
+			path := strings.ReplaceAll(e.config.RuntimeModule, ".", "/") + ".py"
+			g := gen.NewGeneratedFile(path, "")
+			if err := e.GenerateRuntimeModule(g, usesNanos); err != nil {
+				return fmt.Errorf("failed to write to %s: %w", path, err)
+			}
 		}
 
 		return nil
@@ -175,7 +253,10 @@ const modelTemplate = `# DO NOT EDIT. Generated by protoc-gen-pydantic.
 {{- end }}
 """
 {{- end }}
-{{ if .StdImports._Enum }}
+{{ if .StdImports._re }}
+import re as _re
+{{- end }}
+{{- if .StdImports._Enum }}
 from enum import Enum as _Enum
 {{- end }}
 {{- if $hasEnumOptions }}
@@ -187,6 +268,16 @@ from dataclasses import dataclass as _dataclass
 {{- if .PydanticImportLine }}
 
 {{ .PydanticImportLine }}
+{{- if and .TypedDicts .StdImports._BaseModel (not $config.RuntimeModule) }}
+from pydantic_core import SchemaSerializer as _SchemaSerializer
+{{- end }}
+{{- if .TypedDicts }}
+from typing_extensions import NotRequired as _NotRequired, TypedDict as _TypedDict
+{{- end }}
+{{- end }}
+{{- if .ProtoModelImportLine }}
+
+{{ .ProtoModelImportLine }}
 {{- end }}
 {{- if .RuntimeImportLine }}
 
@@ -200,75 +291,15 @@ from dataclasses import dataclass as _dataclass
 
 {{ . }}
 {{- end }}
-{{- if .StdImports._BaseModel }}
-
-
-class _ProtoModel(_BaseModel):
-    """Base class for generated Pydantic models with ProtoJSON helpers."""
-
-    model_config = _ConfigDict(
-        use_enum_values=True,
-        ser_json_bytes="base64",
-        val_json_bytes="base64",
-        ser_json_inf_nan="strings",
-    )
-
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
+{{- if and .StdImports._BaseModel (not $config.RuntimeModule) }}
 
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
 
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
+{{template "protoModel" .}}
 {{- end }}
 {{- if $hasEnumOptions }}
 
 
-@_dataclass(frozen=True)
-class _EnumValueOptions:
-    number: int
-    deprecated: bool = False
-    debug_redact: bool = False
-{{- range $customOptionFields }}
-    {{ .Name }}: {{ .PythonType }} | None = None
-{{- end }}
-
-
-class _ProtoEnum({{ if $config.UseIntegersForEnums }}int{{ else }}str{{ end }}, _Enum):
-    _options_: _EnumValueOptions
-
-    def __new__(cls, value: {{ if $config.UseIntegersForEnums }}int{{ else }}str{{ end }}, options: _EnumValueOptions | None = None):
-        obj = {{ if $config.UseIntegersForEnums }}int{{ else }}str{{ end }}.__new__(cls, value)
-        obj._value_ = value
-        if options is not None:
-            obj._options_ = options
-        return obj
-
-    @property
-    def options(self) -> _EnumValueOptions:
-        return self._options_
+{{template "enumOptions" .}}
 {{- end }}
 {{- range .Enums }}
 
@@ -277,6 +308,11 @@ class _ProtoEnum({{ if $config.UseIntegersForEnums }}int{{ else }}str{{ end }},
 
 
 {{template "renderMessage" (dict "Message" . "Indent" "" "Config" $config "HasEnumOptions" $hasEnumOptions "CustomOptionFields" $customOptionFields)}}{{- end -}}
+{{- with .TypedDicts }}
+
+
+{{ . }}
+{{- end }}
 {{- range .File.TrailingComments }}
 # {{ . }}
 {{- end }}
@@ -365,6 +401,10 @@ class _ProtoEnum({{ if $config.UseIntegersForEnums }}int{{ else }}str{{ end }},
 {{$bi}}# {{ . }}
 {{- end }}
 {{- end }}
+{{- if not $config.UseIntegersForEnums }}
+
+{{$bi}}{{ $e.ProtoNumbers $bi }}
+{{- end }}
 {{- end -}}
 {{define "renderMessage" -}}
 {{- $m := index . "Message" -}}
@@ -404,245 +444,2669 @@ class _ProtoEnum({{ if $config.UseIntegersForEnums }}int{{ else }}str{{ end }},
 {{ end }}{{- range $field.LeadingComments }}
 {{$bi}}# {{ . }}
 {{- end }}
-{{- if or (and (not $config.DisableFieldDescription) (or (ne (len $field.LeadingComments) 0) (ne $field.OneOf nil))) $field.Alias $field.IsDefaultFactory $field.HasConstraints }}
-{{$bi}}{{ $field.Name }}: "{{ $field.Type }}" = _Field(
-{{$bi}}    {{ $field.Default }},
-{{- if and (not $config.DisableFieldDescription) (or (ne (len $field.LeadingComments) 0) (ne $field.OneOf nil)) }}
-{{$bi}}    description={{ pyQuote $field.Description }},
+{{- if $field.RendersMultiline $config }}
+{{- $vi := $bi }}{{ if $field.Parenthesized }}{{ $vi = printf "%s    " $bi }}{{ end }}
+{{$bi}}{{ $field.Name }}: {{ $field.Annotation }} = {{ if $field.Parenthesized }}(
+{{$vi}}{{ end }}_Field(
+{{$vi}}    {{ $field.Default }},
+{{- if $field.HasDescription $config }}
+{{$vi}}    description={{ pyQuote $field.Description }},
 {{- end }}
 {{- if $field.Alias }}
-{{$bi}}    alias="{{ $field.Alias }}",
+{{$vi}}    alias="{{ $field.Alias }}",
 {{- end }}
 {{- range $field.ConstraintArgs }}
-{{$bi}}    {{ . }},
+{{$vi}}    {{ . }},
 {{- end }}
 {{- range $field.DroppedConstraintComments }}
-{{$bi}}    {{ . }}
+{{$vi}}    {{ . }}
+{{- end }}
+{{$vi}})
+{{- if $field.Parenthesized }}
+{{$bi}})
 {{- end }}
+{{- else if $field.Parenthesized }}
+{{$bi}}{{ $field.Name }}: {{ $field.Annotation }} = (
+{{$bi}}    _Field({{ $field.Default }})
 {{$bi}})
 {{- else }}
-{{$bi}}{{ $field.Name }}: "{{ $field.Type }}" = _Field({{ $field.Default }})
+{{$bi}}{{ $field.Name }}: {{ $field.Annotation }} = _Field({{ $field.Default }})
 {{- end }}
 {{- range $field.TrailingComments }}
 {{$bi}}# {{ . }}
 {{- end }}{{- end }}
-{{- if and (eq (len $m.Fields) 0) (eq (len $m.NestedEnums) 0) (eq (len $m.NestedMessages) 0) }}
-{{$bi}}pass
+{{- if $m.Unions }}
+
+{{$bi}}@_model_validator(mode="before")
+{{$bi}}@classmethod
+{{$bi}}def _fold_oneofs(cls, data):
+{{$bi}}    return cls.__proto_wire__.fold_unions(data)
+
+{{$bi}}@_model_serializer(mode="wrap")
+{{$bi}}def _flatten_oneofs(self, handler, info):
+{{$bi}}    return self.__proto_wire__.flatten_unions(self, handler(self), info)
+{{- range $m.Unions }}{{ range .Members }}
+
+{{$bi}}@property
+{{$bi}}def {{ .Name }}(self):
+{{$bi}}    return self.__proto_wire__.union_member(self, "{{ .Name }}")
+{{- end }}{{ end }}
+{{- else if $m.OneOfs }}
+
+{{$bi}}@_model_validator(mode="after")
+{{$bi}}def _check_oneofs(self):
+{{$bi}}    return self.__proto_wire__.check_oneofs(self)
+{{- end }}
+{{- if and $m.ZeroEnums (not $m.Unions) }}
+
+{{$bi}}@_model_serializer(mode="wrap")
+{{$bi}}def _omit_zero_enums(self, handler, info):
+{{$bi}}    return self.__proto_wire__.omit_zero_enums(self, handler(self), info)
+{{- end }}
+{{- with $m.CelValidators $bi }}
+
+{{$bi}}{{ . }}
 {{- end }}
+{{- if $m.Fields }}
+{{ end }}
+{{$bi}}{{ $m.ProtoWire $bi }}
+{{- end -}}
+{{define "enumOptions" -}}
+@_dataclass(frozen=True)
+class _EnumValueOptions:
+    number: int
+    deprecated: bool = False
+    debug_redact: bool = False
+{{- range .CustomOptionFields }}
+    {{ .Name }}: {{ .PythonType }} | None = None
+{{- end }}
+
+
+class _ProtoEnum({{ if .Config.UseIntegersForEnums }}int{{ else }}str{{ end }}, _Enum):
+    _options_: _EnumValueOptions
+
+    def __new__(cls, value: {{ if .Config.UseIntegersForEnums }}int{{ else }}str{{ end }}, options: _EnumValueOptions | None = None):
+        obj = {{ if .Config.UseIntegersForEnums }}int{{ else }}str{{ end }}.__new__(cls, value)
+        obj._value_ = value
+        if options is not None:
+            obj._options_ = options
+        return obj
+
+    @property
+    def options(self) -> _EnumValueOptions:
+        return self._options_
 {{- end -}}
+{{define "protoModel" -}}
+class _ProtoModel(ProtoModelMixin, _BaseModel):
+    """Base class for generated Pydantic models with ProtoJSON helpers."""
+
+    model_config = _ConfigDict(
+        use_enum_values=True,
+        ser_json_bytes="base64",
+        val_json_bytes="base64",
+        ser_json_inf_nan="strings",
+{{- if .Config.DeferBuild }}
+        defer_build=True,
+{{- end }}
+{{- if .Config.FrozenModels }}
+        frozen=True,
+{{- end }}
+    )
+{{- if .Config.FrozenModels }}
+
+    __slots__ = ("__proto_hash__",)
+
+    def __hash__(self) -> int:
+        """Hash the field values, once per instance."""
+        try:
+            return self.__proto_hash__
+        except AttributeError:
+            pass
+        value = self.__proto_wire__.hash(self)
+        object.__setattr__(self, "__proto_hash__", value)
+        return value
+
+    @_model_validator(mode="after")
+    def _share_fields_set(self):
+        return self.__proto_wire__.share_fields_set(self)
+
+    def __copy__(self):
+        return self.__proto_wire__.own_fields_set(super().__copy__())
+
+    def __deepcopy__(self, memo=None):
+        return self.__proto_wire__.own_fields_set(super().__deepcopy__(memo))
+{{- end }}
+{{- if .Config.TypedDicts }}
+
+    @classmethod
+    def proto_dict_adapter(cls) -> _TypeAdapter:
+        """Return a cached TypeAdapter of the TypedDict mirror of the model.
+
+        It validates ProtoJSON into plain dicts keyed by ProtoJSON names, with
+        no model built per message. Field constraints are checked; CEL rules
+        and oneof exclusivity are not.
+        """
+        # Built on first use and cached on the class itself, not inherited.
+        adapter = cls.__dict__.get("__proto_dict_adapter__")
+        if adapter is None:
+            adapter = _TypeAdapter(cls.__proto_wire__.typed_dict())
+            # A TypedDict's config only reaches its validator: the serializer
+            # is rebuilt with the ProtoJSON forms of bytes and floats.
+            adapter.rebuild()
+            adapter.serializer = _SchemaSerializer(
+                adapter.core_schema,
+                {"ser_json_bytes": "base64", "ser_json_inf_nan": "strings"},
+            )
+            cls.__proto_dict_adapter__ = adapter
+        return adapter
+{{- end }}
+{{- end -}}
+{{define "runtimeModule" -}}
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+import base64 as _base64
+import datetime as _datetime
+import math as _math
+import struct as _struct
+import sys as _sys
+from collections.abc import Iterable as _Iterable
+from typing import Annotated as _Annotated
+
+from pydantic import (
+    AfterValidator as _AfterValidator,
+    BaseModel as _BaseModel,
+    BeforeValidator as _BeforeValidator,
+    ConfigDict as _ConfigDict,
+    PlainSerializer as _PlainSerializer,
+    PlainValidator as _PlainValidator,
+    TypeAdapter as _TypeAdapter,
+    WrapValidator as _WrapValidator,
+{{- if .Config.FrozenModels }}
+    model_validator as _model_validator,
+{{- end }}
+    with_config as _with_config,
+)
+{{- if .Config.TypedDicts }}
+from pydantic_core import SchemaSerializer as _SchemaSerializer
+{{- end }}
+from typing_extensions import NotRequired as _NotRequired, TypedDict as _TypedDict
+{{ .ModelFuncs }}
+
+{{template "protoModel" .}}
+{{ .WireFuncs }}
+{{end -}}
 `
 
 // protoTypesBaseFuncs contains the always-present base function bodies for
-// _proto_types.py. It starts with two newlines so that when appended directly
-// after the last import/assignment line (which ends with \n), the result has
-// exactly two blank lines before the first function — satisfying ruff E302.
-const protoTypesBaseFuncs = `
+// _proto_types.py. Each part starts with two newlines so that when appended
+// directly after the last import/assignment line (which ends with \n), the
+// result has exactly two blank lines before the first function — satisfying
+// ruff E302.
+const protoTypesBaseFuncs = protoTypesInt64Funcs + protoTypesTimeFuncs + protoTypesSetFuncs
+
+// protoTypesInt64Funcs holds the 64-bit integer types.
+const protoTypesInt64Funcs = `
+
+class _JsonStringInt:
+    """Integer that is a decimal string in JSON, as ProtoJSON encodes 64-bit ints.
+
+    Both directions run inside pydantic-core: lax int validation parses
+    numeric strings, and the to-string serializer formats the value.
+    """
+
+    def __get_pydantic_core_schema__(self, source, handler):
+        schema = handler(source)
+        schema["serialization"] = _core_schema.to_string_ser_schema(when_used="json")
+        return schema
+
+
+ProtoInt64 = _Annotated[int, _JsonStringInt()]
+
+ProtoUInt64 = _Annotated[int, _JsonStringInt()]
+`
+
+// protoTypesTimeFuncs holds the Timestamp and Duration types and the
+// conversions the binary codec shares with them.
+const protoTypesTimeFuncs = `
+
+_UTC = _datetime.timezone.utc
+
+_EPOCH = _datetime.datetime(1970, 1, 1, tzinfo=_UTC)
+
+# google.protobuf.Duration spans +-10000 years.
+_MAX_DURATION_SECONDS = 315_576_000_000
+
+
+def _split_timestamp(s):
+    """Split an RFC 3339 timestamp into integer fields without losing nanoseconds.
+
+    Returns (year, month, day, hour, minute, second, nanos, offset_seconds).
+    """
+    n = len(s)
+    zone_start = n - 1 if s[-1:] in ("Z", "z") else n - 6
+    if (
+        zone_start < 19
+        or s[4] != "-"
+        or s[7] != "-"
+        or s[10] not in ("T", "t", " ")
+        or s[13] != ":"
+        or s[16] != ":"
+    ):
+        raise ValueError(f"Invalid timestamp: {s!r}")
+    fields = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+    if not (fields.isdigit() and fields.isascii()):
+        raise ValueError(f"Invalid timestamp: {s!r}")
+    frac = s[20:zone_start]
+    if zone_start > 19 and (
+        s[19] != "."
+        or not 0 < len(frac) <= 9
+        or not (frac.isdigit() and frac.isascii())
+    ):
+        raise ValueError(f"Invalid timestamp: {s!r}")
+    offset = 0
+    if zone_start == n - 6:
+        hhmm = s[n - 5 : n - 3] + s[n - 2 :]
+        if (
+            s[zone_start] not in ("+", "-")
+            or s[n - 3] != ":"
+            or not (hhmm.isdigit() and hhmm.isascii())
+        ):
+            raise ValueError(f"Invalid timestamp: {s!r}")
+        offset = (int(hhmm[:2]) * 60 + int(hhmm[2:])) * 60
+        if s[zone_start] == "-":
+            offset = -offset
+    return (
+        int(s[0:4]),
+        int(s[5:7]),
+        int(s[8:10]),
+        int(s[11:13]),
+        int(s[14:16]),
+        int(s[17:19]),
+        int(frac) * 10 ** (9 - len(frac)) if frac else 0,
+        offset,
+    )
+
+
+# Canonical UTC timestamps with at most microsecond precision are handed to
+# the C parser, which accepts the Z suffix from Python 3.11. Indexed by
+# length, the separators v[4:20:3] picks from them: date, time, and fraction
+# or Z. Other lengths map to None.
+_CANONICAL_TIMESTAMP_SEPARATORS = tuple(
+    "--T::Z" if n == 20 else "--T::." if 21 < n else None for n in range(28)
+)
+_fromisoformat = _datetime.datetime.fromisoformat
+
+
+def _parse_timestamp(v):
+    # The fast path runs first: LookupError and TypeError mean v is too long
+    # or not a string, ValueError that the C parser rejects it.
+    try:
+        if v[4:20:3] == _CANONICAL_TIMESTAMP_SEPARATORS[len(v)] and v[-1] == "Z":
+            return _fromisoformat(v)
+    except (LookupError, TypeError, ValueError):
+        pass
+    if isinstance(v, str):
+        year, month, day, hour, minute, second, nanos, offset = _split_timestamp(v)
+        tz = (
+            _UTC
+            if not offset
+            else _datetime.timezone(_datetime.timedelta(seconds=offset))
+        )
+        return _datetime.datetime(
+            year, month, day, hour, minute, second, nanos // 1000, tz
+        )
+    if isinstance(v, _datetime.datetime):
+        return v
+    raise ValueError(f"Cannot parse timestamp from {type(v)}")
+
+
+def _format_timestamp(v, nanos):
+    s = f"{v.year:04d}-{v.month:02d}-{v.day:02d}T{v.hour:02d}:{v.minute:02d}:{v.second:02d}"
+    if nanos:
+        s += f".{nanos:09d}".rstrip("0")
+    return s + "Z"
+
+
+def _serialize_timestamp(v):
+    if v.tzinfo is not None and v.utcoffset():
+        v = v.astimezone(_UTC)
+    return _format_timestamp(v, v.microsecond * 1000)
+
+
+def _timestamp_to_seconds_nanos(v):
+    if v.tzinfo is None:
+        v = v.replace(tzinfo=_UTC)
+    delta = v - _EPOCH
+    return delta.days * 86400 + delta.seconds, delta.microseconds * 1000
+
+
+def _timestamp_from_seconds_nanos(seconds, nanos):
+    return _EPOCH + _datetime.timedelta(seconds=seconds, microseconds=nanos // 1000)
+
+
+ProtoTimestamp = _Annotated[
+    _datetime.datetime,
+    _BeforeValidator(_parse_timestamp),
+    _PlainSerializer(_serialize_timestamp, return_type=str, when_used="json"),
+]
+
+
+def _split_duration(s):
+    """Split a ProtoJSON duration such as "-1.5s" into exact (seconds, nanos).
+
+    Both parts carry the sign of the duration.
+    """
+    whole, dot, frac = s[:-1].partition(".")
+    negative = whole[:1] == "-"
+    if negative:
+        whole = whole[1:]
+    if (
+        s[-1:] != "s"
+        or not (whole.isdigit() and whole.isascii())
+        or (dot and not (0 < len(frac) <= 9 and frac.isdigit() and frac.isascii()))
+    ):
+        raise ValueError(f"Invalid duration: {s!r}")
+    seconds = int(whole)
+    if seconds > _MAX_DURATION_SECONDS:
+        raise ValueError(f"Duration out of range: {s!r}")
+    nanos = int(frac) * 10 ** (9 - len(frac)) if frac else 0
+    if negative:
+        return -seconds, -nanos
+    return seconds, nanos
+
+
+def _duration_to_seconds_nanos(v):
+    micros = (v.days * 86400 + v.seconds) * 1_000_000 + v.microseconds
+    seconds, micros = divmod(abs(micros), 1_000_000)
+    sign = -1 if v < _datetime.timedelta(0) else 1
+    return sign * seconds, sign * micros * 1000
+
+
+def _duration_from_seconds_nanos(seconds, nanos):
+    # timedelta holds microseconds: truncate toward zero like the seconds part.
+    return _datetime.timedelta(0, seconds, int(nanos / 1000))
+
+
+def _parse_duration(v):
+    if isinstance(v, str):
+        return _duration_from_seconds_nanos(*_split_duration(v))
+    if isinstance(v, _datetime.timedelta):
+        return v
+    raise ValueError(f"Cannot parse duration from {type(v)}")
+
+
+def _format_duration(negative, seconds, nanos):
+    sign = "-" if negative else ""
+    if nanos:
+        return f"{sign}{seconds}.{nanos:09d}".rstrip("0") + "s"
+    return f"{sign}{seconds}s"
+
+
+def _serialize_duration(v):
+    micros = (v.days * 86400 + v.seconds) * 1_000_000 + v.microseconds
+    seconds, rest = divmod(abs(micros), 1_000_000)
+    return _format_duration(micros < 0, seconds, rest * 1000)
+
+
+ProtoDuration = _Annotated[
+    _datetime.timedelta,
+    _BeforeValidator(_parse_duration),
+    _PlainSerializer(_serialize_duration, return_type=str, when_used="json"),
+]
+`
+
+// protoTypesSetFuncs holds the unique, in and not_in checks.
+const protoTypesSetFuncs = `
+
+def _check_unique(v, keys):
+    seen = {}
+    for i, key in enumerate(keys):
+        first = seen.setdefault(key, i)
+        if first != i:
+            raise ValueError(
+                f"list items must be unique, item {i} repeats item {first}"
+            )
+    return v
+
+
+def _require_unique(v):
+    if len(set(v)) == len(v):
+        return v
+    return _check_unique(v, v)
+
+
+def _require_unique_floats(v):
+    if len(set(v)) == len(v):
+        return v
+    # NaN never equals itself, so NaNs are never duplicates; the set above
+    # can still merge one NaN object listed twice, hence the second pass.
+    return _check_unique(v, [x if x == x else object() for x in v])
+
+
+class _InValues:
+    """Annotated marker that restricts a field to a fixed set of values.
+
+    The field's own schema runs first, so lax inputs such as the ProtoJSON
+    string form of an integer still parse; a literal schema then checks
+    membership inside pydantic-core, without a Python call per value.
+    """
+
+    def __init__(self, *values):
+        self.values = values
+
+    def __get_pydantic_core_schema__(self, source, handler):
+        schema = handler(source)
+        return _core_schema.chain_schema(
+            [schema, _core_schema.literal_schema(list(self.values))],
+            serialization=schema.get("serialization"),
+        )
+
+    def __get_pydantic_json_schema__(self, schema, handler):
+        json_schema = handler(schema)
+        json_schema["enum"] = list(self.values)
+        return json_schema
+
+
+def _make_not_in_validator(excluded_values):
+    def _validate(v):
+        if v in excluded_values:
+            raise ValueError(f"value must not be one of {sorted(excluded_values)}")
+        return v
+
+    return _validate
+`
+
+// Each per-validator constant starts with two newlines so that when appended
+// after content that ends with \n, the result has exactly two blank lines
+// before the function definition (ruff E302).
+
+const protoTypesEmailFunc = `
+
+def _validate_email(v: str) -> str:
+    if not v:
+        return v
+    _pydantic_validate_email(v)
+    return v
+`
+
+const protoTypesURIFunc = `
+
+def _validate_uri(v: str) -> str:
+    if not v:
+        return v
+    _url_adapter.validate_python(v)
+    return v
+`
+
+const protoTypesIPFunc = `
+
+def _validate_ip(v: str) -> str:
+    if not v:
+        return v
+    _ipaddress.ip_address(v)
+    return v
+`
+
+const protoTypesIPv4Func = `
+
+def _validate_ipv4(v: str) -> str:
+    if not v:
+        return v
+    _ipaddress.IPv4Address(v)
+    return v
+`
+
+const protoTypesIPv6Func = `
+
+def _validate_ipv6(v: str) -> str:
+    if not v:
+        return v
+    _ipaddress.IPv6Address(v)
+    return v
+`
+
+const protoTypesUUIDFunc = `
+
+def _validate_uuid(v: str) -> str:
+    if not v:
+        return v
+    _uuid_lib.UUID(v)
+    return v
+`
+
+const protoTypesFiniteFunc = `
+
+def _require_finite(v: float) -> float:
+    if not _math.isfinite(v):
+        raise ValueError("value must be finite")
+    return v
+`
+
+// protoTypesUniqueMessagesFunc checks repeated.unique on message lists.
+// Pydantic models are unhashable, so each item is reduced to a hashable key
+// that compares like proto equality: map order is ignored and NaN is distinct.
+const protoTypesUniqueMessagesFunc = `
+
+def _unique_key(v):
+    if isinstance(v, _BaseModel):
+        return (type(v), tuple(map(_unique_key, v.__dict__.values())))
+    if isinstance(v, dict):
+        return frozenset((k, _unique_key(x)) for k, x in v.items())
+    if isinstance(v, list):
+        return tuple(map(_unique_key, v))
+    if v != v:
+        return object()
+    return v
+
+
+def _require_unique_messages(v):
+    return _check_unique(v, map(_unique_key, v))
+`
+
+// protoTypesNanosFuncs holds the integer-nanosecond Timestamp and Duration
+// types emitted with use_integer_nanos_for_time.
+const protoTypesNanosFuncs = `
+
+_NANOS_PER_SECOND = 1_000_000_000
+
+
+def _parse_timestamp_nanos(v):
+    if isinstance(v, str):
+        year, month, day, hour, minute, second, nanos, offset = _split_timestamp(v)
+        seconds, _ = _timestamp_to_seconds_nanos(
+            _datetime.datetime(year, month, day, hour, minute, second, tzinfo=_UTC)
+        )
+        return (seconds - offset) * _NANOS_PER_SECOND + nanos
+    if isinstance(v, _datetime.datetime):
+        seconds, nanos = _timestamp_to_seconds_nanos(v)
+        return seconds * _NANOS_PER_SECOND + nanos
+    return v
+
+
+def _serialize_timestamp_nanos(v):
+    seconds, nanos = divmod(v, _NANOS_PER_SECOND)
+    return _format_timestamp(_timestamp_from_seconds_nanos(seconds, 0), nanos)
+
+
+ProtoTimestampNanos = _Annotated[
+    int,
+    _BeforeValidator(_parse_timestamp_nanos),
+    _PlainSerializer(_serialize_timestamp_nanos, return_type=str, when_used="json"),
+]
+
+
+def _duration_nanos_to_seconds_nanos(v):
+    seconds, nanos = divmod(abs(v), _NANOS_PER_SECOND)
+    if v < 0:
+        return -seconds, -nanos
+    return seconds, nanos
+
+
+def _parse_duration_nanos(v):
+    if isinstance(v, str):
+        seconds, nanos = _split_duration(v)
+        return seconds * _NANOS_PER_SECOND + nanos
+    if isinstance(v, _datetime.timedelta):
+        seconds, nanos = _duration_to_seconds_nanos(v)
+        return seconds * _NANOS_PER_SECOND + nanos
+    return v
+
+
+def _serialize_duration_nanos(v):
+    seconds, nanos = divmod(abs(v), _NANOS_PER_SECOND)
+    return _format_duration(v < 0, seconds, nanos)
+
+
+ProtoDurationNanos = _Annotated[
+    int,
+    _BeforeValidator(_parse_duration_nanos),
+    _PlainSerializer(_serialize_duration_nanos, return_type=str, when_used="json"),
+]
+`
+
+// protoTypesNanosWireFuncs registers the integer-nanosecond Timestamp and
+// Duration kinds with ProtoWire when both are present.
+const protoTypesNanosWireFuncs = `
+
+def _nanos_from_seconds_nanos(seconds, nanos):
+    return seconds * _NANOS_PER_SECOND + nanos
+
+
+def _encode_timestamp_nanos(v):
+    return _encode_seconds_nanos(*divmod(v, _NANOS_PER_SECOND))
+
+
+def _encode_duration_nanos(v):
+    return _encode_seconds_nanos(*_duration_nanos_to_seconds_nanos(v))
+
+
+def _decode_nanos(raw):
+    return _nanos_from_seconds_nanos(*_decode_seconds_nanos(raw))
+
+
+def _pb2_get_nanos(sub):
+    return _nanos_from_seconds_nanos(sub.seconds, sub.nanos)
+
+
+def _pb2_put_timestamp_nanos(sub, v):
+    sub.seconds, sub.nanos = divmod(v, _NANOS_PER_SECOND)
+
+
+def _pb2_put_duration_nanos(sub, v):
+    sub.seconds, sub.nanos = _duration_nanos_to_seconds_nanos(v)
+
+
+# Under use_integer_nanos_for_time, field tables tag Timestamp and Duration
+# fields with these kinds.
+_WELL_KNOWN_KINDS["google.protobuf.Timestamp:nanos"] = _message_kind(
+    _encode_timestamp_nanos, _decode_nanos
+)
+_WELL_KNOWN_KINDS["google.protobuf.Duration:nanos"] = _message_kind(
+    _encode_duration_nanos, _decode_nanos
+)
+_WELL_KNOWN_PB2["google.protobuf.Timestamp:nanos"] = (
+    _pb2_get_nanos,
+    _pb2_put_timestamp_nanos,
+)
+_WELL_KNOWN_PB2["google.protobuf.Duration:nanos"] = (
+    _pb2_get_nanos,
+    _pb2_put_duration_nanos,
+)
+_JSON_DECODERS["google.protobuf.Timestamp:nanos"] = _parse_timestamp_nanos
+_JSON_DECODERS["google.protobuf.Duration:nanos"] = _parse_duration_nanos
+`
+
+// protoTypesModelFuncs defines ProtoModelMixin, the ProtoJSON, binary and
+// protobuf helpers every _ProtoModel inherits, so that generated files only
+// add their config to it.
+const protoTypesModelFuncs = `
+
+class ProtoModelMixin:
+    """Methods of the generated _ProtoModel base classes.
+
+    _ProtoModel derives from this class and BaseModel and adds only its
+    config and option hooks, so generated files do not repeat the helpers.
+    """
+
+    __slots__ = ()
+
+    def to_proto_dict(self, **kwargs) -> dict:
+        """Serialize to a dict using ProtoJSON conventions.
+
+        Omits fields with default (zero) values and uses original proto
+        field names (camelCase aliases).
+        """
+        kwargs.setdefault("exclude_defaults", True)
+        kwargs.setdefault("by_alias", True)
+        return super().model_dump(**kwargs)
+
+    def to_proto_json(self, **kwargs) -> str:
+        """Serialize to a JSON string using ProtoJSON conventions.
+
+        Omits fields with default (zero) values and uses original proto
+        field names (camelCase aliases).
+        """
+        kwargs.setdefault("exclude_defaults", True)
+        kwargs.setdefault("by_alias", True)
+        return super().model_dump_json(**kwargs)
+
+    @classmethod
+    def from_proto_dict(cls, data: dict, **kwargs):
+        """Deserialize from a dict using ProtoJSON conventions."""
+        return cls.model_validate(data, **kwargs)
+
+    @classmethod
+    def from_proto_dict_trusted(cls, data: dict):
+        """Deserialize from a trusted dict using ProtoJSON conventions.
+
+        Skips validation, including buf.validate constraints: only use it for
+        data this code base produced itself, e.g. to_proto_dict output read
+        back from storage. Nested messages are built with model_construct.
+        """
+        return cls.__proto_wire__.construct(data)
+
+    @classmethod
+    def from_proto_json(
+        cls, json_str: str, field_mask: _Iterable[str] | None = None, **kwargs
+    ):
+        """Deserialize from a JSON string using ProtoJSON conventions.
+
+        With field_mask, a list of FieldMask paths such as ["name",
+        "address.city"], only the selected fields are validated: the JSON of
+        the others is skipped and they keep their defaults.
+        """
+        if field_mask is not None:
+            return cls.__proto_wire__.project_json(json_str, field_mask, **kwargs)
+        return cls.model_validate_json(json_str, **kwargs)
+
+    @classmethod
+    def from_proto_dicts(cls, items: _Iterable[dict], **kwargs) -> list:
+        """Deserialize a batch of dicts using ProtoJSON conventions.
+
+        The whole batch is validated in a single call of a cached
+        TypeAdapter(list[cls]).
+        """
+        if not isinstance(items, list):
+            items = list(items)
+        return cls._proto_list_adapter().validate_python(items, **kwargs)
+
+    @classmethod
+    def from_proto_json_many(cls, data: str | bytes, **kwargs) -> list:
+        """Deserialize a JSON array of messages using ProtoJSON conventions.
+
+        The whole array is validated in a single call of a cached
+        TypeAdapter(list[cls]).
+        """
+        return cls._proto_list_adapter().validate_json(data, **kwargs)
+
+    @classmethod
+    def to_proto_dicts(cls, models: _Iterable["ProtoModelMixin"], **kwargs) -> list:
+        """Serialize a batch of models to dicts, like to_proto_dict."""
+        kwargs.setdefault("exclude_defaults", True)
+        kwargs.setdefault("by_alias", True)
+        if not isinstance(models, list):
+            models = list(models)
+        return cls._proto_list_adapter().dump_python(models, **kwargs)
+
+    @classmethod
+    def to_proto_json_many(
+        cls, models: _Iterable["ProtoModelMixin"], **kwargs
+    ) -> bytes:
+        """Serialize a batch of models to a JSON array, like to_proto_json."""
+        kwargs.setdefault("exclude_defaults", True)
+        kwargs.setdefault("by_alias", True)
+        if not isinstance(models, list):
+            models = list(models)
+        return cls._proto_list_adapter().dump_json(models, **kwargs)
+
+    @classmethod
+    def _proto_list_adapter(cls) -> _TypeAdapter:
+        # Built on first use and cached on the class itself, not inherited.
+        adapter = cls.__dict__.get("__proto_list_adapter__")
+        if adapter is None:
+            adapter = cls.__proto_list_adapter__ = ProtoModelMixin._new_list_adapter(
+                cls
+            )
+        return adapter
+
+    @staticmethod
+    def _new_list_adapter(model) -> _TypeAdapter:
+        return _TypeAdapter(list[model])
+
+    def to_proto_bytes(self) -> bytes:
+        """Serialize to the protobuf binary wire format."""
+        return self.__proto_wire__.encode(self)
+
+    @classmethod
+    def from_proto_bytes(cls, data: bytes, **kwargs):
+        """Deserialize from the protobuf binary wire format.
+
+        Unknown fields are skipped; the decoded values are validated like
+        from_proto_dict input.
+        """
+        return cls.model_validate(cls.__proto_wire__.decode(data), **kwargs)
+
+    @classmethod
+    def iter_proto_ndjson(cls, fp, **kwargs):
+        """Read models from a newline-delimited JSON stream, like from_proto_json.
+
+        fp is a text or binary file object, consumed one line at a time;
+        blank lines are skipped.
+        """
+        for line in fp:
+            if line.strip():
+                yield cls.from_proto_json(line, **kwargs)
+
+    @classmethod
+    def write_proto_ndjson(
+        cls, fp, models: _Iterable["ProtoModelMixin"], **kwargs
+    ) -> None:
+        """Write models to the text file object fp as newline-delimited JSON.
+
+        Each line is the to_proto_json output of a model.
+        """
+        for model in models:
+            fp.write(model.to_proto_json(**kwargs) + "\n")
+
+    @classmethod
+    def iter_proto_delimited(cls, fp, chunk_size: int = 65536, **kwargs):
+        """Read models from a varint length-delimited binary stream.
+
+        This is the framing written by writeDelimitedTo in the Java and C++
+        protobuf runtimes. fp is read in chunks, so memory use does not grow
+        with the length of the stream.
+        """
+        for data in cls.__proto_wire__.iter_delimited(fp, chunk_size):
+            yield cls.from_proto_bytes(data, **kwargs)
+
+    @classmethod
+    def write_proto_delimited(cls, fp, models: _Iterable["ProtoModelMixin"]) -> None:
+        """Write models to the binary file object fp, each prefixed by its length."""
+        write = cls.__proto_wire__.write_delimited
+        for model in models:
+            write(fp, model.to_proto_bytes())
+
+    @classmethod
+    def proto_field_mask(cls, paths: _Iterable[str] | str | None = None):
+        """Compile FieldMask paths against the model, once per mask.
+
+        paths is a list of paths such as ["name", "address.city"] or their
+        comma-separated ProtoJSON form; None selects every field. The result
+        projects, merges and diffs models through the selected fields.
+        """
+        return cls.__proto_wire__.field_mask(paths)
+
+    def which_oneof(self, name: str) -> str | None:
+        """Return the name of the member of oneof name that is set, or None.
+
+        Raises ValueError if the message has no oneof called name.
+        """
+        return self.__proto_wire__.which_oneof(self, name)
+
+    def clear_oneof(self, name: str) -> None:
+        """Unset every member of oneof name."""
+        self.__proto_wire__.clear_oneof(self, name)
+
+    def merge_from(self, other) -> None:
+        """Merge other, a message of the same class, into this one in place.
+
+        Follows MergeFrom of the protobuf runtimes: the fields other sets
+        overwrite these, repeated fields are appended to, maps are updated
+        key by key and message fields are merged recursively.
+        """
+        self.__proto_wire__.merge_from(self, other)
+
+    def to_pb2(self, message_class):
+        """Convert to an instance of message_class, the protoc-generated class."""
+        return self.__proto_wire__.to_pb2(self, message_class())
+
+    @classmethod
+    def from_pb2(cls, message, **kwargs):
+        """Convert from a protoc-generated message object.
+
+        Fields are copied attribute by attribute; the values are validated like
+        from_proto_dict input.
+        """
+        return cls.model_validate(cls.__proto_wire__.from_pb2(message), **kwargs)
+`
+
+// protoTypesWireFuncs implements ProtoWire, the protobuf binary codec that
+// generated messages reference through their __proto_wire__ field tables.
+const protoTypesWireFuncs = `
+
+_WIRE_VARINT = 0
+_WIRE_I64 = 1
+_WIRE_LEN = 2
+_WIRE_I32 = 5
+
+_object_setattr = object.__setattr__
+
+
+def _is_default(v):
+    # -0.0 is not the default value: like NaN, it is written.
+    return not v and (not isinstance(v, float) or _math.copysign(1.0, v) > 0)
+
+
+def _write_varint(out, v):
+    while v > 0x7F:
+        out.append((v & 0x7F) | 0x80)
+        v >>= 7
+    out.append(v)
+
+
+def _read_varint(data, pos):
+    b = data[pos]
+    if b < 0x80:
+        return b, pos + 1
+    result = b & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        b = data[pos]
+        result |= (b & 0x7F) << shift
+        if b < 0x80:
+            return result, pos + 1
+        shift += 7
+
+
+def _write_len(out, payload):
+    _write_varint(out, len(payload))
+    out += payload
+
+
+def _to_int32(v):
+    v &= 0xFFFFFFFF
+    return v - 0x100000000 if v & 0x80000000 else v
+
+
+def _to_int64(v):
+    v &= 0xFFFFFFFFFFFFFFFF
+    return v - 0x10000000000000000 if v & 0x8000000000000000 else v
+
+
+def _zigzag(v):
+    return (v << 1) ^ (v >> 63)
+
+
+def _unzigzag(v):
+    return (v >> 1) ^ -(v & 1)
+
+
+def _varint_kind(to_raw, from_raw, is_default=None):
+    def write(out, v):
+        _write_varint(out, to_raw(v))
+
+    return _WIRE_VARINT, write, from_raw, is_default or _is_default
+
+
+def _fixed_kind(fmt):
+    packer = _struct.Struct(fmt)
+    wire_type = _WIRE_I32 if packer.size == 4 else _WIRE_I64
+
+    def write(out, v):
+        out += packer.pack(v)
+
+    def read(raw):
+        return packer.unpack(raw)[0]
+
+    return wire_type, write, read, _is_default
+
+
+def _write_str(out, v):
+    _write_len(out, v.encode())
+
+
+# kind -> (wire type, write(out, value), read(raw) -> value, is_default(value))
+_SCALAR_KINDS = {
+    "int32": _varint_kind(lambda v: v & 0xFFFFFFFFFFFFFFFF, _to_int32),
+    "int64": _varint_kind(lambda v: v & 0xFFFFFFFFFFFFFFFF, _to_int64),
+    "uint32": _varint_kind(int, lambda v: v & 0xFFFFFFFF),
+    "uint64": _varint_kind(int, lambda v: v & 0xFFFFFFFFFFFFFFFF),
+    "sint32": _varint_kind(_zigzag, lambda v: _to_int32(_unzigzag(v))),
+    "sint64": _varint_kind(_zigzag, _unzigzag),
+    "bool": _varint_kind(int, bool),
+    "fixed32": _fixed_kind("<I"),
+    "fixed64": _fixed_kind("<Q"),
+    "sfixed32": _fixed_kind("<i"),
+    "sfixed64": _fixed_kind("<q"),
+    "float": _fixed_kind("<f"),
+    "double": _fixed_kind("<d"),
+    "string": (_WIRE_LEN, _write_str, bytes.decode, _is_default),
+    "bytes": (_WIRE_LEN, _write_len, bytes, _is_default),
+}
+
+
+def _iter_fields(data):
+    """Yield (number, wire type, raw value) for each record in data."""
+    pos = 0
+    end = len(data)
+    while pos < end:
+        key, pos = _read_varint(data, pos)
+        wire_type = key & 7
+        if wire_type == _WIRE_VARINT:
+            raw, pos = _read_varint(data, pos)
+        elif wire_type == _WIRE_LEN:
+            size, pos = _read_varint(data, pos)
+            raw = data[pos : pos + size]
+            pos += size
+        elif wire_type == _WIRE_I64:
+            raw = data[pos : pos + 8]
+            pos += 8
+        elif wire_type == _WIRE_I32:
+            raw = data[pos : pos + 4]
+            pos += 4
+        else:
+            raise ValueError(f"unsupported wire type {wire_type}")
+        if pos > end:
+            raise ValueError("truncated message")
+        yield key >> 3, wire_type, raw
+
+
+def _default_value(spec):
+    """Return the value read from a field that is absent on the wire."""
+    wire_type, _, read, _ = spec
+    if wire_type == _WIRE_VARINT:
+        return read(0)
+    if wire_type == _WIRE_LEN:
+        return read(b"")
+    return read(bytes(4 if wire_type == _WIRE_I32 else 8))
+
+
+def _iter_packed(wire_type, raw):
+    if wire_type == _WIRE_VARINT:
+        pos = 0
+        while pos < len(raw):
+            v, pos = _read_varint(raw, pos)
+            yield v
+    else:
+        size = 4 if wire_type == _WIRE_I32 else 8
+        for pos in range(0, len(raw), size):
+            yield raw[pos : pos + size]
+
+
+def _message_kind(encode, decode):
+    def write(out, v):
+        _write_len(out, encode(v))
+
+    return _WIRE_LEN, write, decode, _is_none
+
+
+def _is_none(v):
+    return v is None
+
+
+def _encode_timestamp(v):
+    return _encode_seconds_nanos(*_timestamp_to_seconds_nanos(v))
+
+
+def _decode_timestamp(raw):
+    return _timestamp_from_seconds_nanos(*_decode_seconds_nanos(raw))
+
+
+def _encode_duration(v):
+    return _encode_seconds_nanos(*_duration_to_seconds_nanos(v))
+
+
+def _decode_duration(raw):
+    return _duration_from_seconds_nanos(*_decode_seconds_nanos(raw))
+
+
+def _encode_seconds_nanos(seconds, nanos):
+    out = bytearray()
+    if seconds:
+        out.append(0x08)
+        _write_varint(out, seconds & 0xFFFFFFFFFFFFFFFF)
+    if nanos:
+        out.append(0x10)
+        _write_varint(out, nanos & 0xFFFFFFFFFFFFFFFF)
+    return out
+
+
+def _decode_seconds_nanos(raw):
+    seconds = nanos = 0
+    for number, _, v in _iter_fields(raw):
+        if number == 1:
+            seconds = _to_int64(v)
+        elif number == 2:
+            nanos = _to_int32(v)
+    return seconds, nanos
+
+
+def _encode_value(v):
+    out = bytearray()
+    if v is None:
+        out += b"\x08\x00"
+    elif isinstance(v, bool):
+        out += b"\x20\x01" if v else b"\x20\x00"
+    elif isinstance(v, (int, float)):
+        out.append(0x11)
+        out += _struct.pack("<d", v)
+    elif isinstance(v, str):
+        out.append(0x1A)
+        _write_str(out, v)
+    elif isinstance(v, dict):
+        out.append(0x2A)
+        _write_len(out, _encode_struct(v))
+    elif isinstance(v, (list, tuple)):
+        out.append(0x32)
+        _write_len(out, _encode_list_value(v))
+    else:
+        raise TypeError(f"cannot encode {type(v).__name__} as google.protobuf.Value")
+    return out
+
+
+def _decode_value(raw):
+    value = None
+    for number, _, v in _iter_fields(raw):
+        if number == 1:
+            value = None
+        elif number == 2:
+            value = _struct.unpack("<d", v)[0]
+        elif number == 3:
+            value = v.decode()
+        elif number == 4:
+            value = bool(v)
+        elif number == 5:
+            value = _decode_struct(v)
+        elif number == 6:
+            value = _decode_list_value(v)
+    return value
+
+
+def _encode_struct(v):
+    out = bytearray()
+    for key, item in v.items():
+        entry = bytearray(b"\x0a")
+        _write_str(entry, key)
+        entry.append(0x12)
+        _write_len(entry, _encode_value(item))
+        out.append(0x0A)
+        _write_len(out, entry)
+    return out
+
+
+def _decode_struct(raw):
+    result = {}
+    for number, _, entry in _iter_fields(raw):
+        if number == 1:
+            key, value = "", None
+            for entry_number, _, v in _iter_fields(entry):
+                if entry_number == 1:
+                    key = v.decode()
+                elif entry_number == 2:
+                    value = _decode_value(v)
+            result[key] = value
+    return result
+
+
+def _encode_list_value(v):
+    out = bytearray()
+    for item in v:
+        out.append(0x0A)
+        _write_len(out, _encode_value(item))
+    return out
+
+
+def _decode_list_value(raw):
+    return [_decode_value(v) for number, _, v in _iter_fields(raw) if number == 1]
+
+
+def _encode_field_mask(v):
+    out = bytearray()
+    for path in v:
+        out.append(0x0A)
+        _write_str(out, path)
+    return out
+
+
+def _decode_field_mask(raw):
+    return [v.decode() for number, _, v in _iter_fields(raw) if number == 1]
+
+
+def _unsupported_any(_):
+    raise ValueError("google.protobuf.Any is not supported by the binary codec")
+
+
+def _wrapper_kind(kind):
+    wire_type, write, read, is_default = _SCALAR_KINDS[kind]
+    tag = bytes([0x08 | wire_type])
+    default = _default_value(_SCALAR_KINDS[kind])
+
+    def encode(v):
+        out = bytearray()
+        if not is_default(v):
+            out += tag
+            write(out, v)
+        return out
+
+    def decode(raw):
+        value = default
+        for number, _, v in _iter_fields(raw):
+            if number == 1:
+                value = read(v)
+        return value
+
+    return _message_kind(encode, decode)
+
+
+_WELL_KNOWN_KINDS = {
+    "google.protobuf.Timestamp": _message_kind(_encode_timestamp, _decode_timestamp),
+    "google.protobuf.Duration": _message_kind(_encode_duration, _decode_duration),
+    "google.protobuf.Struct": _message_kind(_encode_struct, _decode_struct),
+    "google.protobuf.Value": _message_kind(_encode_value, _decode_value),
+    "google.protobuf.ListValue": _message_kind(_encode_list_value, _decode_list_value),
+    "google.protobuf.FieldMask": _message_kind(_encode_field_mask, _decode_field_mask),
+    "google.protobuf.Empty": _message_kind(lambda v: b"", lambda raw: None),
+    "google.protobuf.Any": _message_kind(_unsupported_any, _unsupported_any),
+    "google.protobuf.BoolValue": _wrapper_kind("bool"),
+    "google.protobuf.Int32Value": _wrapper_kind("int32"),
+    "google.protobuf.Int64Value": _wrapper_kind("int64"),
+    "google.protobuf.UInt32Value": _wrapper_kind("uint32"),
+    "google.protobuf.UInt64Value": _wrapper_kind("uint64"),
+    "google.protobuf.FloatValue": _wrapper_kind("float"),
+    "google.protobuf.DoubleValue": _wrapper_kind("double"),
+    "google.protobuf.StringValue": _wrapper_kind("string"),
+    "google.protobuf.BytesValue": _wrapper_kind("bytes"),
+}
+
+
+# pb2 converters of the well-known types: (get, put) pairs that read a value
+# from a protobuf message object and write one into it. Timestamp, Duration,
+# FieldMask and the wrappers copy attributes; the JSON-like types go through
+# the binary codecs above.
+def _pb2_get_timestamp(sub):
+    return _timestamp_from_seconds_nanos(sub.seconds, sub.nanos)
+
+
+def _pb2_put_timestamp(sub, v):
+    sub.seconds, sub.nanos = _timestamp_to_seconds_nanos(v)
+
 
-def _coerce_int(v):
-    return int(v)
+def _pb2_get_duration(sub):
+    return _duration_from_seconds_nanos(sub.seconds, sub.nanos)
 
 
-ProtoInt64 = _Annotated[
-    int,
-    _BeforeValidator(_coerce_int),
-    _PlainSerializer(lambda v: str(v), return_type=str, when_used="json"),
-]
+def _pb2_put_duration(sub, v):
+    sub.seconds, sub.nanos = _duration_to_seconds_nanos(v)
 
-ProtoUInt64 = _Annotated[
-    int,
-    _BeforeValidator(_coerce_int),
-    _PlainSerializer(lambda v: str(v), return_type=str, when_used="json"),
-]
 
+def _pb2_get_field_mask(sub):
+    return list(sub.paths)
 
-def _parse_timestamp(v):
-    if isinstance(v, str):
-        return _datetime.datetime.fromisoformat(v.replace("Z", "+00:00"))
-    if isinstance(v, _datetime.datetime):
-        return v
-    raise ValueError(f"Cannot parse timestamp from {type(v)}")
 
+def _pb2_put_field_mask(sub, v):
+    sub.paths.extend(v)
 
-def _serialize_timestamp(v):
-    if v.tzinfo is None:
-        v = v.replace(tzinfo=_datetime.timezone.utc)
-    s = v.strftime("%Y-%m-%dT%H:%M:%S")
-    us = v.microsecond
-    if us:
-        s += f".{us:06d}".rstrip("0")
-    return s + "Z"
 
+def _pb2_get_wrapper(sub):
+    return sub.value
 
-ProtoTimestamp = _Annotated[
-    _datetime.datetime,
-    _BeforeValidator(_parse_timestamp),
-    _PlainSerializer(_serialize_timestamp, return_type=str, when_used="json"),
-]
 
+def _pb2_put_wrapper(sub, v):
+    sub.value = v
 
-def _parse_duration(v):
-    if isinstance(v, str):
-        m = _re.match(r"^(-?\d+(?:\.\d+)?)s$", v)
-        if not m:
-            raise ValueError(f"Invalid duration: {v}")
-        return _datetime.timedelta(seconds=float(m.group(1)))
-    if isinstance(v, _datetime.timedelta):
-        return v
-    raise ValueError(f"Cannot parse duration from {type(v)}")
 
+def _pb2_via_wire(encode, decode):
+    def get(sub):
+        return decode(sub.SerializeToString())
 
-def _serialize_duration(v):
-    total = v.total_seconds()
-    if total == int(total):
-        return f"{int(total)}s"
-    return f"{total}s"
+    def put(sub, v):
+        sub.ParseFromString(bytes(encode(v)))
 
+    return get, put
 
-ProtoDuration = _Annotated[
-    _datetime.timedelta,
-    _BeforeValidator(_parse_duration),
-    _PlainSerializer(_serialize_duration, return_type=str, when_used="json"),
-]
 
+def _pb2_unsupported_any(*_):
+    raise ValueError("google.protobuf.Any is not supported by the pb2 converters")
 
-def _require_unique(v):
-    if len(v) != len(set(v)):
-        raise ValueError("list items must be unique")
-    return v
 
+_PB2_WRAPPER = (_pb2_get_wrapper, _pb2_put_wrapper)
 
-def _make_in_validator(valid_values):
-    def _validate(v):
-        if v not in valid_values:
-            raise ValueError(f"value must be one of {sorted(valid_values)}")
-        return v
+_WELL_KNOWN_PB2 = {
+    "google.protobuf.Timestamp": (_pb2_get_timestamp, _pb2_put_timestamp),
+    "google.protobuf.Duration": (_pb2_get_duration, _pb2_put_duration),
+    "google.protobuf.Struct": _pb2_via_wire(_encode_struct, _decode_struct),
+    "google.protobuf.Value": _pb2_via_wire(_encode_value, _decode_value),
+    "google.protobuf.ListValue": _pb2_via_wire(_encode_list_value, _decode_list_value),
+    "google.protobuf.FieldMask": (_pb2_get_field_mask, _pb2_put_field_mask),
+    "google.protobuf.Empty": (lambda sub: None, lambda sub, v: None),
+    "google.protobuf.Any": (_pb2_unsupported_any, _pb2_unsupported_any),
+    "google.protobuf.BoolValue": _PB2_WRAPPER,
+    "google.protobuf.Int32Value": _PB2_WRAPPER,
+    "google.protobuf.Int64Value": _PB2_WRAPPER,
+    "google.protobuf.UInt32Value": _PB2_WRAPPER,
+    "google.protobuf.UInt64Value": _PB2_WRAPPER,
+    "google.protobuf.FloatValue": _PB2_WRAPPER,
+    "google.protobuf.DoubleValue": _PB2_WRAPPER,
+    "google.protobuf.StringValue": _PB2_WRAPPER,
+    "google.protobuf.BytesValue": _PB2_WRAPPER,
+}
 
-    return _validate
+# Distinct fields sets kept per frozen model for instances to share.
+_MAX_SHARED_FIELDS_SETS = 1024
 
+# FieldMask projections kept per model, by mask.
+_MAX_PROJECTIONS = 256
 
-def _make_not_in_validator(excluded_values):
-    def _validate(v):
-        if v in excluded_values:
-            raise ValueError(f"value must not be one of {sorted(excluded_values)}")
-        return v
+# The Annotated form of a field validator, by mode.
+_FIELD_VALIDATORS = {
+    "after": _AfterValidator,
+    "before": _BeforeValidator,
+    "plain": _PlainValidator,
+    "wrap": _WrapValidator,
+}
 
-    return _validate
-`
 
-// Each per-validator constant starts with two newlines so that when appended
-// after content that ends with \n, the result has exactly two blank lines
-// before the function definition (ruff E302).
+def _hashable(value):
+    """Return value, with lists and dicts turned into tuples and frozensets."""
+    if isinstance(value, list):
+        return tuple(map(_hashable, value))
+    if isinstance(value, dict):
+        return frozenset([(k, _hashable(v)) for k, v in value.items()])
+    return value
+
+
+def _mask_paths(field_mask):
+    """Return FieldMask paths as a tuple, splitting the ProtoJSON string form."""
+    if isinstance(field_mask, str):
+        return tuple(field_mask.split(",")) if field_mask else ()
+    return tuple(field_mask)
+
+
+def _mask_tree(paths):
+    """Return FieldMask paths as a tree of dicts, None marking a whole field."""
+    tree = {}
+    for path in paths:
+        node = tree
+        *parents, last = path.split(".")
+        for segment in parents:
+            node = node.setdefault(segment, {})
+            if node is None:
+                break
+        else:
+            node[last] = None
+    return tree
+
+
+class _Projection:
+    """The fields of a message that a FieldMask selects.
+
+    typed_dict validates the selected fields of ProtoJSON data and ignores
+    the others; build turns its output into a model instance.
+    """
+
+    __slots__ = ("typed_dict", "adapter", "_wire", "_fields")
+
+    def __init__(self, wire, typed_dict, fields):
+        self.typed_dict = typed_dict
+        self.adapter = None
+        self._wire = wire
+        self._fields = fields
+
+    def build(self, data):
+        values = {}
+        for key, name, nested in self._fields:
+            if key in data:
+                v = data[key]
+                values[name] = v if nested is None or v is None else nested.build(v)
+        return self._wire.instance(values)
+
+
+class ProtoFieldMask:
+    """A FieldMask compiled against a message class.
+
+    Built by Model.proto_field_mask(). paths lists the selected fields by
+    their ProtoJSON keys. Merges follow the FieldMask rules of the protobuf
+    runtimes: a path through a message field only applies when the source
+    sets it, masked repeated fields and maps are appended to and updated,
+    and masked message fields are merged unless replace_message_field is
+    set. Nested messages are never changed in place: merged ones are new
+    instances, and those taken from the source are deep copies.
+    """
+
+    __slots__ = ("_fields", "_wire", "paths")
+
+    def __init__(self, wire, tree):
+        self.paths = []
+        self._wire = wire
+        self._fields = []
+        for entry, subtree, nested_wire in wire._mask_fields(tree):
+            key, name, kind, type_name, _, _ = entry
+            nested = None
+            if nested_wire is not None:
+                nested = ProtoFieldMask(nested_wire, subtree)
+                self.paths.extend(f"{key}.{path}" for path in nested.paths)
+            else:
+                self.paths.append(key)
+            label, _, base = kind.rpartition(" ")
+            messages = base in ("message", "message>")
+            if kind.startswith("map<"):
+                kind = "map"
+            elif label in ("packed", "repeated"):
+                kind = "repeated"
+            elif base == "message":
+                kind = "message"
+            else:
+                kind = "value"
+            self._fields.append((key, name, kind, type_name, nested, messages))
+
+    def project(self, message):
+        """Return a new message holding only the masked fields of message."""
+        return self._merged(None, message, False, False)
+
+    def merge_into(
+        self,
+        destination,
+        source,
+        replace_message_field: bool = False,
+        replace_repeated_field: bool = False,
+    ) -> None:
+        """Merge the masked fields of source into destination, in place."""
+        if destination.model_config.get("frozen"):
+            raise TypeError(f"{type(destination).__name__} is frozen")
+        merged = self._merged(
+            destination, source, replace_message_field, replace_repeated_field
+        )
+        _object_setattr(destination, "__dict__", merged.__dict__)
+        _object_setattr(
+            destination, "__pydantic_fields_set__", set(merged.__pydantic_fields_set__)
+        )
+
+    def diff(self, a, b) -> list:
+        """Return the paths of the masked fields whose values differ in a and b.
+
+        Message fields set on both sides are compared field by field, so the
+        paths name the innermost fields that differ.
+        """
+        paths = []
+        self._diff(a, b, "", paths)
+        return paths
+
+    def _diff(self, a, b, prefix, paths):
+        for key, name, kind, type_name, nested, _ in self._fields:
+            va, vb = getattr(a, name), getattr(b, name)
+            if va == vb:
+                continue
+            if nested is None and kind == "message" and None not in (va, vb):
+                nested = self._wire._resolve(type_name).__proto_wire__.field_mask()
+            if nested is None:
+                paths.append(prefix + key)
+                continue
+            empty = nested._wire.instance({})
+            nested._diff(
+                empty if va is None else va,
+                empty if vb is None else vb,
+                prefix + key + ".",
+                paths,
+            )
+
+    def _merged(self, destination, source, replace_message, replace_repeated):
+        """Return a new instance: destination, or an empty message when it is
+        None, with the masked fields of source merged in.
+        """
+        wire = self._wire
+        values = {}
+        if destination is not None:
+            fields_set = destination.__pydantic_fields_set__
+            values = {k: v for k, v in destination.__dict__.items() if k in fields_set}
+        for _, name, kind, type_name, nested, messages in self._fields:
+            v = getattr(source, name)
+            old = None if destination is None else getattr(destination, name)
+            if nested is not None:
+                if v is None:
+                    continue
+                v = nested._merged(old, v, replace_message, replace_repeated)
+            elif kind == "repeated":
+                if messages:
+                    v = [m.__deepcopy__() for m in v]
+                v = list(v) if replace_repeated or old is None else old + v
+            elif kind == "map":
+                if messages:
+                    v = {k: m.__deepcopy__() for k, m in v.items()}
+                v = dict(v) if replace_repeated or old is None else {**old, **v}
+            elif kind == "message" and v is not None:
+                if replace_message or old is None:
+                    v = v.__deepcopy__()
+                else:
+                    v = wire._resolve(type_name).__proto_wire__.merged(old, v)
+            elif kind == "message" and not replace_message:
+                continue
+            wire.set_value(values, name, v)
+        return wire.instance(values)
+
+
+class _SharedFieldsSet(set):
+    """A fields set shared by the frozen instances of a model; read-only.
+
+    pydantic-core serializes with exclude_unset only from a set, so the
+    shared set cannot be a frozenset; its mutating methods raise instead.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args):
+        raise TypeError("the fields set of a frozen message is shared and read-only")
+
+    add = discard = remove = pop = clear = update = _read_only
+    difference_update = intersection_update = _read_only
+    symmetric_difference_update = _read_only
+    __ior__ = __iand__ = __isub__ = __ixor__ = _read_only
+
+
+class ProtoWire:
+    """Protobuf binary codec of a generated message.
+
+    Each field is a (number, name, kind[, type]) tuple. kind is a proto scalar
+    type, "enum", "message", a well-known type name or "map<K, V>", optionally
+    prefixed by "optional", "repeated" or "packed". type is the dotted name of
+    the enum or message class, resolved in the module that defines the model
+    on first use.
+
+    The same table drives the conversion from and to protobuf message objects
+    (from_pb2 and to_pb2); their attribute names are looked up by field number
+    in the message descriptor.
+
+    unions maps the members of oneofs modelled as discriminated unions, by
+    Python name and ProtoJSON key, to the attribute holding the union and the
+    branch model of the member. Such members are read through properties and
+    folded into, or flattened out of, their union attribute.
+    """
+
+    def __init__(self, *fields, oneofs=None, unions=None):
+        self._fields = fields
+        self._oneofs = oneofs or {}
+        self._oneof_members = frozenset(
+            name for members in self._oneofs.values() for name in members
+        )
+        self._unions = unions or {}
+        self._union_keys = frozenset(self._unions)
+        self._union_cases = {
+            key: branch.model_fields["case"].default
+            for key, (_, branch) in self._unions.items()
+        }
+        self._union_aliases = {
+            case: key for key, case in self._union_cases.items() if key != case
+        }
+        self._union_attrs = {
+            self._unions[members[0]][0]: name
+            for name, members in self._oneofs.items()
+            if members[0] in self._unions
+        }
+        self._model = None
+        self._compiled = False
+        self._writers = []
+        self._readers = {}
+        self._pb2 = {}
+        self._json_compiled = False
+        self._json_decoders = {}
+        self._json_fast = False
+        self._json_defaults = {}
+        self._json_factories = []
+        self._json_required = []
+        self._json_frozen = False
+        self._fields_sets = {}
+        self._projections = {}
+        self._field_masks = {}
+        self._table = None
+        self._mergers = None
+        self._zero_enums = None
+
+    def __set_name__(self, owner, name):
+        self._model = owner
+
+    def encode(self, message) -> bytes:
+        """Encode a model instance to wire-format bytes."""
+        if not self._compiled:
+            self._compile()
+        out = bytearray()
+        for write in self._writers:
+            write(out, message)
+        return bytes(out)
+
+    def decode(self, data: bytes) -> dict:
+        """Decode wire-format bytes into a dict of field values.
+
+        Unknown fields are skipped. The result is meant for model_validate;
+        nested messages are decoded to dicts as well. A message field that
+        occurs more than once is merged, as the protobuf runtimes do.
+        """
+        if not self._compiled:
+            self._compile()
+        data = bytes(data)
+        readers = self._readers
+        values = {}
+        # Raw bytes of the message fields read so far, by name.
+        messages = {}
+        try:
+            for number, wire_type, raw in _iter_fields(data):
+                read = readers.get(number)
+                if read is not None:
+                    read(values, wire_type, raw, messages)
+        except (IndexError, _struct.error):
+            raise ValueError("truncated message") from None
+        return values
+
+    def construct(self, data: dict):
+        """Build a model instance from trusted ProtoJSON dict data.
+
+        Nothing is validated: values are only converted from their ProtoJSON
+        form (int64 strings, base64 bytes, Timestamp and Duration strings,
+        nested messages) and set on the instance like model_construct does.
+        Unknown keys and null values are dropped.
+        """
+        if not self._json_compiled:
+            self._compile_json()
+        decoders = self._json_decoders
+        values = {}
+        for key, v in data.items():
+            entry = decoders.get(key)
+            if entry is not None and v is not None:
+                name, decode = entry
+                values[name] = v if decode is None else decode(v)
+        return self.instance(values)
+
+    def instance(self, values):
+        """Build a model instance from field values, like model_construct.
+
+        values are keyed by Python name; members of discriminated unions are
+        folded into their union attribute.
+        """
+        if not self._json_compiled:
+            self._compile_json()
+        if not self._union_keys.isdisjoint(values):
+            for name in self._union_keys.intersection(values):
+                attr, branch = self._unions[name]
+                values[attr] = branch.model_construct(value=values.pop(name))
+        model = self._model
+        if not self._json_fast:
+            instance = model.model_construct(**values)
+        else:
+            # model_construct, minus the per-field alias and default lookups;
+            # copying the defaults keeps the field order of __dict__.
+            fields_values = self._json_defaults.copy()
+            fields_values.update(values)
+            for name, factory in self._json_factories:
+                if name not in values:
+                    fields_values[name] = factory()
+            for name in self._json_required:
+                if name not in values:
+                    del fields_values[name]
+            instance = model.__new__(model)
+            _object_setattr(instance, "__dict__", fields_values)
+            _object_setattr(instance, "__pydantic_fields_set__", set(values))
+            _object_setattr(instance, "__pydantic_extra__", None)
+            _object_setattr(instance, "__pydantic_private__", None)
+        if self._json_frozen:
+            self.share_fields_set(instance)
+        return instance
+
+    def set_value(self, values, name, value):
+        """Set field name in values, the field values of a message to build.
+
+        None unsets the field. A oneof member that is set unsets the other
+        members of its oneof.
+        """
+        union = self._unions.get(name)
+        if value is None:
+            values.pop(name, None)
+            if union is not None:
+                branch = values.get(union[0])
+                if branch is not None and branch.case == name:
+                    del values[union[0]]
+            return
+        if name in self._oneof_members:
+            for members in self._oneofs.values():
+                if name in members:
+                    for member in members:
+                        values.pop(member, None)
+            if union is not None:
+                values.pop(union[0], None)
+        values[name] = value
+
+    def project_json(self, data, field_mask, **kwargs):
+        """Build a model instance from the fields field_mask selects in data.
+
+        field_mask is a list of FieldMask paths or their comma-separated
+        ProtoJSON form. Each mask is compiled once into a TypedDict of the
+        selected fields, nested messages included, so pydantic-core validates
+        those and skips the rest of the JSON. The instance is then assembled
+        like construct does: unselected fields keep their defaults and
+        model-level checks (oneofs, CEL) do not run.
+        """
+        key = _mask_paths(field_mask)
+        projection = self._projections.get(key)
+        if projection is None:
+            projection = self._projection(_mask_tree(key))
+            projection.adapter = _TypeAdapter(projection.typed_dict)
+            if len(self._projections) < _MAX_PROJECTIONS:
+                self._projections[key] = projection
+        return projection.build(projection.adapter.validate_json(data, **kwargs))
+
+    def field_mask(self, paths=None):
+        """Return paths compiled into a ProtoFieldMask, once per mask.
+
+        paths is a list of FieldMask paths or their comma-separated ProtoJSON
+        form; None selects every field of the message.
+        """
+        key = None if paths is None else _mask_paths(paths)
+        mask = self._field_masks.get(key)
+        if mask is None:
+            if key is None:
+                tree = dict.fromkeys(name for _, name, *_ in self._fields)
+            else:
+                tree = _mask_tree(key)
+            mask = ProtoFieldMask(self, tree)
+            if len(self._field_masks) < _MAX_PROJECTIONS:
+                self._field_masks[key] = mask
+        return mask
+
+    def _field_table(self):
+        # Fields by Python name and ProtoJSON key: (key, name, kind, type
+        # name, FieldInfo, required).
+        table = self._table
+        if table is not None:
+            return table
+        model = self._model
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+        table = {}
+        for _, name, kind, *type_name in self._fields:
+            type_name = type_name[0] if type_name else None
+            field = model.model_fields.get(name)
+            if field is None:
+                # A member of a discriminated union: the value of its branch.
+                field = self._unions[name][1].model_fields["value"]
+                key, required = self._union_aliases.get(name, name), False
+            else:
+                key, required = field.alias or name, field.is_required()
+            entry = (key, name, kind, type_name, field, required)
+            table[name] = table[key] = entry
+        self._table = table
+        return table
+
+    def _mask_fields(self, tree):
+        """Resolve the top level of a FieldMask tree against the field table.
+
+        Yields (entry, subtree, wire): wire is the ProtoWire of the message
+        whose fields subtree selects, or None when the whole field is.
+        """
+        table = self._field_table()
+        model = self._model
+        for segment, subtree in tree.items():
+            entry = table.get(segment)
+            if entry is None:
+                raise ValueError(f"{model.__name__} has no field {segment!r}")
+            if subtree is None:
+                yield entry, None, None
+            elif entry[2] == "message":
+                yield entry, subtree, self._resolve(entry[3]).__proto_wire__
+            else:
+                raise ValueError(
+                    f"{model.__name__}.{entry[1]} is not a singular message"
+                )
+
+    def _field_validators(self, name):
+        """Return the model's field validators of name, as Annotated metadata.
+
+        A projection validates into a TypedDict, which the model's decorators
+        do not reach; CEL field rules among them must still hold.
+        """
+        return [
+            _FIELD_VALIDATORS[d.info.mode](d.func)
+            for d in self._model.__pydantic_decorators__.field_validators.values()
+            if name in d.info.fields or "*" in d.info.fields
+        ]
+
+    def _projection(self, tree):
+        annotations = {}
+        fields = []
+        for entry, subtree, wire in self._mask_fields(tree):
+            key, name, _, _, field, required = entry
+            if wire is None:
+                nested = None
+                typ = field.annotation
+                metadata = [*field.metadata, *self._field_validators(name)]
+                if metadata:
+                    typ = _Annotated[(typ, *metadata)]
+            else:
+                nested = wire._projection(subtree)
+                typ = nested.typed_dict | None
+            annotations[key] = typ if required else _NotRequired[typ]
+            fields.append((key, name, nested))
+        model = self._model
+        typed_dict = _with_config(model.model_config)(
+            _TypedDict(model.__name__ + "Projection", annotations)
+        )
+        return _Projection(self, typed_dict, fields)
+
+    def typed_dict(self):
+        """Return the TypedDict mirror of the model, generated by typed_dicts."""
+        return self._resolve(self._model.__qualname__.replace(".", "") + "Dict")
+
+    def hash(self, message) -> int:
+        """Hash the field values of a frozen message.
+
+        Lists and maps are hashed as tuples and frozensets of their items;
+        nested messages, frozen as well, hash themselves.
+        """
+        return hash(tuple(map(_hashable, message.__dict__.values())))
 
-const protoTypesEmailFunc = `
+    def share_fields_set(self, message):
+        """Swap the fields set of a frozen message for an equal, shared one.
 
-def _validate_email(v: str) -> str:
-    if not v:
-        return v
-    from pydantic.networks import validate_email as _pydantic_validate_email
+        A frozen message never adds to its fields set, so instances with the
+        same fields set can hold one read-only set instead of a set each. Only
+        instances of frozen classes share: a mutable subclass adds to and
+        discards from its own set. Returns message.
+        """
+        if not type(message).model_config.get("frozen"):
+            return message
+        key = frozenset(message.__pydantic_fields_set__)
+        shared = self._fields_sets.get(key)
+        if shared is None:
+            if len(self._fields_sets) >= _MAX_SHARED_FIELDS_SETS:
+                return message
+            shared = self._fields_sets[key] = _SharedFieldsSet(key)
+        _object_setattr(message, "__pydantic_fields_set__", shared)
+        return message
+
+    @staticmethod
+    def own_fields_set(message):
+        """Give a copy of a frozen message a fields set of its own.
+
+        model_copy(update=...) adds the updated fields to the copy's set,
+        which cannot be the read-only shared one. Returns message.
+        """
+        fields_set = set(message.__pydantic_fields_set__)
+        _object_setattr(message, "__pydantic_fields_set__", fields_set)
+        return message
 
-    _pydantic_validate_email(v)
-    return v
-`
+    def check_oneofs(self, message):
+        """Raise ValueError when more than one member of a oneof is set.
 
-const protoTypesURIFunc = `
+        A member is set when it is in model_fields_set and not None.
+        """
+        fields_set = message.__pydantic_fields_set__
+        if self._oneof_members.isdisjoint(fields_set):
+            return message
+        values = message.__dict__
+        for name, members in self._oneofs.items():
+            found = [m for m in members if m in fields_set and values[m] is not None]
+            if len(found) > 1:
+                raise ValueError(
+                    f"oneof {name} has more than one member set: {', '.join(found)}"
+                )
+        return message
+
+    def which_oneof(self, message, name):
+        """Return the name of the member of oneof name set on message, or None.
+
+        A oneof of plain fields is scanned member by member: a record kept at
+        validation would go stale on assignment. A discriminated union holds
+        its case, which is read directly.
+        """
+        members = self._oneofs.get(name)
+        if members is None:
+            raise ValueError(f"{self._model.__name__} has no oneof {name!r}")
+        if members[0] in self._unions:
+            branch = message.__dict__[self._unions[members[0]][0]]
+            return None if branch is None else branch.case
+        fields_set = message.__pydantic_fields_set__
+        values = message.__dict__
+        for member in members:
+            if member in fields_set and values[member] is not None:
+                return member
+        return None
+
+    def clear_oneof(self, message, name):
+        """Unset every member of oneof name on message."""
+        members = self._oneofs.get(name)
+        if members is None:
+            raise ValueError(f"{self._model.__name__} has no oneof {name!r}")
+        if message.model_config.get("frozen"):
+            raise TypeError(f"{self._model.__name__} is frozen")
+        if members[0] in self._unions:
+            members = (self._unions[members[0]][0],)
+        fields_set = message.__pydantic_fields_set__
+        values = message.__dict__
+        for member in members:
+            values[member] = None
+            fields_set.discard(member)
+
+    def merge_from(self, message, other):
+        """Merge other into message in place, as MergeFrom does.
+
+        A field other sets overwrites that of message when it is not None, or
+        not the zero value for fields without presence. Repeated fields are
+        appended to, maps updated key by key and message fields merged field
+        by field; well-known types are values and replaced. Nested messages
+        are never changed in place: a merged one is a new instance, and one
+        taken from other is a deep copy, so the two messages share none.
+        """
+        if message.model_config.get("frozen"):
+            raise TypeError(f"{self._model.__name__} is frozen")
+        if not isinstance(other, self._model):
+            raise TypeError(
+                f"cannot merge {type(other).__name__} into {self._model.__name__}"
+            )
+        self._merge(message, other)
+
+    def merged(self, message, other):
+        """Return a copy of message with other merged in, as by merge_from."""
+        message = message.__copy__()
+        self._merge(message, other)
+        if self._json_frozen:
+            self.share_fields_set(message)
+        return message
+
+    def _merge(self, message, other):
+        mergers = self._mergers
+        if mergers is None:
+            mergers = self._mergers = self._compile_mergers()
+        values = message.__dict__
+        fields_set = message.__pydantic_fields_set__
+        source = other.__dict__
+        # A field other does not set holds its default, which merges to nothing.
+        for name in other.__pydantic_fields_set__:
+            merge = mergers.get(name)
+            if merge is not None:
+                merge(values, fields_set, source[name])
+
+    def fold_unions(self, data):
+        """Move the oneof members in input data into their union attributes.
+
+        Each member key becomes {"case": name, "value": value} under the
+        attribute, so the discriminated union validates only that branch.
+        """
+        if not isinstance(data, dict) or self._union_keys.isdisjoint(data):
+            return data
+        unions = self._unions
+        data = dict(data)
+        for key in [key for key in data if key in unions]:
+            value = data.pop(key)
+            if value is None:
+                continue
+            attr, _ = unions[key]
+            if data.get(attr) is not None:
+                name = self._union_attrs[attr]
+                raise ValueError(f"oneof {name} has more than one member set")
+            data[attr] = {"case": self._union_cases[key], "value": value}
+        return data
+
+    def flatten_unions(self, message, data, info):
+        """Replace each union attribute in serialized data by its member key."""
+        values = message.__dict__
+        for attr in self._union_attrs:
+            dumped = data.pop(attr, None)
+            branch = values[attr]
+            if isinstance(dumped, dict) and "value" in dumped and branch is not None:
+                key = branch.case
+                if info.by_alias:
+                    key = self._union_aliases.get(key, key)
+                data[key] = dumped["value"]
+        return self.omit_zero_enums(message, data, info)
+
+    def omit_zero_enums(self, message, data, info):
+        """Drop enum fields without presence at their zero value from data.
+
+        Such fields default to None, so exclude_defaults keeps a zero that
+        was set; ProtoJSON omits it as it does every other zero value.
+        """
+        if not info.exclude_defaults:
+            return data
+        zeros = self._zero_enums
+        if zeros is None:
+            zeros = self._zero_enums = self._compile_zero_enums()
+        for name, alias, zero in zeros:
+            key = alias if info.by_alias else name
+            if data.get(key) == zero:
+                del data[key]
+        return data
+
+    def union_member(self, message, name):
+        """Return the value of union member name on message, or None."""
+        attr, branch = self._unions[name]
+        value = message.__dict__[attr]
+        return value.value if isinstance(value, branch) else None
+
+    @staticmethod
+    def iter_delimited(fp, chunk_size=65536):
+        """Yield the payloads of a varint length-delimited binary stream.
+
+        fp is read chunk_size bytes at a time; a payload that does not fit
+        in a chunk is read in one go.
+        """
+        buf = b""
+        pos = 0
+        while True:
+            need = chunk_size
+            if pos < len(buf):
+                try:
+                    size, start = _read_varint(buf, pos)
+                except IndexError:
+                    pass
+                else:
+                    end = start + size
+                    if end <= len(buf):
+                        yield buf[start:end]
+                        pos = end
+                        continue
+                    need = max(need, end - len(buf))
+            chunk = fp.read(need)
+            if not chunk:
+                if pos < len(buf):
+                    raise ValueError("truncated message")
+                return
+            buf = buf[pos:] + chunk
+            pos = 0
+
+    @staticmethod
+    def write_delimited(fp, payload):
+        """Write payload to fp, prefixed by its varint length."""
+        out = bytearray()
+        _write_len(out, payload)
+        fp.write(out)
+
+    def from_pb2(self, message) -> dict:
+        """Copy the fields of a protobuf message object into a dict of values.
+
+        Like decode, the result is meant for model_validate and leaves out the
+        fields without presence that hold their default, so that they are not
+        in model_fields_set.
+        """
+        table = self._pb2.get(message.DESCRIPTOR)
+        if table is None:
+            table = self._compile_pb2(message.DESCRIPTOR)
+        values = {}
+        for get, _ in table:
+            get(values, message)
+        return values
+
+    def to_pb2(self, message, target):
+        """Copy the fields of a model instance into the protobuf message target."""
+        table = self._pb2.get(target.DESCRIPTOR)
+        if table is None:
+            table = self._compile_pb2(target.DESCRIPTOR)
+        for _, put in table:
+            put(target, message)
+        return target
+
+    def _resolve(self, path):
+        obj = _sys.modules[self._model.__module__]
+        for part in path.split("."):
+            obj = getattr(obj, part)
+        return obj
 
-def _validate_uri(v: str) -> str:
-    if not v:
-        return v
-    _url_adapter.validate_python(v)
+    def _kind(self, kind, type_name):
+        if kind in _SCALAR_KINDS:
+            return _SCALAR_KINDS[kind]
+        if kind in _WELL_KNOWN_KINDS:
+            return _WELL_KNOWN_KINDS[kind]
+        cls = self._resolve(type_name)
+        if kind == "message":
+            wire = cls.__proto_wire__
+            return _message_kind(wire.encode, wire.decode)
+        # Enums: string-valued enums carry their numbers, integer ones are numbers.
+        numbers = getattr(cls, "__proto_numbers__", None)
+        if numbers is None:
+            return _varint_kind(
+                lambda v: v & 0xFFFFFFFFFFFFFFFF,
+                _to_int32,
+                lambda v: v is None or v == 0,
+            )
+        names = {number: name for name, number in numbers.items()}
+
+        def to_raw(v):
+            return numbers[v] & 0xFFFFFFFFFFFFFFFF
+
+        def from_raw(v):
+            v = _to_int32(v)
+            return names.get(v, v)
+
+        def is_default(v):
+            return v is None or numbers[v] == 0
+
+        return _varint_kind(to_raw, from_raw, is_default)
+
+    def _compile(self):
+        writers = []
+        readers = {}
+        siblings = {
+            name: members for members in self._oneofs.values() for name in members
+        }
+        for number, name, kind, *type_name in sorted(self._fields):
+            type_name = type_name[0] if type_name else None
+            if kind.startswith("map<"):
+                key_kind, _, value_kind = kind[4:-1].partition(", ")
+                key_spec = self._kind(key_kind, None)
+                value_spec = self._kind(value_kind, type_name)
+                writer, reader = self._map_field(number, name, key_spec, value_spec)
+            else:
+                label, _, kind = kind.rpartition(" ")
+                writer, reader = _field(
+                    number,
+                    name,
+                    label,
+                    self._kind(kind, type_name),
+                    siblings.get(name, ()),
+                )
+            writers.append(writer)
+            readers[number] = reader
+        self._readers = readers
+        self._writers = writers
+        self._compiled = True
+
+    def _compile_mergers(self):
+        # Field kinds as the binary codec reads them: the merge of two
+        # messages is the message decoded from their concatenated encodings.
+        mergers = {}
+        members = {}
+        siblings = {
+            name: tuple(m for m in oneof if m != name)
+            for oneof in self._oneofs.values()
+            for name in oneof
+        }
+        for _, name, kind, *type_name in self._fields:
+            type_name = type_name[0] if type_name else None
+            label, _, kind = kind.rpartition(" ")
+            if label.startswith("map<"):
+                label = "map"
+                kind = kind[:-1]
+            wire = None
+            if kind == "message" and label in ("", "optional"):
+                wire = self._resolve(type_name).__proto_wire__
+            if name in self._unions:
+                members[name] = wire
+                continue
+            if label in ("map", "packed", "repeated"):
+                is_default = None
+            elif label == "optional":
+                is_default = _is_none
+            else:
+                is_default = self._kind(kind, type_name)[3]
+            mergers[name] = _merge_field(
+                name, label, is_default, wire, kind == "message", siblings.get(name, ())
+            )
+        for attr in self._union_attrs:
+            mergers[attr] = _merge_union(attr, members)
+        return mergers
+
+    def _compile_zero_enums(self):
+        zeros = []
+        fields = self._model.model_fields
+        for _, name, kind, *type_name in self._fields:
+            if kind != "enum":
+                continue
+            # Values are stored as the enum's values: names, or numbers.
+            numbers = getattr(self._resolve(type_name[0]), "__proto_numbers__", None)
+            zero = 0
+            if numbers is not None:
+                zero = next(k for k, v in numbers.items() if v == 0)
+            zeros.append((name, fields[name].alias or name, zero))
+        return zeros
+
+    def _map_field(self, number, name, key_kind, value_kind):
+        tag = _tag(number, _WIRE_LEN)
+        key_wire, write_key, read_key, _ = key_kind
+        value_wire, write_value, read_value, _ = value_kind
+        key_tag = bytes([0x08 | key_wire])
+        value_tag = bytes([0x10 | value_wire])
+        key_zero = _default_value(key_kind)
+        value_zero = _default_value(value_kind)
+
+        def write(out, message):
+            for k, v in getattr(message, name).items():
+                entry = bytearray(key_tag)
+                write_key(entry, k)
+                entry += value_tag
+                write_value(entry, v)
+                out += tag
+                _write_len(out, entry)
+
+        def read(values, wire_type, raw, messages):
+            k, v = key_zero, value_zero
+            for entry_number, _, item in _iter_fields(raw):
+                if entry_number == 1:
+                    k = read_key(item)
+                elif entry_number == 2:
+                    v = read_value(item)
+            values.setdefault(name, {})[k] = v
+
+        return write, read
+
+    def _pb2_kind(self, kind, type_name):
+        if kind in _SCALAR_KINDS:
+            return "scalar", None, None
+        if kind in _WELL_KNOWN_PB2:
+            return ("message", *_WELL_KNOWN_PB2[kind])
+        cls = self._resolve(type_name)
+        if kind == "message":
+            wire = cls.__proto_wire__
+
+            def put(sub, v):
+                wire.to_pb2(v, sub)
+
+            return "message", wire.from_pb2, put
+        numbers = getattr(cls, "__proto_numbers__", None)
+        if numbers is None:
+            return "enum", None, None
+        names = {number: name for name, number in numbers.items()}
+
+        def get(v):
+            return names.get(v, v)
+
+        return "enum", get, numbers.__getitem__
+
+    def _json_kind(self, kind, type_name):
+        if kind in _JSON_DECODERS:
+            return _JSON_DECODERS[kind]
+        if kind == "message":
+            construct = self._resolve(type_name).__proto_wire__.construct
+
+            def decode(v):
+                return construct(v) if isinstance(v, dict) else v
+
+            return decode
+        return None
+
+    def _compile_json(self):
+        decoders = {}
+        model_fields = self._model.model_fields
+        for _, name, kind, *type_name in self._fields:
+            type_name = type_name[0] if type_name else None
+            if kind.startswith("map<"):
+                key_kind, _, value_kind = kind[4:-1].partition(", ")
+                decode = _json_map(
+                    _JSON_KEY_DECODERS.get(key_kind),
+                    self._json_kind(value_kind, type_name),
+                )
+            else:
+                label, _, kind = kind.rpartition(" ")
+                decode = self._json_kind(kind, type_name)
+                if label in ("packed", "repeated"):
+                    decode = _json_list(decode)
+            decoders[name] = (name, decode)
+            field = model_fields.get(name)
+            if field is not None and field.alias:
+                decoders[field.alias] = (name, decode)
+        for case, alias in self._union_aliases.items():
+            decoders[alias] = decoders[case]
+        self._json_decoders = decoders
+        # Models that need more than plain field values go through
+        # model_construct itself.
+        model = self._model
+        self._json_frozen = bool(model.model_config.get("frozen"))
+        if not (
+            model.__private_attributes__
+            or model.__pydantic_post_init__
+            or model.model_config.get("extra") == "allow"
+        ):
+            for name, field in model_fields.items():
+                self._json_defaults[name] = field.default
+                if field.default_factory is not None:
+                    self._json_factories.append((name, field.default_factory))
+                elif field.is_required():
+                    self._json_required.append(name)
+            self._json_fast = True
+        self._json_compiled = True
+
+    def _compile_pb2(self, descriptor):
+        table = []
+        for number, name, kind, *type_name in self._fields:
+            type_name = type_name[0] if type_name else None
+            attr = descriptor.fields_by_number[number].name
+            if kind.startswith("map<"):
+                value_kind = kind[4:-1].partition(", ")[2]
+                spec = self._pb2_kind(value_kind, type_name)
+                table.append(_pb2_map_field(attr, name, spec))
+            else:
+                label, _, kind = kind.rpartition(" ")
+                spec = self._pb2_kind(kind, type_name)
+                table.append(_pb2_field(attr, name, label, spec))
+        self._pb2[descriptor] = table
+        return table
+
+
+def _tag(number, wire_type):
+    out = bytearray()
+    _write_varint(out, number << 3 | wire_type)
+    return bytes(out)
+
+
+def _field(number, name, label, spec, siblings):
+    wire_type, write_value, read_value, is_default = spec
+    tag = _tag(number, wire_type)
+    presence = label == "optional" or is_default is _is_none
+
+    if label == "packed":
+        packed_tag = _tag(number, _WIRE_LEN)
+
+        def write(out, message):
+            items = getattr(message, name)
+            if items:
+                payload = bytearray()
+                for v in items:
+                    write_value(payload, v)
+                out += packed_tag
+                _write_len(out, payload)
+
+    elif label == "repeated":
+
+        def write(out, message):
+            for v in getattr(message, name):
+                out += tag
+                write_value(out, v)
+
+    elif presence:
+
+        def write(out, message):
+            v = getattr(message, name)
+            if v is not None:
+                out += tag
+                write_value(out, v)
+
+    else:
+
+        def write(out, message):
+            v = getattr(message, name)
+            if not is_default(v):
+                out += tag
+                write_value(out, v)
+
+    if label in ("packed", "repeated"):
+
+        def read(values, wire_type, raw, messages):
+            items = values.setdefault(name, [])
+            if wire_type == _WIRE_LEN and spec[0] != _WIRE_LEN:
+                items.extend(map(read_value, _iter_packed(spec[0], raw)))
+            else:
+                items.append(read_value(raw))
+
+    elif is_default is _is_none:
+        # The concatenation of two encodings of a message decodes to their
+        # merge, so a repeated message field is read from all its records.
+
+        def read(values, wire_type, raw, messages):
+            previous = messages.get(name)
+            for sibling in siblings:
+                values.pop(sibling, None)
+                messages.pop(sibling, None)
+            if previous is not None:
+                raw = previous + raw
+            messages[name] = raw
+            values[name] = read_value(raw)
+
+    else:
+
+        def read(values, wire_type, raw, messages):
+            for sibling in siblings:
+                values.pop(sibling, None)
+                messages.pop(sibling, None)
+            values[name] = read_value(raw)
+
+    return write, read
+
+
+def _merge_field(name, label, is_default, wire, messages, siblings):
+    """Return merge(values, fields_set, v), which merges v, the value of field
+    name in the source message, into the fields of the destination. Messages
+    taken from the source, when the field holds messages, are deep copies."""
+    if label == "map":
+
+        def merge(values, fields_set, v):
+            if v:
+                if messages:
+                    v = {k: m.__deepcopy__() for k, m in v.items()}
+                values[name] = {**values[name], **v}
+                fields_set.add(name)
+
+    elif label in ("packed", "repeated"):
+
+        def merge(values, fields_set, v):
+            if v:
+                if messages:
+                    v = [m.__deepcopy__() for m in v]
+                values[name] = values[name] + v
+                fields_set.add(name)
+
+    else:
+
+        def merge(values, fields_set, v):
+            if is_default(v):
+                return
+            for sibling in siblings:
+                values[sibling] = None
+                fields_set.discard(sibling)
+            if wire is not None:
+                old = values[name]
+                v = v.__deepcopy__() if old is None else wire.merged(old, v)
+            values[name] = v
+            fields_set.add(name)
+
+    return merge
+
+
+def _merge_union(attr, members):
+    """Return merge(values, fields_set, v) for the branch v of union attr.
+
+    members maps the member names to the ProtoWire of their message type, or
+    None for other types; a message member set on both sides is merged. The
+    branch taken from the source is a deep copy.
+    """
+
+    def merge(values, fields_set, v):
+        if v is None:
+            return
+        old = values[attr]
+        wire = members[v.case]
+        if wire is not None and old is not None and old.case == v.case:
+            v = type(v).model_construct(value=wire.merged(old.value, v.value))
+        else:
+            v = v.__deepcopy__()
+        values[attr] = v
+        fields_set.add(attr)
+
+    return merge
+
+
+def _pb2_field(attr, name, label, spec):
+    shape, get_value, put_value = spec
+
+    if label in ("packed", "repeated"):
+
+        def get(values, pb):
+            items = getattr(pb, attr)
+            if items:
+                values[name] = list(
+                    items if get_value is None else map(get_value, items)
+                )
+
+        if shape == "message":
+
+            def put(pb, message):
+                items = getattr(pb, attr)
+                for v in getattr(message, name):
+                    put_value(items.add(), v)
+
+        else:
+
+            def put(pb, message):
+                items = getattr(message, name)
+                getattr(pb, attr).extend(
+                    items if put_value is None else map(put_value, items)
+                )
+
+    elif shape == "message":
+
+        def get(values, pb):
+            if pb.HasField(attr):
+                values[name] = get_value(getattr(pb, attr))
+
+        def put(pb, message):
+            v = getattr(message, name)
+            if v is not None:
+                sub = getattr(pb, attr)
+                sub.SetInParent()
+                put_value(sub, v)
+
+    else:
+        presence = label == "optional"
+
+        # Like decode, leave fields without presence unset at their default.
+        def get(values, pb):
+            if presence and not pb.HasField(attr):
+                return
+            v = getattr(pb, attr)
+            if not presence and _is_default(v):
+                return
+            values[name] = v if get_value is None else get_value(v)
+
+        def put(pb, message):
+            v = getattr(message, name)
+            if v is not None:
+                setattr(pb, attr, v if put_value is None else put_value(v))
+
+    return get, put
+
+
+def _pb2_map_field(attr, name, spec):
+    shape, get_value, put_value = spec
+
+    def get(values, pb):
+        entries = getattr(pb, attr)
+        if not entries:
+            return
+        if get_value is None:
+            values[name] = dict(entries)
+        else:
+            values[name] = {k: get_value(v) for k, v in entries.items()}
+
+    def put(pb, message):
+        entries = getattr(pb, attr)
+        items = getattr(message, name)
+        if shape == "message":
+            for k, v in items.items():
+                put_value(entries[k], v)
+        elif put_value is None:
+            entries.update(items)
+        else:
+            entries.update({k: put_value(v) for k, v in items.items()})
+
+    return get, put
+
+
+# ProtoJSON decoders of the trusted construct path, for the kinds whose
+# ProtoJSON form differs from the model value. Values already in model form
+# are passed through.
+def _json_bytes(v):
+    if isinstance(v, str):
+        return _base64.b64decode(v + "=" * (-len(v) % 4), altchars=b"-_")
     return v
-`
 
-const protoTypesIPFunc = `
 
-def _validate_ip(v: str) -> str:
-    if not v:
-        return v
-    _ipaddress.ip_address(v)
-    return v
-`
+def _json_bool_key(v):
+    return v == "true" if isinstance(v, str) else v
+
+
+_JSON_DECODERS = {
+    "int64": int,
+    "uint64": int,
+    "sint64": int,
+    "fixed64": int,
+    "sfixed64": int,
+    "float": float,
+    "double": float,
+    "bytes": _json_bytes,
+    "google.protobuf.Timestamp": _parse_timestamp,
+    "google.protobuf.Duration": _parse_duration,
+    "google.protobuf.Int64Value": int,
+    "google.protobuf.UInt64Value": int,
+    "google.protobuf.FloatValue": float,
+    "google.protobuf.DoubleValue": float,
+    "google.protobuf.BytesValue": _json_bytes,
+}
 
-const protoTypesIPv4Func = `
+_JSON_KEY_DECODERS = {
+    kind: int
+    for kind in (
+        "int32",
+        "int64",
+        "uint32",
+        "uint64",
+        "sint32",
+        "sint64",
+        "fixed32",
+        "fixed64",
+        "sfixed32",
+        "sfixed64",
+    )
+}
+_JSON_KEY_DECODERS["bool"] = _json_bool_key
 
-def _validate_ipv4(v: str) -> str:
-    if not v:
-        return v
-    _ipaddress.IPv4Address(v)
-    return v
-`
 
-const protoTypesIPv6Func = `
+def _json_list(decode):
+    if decode is None:
+        return list
 
-def _validate_ipv6(v: str) -> str:
-    if not v:
-        return v
-    _ipaddress.IPv6Address(v)
-    return v
-`
+    def decode_list(v):
+        return [decode(item) for item in v]
 
-const protoTypesUUIDFunc = `
+    return decode_list
 
-def _validate_uuid(v: str) -> str:
-    if not v:
-        return v
-    _uuid_lib.UUID(v)
-    return v
-`
 
-const protoTypesFiniteFunc = `
+def _json_map(decode_key, decode_value):
+    if decode_key is None and decode_value is None:
+        return dict
+    if decode_key is None:
+        decode_key = _identity
+    if decode_value is None:
+        decode_value = _identity
 
-def _require_finite(v: float) -> float:
-    if not _math.isfinite(v):
-        raise ValueError("value must be finite")
-    return v
-`
+    def decode_map(v):
+        return {decode_key(k): decode_value(item) for k, item in v.items()}
 
-const protoTypesConstValidatorFunc = `
+    return decode_map
 
-def _make_const_validator(c):
-    def _validate(v):
-        if v != c:
-            raise ValueError(f"value must equal {c!r}")
-        return v
 
-    return _validate
+def _identity(v):
+    return v
 `
 
 // buildProtoTypesContent assembles the content for _proto_types.py, including
 // only the format validator functions (and their imports) that are actually
 // used by files in the same output directory.
-func buildProtoTypesContent(needed map[string]bool) string {
+func buildProtoTypesContent(needed map[string]bool, cacheSize int) string {
 	needIP := needed["_validate_ip"] || needed["_validate_ipv4"] || needed["_validate_ipv6"]
 	needURI := needed["_validate_uri"]
+	var cached []string
+	if cacheSize > 0 {
+		for _, name := range formatValidators {
+			if needed[name] {
+				cached = append(cached, name)
+			}
+		}
+	}
 
 	var b strings.Builder
 
 	b.WriteString("# DO NOT EDIT. Generated by protoc-gen-pydantic.\n")
 
 	// Stdlib imports (alphabetical).
+	if needed["ProtoWire"] {
+		b.WriteString("import base64 as _base64\n")
+	}
 	b.WriteString("import datetime as _datetime\n")
+	if len(cached) > 0 {
+		b.WriteString("import functools as _functools\n")
+	}
 	if needIP {
 		b.WriteString("import ipaddress as _ipaddress\n")
 	}
-	if needed["_require_finite"] {
+	if needed["_require_finite"] || needed["ProtoWire"] {
 		b.WriteString("import math as _math\n")
 	}
-	b.WriteString("import re as _re\n")
+	if needed["ProtoWire"] {
+		b.WriteString("import struct as _struct\n")
+		b.WriteString("import sys as _sys\n")
+	}
 	if needed["_validate_uuid"] {
 		b.WriteString("import uuid as _uuid_lib\n")
 	}
+	if needed["ProtoWire"] {
+		b.WriteString("from collections.abc import Iterable as _Iterable\n")
+	}
 	b.WriteString("from typing import Annotated as _Annotated\n")
 	b.WriteString("\n")
 
 	// Third-party imports (alphabetical within group).
+	if needed["ProtoWire"] {
+		b.WriteString("from pydantic import AfterValidator as _AfterValidator\n")
+	}
 	if needURI {
 		b.WriteString("from pydantic import AnyUrl as _AnyUrl\n")
 	}
+	if needed["_require_unique_messages"] {
+		b.WriteString("from pydantic import BaseModel as _BaseModel\n")
+	}
 	b.WriteString("from pydantic import BeforeValidator as _BeforeValidator\n")
 	b.WriteString("from pydantic import PlainSerializer as _PlainSerializer\n")
-	if needURI {
+	if needed["ProtoWire"] {
+		b.WriteString("from pydantic import PlainValidator as _PlainValidator\n")
+	}
+	if needURI || needed["ProtoWire"] {
 		b.WriteString("from pydantic import TypeAdapter as _TypeAdapter\n")
 	}
+	if needed["ProtoWire"] {
+		b.WriteString("from pydantic import WrapValidator as _WrapValidator\n")
+		b.WriteString("from pydantic import with_config as _with_config\n")
+	}
+	if needed["_validate_email"] {
+		b.WriteString("from pydantic.networks import validate_email as _pydantic_validate_email\n")
+	}
+	b.WriteString("from pydantic_core import core_schema as _core_schema\n")
+	if needed["ProtoWire"] {
+		b.WriteString("from typing_extensions import NotRequired as _NotRequired\n")
+		b.WriteString("from typing_extensions import TypedDict as _TypedDict\n")
+	}
 
 	// Module-level declarations.
 	if needURI {
@@ -671,16 +3135,216 @@ func buildProtoTypesContent(needed map[string]bool) string {
 	if needed["_validate_uuid"] {
 		b.WriteString(protoTypesUUIDFunc)
 	}
+	if len(cached) > 0 {
+		b.WriteString(formatValidatorCache(cached, cacheSize))
+	}
 	if needed["_require_finite"] {
 		b.WriteString(protoTypesFiniteFunc)
 	}
-	if needed["_make_const_validator"] {
-		b.WriteString(protoTypesConstValidatorFunc)
+	if needed["_require_unique_messages"] {
+		b.WriteString(protoTypesUniqueMessagesFunc)
+	}
+	needNanos := needed["ProtoTimestampNanos"] || needed["ProtoDurationNanos"]
+	if needNanos {
+		b.WriteString(protoTypesNanosFuncs)
+	}
+	if needed["ProtoWire"] {
+		b.WriteString(protoTypesWireFuncs)
+		if needNanos {
+			b.WriteString(protoTypesNanosWireFuncs)
+		}
+		b.WriteString(protoTypesModelFuncs)
+	}
+
+	return b.String()
+}
+
+// formatValidators lists the format validator helpers of _proto_types.py in
+// emission order; format_validator_cache_size memoizes the ones in use.
+var formatValidators = []string{
+	"_validate_email", "_validate_uri", "_validate_ip", "_validate_ipv4", "_validate_ipv6", "_validate_uuid",
+}
+
+// formatValidatorCache wraps the named format validators in bounded LRU
+// caches and adds functions to inspect and clear them.
+func formatValidatorCache(names []string, size int) string {
+	var b strings.Builder
+	b.WriteString("\n\n# format_validator_cache_size: values that passed a format check are\n")
+	b.WriteString("# remembered, failures are checked again on every call.\n")
+	for _, name := range names {
+		fmt.Fprintf(&b, "%s = _functools.lru_cache(maxsize=%d)(%s)\n", name, size, name)
+	}
+	b.WriteString("\n\ndef format_validator_cache_info() -> dict:\n")
+	b.WriteString("    \"\"\"Return the hits, misses and size of each format validator cache.\"\"\"\n")
+	b.WriteString("    return {\n")
+	for _, name := range names {
+		fmt.Fprintf(&b, "        %q: %s.cache_info(),\n", strings.TrimPrefix(name, "_validate_"), name)
+	}
+	b.WriteString("    }\n")
+	b.WriteString("\n\ndef format_validator_cache_clear() -> None:\n")
+	b.WriteString("    \"\"\"Empty the format validator caches and reset their counters.\"\"\"\n")
+	for _, name := range names {
+		fmt.Fprintf(&b, "    %s.cache_clear()\n", name)
+	}
+	return b.String()
+}
+
+// lazyInitFuncs implements PEP 562 module-level __getattr__/__dir__ so that a
+// generated module is only imported when one of its names is first used.
+const lazyInitFuncs = `
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
+`
+
+// warmUpFunc rebuilds every model listed in _MODELS. With defer_build each
+// model otherwise builds its schema on first use.
+const warmUpFunc = `
+
+def warm_up() -> None:
+    """Build the schema of every model in this package ahead of first use.
+
+    Models are rebuilt in dependency order, so each one reuses the already
+    built schemas of the messages it refers to.
+    """
+    for module, qualname in _MODELS:
+        model = _importlib.import_module(module, __name__)
+        for part in qualname.split("."):
+            model = getattr(model, part)
+        model.model_rebuild()
+`
+
+// modelRef locates a generated model class for the package warm_up() table.
+type modelRef struct {
+	Module  string // relative module, e.g. ".messages_pydantic"
+	Message Message
+}
+
+// appendModelRefs flattens messages and their nested messages into refs.
+func appendModelRefs(refs []modelRef, module string, messages []Message) []modelRef {
+	for _, m := range messages {
+		refs = append(refs, modelRef{Module: module, Message: m})
+		refs = appendModelRefs(refs, module, m.NestedMessages)
+	}
+	return refs
+}
+
+// sortModelRefs orders refs so that every model comes after the models its
+// fields refer to. Dependencies outside refs are ignored and cycles are broken
+// at the first back edge, keeping the input order wherever it is free.
+func sortModelRefs(refs []modelRef) []modelRef {
+	byKey := make(map[string]modelRef, len(refs))
+	for _, r := range refs {
+		byKey[r.Message.TopoKey()] = r
+	}
+	visited := make(map[string]bool, len(refs))
+	sorted := make([]modelRef, 0, len(refs))
+	var visit func(r modelRef)
+	visit = func(r modelRef) {
+		key := r.Message.TopoKey()
+		if visited[key] {
+			return
+		}
+		visited[key] = true
+		for _, dep := range r.Message.Deps {
+			if d, ok := byKey[dep]; ok {
+				visit(d)
+			}
+		}
+		sorted = append(sorted, r)
+	}
+	for _, r := range refs {
+		visit(r)
+	}
+	return sorted
+}
+
+// buildInitContent assembles a package __init__.py. exports maps each
+// top-level message and enum name to the relative module defining it and
+// turns on lazy attribute loading; models, in dependency order, adds
+// warm_up().
+func buildInitContent(exports map[string]string, models []modelRef) string {
+	names := make([]string, 0, len(exports))
+	byModule := map[string][]string{}
+	for name, module := range exports {
+		names = append(names, name)
+		byModule[module] = append(byModule[module], name)
+	}
+	sort.Strings(names)
+	modules := make([]string, 0, len(byModule))
+	for module := range byModule {
+		modules = append(modules, module)
+		sort.Strings(byModule[module])
+	}
+	sort.Strings(modules)
+
+	var b strings.Builder
+
+	b.WriteString("# Generated by protoc-gen-pydantic.\n")
+	b.WriteString("import importlib as _importlib\n")
+	if len(exports) > 0 {
+		b.WriteString("from typing import TYPE_CHECKING as _TYPE_CHECKING\n")
+
+		// Static type checkers and IDEs see regular imports.
+		b.WriteString("\nif _TYPE_CHECKING:\n")
+		for _, module := range modules {
+			b.WriteString(indentLines(formatImportBlockWidth("from "+module+" import ", byModule[module], 84), "    "))
+			b.WriteString("\n")
+		}
+
+		b.WriteString("\n_EXPORTS = {\n")
+		for _, name := range names {
+			fmt.Fprintf(&b, "    %q: %q,\n", name, exports[name])
+		}
+		b.WriteString("}\n")
+
+		b.WriteString("\n__all__ = [\n")
+		for _, name := range names {
+			fmt.Fprintf(&b, "    %q,\n", name)
+		}
+		b.WriteString("]\n")
+	}
+
+	if len(models) > 0 {
+		b.WriteString("\n_MODELS = [\n")
+		for _, r := range models {
+			line := fmt.Sprintf("    (%q, %q),", r.Module, r.Message.QualName)
+			if len(line) > 88 {
+				line = fmt.Sprintf("    (\n        %q,\n        %q,\n    ),", r.Module, r.Message.QualName)
+			}
+			b.WriteString(line + "\n")
+		}
+		b.WriteString("]\n")
+	}
+
+	if len(exports) > 0 {
+		b.WriteString(lazyInitFuncs)
+	}
+	if len(models) > 0 {
+		b.WriteString(warmUpFunc)
 	}
 
 	return b.String()
 }
 
+// indentLines prefixes every line of s with indent.
+func indentLines(s, indent string) string {
+	lines := strings.Split(s, "\n")
+	for i, line := range lines {
+		lines[i] = indent + line
+	}
+	return strings.Join(lines, "\n")
+}
+
 // reservedNames is the set of names that must not be used as Pydantic field
 // names. Fields with these names are renamed with a trailing underscore and
 // given an alias to preserve the original proto field name.
@@ -711,6 +3375,16 @@ var reservedNames = map[string]bool{
 	"model_post_init": true, "model_rebuild": true,
 	"model_validate": true, "model_validate_json": true,
 	"model_validate_strings": true,
+	// _ProtoModel members (shadowed by a field of the same name)
+	"to_proto_bytes": true, "from_proto_bytes": true, "__proto_wire__": true,
+	"to_pb2": true, "from_pb2": true,
+	"from_proto_dicts": true, "to_proto_dicts": true,
+	"from_proto_json_many": true, "to_proto_json_many": true,
+	"iter_proto_ndjson": true, "write_proto_ndjson": true,
+	"iter_proto_delimited": true, "write_proto_delimited": true,
+	"from_proto_dict_trusted": true, "which_oneof": true, "clear_oneof": true,
+	"__proto_hash__": true, "proto_dict_adapter": true, "proto_field_mask": true,
+	"merge_from": true,
 }
 
 // wellKnownTypes maps protobuf well-known type full names to native Python types.
@@ -740,6 +3414,29 @@ var wellKnownTypes = map[string]wktMapping{
 	"google.protobuf.BytesValue":  {pythonType: "bytes"},
 }
 
+// integerNanosTypes replaces the Timestamp and Duration mappings of
+// wellKnownTypes under use_integer_nanos_for_time.
+var integerNanosTypes = map[string]wktMapping{
+	"google.protobuf.Timestamp": {pythonType: "ProtoTimestampNanos", runtimeType: "ProtoTimestampNanos"},
+	"google.protobuf.Duration":  {pythonType: "ProtoDurationNanos", runtimeType: "ProtoDurationNanos"},
+}
+
+// wellKnownType returns the Python mapping of the well-known type name under
+// the generator's options.
+func (e *generator) wellKnownType(name string) (wktMapping, bool) {
+	if e.config.Backend == backendMsgspec {
+		if wkt, ok := msgspecTypes[name]; ok {
+			return wkt, true
+		}
+	} else if e.config.UseIntegerNanosForTime {
+		if wkt, ok := integerNanosTypes[name]; ok {
+			return wkt, true
+		}
+	}
+	wkt, ok := wellKnownTypes[name]
+	return wkt, ok
+}
+
 type CustomOption struct {
 	Key   string
 	Value string // Python literal representation
@@ -804,6 +3501,18 @@ type Enum struct {
 	TrailingComments []string
 }
 
+// ProtoNumbers renders the __proto_numbers__ mapping from each value of a
+// string-valued enum to its number, used by the binary codec.
+func (e Enum) ProtoNumbers(indent string) string {
+	var b strings.Builder
+	b.WriteString("__proto_numbers__ = {\n")
+	for _, v := range e.Values {
+		fmt.Fprintf(&b, "%s    %q: %d,\n", indent, v.Name, v.Number)
+	}
+	b.WriteString(indent + "}")
+	return b.String()
+}
+
 func (e Enum) HasOptions() bool {
 	for _, v := range e.Values {
 		if v.Deprecated || v.DebugRedact || len(v.CustomOptions) > 0 {
@@ -817,20 +3526,44 @@ type Field struct {
 	Name             string
 	Alias            string // non-empty when Name was renamed to avoid shadowing Python builtins
 	Type             string
+	Annotation       string // Type as emitted: unquoted when every name is bound, else a string forward ref
+	Number           int32
+	WireKind         string // ProtoWire kind, e.g. "int32", "packed sint64", "map<string, message>"
+	WireType         string // enum or message class referenced by WireKind, "" otherwise
 	Optional         bool
 	Default          string // proto3 zero-value default (e.g. "0", "False", "None", "default_factory=list")
 	OneOf            *OneOf
 	Constraints      *FieldConstraints
 	LeadingComments  []string
 	TrailingComments []string
+	Overflows        bool   // the one-line _Field() call would exceed ruff's line length
+	Parenthesized    bool   // the _Field() call goes on its own lines, in added parentheses
+	DictType         string // type in the TypedDict mirror of the message, under typed_dicts
 }
 
 func (f Field) IsDefaultFactory() bool {
 	return strings.HasPrefix(f.Default, "default_factory=")
 }
 
+func (f Field) HasDescription(c GeneratorConfig) bool {
+	return !c.DisableFieldDescription && (len(f.LeadingComments) != 0 || f.OneOf != nil)
+}
+
+// RendersMultiline reports whether the field's _Field() call spans several
+// lines, one keyword argument per line.
+func (f Field) RendersMultiline(c GeneratorConfig) bool {
+	return f.HasDescription(c) || f.Alias != "" || f.IsDefaultFactory() || f.HasConstraints() || f.Overflows
+}
+
+// HasConstraints reports whether the field has constraints other than
+// compiled CEL rules, which run in a field validator instead of _Field().
 func (f Field) HasConstraints() bool {
-	return f.Constraints != nil && f.Constraints.HasAny()
+	if f.Constraints == nil {
+		return false
+	}
+	c := *f.Constraints
+	c.Cel = nil
+	return c.HasAny()
 }
 
 func (f Field) ConstraintArgs() []string {
@@ -878,15 +3611,19 @@ type FieldConstraints struct {
 	DroppedConstraints []string // constraint names not translated (required, cel, ...)
 	ConstLiteral       *string  // Python literal for Literal[...] (single-quoted string for strings)
 	ConstDefault       *string  // Python literal for _Field(...) default (double-quoted for strings)
-	InValues           []string // Python literals for AfterValidator in-set
+	InValues           []string // Python literals for the _InValues set
 	NotInValues        []string // Python literals for AfterValidator exclusion-set
 	UniqueItems        bool     // true when repeated.unique = true
+	UniqueValidator    string   // _require_unique helper chosen by element kind
 	FormatValidator    *string  // one of: "email", "uri", "ip", "ipv4", "ipv6", "uuid"
 	RequireFinite      bool     // true when float/double.finite = true
 	Contains           *string  // string.contains substring — intermediate; resolved into Pattern by combinePatternConstraints
-	ConstFloatLiteral  *string  // Python float literal for float/double const (Literal[] is invalid per PEP 586)
+	ConstFloatLiteral  *string  // Python float literal for float/double const, checked with _InValues (Literal[] is invalid per PEP 586)
 	Required           bool     // true when buf.validate required = true is set
 	IsNonScalar        bool     // true when field kind is MessageKind or EnumKind
+
+	// Cel holds the cel / cel_expression rules compiled to Python.
+	Cel []*celRule
 }
 
 func (c *FieldConstraints) HasAny() bool {
@@ -899,7 +3636,7 @@ func (c *FieldConstraints) HasAny() bool {
 		c.Gt != nil || c.Gte != nil || c.Lt != nil || c.Lte != nil ||
 		c.MinLength != nil || c.MaxLength != nil || c.Pattern != nil || c.Contains != nil ||
 		len(c.Examples) > 0 || c.FormatValidator != nil ||
-		len(c.DroppedConstraints) > 0
+		len(c.Cel) > 0 || len(c.DroppedConstraints) > 0
 }
 
 // PydanticArgs returns ["gt=0", "le=150", ...] to inject into _Field().
@@ -1002,15 +3739,62 @@ func (c *FieldConstraints) combinePatternConstraints() {
 
 type Message struct {
 	Name             string
+	FullName         string   // fully-qualified proto name
+	QualName         string   // dotted Python path within the module, e.g. "Outer.Inner"
+	Deps             []string // full names of generated messages referenced by fields
+	OneOfs           []OneOf  // real (non-synthetic) oneofs, FieldNames holding Python field names
 	Fields           []Field
 	NestedMessages   []Message
 	NestedEnums      []Enum
 	LeadingComments  []string
 	TrailingComments []string
+
+	// Cel holds the message-level CEL rules compiled to Python; CelDropped
+	// is set when some of them were not translated.
+	Cel        []*celRule
+	CelDropped bool
+
+	// Unions are the oneofs folded into discriminated unions under
+	// use_discriminated_unions_for_oneofs; UnionMembers are the member
+	// fields they replace, still listed in the wire table.
+	Unions       []Union
+	UnionMembers []Field
+
+	// Branch is set on the branch models foldOneofs nests in a message.
+	// DictFields are the fields of the TypedDict mirror under typed_dicts:
+	// the proto fields, oneof members included.
+	Branch     bool
+	DictFields []Field
+}
+
+// Union is a oneof modelled as the single attribute Attr, holding one
+// branch model per member.
+type Union struct {
+	Attr    string
+	Members []UnionMember
+}
+
+// UnionMember is a member of a Union: its Python name, its ProtoJSON key when
+// that differs, and the name of its branch model nested in the message.
+type UnionMember struct {
+	Name   string
+	Alias  string
+	Branch string
 }
 
 func (m Message) TopoKey() string {
-	return m.Name
+	return m.FullName
+}
+
+// ZeroEnums reports whether the message has enum fields without presence,
+// whose zero value ProtoJSON omits.
+func (m Message) ZeroEnums() bool {
+	for _, f := range m.Fields {
+		if f.WireKind == "enum" {
+			return true
+		}
+	}
+	return false
 }
 
 func (m Message) HasAlias() bool {
@@ -1019,7 +3803,117 @@ func (m Message) HasAlias() bool {
 			return true
 		}
 	}
-	return false
+	return false
+}
+
+// CelValidators renders the compiled CEL rules as validator methods: a
+// field_validator per field with rules, then a model_validator for the
+// message-level rules. Lines after the first are indented by indent.
+func (m Message) CelValidators(indent string) string {
+	// Statements sit in a method body, one level below indent.
+	width := 88 - len(indent) - 8
+	var blocks [][]string
+	if m.CelDropped {
+		blocks = append(blocks, []string{"# buf.validate: cel (not translated)"})
+	}
+	for _, f := range m.Fields {
+		if f.Constraints == nil || len(f.Constraints.Cel) == 0 {
+			continue
+		}
+		lines := []string{
+			"@_field_validator(" + strconv.Quote(f.Name) + ")",
+			"@classmethod",
+			"def _validate_" + f.Name + "_cel(cls, value):",
+		}
+		var body []string
+		if f.Default == "default=None" {
+			// Like the Annotated validators, rules skip unset fields.
+			body = append(body, "if value is None:", "    return value")
+		}
+		body = append(append(body, celRuleLines(f.Constraints.Cel, width)...), "return value")
+		blocks = append(blocks, append(lines, indentEach(body, "    ")...))
+	}
+	if len(m.Cel) > 0 {
+		lines := []string{`@_model_validator(mode="after")`, "def _validate_cel(self):"}
+		body := append(celRuleLines(m.Cel, width), "return self")
+		blocks = append(blocks, append(lines, indentEach(body, "    ")...))
+	}
+	rendered := make([]string, len(blocks))
+	for i, lines := range blocks {
+		rendered[i] = strings.Join(lines, "\n"+indent)
+	}
+	return strings.Join(rendered, "\n\n"+indent)
+}
+
+// ProtoWire renders the __proto_wire__ class attribute: the field table the
+// runtime binary codec works from. Continuation lines are indented by indent.
+func (m Message) ProtoWire(indent string) string {
+	var fields []Field
+	for _, f := range m.Fields {
+		if f.WireKind != "" {
+			fields = append(fields, f)
+		}
+	}
+	fields = append(fields, m.UnionMembers...)
+	if len(fields) == 0 {
+		return "__proto_wire__ = ProtoWire()"
+	}
+	sort.SliceStable(fields, func(i, j int) bool { return fields[i].Number < fields[j].Number })
+
+	var b strings.Builder
+	b.WriteString("__proto_wire__ = ProtoWire(\n")
+	for _, f := range fields {
+		items := []string{strconv.Itoa(int(f.Number)), strconv.Quote(f.Name), strconv.Quote(f.WireKind)}
+		if f.WireType != "" {
+			items = append(items, strconv.Quote(f.WireType))
+		}
+		b.WriteString(pyTuple(indent+"    ", "", items) + ",\n")
+	}
+	if len(m.OneOfs) > 0 {
+		b.WriteString(indent + "    oneofs={\n")
+		for _, oo := range m.OneOfs {
+			names := make([]string, len(oo.FieldNames))
+			for i, name := range oo.FieldNames {
+				names[i] = strconv.Quote(name)
+			}
+			b.WriteString(pyTuple(indent+"        ", strconv.Quote(oo.Name)+": ", names) + ",\n")
+		}
+		b.WriteString(indent + "    },\n")
+	}
+	if len(m.Unions) > 0 {
+		b.WriteString(indent + "    unions={\n")
+		for _, u := range m.Unions {
+			for _, member := range u.Members {
+				item := strconv.Quote(u.Attr) + ", " + member.Branch
+				b.WriteString(indent + "        " + strconv.Quote(member.Name) + ": (" + item + "),\n")
+				if member.Alias != "" {
+					b.WriteString(indent + "        " + strconv.Quote(member.Alias) + ": (" + item + "),\n")
+				}
+			}
+		}
+		b.WriteString(indent + "    },\n")
+	}
+	b.WriteString(indent + ")")
+	return b.String()
+}
+
+// pyTuple formats items as a Python tuple literal on one line at indent,
+// or one item per line when that would exceed ruff's line length.
+func pyTuple(indent, prefix string, items []string) string {
+	if len(items) == 1 {
+		items = []string{items[0] + ","}
+	}
+	line := indent + prefix + "(" + strings.Join(items, ", ") + ")"
+	if len(line)+1 <= 88 {
+		return line
+	}
+	var b strings.Builder
+	b.WriteString(indent + prefix + "(\n")
+	for _, item := range items {
+		b.WriteString(indent + "    " + strings.TrimSuffix(item, ",") + ",\n")
+	}
+	b.WriteString(indent + ")")
+	return b.String()
 }
 
 type File struct {
@@ -1041,6 +3935,8 @@ type generator struct {
 	config             GeneratorConfig
 	resolver           *protoregistry.Types
 	fieldConstraintExt protoreflect.ExtensionDescriptor
+	// messageConstraintExt is (buf.validate.message), for message-level CEL rules.
+	messageConstraintExt protoreflect.ExtensionDescriptor
 }
 
 type GeneratorConfig struct {
@@ -1049,6 +3945,13 @@ type GeneratorConfig struct {
 	UseIntegersForEnums                 bool
 	DisableFieldDescription             bool
 	UseNoneUnionSyntaxInsteadOfOptional bool
+	RuntimeModule                       string // dotted module path providing a shared _ProtoModel; "" emits it per file
+	DeferBuild                          bool
+	UseIntegerNanosForTime              bool   // Timestamp and Duration as int nanoseconds instead of datetime/timedelta
+	UseDiscriminatedUnionsForOneofs     bool   // each oneof as one attribute holding a tagged union of branch models
+	Backend                             string // "pydantic" or "msgspec", the library the classes are rendered for
+	FrozenModels                        bool   // frozen, hashable models sharing their fields sets
+	TypedDicts                          bool   // a TypedDict mirror of each message, validated by Model.proto_dict_adapter()
 }
 
 func NewGenerator(c GeneratorConfig) *generator {
@@ -1114,6 +4017,43 @@ func messageHasEnumOptions(msg Message) bool {
 	return false
 }
 
+func (e *generator) hasAlias() bool {
+	for _, msg := range e.messages {
+		if messageHasAlias(msg) {
+			return true
+		}
+	}
+	return false
+}
+
+func messageHasAlias(msg Message) bool {
+	if msg.HasAlias() {
+		return true
+	}
+	for _, nested := range msg.NestedMessages {
+		if messageHasAlias(nested) {
+			return true
+		}
+	}
+	return false
+}
+
+// exportedNames returns the top-level message and enum names defined by the
+// current file.
+func (e *generator) exportedNames() []string {
+	names := make([]string, 0, len(e.enums)+len(e.messages))
+	for _, enum := range e.enums {
+		names = append(names, enum.Name)
+	}
+	for _, msg := range e.messages {
+		names = append(names, msg.Name)
+	}
+	for _, msg := range e.dictMessages() {
+		names = append(names, dictName(msg.QualName))
+	}
+	return names
+}
+
 func (e *generator) addStdImport(name string) {
 	e.stdImports[name] = true
 }
@@ -1122,8 +4062,14 @@ func (e *generator) addStdImport(name string) {
 // multi-line parenthesized form when the single-line form would exceed
 // 88 characters (ruff's default line length).
 func formatImportBlock(prefix string, symbols []string) string {
+	return formatImportBlockWidth(prefix, symbols, 88)
+}
+
+// formatImportBlockWidth is formatImportBlock with an explicit line length,
+// for import statements that are emitted indented.
+func formatImportBlockWidth(prefix string, symbols []string, width int) string {
 	oneLine := prefix + strings.Join(symbols, ", ")
-	if len(oneLine) <= 88 {
+	if len(oneLine) <= width {
 		return oneLine
 	}
 	var sb strings.Builder
@@ -1167,10 +4113,43 @@ func (e *generator) pydanticImportLine() string {
 	if e.stdImports["_AfterValidator"] {
 		symbols = append(symbols, "AfterValidator as _AfterValidator")
 	}
-	symbols = append(symbols, "BaseModel as _BaseModel", "ConfigDict as _ConfigDict", "Field as _Field")
+	if e.config.RuntimeModule == "" {
+		symbols = append(symbols, "BaseModel as _BaseModel", "ConfigDict as _ConfigDict")
+	} else if e.hasAlias() {
+		// _ProtoModel comes from the runtime module; _ConfigDict is still
+		// needed for per-message populate_by_name.
+		symbols = append(symbols, "ConfigDict as _ConfigDict")
+	}
+	symbols = append(symbols, "Field as _Field")
+	if e.config.RuntimeModule == "" && e.config.TypedDicts {
+		// For proto_dict_adapter; the other helpers come from ProtoModelMixin.
+		symbols = append(symbols, "TypeAdapter as _TypeAdapter")
+	}
+	if e.stdImports["_field_validator"] {
+		symbols = append(symbols, "field_validator as _field_validator")
+	}
+	if e.stdImports["_model_serializer"] {
+		symbols = append(symbols, "model_serializer as _model_serializer")
+	}
+	if e.stdImports["_model_validator"] {
+		symbols = append(symbols, "model_validator as _model_validator")
+	}
+	if e.stdImports["_with_config"] {
+		symbols = append(symbols, "with_config as _with_config")
+	}
 	return formatImportBlock("from pydantic import ", symbols)
 }
 
+// protoModelImportLine returns the import of the shared _ProtoModel base
+// class and the ProtoWire codec of its field tables, or "" when they are
+// defined in the generated file and its _proto_types.py.
+func (e *generator) protoModelImportLine() string {
+	if !e.stdImports["_BaseModel"] || e.config.RuntimeModule == "" {
+		return ""
+	}
+	return "from " + e.config.RuntimeModule + " import ProtoWire, _ProtoModel"
+}
+
 // wrapWithAnnotated wraps a type string with _Annotated[..., validators],
 // preserving `| None` and `_Optional[...]` wrappers correctly.
 func wrapWithAnnotated(typ string, validators []string) string {
@@ -1227,12 +4206,17 @@ func (e *generator) applyConstraintTypeOverrides(f *Field) {
 		}
 	}
 
-	// in/not_in/unique → AfterValidator wrapping
+	if e.config.Backend == backendMsgspec {
+		e.applyMsgspecMeta(f)
+		return
+	}
+
+	// in and float const → _InValues, checked by pydantic-core;
+	// not_in/unique/formats → AfterValidator wrapping
 	var validators []string
 	if len(fc.InValues) > 0 {
-		v := "{" + strings.Join(fc.InValues, ", ") + "}"
-		validators = append(validators, "_AfterValidator(_make_in_validator(frozenset("+v+")))")
-		e.addRuntimeImport("_make_in_validator")
+		validators = append(validators, "_InValues("+strings.Join(fc.InValues, ", ")+")")
+		e.addRuntimeImport("_InValues")
 	}
 	if len(fc.NotInValues) > 0 {
 		v := "{" + strings.Join(fc.NotInValues, ", ") + "}"
@@ -1240,8 +4224,8 @@ func (e *generator) applyConstraintTypeOverrides(f *Field) {
 		e.addRuntimeImport("_make_not_in_validator")
 	}
 	if fc.UniqueItems {
-		validators = append(validators, "_AfterValidator(_require_unique)")
-		e.addRuntimeImport("_require_unique")
+		validators = append(validators, "_AfterValidator("+fc.UniqueValidator+")")
+		e.addRuntimeImport(fc.UniqueValidator)
 	}
 	if fc.FormatValidator != nil {
 		helperName := "_validate_" + *fc.FormatValidator
@@ -1253,8 +4237,8 @@ func (e *generator) applyConstraintTypeOverrides(f *Field) {
 		e.addRuntimeImport("_require_finite")
 	}
 	if fc.ConstFloatLiteral != nil {
-		validators = append(validators, "_AfterValidator(_make_const_validator("+*fc.ConstFloatLiteral+"))")
-		e.addRuntimeImport("_make_const_validator")
+		validators = append(validators, "_InValues("+*fc.ConstFloatLiteral+")")
+		e.addRuntimeImport("_InValues")
 		// Set the field default to the const value (only for non-optional fields).
 		if fc.ConstDefault != nil &&
 			!strings.HasSuffix(f.Type, " | None") &&
@@ -1273,19 +4257,22 @@ func (e *generator) Generate(w io.Writer) error {
 	runtimeImportLine := e.runtimeImportLine()
 	typingImportLine := e.typingImportLine()
 	pydanticImportLine := e.pydanticImportLine()
-	err := tmpl.Execute(&buf, struct {
-		File               File
-		Enums              []Enum
-		Messages           []Message
-		ExternalImports    []string
-		RelativeImports    []string
-		Config             GeneratorConfig
-		StdImports         map[string]bool
-		HasEnumOptions     bool
-		CustomOptionFields []CustomOptionField
-		RuntimeImportLine  string
-		TypingImportLine   string
-		PydanticImportLine string
+	protoModelImportLine := e.protoModelImportLine()
+	err := tmpl.ExecuteTemplate(&buf, e.config.Backend, struct {
+		File                 File
+		Enums                []Enum
+		Messages             []Message
+		ExternalImports      []string
+		RelativeImports      []string
+		Config               GeneratorConfig
+		StdImports           map[string]bool
+		HasEnumOptions       bool
+		CustomOptionFields   []CustomOptionField
+		RuntimeImportLine    string
+		TypingImportLine     string
+		PydanticImportLine   string
+		ProtoModelImportLine string
+		TypedDicts           string
 	}{
 		e.file,
 		e.enums,
@@ -1299,13 +4286,52 @@ func (e *generator) Generate(w io.Writer) error {
 		runtimeImportLine,
 		typingImportLine,
 		pydanticImportLine,
+		protoModelImportLine,
+		e.typedDicts(),
+	})
+	if err != nil {
+		return err
+	}
+
+	_, err = io.WriteString(w, formatOutput(buf.String()))
+	return err
+}
+
+// GenerateRuntimeModule writes the shared module that defines _ProtoModel
+// and the ProtoWire codec when the runtime_module option is set. nanos adds
+// the integer-nanosecond Timestamp and Duration kinds to the codec.
+func (e *generator) GenerateRuntimeModule(w io.Writer, nanos bool) error {
+	wireFuncs := protoTypesTimeFuncs
+	if nanos {
+		wireFuncs += protoTypesNanosFuncs
+	}
+	wireFuncs += protoTypesWireFuncs
+	if nanos {
+		wireFuncs += protoTypesNanosWireFuncs
+	}
+	var buf bytes.Buffer
+	err := tmpl.ExecuteTemplate(&buf, "runtimeModule", struct {
+		Config     GeneratorConfig
+		ModelFuncs string
+		WireFuncs  string
+	}{
+		e.config,
+		protoTypesModelFuncs,
+		wireFuncs,
 	})
 	if err != nil {
 		return err
 	}
 
+	_, err = io.WriteString(w, formatOutput(buf.String()))
+	return err
+}
+
+// formatOutput normalizes rendered template output: trailing whitespace is
+// stripped, runs of blank lines are collapsed and the file ends with a
+// single newline.
+func formatOutput(output string) string {
 	// Post-process: strip trailing whitespace from each line.
-	output := buf.String()
 	lines := strings.Split(output, "\n")
 	for i, line := range lines {
 		lines[i] = strings.TrimRight(line, " \t")
@@ -1318,10 +4344,7 @@ func (e *generator) Generate(w io.Writer) error {
 	}
 
 	// Ensure file ends with exactly one newline.
-	output = strings.TrimRight(output, "\n") + "\n"
-
-	_, err = io.WriteString(w, output)
-	return err
+	return strings.TrimRight(output, "\n") + "\n"
 }
 
 func (e *generator) processFile(file protoreflect.FileDescriptor, fdp *descriptorpb.FileDescriptorProto) error {
@@ -1353,9 +4376,280 @@ func (e *generator) processFile(file protoreflect.FileDescriptor, fdp *descripto
 			e.messages = append(e.messages, msg)
 		}
 	}
+	e.orderMessages()
+	e.resolveAnnotations()
 	return nil
 }
 
+// orderMessages sorts top-level messages so that each one follows the
+// messages its fields (and those of its nested messages) refer to, which
+// lets those annotations be emitted unquoted. Messages in a cycle keep their
+// source order.
+func (e *generator) orderMessages() {
+	index := make(map[string]int, len(e.messages))
+	for i, m := range e.messages {
+		index[m.Name] = i
+	}
+	visited := make([]bool, len(e.messages))
+	sorted := make([]Message, 0, len(e.messages))
+	var visit func(i int)
+	visit = func(i int) {
+		if visited[i] {
+			return
+		}
+		visited[i] = true
+		for _, ref := range messageRefs(e.messages[i]) {
+			if j, ok := index[strings.SplitN(ref, ".", 2)[0]]; ok {
+				visit(j)
+			}
+		}
+		sorted = append(sorted, e.messages[i])
+	}
+	for i := range e.messages {
+		visit(i)
+	}
+	e.messages = sorted
+}
+
+// messageRefs returns every dotted name referenced by the field annotations
+// of m and its nested messages.
+func messageRefs(m Message) []string {
+	var refs []string
+	for _, f := range m.Fields {
+		refs = append(refs, annotationRefs(f.Type)...)
+	}
+	for _, nested := range m.NestedMessages {
+		refs = append(refs, messageRefs(nested)...)
+	}
+	return refs
+}
+
+// annotationRefs returns the dotted names in a Python annotation, skipping the
+// contents of string literals.
+func annotationRefs(typ string) []string {
+	var refs []string
+	for _, tok := range matchAnnotationToken.FindAllString(typ, -1) {
+		if tok[0] != '\'' && tok[0] != '"' {
+			refs = append(refs, tok)
+		}
+	}
+	return refs
+}
+
+// resolveAnnotations sets Field.Annotation for every field. Module-level
+// names are bound in definition order: imports and enums first, then each
+// top-level message once its class statement has run.
+func (e *generator) resolveAnnotations() {
+	pending := make(map[string]bool, len(e.messages))
+	for _, m := range e.messages {
+		pending[m.Name] = true
+	}
+	for i := range e.messages {
+		e.annotateMessage(&e.messages[i], "", pending)
+		delete(pending, e.messages[i].Name)
+	}
+}
+
+// annotateMessage resolves the annotations of m's fields as they are
+// evaluated in its class body, where nested types are reachable by their
+// short name but enclosing classes are not bound yet.
+func (e *generator) annotateMessage(m *Message, indent string, pending map[string]bool) {
+	local := map[string]bool{}
+	for _, nested := range m.NestedEnums {
+		local[nested.Name] = true
+	}
+	for i := range m.NestedMessages {
+		e.annotateMessage(&m.NestedMessages[i], indent+"    ", pending)
+		local[m.NestedMessages[i].Name] = true
+	}
+	// Class attributes assigned by fields shadow module-level names, including
+	// the field's own name: the value is assigned before the annotation runs.
+	assigned := map[string]bool{}
+	for i := range m.Fields {
+		f := &m.Fields[i]
+		assigned[f.Name] = true
+		f.Annotation = resolveAnnotation(f.Type, m.QualName, local, assigned, pending)
+		hasValue := e.config.Backend != backendMsgspec || f.Default != "default=..."
+		f.Annotation = wrapAnnotation(indent+"    ", f.Name, f.Annotation, hasValue)
+		if e.config.Backend == backendMsgspec {
+			// StructDefault lays out the default, if any, that follows.
+			continue
+		}
+		// ruff format splits the _Field() call of an overflowing line, or
+		// moves it into added parentheses when even its opening overflows.
+		head := lastLine(indent+"    "+f.Name+": "+f.Annotation) + " = "
+		switch {
+		case f.RendersMultiline(e.config):
+			f.Parenthesized = len(head+"_Field(") > 88 && len(head+"(") <= 88
+		case len(head+"_Field("+f.Default+")") <= 88:
+		case len(head+"_Field(") > 88 && len(head+"(") <= 88:
+			f.Parenthesized = true
+		default:
+			f.Overflows = true
+		}
+	}
+}
+
+// wrapAnnotation returns ann laid out for the field statement that starts
+// with "name: " at indent. ruff format first splits the value of a statement
+// that overflows the line, and splits the annotation only when the line up
+// to "name: ann = (" does not fit either.
+func wrapAnnotation(indent, name, ann string, hasValue bool) string {
+	suffix := ""
+	if hasValue {
+		suffix = " = ("
+	}
+	return layoutExpr(ann, indent, len(indent+name+": "), suffix)
+}
+
+// layoutExpr returns expr as ruff format lays it out on a line of the given
+// indent that already holds width characters and continues with suffix:
+// unchanged if it fits, else with the contents of its last bracket pair
+// moved to their own lines, recursively. Expressions ruff cannot split that
+// way, such as string forward references, are returned unchanged.
+func layoutExpr(expr, indent string, width int, suffix string) string {
+	if width+len(expr)+len(suffix) <= 88 {
+		return expr
+	}
+	open := lastBracketGroup(expr)
+	if open < 0 {
+		return expr
+	}
+	inner := indent + "    "
+	items := splitTopLevel(expr[open+1 : len(expr)-1])
+	var b strings.Builder
+	b.WriteString(expr[:open+1])
+	// The items of a call or subscript share a line if they fit, unlike
+	// those of a literal such as a set.
+	if flat := strings.Join(items, ", "); len(items) > 1 && open > 0 && len(inner+flat) <= 88 {
+		b.WriteString("\n" + inner + flat)
+	} else if len(items) == 1 {
+		b.WriteString("\n" + inner + layoutExpr(items[0], inner, len(inner), ""))
+	} else {
+		for _, item := range items {
+			b.WriteString("\n" + inner + layoutExpr(item, inner, len(inner), ",") + ",")
+		}
+	}
+	b.WriteString("\n" + indent + expr[len(expr)-1:])
+	return b.String()
+}
+
+// lastBracketGroup returns the index of the bracket that the closing bracket
+// ending expr matches, or -1 unless expr is a name, call or subscript ending
+// with a non-empty bracket pair.
+func lastBracketGroup(expr string) int {
+	if !strings.ContainsAny(expr[len(expr)-1:], ")]}") {
+		return -1
+	}
+	open, depth := -1, 0
+	scanTopLevel(expr, func(i int, c byte) {
+		switch c {
+		case '(', '[', '{':
+			if depth == 0 {
+				open = i
+			}
+			depth++
+		case ')', ']', '}':
+			depth--
+		}
+	})
+	if open < 0 || open+2 == len(expr) || strings.ContainsRune(expr[:open], ' ') {
+		return -1
+	}
+	return open
+}
+
+// splitTopLevel splits s at the commas outside brackets and string literals.
+func splitTopLevel(s string) []string {
+	var items []string
+	start, depth := 0, 0
+	scanTopLevel(s, func(i int, c byte) {
+		switch c {
+		case '(', '[', '{':
+			depth++
+		case ')', ']', '}':
+			depth--
+		case ',':
+			if depth == 0 {
+				items = append(items, strings.TrimSpace(s[start:i]))
+				start = i + 1
+			}
+		}
+	})
+	return append(items, strings.TrimSpace(s[start:]))
+}
+
+// scanTopLevel calls visit for each byte of s outside string literals.
+func scanTopLevel(s string, visit func(i int, c byte)) {
+	var quote byte
+	for i := 0; i < len(s); i++ {
+		switch c := s[i]; {
+		case quote == 0 && (c == '"' || c == '\''):
+			quote = c
+		case quote == 0:
+			visit(i, c)
+		case c == '\\':
+			i++
+		case c == quote:
+			quote = 0
+		}
+	}
+}
+
+// lastLine returns the text after the last newline in s.
+func lastLine(s string) string {
+	return s[strings.LastIndexByte(s, '\n')+1:]
+}
+
+// quoteAnnotation returns typ as a string forward reference. Backslashes are
+// escaped so that the string literals in typ read back unchanged.
+func quoteAnnotation(typ string) string {
+	return `"` + strings.ReplaceAll(typ, `\`, `\\`) + `"`
+}
+
+// requoteLiteral rewrites a string literal written by pyQuoteSingle with the
+// quotes ruff format prefers once it is no longer nested in a string.
+func requoteLiteral(lit string) string {
+	if lit[0] != '\'' {
+		return lit
+	}
+	inner := strings.ReplaceAll(lit[1:len(lit)-1], `\'`, `'`)
+	if strings.Count(inner, `"`) > strings.Count(inner, "'") {
+		return "'" + strings.ReplaceAll(inner, "'", `\'`) + "'"
+	}
+	return `"` + strings.ReplaceAll(inner, `"`, `\"`) + `"`
+}
+
+// resolveAnnotation returns typ unquoted, with references to m's nested types
+// shortened, when every name in it is bound at this point of the class body;
+// otherwise it returns typ as a string forward reference.
+func resolveAnnotation(typ, qualName string, local, assigned, pending map[string]bool) string {
+	bound := true
+	resolved := matchAnnotationToken.ReplaceAllStringFunc(typ, func(tok string) string {
+		if tok[0] == '\'' || tok[0] == '"' {
+			return requoteLiteral(tok)
+		}
+		short, nested := strings.CutPrefix(tok, qualName+".")
+		if nested {
+			tok = short
+		}
+		first := strings.SplitN(tok, ".", 2)[0]
+		switch {
+		case assigned[first]:
+			bound = false
+		case nested:
+			bound = bound && local[first]
+		case local[first] || pending[first]:
+			bound = false
+		}
+		return tok
+	})
+	if !bound {
+		return quoteAnnotation(typ)
+	}
+	return resolved
+}
+
 func (e *generator) processEnum(
 	enum protoreflect.EnumDescriptor,
 	enumProto *descriptorpb.EnumDescriptorProto,
@@ -1368,13 +4662,9 @@ func (e *generator) processEnum(
 	}
 	def.LeadingComments, def.TrailingComments = extractComments(sourceCodeInfo, path)
 
-	prefix := camelToSnakeCase(string(enum.Name())) + "_"
 	for i := range enum.Values().Len() {
 		v := enum.Values().Get(i)
-		valueName := string(v.Name())
-		if e.config.AutoTrimEnumPrefix {
-			valueName = strings.TrimPrefix(valueName, prefix)
-		}
+		valueName := e.enumValueName(v)
 		fieldPath := append(append([]int32{}, path...), 2, int32(i))
 		leadingComments, trailingComments := extractComments(sourceCodeInfo, fieldPath)
 
@@ -1421,6 +4711,17 @@ func (e *generator) processEnum(
 	return def, nil
 }
 
+// enumValueName returns the Python member name of an enum value, with the
+// enum-name prefix trimmed when auto_trim_enum_prefix is set.
+func (e *generator) enumValueName(v protoreflect.EnumValueDescriptor) string {
+	name := string(v.Name())
+	if e.config.AutoTrimEnumPrefix {
+		prefix := camelToSnakeCase(string(v.Parent().Name())) + "_"
+		name = strings.TrimPrefix(name, prefix)
+	}
+	return name
+}
+
 func (e *generator) processMessage(
 	msg protoreflect.MessageDescriptor,
 	msgProto *descriptorpb.DescriptorProto,
@@ -1432,8 +4733,10 @@ func (e *generator) processMessage(
 	}
 
 	def := Message{
-		Name:   string(msg.Name()),
-		Fields: []Field{},
+		Name:     string(msg.Name()),
+		FullName: string(msg.FullName()),
+		QualName: resolveQualifiedName(msg),
+		Fields:   []Field{},
 	}
 	def.LeadingComments, def.TrailingComments = extractComments(sourceCodeInfo, path)
 
@@ -1475,15 +4778,8 @@ func (e *generator) processMessage(
 				FieldNames: fieldNames,
 			}
 		}
-		name := field.JSONName()
-		if e.config.PreservingProtoFieldName {
-			name = string(field.Name())
-		}
-		var alias string
-		if reservedNames[name] {
-			alias = name
-			name = name + "_"
-		}
+		name, alias := e.fieldName(field)
+		wireKind, wireType := e.fieldWireKind(field)
 		f := Field{
 			Name:     name,
 			Alias:    alias,
@@ -1491,20 +4787,230 @@ func (e *generator) processMessage(
 			Optional: field.HasOptionalKeyword(),
 			Default:  e.resolveDefault(field),
 			OneOf:    oneOf,
+			Number:   int32(field.Number()),
+			WireKind: wireKind,
+			WireType: wireType,
 		}
 		f.LeadingComments, f.TrailingComments = extractComments(sourceCodeInfo, fieldPath)
 		if fp := msgProto.GetField()[i]; fp.GetOptions() != nil {
 			f.Constraints = e.extractFieldConstraints(fp.GetOptions(), field)
 		}
 		e.applyConstraintTypeOverrides(&f)
+		if e.config.TypedDicts && e.config.Backend == backendPydantic {
+			if err := e.setDictType(&f, field); err != nil {
+				return Message{}, fmt.Errorf("field %s.%s: %w", def.Name, field.Name(), err)
+			}
+		}
 		def.Fields = append(def.Fields, f)
+		if dep := messageDependency(field); dep != "" {
+			def.Deps = append(def.Deps, dep)
+		}
+	}
+
+	def.Cel, def.CelDropped = e.extractMessageCel(msgProto.GetOptions(), msg)
+
+	for _, oo := range iter(msg.Oneofs()) {
+		if oo.IsSynthetic() {
+			continue
+		}
+		group := OneOf{Name: string(oo.Name())}
+		for _, f := range iter(oo.Fields()) {
+			name, _ := e.fieldName(f)
+			group.FieldNames = append(group.FieldNames, name)
+		}
+		def.OneOfs = append(def.OneOfs, group)
+	}
+	if e.config.Backend == backendMsgspec {
+		e.addStdImport("_msgspec")
+		return def, nil
+	}
+	if e.config.TypedDicts {
+		def.DictFields = def.Fields
+		e.addStdImport("_with_config")
+	}
+	if len(def.OneOfs) > 0 {
+		e.addStdImport("_model_validator")
+		if e.config.UseDiscriminatedUnionsForOneofs {
+			e.foldOneofs(&def, msg, sourceCodeInfo, path)
+		}
 	}
 
+	if def.ZeroEnums() {
+		// Enum fields default to None, so exclude_defaults keeps a set zero.
+		e.addStdImport("_model_serializer")
+	}
+
+	if e.config.FrozenModels && e.config.RuntimeModule == "" {
+		// _ProtoModel, defined in this file, shares fields sets in a validator.
+		e.addStdImport("_model_validator")
+	}
 	e.addStdImport("_BaseModel")
 	e.addStdImport("_Field")
+	if e.config.RuntimeModule == "" {
+		// Otherwise the runtime module defines ProtoWire with _ProtoModel.
+		e.addRuntimeImport("ProtoModelMixin")
+		e.addRuntimeImport("ProtoWire")
+	}
 	return def, nil
 }
 
+// foldOneofs replaces the members of each oneof of def by one attribute
+// holding a discriminated union of branch models nested in def, one per
+// member, tagged by its "case" field. The members move to UnionMembers.
+func (e *generator) foldOneofs(
+	def *Message,
+	msg protoreflect.MessageDescriptor,
+	sourceCodeInfo *descriptorpb.SourceCodeInfo,
+	path []int32,
+) {
+	taken := map[string]bool{}
+	for _, nested := range def.NestedMessages {
+		taken[nested.Name] = true
+	}
+	for _, nested := range def.NestedEnums {
+		taken[nested.Name] = true
+	}
+	unionFields := map[int32]Field{} // keyed by the number of the first member
+	members := map[int32]bool{}
+	for _, oo := range iter(msg.Oneofs()) {
+		if oo.IsSynthetic() {
+			continue
+		}
+		attr := string(oo.Name())
+		if reservedNames[attr] {
+			attr += "_"
+		}
+		union := Union{Attr: attr}
+		var branches []string
+		for _, fd := range iter(oo.Fields()) {
+			var f Field
+			for _, field := range def.Fields {
+				if field.Number == int32(fd.Number()) {
+					f = field
+				}
+			}
+			members[f.Number] = true
+			def.UnionMembers = append(def.UnionMembers, f)
+
+			name := snakeToCamelCase(string(oo.Name())) + snakeToCamelCase(string(fd.Name()))
+			for taken[name] {
+				name += "_"
+			}
+			taken[name] = true
+			value := f
+			value.Name, value.Alias, value.OneOf = "value", "", nil
+			value.Type = stripOptional(f.Type)
+			value.Default = "default=..."
+			var deps []string
+			if dep := messageDependency(fd); dep != "" {
+				deps = append(deps, dep)
+			}
+			// The union annotation refers to the branch models, so the
+			// parent's schema is built from theirs.
+			def.Deps = append(def.Deps, def.FullName+"."+name)
+			def.NestedMessages = append(def.NestedMessages, Message{
+				Branch:          true,
+				Name:            name,
+				FullName:        def.FullName + "." + name,
+				QualName:        def.QualName + "." + name,
+				Deps:            deps,
+				LeadingComments: []string{fmt.Sprintf("Member %s of oneof %s.", fd.Name(), oo.Name())},
+				Fields: []Field{
+					{
+						Name:    "case",
+						Type:    "_Literal[" + pyQuoteSingle(f.Name) + "]",
+						Default: "default=" + strconv.Quote(f.Name),
+					},
+					value,
+				},
+			})
+			branches = append(branches, def.QualName+"."+name)
+			union.Members = append(union.Members, UnionMember{Name: f.Name, Alias: f.Alias, Branch: name})
+		}
+		typ := "_Annotated[" + strings.Join(branches, " | ") + ", _Field(discriminator='case')]"
+		f := Field{Name: attr, Type: e.wrapOptional(typ), Default: "default=None"}
+		oneofPath := append(append([]int32{}, path...), 8, int32(oo.Index()))
+		f.LeadingComments, f.TrailingComments = extractComments(sourceCodeInfo, oneofPath)
+		unionFields[int32(oo.Fields().Get(0).Number())] = f
+		def.Unions = append(def.Unions, union)
+	}
+	var fields []Field
+	for _, f := range def.Fields {
+		if union, ok := unionFields[f.Number]; ok {
+			fields = append(fields, union)
+		}
+		if !members[f.Number] {
+			fields = append(fields, f)
+		}
+	}
+	def.Fields = fields
+	e.addStdImport("_Annotated")
+	e.addStdImport("_Literal")
+	e.addStdImport("_model_serializer")
+}
+
+// stripOptional removes the None alternative that wrapOptional adds.
+func stripOptional(typ string) string {
+	if inner, ok := strings.CutSuffix(typ, " | None"); ok {
+		return inner
+	}
+	if strings.HasPrefix(typ, "_Optional[") && strings.HasSuffix(typ, "]") {
+		return typ[len("_Optional[") : len(typ)-1]
+	}
+	return typ
+}
+
+// fieldName returns the Python attribute name of field and, when that name
+// was renamed to avoid shadowing a builtin, the original name as alias.
+func (e *generator) fieldName(field protoreflect.FieldDescriptor) (name, alias string) {
+	name = field.JSONName()
+	if e.config.PreservingProtoFieldName {
+		name = string(field.Name())
+	}
+	if reservedNames[name] {
+		return name + "_", name
+	}
+	return name, ""
+}
+
+// fieldWireKind returns the ProtoWire kind of field, labelled "optional" for
+// scalars with explicit presence and "repeated" or "packed" for lists, and
+// the Python name of the enum or message class it refers to.
+func (e *generator) fieldWireKind(field protoreflect.FieldDescriptor) (kind, typeName string) {
+	if field.IsMap() {
+		key, _ := e.baseWireKind(field.MapKey())
+		value, typeName := e.baseWireKind(field.MapValue())
+		return "map<" + key + ", " + value + ">", typeName
+	}
+	kind, typeName = e.baseWireKind(field)
+	switch {
+	case field.IsPacked():
+		kind = "packed " + kind
+	case field.Cardinality() == protoreflect.Repeated:
+		kind = "repeated " + kind
+	case field.HasPresence() && field.Kind() != protoreflect.MessageKind:
+		kind = "optional " + kind
+	}
+	return kind, typeName
+}
+
+func (e *generator) baseWireKind(field protoreflect.FieldDescriptor) (kind, typeName string) {
+	switch field.Kind() {
+	case protoreflect.EnumKind:
+		return "enum", resolveQualifiedName(field.Enum())
+	case protoreflect.MessageKind:
+		name := string(field.Message().FullName())
+		if _, ok := integerNanosTypes[name]; ok && e.config.UseIntegerNanosForTime {
+			return name + ":nanos", ""
+		}
+		if _, ok := wellKnownTypes[name]; ok {
+			return name, ""
+		}
+		return "message", resolveQualifiedName(field.Message())
+	}
+	return field.Kind().String(), ""
+}
+
 func (e *generator) addExternalImport(importLine string) {
 	for _, imp := range e.externalImports {
 		if imp == importLine {
@@ -1537,7 +5043,7 @@ func (e *generator) addCrossFileImport(sourceFile, targetFile protoreflect.FileD
 		importName = typeName[:dot]
 	}
 	targetPath := string(targetFile.Path())
-	moduleName := strings.TrimSuffix(filepath.Base(targetPath), ".proto") + "_pydantic"
+	moduleName := strings.TrimSuffix(filepath.Base(targetPath), ".proto") + e.config.moduleSuffix()
 	if string(sourceFile.Package()) == string(targetFile.Package()) {
 		e.addRelativeImport(fmt.Sprintf("from .%s import %s", moduleName, importName))
 	} else {
@@ -1567,6 +5073,10 @@ func (e *generator) resolveBaseType(referer string, field protoreflect.FieldDesc
 	case
 		protoreflect.Uint64Kind,
 		protoreflect.Fixed64Kind:
+		if e.config.Backend == backendMsgspec {
+			e.addRuntimeImport("ProtoInt64")
+			return "ProtoInt64", nil
+		}
 		e.addRuntimeImport("ProtoUInt64")
 		return "ProtoUInt64", nil
 	case protoreflect.BoolKind:
@@ -1594,7 +5104,7 @@ func (e *generator) resolveBaseType(referer string, field protoreflect.FieldDesc
 	msg := field.Message()
 
 	// Well-known type mappings to native Python types.
-	if wkt, ok := wellKnownTypes[string(msg.FullName())]; ok {
+	if wkt, ok := e.wellKnownType(string(msg.FullName())); ok {
 		if wkt.runtimeType != "" {
 			e.addRuntimeImport(wkt.runtimeType)
 		} else if wkt.importLine != "" {
@@ -1603,6 +5113,9 @@ func (e *generator) resolveBaseType(referer string, field protoreflect.FieldDesc
 		if strings.Contains(wkt.pythonType, "_Any") {
 			e.addStdImport("_Any")
 		}
+		if strings.HasPrefix(wkt.pythonType, "_datetime.") {
+			e.addStdImport("_datetime")
+		}
 		return wkt.pythonType, nil
 	}
 
@@ -1721,6 +5234,23 @@ func resolveQualifiedName(d protoreflect.Descriptor) string {
 	return strings.TrimPrefix(name, prefix) // keep dots
 }
 
+// messageDependency returns the full name of the generated message a field
+// refers to, either directly, as a list element or as a map value. Scalars,
+// enums and well-known types have no model to build and yield "".
+func messageDependency(field protoreflect.FieldDescriptor) string {
+	if field.IsMap() {
+		field = field.MapValue()
+	}
+	if field.Kind() != protoreflect.MessageKind {
+		return ""
+	}
+	name := string(field.Message().FullName())
+	if _, ok := wellKnownTypes[name]; ok {
+		return ""
+	}
+	return name
+}
+
 func extractComments(sourceCodeInfo *descriptorpb.SourceCodeInfo, path []int32) (leading []string, trailing []string) {
 	if sourceCodeInfo != nil {
 		for _, location := range sourceCodeInfo.Location {
@@ -1800,13 +5330,15 @@ func buildCustomOptionFields(gen *protogen.Plugin) []CustomOptionField {
 
 // buildFieldConstraintExt scans gen.Files for the buf.validate.field extension
 // on google.protobuf.FieldOptions. Returns nil when buf.validate is not imported.
-func buildFieldConstraintExt(gen *protogen.Plugin) protoreflect.ExtensionDescriptor {
+// findValidateExt returns the buf.validate extension of the given options
+// message, e.g. (buf.validate.field) on google.protobuf.FieldOptions.
+func findValidateExt(gen *protogen.Plugin, extendee protoreflect.FullName, name string) protoreflect.ExtensionDescriptor {
 	for _, f := range gen.Files {
 		exts := f.Desc.Extensions()
 		for i := 0; i < exts.Len(); i++ {
 			ext := exts.Get(i)
-			if ext.ContainingMessage().FullName() == "google.protobuf.FieldOptions" &&
-				string(ext.Name()) == "field" &&
+			if ext.ContainingMessage().FullName() == extendee &&
+				string(ext.Name()) == name &&
 				string(ext.ParentFile().Package()) == "buf.validate" {
 				return ext
 			}
@@ -1883,9 +5415,13 @@ func (e *generator) extractFieldConstraints(
 		switch {
 		case name == "required" && v.Bool():
 			result.Required = true
-		case name == "cel":
-			// cel is a repeated Constraint message; not translated.
-			result.DroppedConstraints = append(result.DroppedConstraints, "cel")
+		case name == "cel" || name == "cel_expression":
+			// Rules outside the supported CEL subset stay a dropped comment.
+			rules, ok := e.compileCelRules(fd, v.List(), "value", e.celFieldType(field))
+			result.Cel = append(result.Cel, rules...)
+			if !ok {
+				result.DroppedConstraints = append(result.DroppedConstraints, "cel")
+			}
 		case fd.Kind() == protoreflect.MessageKind && !fd.IsList():
 			// Type-specific rules sub-message (int32, string, repeated, map, etc.)
 			v.Message().Range(func(rfd protoreflect.FieldDescriptor, rv protoreflect.Value) bool {
@@ -1901,20 +5437,139 @@ func (e *generator) extractFieldConstraints(
 	if !result.HasAny() {
 		return nil
 	}
+	if result.UniqueItems {
+		result.UniqueValidator = uniqueValidator(field.Kind(), e.config.FrozenModels)
+	}
+	if e.config.Backend == backendMsgspec {
+		switch field.Kind() {
+		case protoreflect.Int64Kind, protoreflect.Uint64Kind, protoreflect.Sint64Kind,
+			protoreflect.Fixed64Kind, protoreflect.Sfixed64Kind:
+			result.dropForMsgspec(true)
+		default:
+			result.dropForMsgspec(false)
+		}
+	}
+	if len(result.Cel) > 0 {
+		e.addStdImport("_field_validator")
+	}
 	// Sort dropped constraint names so the emitted comments are deterministic
 	// regardless of the non-deterministic iteration order of protoreflect.Range.
 	sort.Strings(result.DroppedConstraints)
 	if result.ConstLiteral != nil {
 		e.addStdImport("_Literal")
 	}
-	if len(result.InValues) > 0 || len(result.NotInValues) > 0 || result.UniqueItems || result.FormatValidator != nil ||
-		result.RequireFinite || result.ConstFloatLiteral != nil {
+	if len(result.InValues) > 0 || result.ConstFloatLiteral != nil {
+		e.addStdImport("_Annotated")
+	}
+	if len(result.NotInValues) > 0 || result.UniqueItems || result.FormatValidator != nil || result.RequireFinite {
 		e.addStdImport("_Annotated")
 		e.addStdImport("_AfterValidator")
 	}
 	return result
 }
 
+// compileCelRules compiles a cel (buf.validate.Rule) or cel_expression
+// (string) list with this bound to the Python name subject. ok is false when
+// any rule falls outside the supported CEL subset; those rules are skipped.
+func (e *generator) compileCelRules(
+	fd protoreflect.FieldDescriptor,
+	list protoreflect.List,
+	subject string,
+	this *celType,
+) (rules []*celRule, ok bool) {
+	ok = true
+	for i := 0; i < list.Len(); i++ {
+		var id, message, expression string
+		if fd.Kind() == protoreflect.StringKind {
+			expression = list.Get(i).String()
+		} else {
+			list.Get(i).Message().Range(func(rfd protoreflect.FieldDescriptor, rv protoreflect.Value) bool {
+				switch rfd.Name() {
+				case "id":
+					id = rv.String()
+				case "message":
+					message = rv.String()
+				case "expression":
+					expression = rv.String()
+				}
+				return true
+			})
+		}
+		rule, err := e.compileCel(expression, subject, this)
+		if err != nil {
+			ok = false
+			continue
+		}
+		for _, text := range []string{message, id, expression} {
+			if text != "" {
+				rule.Message = pyQuote(text)
+				break
+			}
+		}
+		if rule.UsesRe {
+			e.addStdImport("_re")
+		}
+		rules = append(rules, rule)
+	}
+	return rules, ok
+}
+
+// extractMessageCel compiles the message-level (buf.validate.message) CEL
+// rules of msg. dropped reports rules outside the supported subset.
+func (e *generator) extractMessageCel(
+	opts *descriptorpb.MessageOptions,
+	msg protoreflect.MessageDescriptor,
+) (rules []*celRule, dropped bool) {
+	if opts == nil || e.messageConstraintExt == nil {
+		return nil, false
+	}
+	raw, err := proto.Marshal(opts)
+	if err != nil {
+		return nil, false
+	}
+	resolver := &protoregistry.Types{}
+	_ = resolver.RegisterExtension(dynamicpb.NewExtensionType(e.messageConstraintExt))
+	resolved := &descriptorpb.MessageOptions{}
+	if err := (proto.UnmarshalOptions{Resolver: resolver}).Unmarshal(raw, resolved); err != nil {
+		return nil, false
+	}
+	this := &celType{kind: celMessage, msg: msg}
+	resolved.ProtoReflect().Range(func(fd protoreflect.FieldDescriptor, v protoreflect.Value) bool {
+		if !fd.IsExtension() || fd.Name() != "message" {
+			return true
+		}
+		v.Message().Range(func(rfd protoreflect.FieldDescriptor, rv protoreflect.Value) bool {
+			if rfd.Name() == "cel" || rfd.Name() == "cel_expression" {
+				compiled, ok := e.compileCelRules(rfd, rv.List(), "self", this)
+				rules = append(rules, compiled...)
+				dropped = dropped || !ok
+			}
+			return true
+		})
+		return false
+	})
+	if len(rules) > 0 {
+		e.addStdImport("_model_validator")
+	}
+	return rules, dropped
+}
+
+// uniqueValidator picks the repeated.unique helper for an element kind:
+// a plain set for hashable scalars, a NaN-aware pass for floats, and a
+// canonical key for messages, which Pydantic models cannot be hashed as
+// unless they are frozen.
+func uniqueValidator(kind protoreflect.Kind, frozen bool) string {
+	switch kind {
+	case protoreflect.FloatKind, protoreflect.DoubleKind:
+		return "_require_unique_floats"
+	case protoreflect.MessageKind, protoreflect.GroupKind:
+		if !frozen {
+			return "_require_unique_messages"
+		}
+	}
+	return "_require_unique"
+}
+
 func extractRuleField(fc *FieldConstraints, fd protoreflect.FieldDescriptor, v protoreflect.Value, isFloat bool) {
 	switch string(fd.Name()) {
 	case "gt":
@@ -1988,7 +5643,7 @@ func extractRuleField(fc *FieldConstraints, fd protoreflect.FieldDescriptor, v p
 			}
 			fc.ConstDefault = &def
 		} else if fd.Kind() == protoreflect.FloatKind || fd.Kind() == protoreflect.DoubleKind {
-			// Literal[float] is invalid per PEP 586; use AfterValidator instead.
+			// Literal[float] is invalid per PEP 586; use _InValues instead.
 			var flit string
 			if fd.Kind() == protoreflect.FloatKind {
 				flit = formatPythonFloat(float64(float32(v.Float())))
@@ -2169,6 +5824,16 @@ func pythonLiteral(v interface{}) string {
 	}
 }
 
+func snakeToCamelCase(str string) string {
+	var b strings.Builder
+	for _, part := range strings.Split(str, "_") {
+		if part != "" {
+			b.WriteString(strings.ToUpper(part[:1]) + part[1:])
+		}
+	}
+	return b.String()
+}
+
 func camelToSnakeCase(str string) string {
 	snake := matchFirstCap.ReplaceAllString(str, "${1}_${2}")
 	snake = matchAllCap.ReplaceAllString(snake, "${1}_${2}")
@@ -0,0 +1,327 @@
+package main
+
+import (
+	"sort"
+	"strconv"
+	"strings"
+)
+
+// This file holds the backend=msgspec renderer. It reuses the model built by
+// processFile and processMessage (types, defaults, aliases, nested classes)
+// and renders each message as a msgspec.Struct instead of a _ProtoModel:
+// aliases become a rename map, proto3 zero values are left out of the
+// encoded JSON by omit_defaults, and the buf.validate constraints that
+// msgspec.Meta can check are moved into the field annotation. Everything
+// else is reported as a "not translated" comment, as the Pydantic backend
+// does for the constraints it cannot express. 64-bit integers are the one
+// runtime type: ProtoInt64 values, written as strings by the enc_hook and
+// made by the dec_hook of a per-directory _proto_types.py while decoding.
+
+const (
+	backendPydantic = "pydantic"
+	backendMsgspec  = "msgspec"
+)
+
+// msgspecTypes replaces the wellKnownTypes mappings that rely on the
+// Pydantic _proto_types runtime. Duration stays a ProtoJSON string ("1.5s"):
+// msgspec encodes timedelta as ISO 8601.
+var msgspecTypes = map[string]wktMapping{
+	"google.protobuf.Timestamp":   {pythonType: "_datetime.datetime"},
+	"google.protobuf.Duration":    {pythonType: "str"},
+	"google.protobuf.Int64Value":  {pythonType: "ProtoInt64", runtimeType: "ProtoInt64"},
+	"google.protobuf.UInt64Value": {pythonType: "ProtoInt64", runtimeType: "ProtoInt64"},
+}
+
+// msgspecProtoTypes is the _proto_types.py of the msgspec backend.
+const msgspecProtoTypes = `# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+
+class ProtoInt64(int):
+    """A 64-bit integer, which ProtoJSON writes as a decimal string.
+
+    msgspec has no string form for integers: pass enc_hook and dec_hook to
+    encoders and decoders, e.g. msgspec.json.decode(data, type=Model,
+    dec_hook=dec_hook). Decoded fields hold ProtoInt64 values; construct
+    them as ProtoInt64 too, as plain ints are written as JSON numbers.
+    """
+
+
+def enc_hook(obj):
+    """Write ProtoInt64 values as decimal strings."""
+    if isinstance(obj, ProtoInt64):
+        return int.__repr__(obj)
+    raise NotImplementedError(f"Objects of type {type(obj).__name__} are not supported")
+
+
+def dec_hook(type_, obj):
+    """Read ProtoInt64 values from decimal strings or JSON numbers."""
+    if type_ is not ProtoInt64:
+        raise NotImplementedError(f"Objects of type {type_.__name__} are not supported")
+    if isinstance(obj, str):
+        digits = obj[1:] if obj[:1] == "-" else obj
+        if digits.isdigit() and digits.isascii():
+            return ProtoInt64(obj)
+    elif isinstance(obj, int) and not isinstance(obj, bool):
+        return ProtoInt64(obj)
+    elif isinstance(obj, float) and obj.is_integer():
+        return ProtoInt64(obj)
+    raise ValueError(f"Invalid 64-bit integer: {obj!r}")
+`
+
+// moduleSuffix returns the suffix of the Python module generated for each
+// proto file, e.g. "_pydantic" for foo.proto → foo_pydantic.py.
+func (c GeneratorConfig) moduleSuffix() string {
+	return "_" + c.Backend
+}
+
+// dropForMsgspec moves the constraints msgspec.Meta cannot check to
+// DroppedConstraints, including the bounds of 64-bit integers: Meta only
+// constrains the builtin numeric types, not ProtoInt64. Examples are
+// documentation only and go silently.
+func (c *FieldConstraints) dropForMsgspec(int64Bounds bool) {
+	if int64Bounds {
+		for _, bound := range []struct {
+			name  string
+			value **string
+		}{{"gt", &c.Gt}, {"gte", &c.Gte}, {"lt", &c.Lt}, {"lte", &c.Lte}} {
+			if *bound.value != nil {
+				c.DroppedConstraints = append(c.DroppedConstraints, bound.name)
+				*bound.value = nil
+			}
+		}
+	}
+	if len(c.InValues) > 0 {
+		c.DroppedConstraints = append(c.DroppedConstraints, "in")
+	}
+	if len(c.NotInValues) > 0 {
+		c.DroppedConstraints = append(c.DroppedConstraints, "not_in")
+	}
+	if c.UniqueItems {
+		c.DroppedConstraints = append(c.DroppedConstraints, "unique")
+	}
+	if c.FormatValidator != nil {
+		c.DroppedConstraints = append(c.DroppedConstraints, *c.FormatValidator)
+	}
+	if c.RequireFinite {
+		c.DroppedConstraints = append(c.DroppedConstraints, "finite")
+	}
+	if c.ConstFloatLiteral != nil {
+		c.DroppedConstraints = append(c.DroppedConstraints, "const")
+	}
+	if len(c.Cel) > 0 {
+		c.DroppedConstraints = append(c.DroppedConstraints, "cel")
+	}
+	c.InValues, c.NotInValues, c.UniqueItems, c.UniqueValidator = nil, nil, false, ""
+	c.FormatValidator, c.RequireFinite, c.ConstFloatLiteral = nil, false, nil
+	c.Examples, c.Cel = nil, nil
+}
+
+// MetaArgs returns ["ge=0", "max_length=3", ...] for msgspec.Meta. Strings
+// are single-quoted like Literal values, as the annotation may be quoted.
+func (c *FieldConstraints) MetaArgs() []string {
+	if c == nil {
+		return nil
+	}
+	var args []string
+	for _, bound := range []struct {
+		name  string
+		value *string
+	}{{"ge", c.Gte}, {"gt", c.Gt}, {"le", c.Lte}, {"lt", c.Lt}} {
+		if bound.value != nil {
+			args = append(args, bound.name+"="+*bound.value)
+		}
+	}
+	if c.MinLength != nil {
+		args = append(args, "min_length="+strconv.FormatInt(*c.MinLength, 10))
+	}
+	if c.MaxLength != nil {
+		args = append(args, "max_length="+strconv.FormatInt(*c.MaxLength, 10))
+	}
+	if c.Pattern != nil {
+		args = append(args, "pattern="+pyQuoteSingle(*c.Pattern))
+	}
+	return args
+}
+
+// applyMsgspecMeta wraps f.Type in Annotated[..., msgspec.Meta(...)] for the
+// constraints that Meta supports.
+func (e *generator) applyMsgspecMeta(f *Field) {
+	args := f.Constraints.MetaArgs()
+	if len(args) == 0 {
+		return
+	}
+	f.Type = wrapWithAnnotated(f.Type, []string{"_msgspec.Meta(" + strings.Join(args, ", ") + ")"})
+	e.addStdImport("_Annotated")
+}
+
+// StructHeader renders the class statement of a msgspec.Struct, indented by
+// indent. Aliases become the rename map; the statement is split one keyword
+// per line when it has one or does not fit on a line.
+func (m Message) StructHeader(indent string) string {
+	bases := []string{"_msgspec.Struct", "omit_defaults=True", "kw_only=True"}
+	renames := map[string]string{}
+	for _, f := range m.Fields {
+		if f.Alias != "" {
+			renames[f.Name] = f.Alias
+		}
+	}
+	line := indent + "class " + m.Name + "(" + strings.Join(bases, ", ") + "):"
+	if len(renames) == 0 && len(line) <= 88 {
+		return line
+	}
+	var b strings.Builder
+	b.WriteString(indent + "class " + m.Name + "(\n")
+	for _, base := range bases {
+		b.WriteString(indent + "    " + base + ",\n")
+	}
+	if len(renames) > 0 {
+		names := make([]string, 0, len(renames))
+		for name := range renames {
+			names = append(names, name)
+		}
+		sort.Strings(names)
+		b.WriteString(indent + "    rename={\n")
+		for _, name := range names {
+			b.WriteString(indent + "        " + strconv.Quote(name) + ": " + strconv.Quote(renames[name]) + ",\n")
+		}
+		b.WriteString(indent + "    },\n")
+	}
+	b.WriteString(indent + "):")
+	return b.String()
+}
+
+// StructDefault renders the default of a msgspec.Struct field as " = ...",
+// or "" for a required field. A default that overflows the line is split the
+// way ruff format does it: a msgspec.field() call within its own parentheses
+// if the line up to them fits, and any default in added ones otherwise;
+// indent is the field's.
+func (f Field) StructDefault(indent string) string {
+	if f.Default == "default=..." {
+		return ""
+	}
+	value := strings.TrimPrefix(f.Default, "default=")
+	if f.IsDefaultFactory() {
+		value = "_msgspec.field(" + f.Default + ")"
+	}
+	head := lastLine(indent+f.Name+": "+f.Annotation) + " = "
+	switch {
+	case len(head+value) <= 88:
+		return " = " + value
+	case f.IsDefaultFactory() && (len(head+"_msgspec.field(") <= 88 || len(head+"(") > 88):
+		return " = _msgspec.field(\n" + indent + "    " + f.Default + "\n" + indent + ")"
+	case len(head+"(") <= 88:
+		return " = (\n" + indent + "    " + value + "\n" + indent + ")"
+	}
+	return " = " + value
+}
+
+// DropsCel reports whether the message has message-level CEL rules, which
+// the msgspec backend leaves as a comment.
+func (m Message) DropsCel() bool {
+	return len(m.Cel) > 0 || m.CelDropped
+}
+
+// Template for msgspec.Struct classes, sharing renderEnum and enumOptions
+// with the Pydantic template.
+const msgspecTemplate = `# DO NOT EDIT. Generated by protoc-gen-pydantic.
+{{- $config := .Config -}}
+{{- $hasEnumOptions := .HasEnumOptions -}}
+{{- $customOptionFields := .CustomOptionFields -}}
+{{- if .File.LeadingComments }}
+"""
+{{- range .File.LeadingComments }}
+{{ . }}
+{{- end }}
+"""
+{{- end }}
+{{ if .StdImports._datetime }}
+import datetime as _datetime
+{{- end }}
+{{- if .StdImports._Enum }}
+from enum import Enum as _Enum
+{{- end }}
+{{- if $hasEnumOptions }}
+from dataclasses import dataclass as _dataclass
+{{- end }}
+{{- if .TypingImportLine }}
+{{ .TypingImportLine }}
+{{- end }}
+{{- if .StdImports._msgspec }}
+{{ if or .StdImports._datetime .StdImports._Enum $hasEnumOptions .TypingImportLine }}
+{{ end -}}
+import msgspec as _msgspec
+{{- end }}
+{{- if .RuntimeImportLine }}
+
+{{ .RuntimeImportLine }}
+{{- end }}
+{{- range .RelativeImports }}
+
+{{ . }}
+{{- end }}
+{{- range .ExternalImports }}
+
+{{ . }}
+{{- end }}
+{{- if $hasEnumOptions }}
+
+
+{{template "enumOptions" .}}
+{{- end }}
+{{- range .Enums }}
+
+
+{{template "renderEnum" (dict "Enum" . "Indent" "" "Config" $config "HasEnumOptions" $hasEnumOptions "CustomOptionFields" $customOptionFields)}}{{- end }}{{- range .Messages }}
+
+
+{{template "renderStruct" (dict "Message" . "Indent" "" "Config" $config "HasEnumOptions" $hasEnumOptions "CustomOptionFields" $customOptionFields)}}{{- end -}}
+{{- range .File.TrailingComments }}
+# {{ . }}
+{{- end }}
+{{define "renderStruct" -}}
+{{- $m := index . "Message" -}}
+{{- $indent := index . "Indent" -}}
+{{- $bi := printf "%s    " $indent -}}
+{{- $config := index . "Config" -}}
+{{- $hasEnumOptions := index . "HasEnumOptions" -}}
+{{- $customOptionFields := index . "CustomOptionFields" -}}
+{{ $m.StructHeader $indent }}
+{{$bi}}"""
+{{- range $m.LeadingComments }}
+{{$bi}}{{ . }}
+{{- end }}
+{{$bi}}
+{{$bi}}Attributes:
+{{- range $m.Fields }}
+{{$bi}}  {{ .Name }} ({{ .Type }}):
+{{- range .LeadingComments }}
+{{$bi}}    {{ . }}
+{{- end }}
+{{- end }}
+{{$bi}}"""
+{{- range $m.NestedEnums }}
+
+{{template "renderEnum" (dict "Enum" . "Indent" $bi "Config" $config "HasEnumOptions" $hasEnumOptions "CustomOptionFields" $customOptionFields)}}{{- end }}{{- range $m.NestedMessages }}
+
+{{template "renderStruct" (dict "Message" . "Indent" $bi "Config" $config "HasEnumOptions" $hasEnumOptions "CustomOptionFields" $customOptionFields)}}{{- end }}
+{{- range $i, $v := $m.TrailingComments }}{{ if eq $i 0 }}
+{{ end }}
+{{$bi}}# {{ $v }}
+{{- end }}
+{{ range $i, $field := $m.Fields }}{{ if $i }}
+{{ end }}{{- range $field.LeadingComments }}
+{{$bi}}# {{ . }}
+{{- end }}
+{{- range $field.DroppedConstraintComments }}
+{{$bi}}{{ . }}
+{{- end }}
+{{$bi}}{{ $field.Name }}: {{ $field.Annotation }}{{ $field.StructDefault $bi }}
+{{- range $field.TrailingComments }}
+{{$bi}}# {{ . }}
+{{- end }}{{- end }}
+{{- if $m.DropsCel }}
+
+{{$bi}}# buf.validate: cel (not translated)
+{{- end }}
+{{- end -}}
+`
@@ -0,0 +1,64 @@
+"""Benchmark ProtoJSON int64 encoding on Collections.int64_repeated.
+
+Compares the generated ProtoInt64, whose string encoding and decoding run
+inside pydantic-core, with the previous definition that called a Python
+BeforeValidator and a Python serializer for every value.
+
+Run from the test/ directory:
+
+    uv run python benchmarks/bench_int64.py
+"""
+
+import timeit
+from typing import Annotated
+
+from api.v1.collections_pydantic import Collections
+from pydantic import BeforeValidator, Field, PlainSerializer, create_model
+
+N = 100_000
+REPEAT = 5
+
+LegacyInt64 = Annotated[
+    int,
+    BeforeValidator(lambda v: int(v)),
+    PlainSerializer(lambda v: str(v), return_type=str, when_used="json"),
+]
+
+LegacyCollections = create_model(
+    "LegacyCollections",
+    __base__=Collections,
+    int64_repeated=(list[LegacyInt64], Field(default_factory=list)),
+)
+
+
+def best(func, number=1):
+    return min(timeit.repeat(func, number=number, repeat=REPEAT)) / number
+
+
+def main():
+    values = list(range(-N // 2, N // 2))
+    model = Collections(int64_repeated=values)
+    legacy_model = LegacyCollections(int64_repeated=values)
+    payload = model.to_proto_json()
+    assert legacy_model.to_proto_json() == payload
+
+    rows = [
+        (
+            "validate JSON",
+            best(lambda: Collections.from_proto_json(payload)),
+            best(lambda: LegacyCollections.from_proto_json(payload)),
+        ),
+        (
+            "dump JSON",
+            best(model.to_proto_json),
+            best(legacy_model.to_proto_json),
+        ),
+    ]
+    print(f"Collections.int64_repeated, {N:,} values (best of {REPEAT})")
+    print(f"{'':16}{'ProtoInt64':>12}{'legacy':>12}{'speedup':>10}")
+    for name, new, old in rows:
+        print(f"{name:16}{new * 1e3:>10.2f}ms{old * 1e3:>10.2f}ms{old / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark ProtoJSON Timestamp and Duration codecs.
+
+Compares the generated ProtoTimestamp and ProtoDuration, which parse seconds
+and nanos as integers, with the previous definitions built on a duration
+regex, float seconds and strftime.
+
+Run from the test/ directory:
+
+    uv run python benchmarks/bench_wkt.py
+"""
+
+import datetime
+import re
+import timeit
+from typing import Annotated
+
+from api.v1._proto_types import ProtoDuration, ProtoTimestamp
+from pydantic import BeforeValidator, PlainSerializer, TypeAdapter
+
+N = 10_000
+REPEAT = 5
+
+
+def legacy_parse_timestamp(v):
+    if isinstance(v, str):
+        return datetime.datetime.fromisoformat(v.replace("Z", "+00:00"))
+    return v
+
+
+def legacy_serialize_timestamp(v):
+    if v.tzinfo is None:
+        v = v.replace(tzinfo=datetime.timezone.utc)
+    s = v.strftime("%Y-%m-%dT%H:%M:%S")
+    if v.microsecond:
+        s += f".{v.microsecond:06d}".rstrip("0")
+    return s + "Z"
+
+
+def legacy_parse_duration(v):
+    if isinstance(v, str):
+        m = re.match(r"^(-?\d+(?:\.\d+)?)s$", v)
+        if not m:
+            raise ValueError(f"Invalid duration: {v}")
+        return datetime.timedelta(seconds=float(m.group(1)))
+    return v
+
+
+def legacy_serialize_duration(v):
+    total = v.total_seconds()
+    if total == int(total):
+        return f"{int(total)}s"
+    return f"{total}s"
+
+
+LegacyTimestamp = Annotated[
+    datetime.datetime,
+    BeforeValidator(legacy_parse_timestamp),
+    PlainSerializer(legacy_serialize_timestamp, return_type=str, when_used="json"),
+]
+
+LegacyDuration = Annotated[
+    datetime.timedelta,
+    BeforeValidator(legacy_parse_duration),
+    PlainSerializer(legacy_serialize_duration, return_type=str, when_used="json"),
+]
+
+
+def best(func, number=1):
+    return min(timeit.repeat(func, number=number, repeat=REPEAT)) / number
+
+
+def compare(name, new_type, old_type, payload):
+    new = TypeAdapter(list[new_type])
+    old = TypeAdapter(list[old_type])
+    values = new.validate_json(payload)
+    assert old.validate_json(payload) == values
+    return [
+        (
+            f"{name} validate",
+            best(lambda: new.validate_json(payload)),
+            best(lambda: old.validate_json(payload)),
+        ),
+        (
+            f"{name} dump",
+            best(lambda: new.dump_json(values)),
+            best(lambda: old.dump_json(values)),
+        ),
+    ]
+
+
+def main():
+    start = datetime.datetime(2024, 1, 15, tzinfo=datetime.timezone.utc)
+    timestamps = TypeAdapter(list[ProtoTimestamp]).dump_json(
+        [start + datetime.timedelta(seconds=i, microseconds=i * 7) for i in range(N)]
+    )
+    durations = TypeAdapter(list[ProtoDuration]).dump_json(
+        [datetime.timedelta(seconds=i, microseconds=i * 7) for i in range(N)]
+    )
+    rows = compare("Timestamp", ProtoTimestamp, LegacyTimestamp, timestamps)
+    rows += compare("Duration", ProtoDuration, LegacyDuration, durations)
+
+    print(f"{N:,} values per list (best of {REPEAT})")
+    print(f"{'':20}{'new':>12}{'legacy':>12}{'speedup':>10}")
+    for name, new, old in rows:
+        print(f"{name:20}{new * 1e3:>10.2f}ms{old * 1e3:>10.2f}ms{old / new:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 
 from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
 
-from ._proto_types import ProtoInt64, ProtoUInt64
+from ._proto_types import ProtoInt64, ProtoModelMixin, ProtoUInt64, ProtoWire
 
 from .enums_pydantic import Enum
 
@@ -12,7 +12,7 @@ from .scalars_pydantic import Scalars
 from .messages_pydantic import Message
 
 
-class _ProtoModel(_BaseModel):
+class _ProtoModel(ProtoModelMixin, _BaseModel):
     """Base class for generated Pydantic models with ProtoJSON helpers."""
 
     model_config = _ConfigDict(
@@ -22,36 +22,6 @@ class _ProtoModel(_BaseModel):
         ser_json_inf_nan="strings",
     )
 
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
-
 
 class Collections(_ProtoModel):
     """
@@ -109,202 +79,260 @@ class Collections(_ProtoModel):
       nested_message_map_value (dict[str, Scalars.NestedMessage]):
     """
 
-    int32_repeated: "list[int]" = _Field(
+    int32_repeated: list[int] = _Field(
         default_factory=list,
     )
 
-    int64_repeated: "list[ProtoInt64]" = _Field(
+    int64_repeated: list[ProtoInt64] = _Field(
         default_factory=list,
     )
 
-    uint32_repeated: "list[int]" = _Field(
+    uint32_repeated: list[int] = _Field(
         default_factory=list,
     )
 
-    uint64_repeated: "list[ProtoUInt64]" = _Field(
+    uint64_repeated: list[ProtoUInt64] = _Field(
         default_factory=list,
     )
 
-    fixed32_repeated: "list[int]" = _Field(
+    fixed32_repeated: list[int] = _Field(
         default_factory=list,
     )
 
-    fixed64_repeated: "list[ProtoUInt64]" = _Field(
+    fixed64_repeated: list[ProtoUInt64] = _Field(
         default_factory=list,
     )
 
-    sint32_repeated: "list[int]" = _Field(
+    sint32_repeated: list[int] = _Field(
         default_factory=list,
     )
 
-    sint64_repeated: "list[ProtoInt64]" = _Field(
+    sint64_repeated: list[ProtoInt64] = _Field(
         default_factory=list,
     )
 
-    sfixed32_repeated: "list[int]" = _Field(
+    sfixed32_repeated: list[int] = _Field(
         default_factory=list,
     )
 
-    sfixed64_repeated: "list[ProtoInt64]" = _Field(
+    sfixed64_repeated: list[ProtoInt64] = _Field(
         default_factory=list,
     )
 
-    bool_repeated: "list[bool]" = _Field(
+    bool_repeated: list[bool] = _Field(
         default_factory=list,
     )
 
-    float_repeated: "list[float]" = _Field(
+    float_repeated: list[float] = _Field(
         default_factory=list,
     )
 
-    double_repeated: "list[float]" = _Field(
+    double_repeated: list[float] = _Field(
         default_factory=list,
     )
 
-    string_repeated: "list[str]" = _Field(
+    string_repeated: list[str] = _Field(
         default_factory=list,
     )
 
-    bytes_repeated: "list[bytes]" = _Field(
+    bytes_repeated: list[bytes] = _Field(
         default_factory=list,
     )
 
-    enum_repeated: "list[Enum]" = _Field(
+    enum_repeated: list[Enum] = _Field(
         default_factory=list,
     )
 
-    nested_enum_repeated: "list[Scalars.NestedEnum]" = _Field(
+    nested_enum_repeated: list[Scalars.NestedEnum] = _Field(
         default_factory=list,
     )
 
-    message_repeated: "list[Message]" = _Field(
+    message_repeated: list[Message] = _Field(
         default_factory=list,
     )
 
-    nested_message_repeated: "list[Scalars.NestedMessage]" = _Field(
+    nested_message_repeated: list[Scalars.NestedMessage] = _Field(
         default_factory=list,
     )
 
-    int32_map_key: "dict[int, str]" = _Field(
+    int32_map_key: dict[int, str] = _Field(
         default_factory=dict,
     )
 
-    int64_map_key: "dict[ProtoInt64, str]" = _Field(
+    int64_map_key: dict[ProtoInt64, str] = _Field(
         default_factory=dict,
     )
 
-    uint32_map_key: "dict[int, str]" = _Field(
+    uint32_map_key: dict[int, str] = _Field(
         default_factory=dict,
     )
 
-    uint64_map_key: "dict[ProtoUInt64, str]" = _Field(
+    uint64_map_key: dict[ProtoUInt64, str] = _Field(
         default_factory=dict,
     )
 
-    fixed32_map_key: "dict[int, str]" = _Field(
+    fixed32_map_key: dict[int, str] = _Field(
         default_factory=dict,
     )
 
-    fixed64_map_key: "dict[ProtoUInt64, str]" = _Field(
+    fixed64_map_key: dict[ProtoUInt64, str] = _Field(
         default_factory=dict,
     )
 
-    sint32_map_key: "dict[int, str]" = _Field(
+    sint32_map_key: dict[int, str] = _Field(
         default_factory=dict,
     )
 
-    sint64_map_key: "dict[ProtoInt64, str]" = _Field(
+    sint64_map_key: dict[ProtoInt64, str] = _Field(
         default_factory=dict,
     )
 
-    sfixed32_map_key: "dict[int, str]" = _Field(
+    sfixed32_map_key: dict[int, str] = _Field(
         default_factory=dict,
     )
 
-    sfixed64_map_key: "dict[ProtoInt64, str]" = _Field(
+    sfixed64_map_key: dict[ProtoInt64, str] = _Field(
         default_factory=dict,
     )
 
-    bool_map_key: "dict[bool, str]" = _Field(
+    bool_map_key: dict[bool, str] = _Field(
         default_factory=dict,
     )
 
-    string_map_key: "dict[str, str]" = _Field(
+    string_map_key: dict[str, str] = _Field(
         default_factory=dict,
     )
 
-    int32_map_value: "dict[str, int]" = _Field(
+    int32_map_value: dict[str, int] = _Field(
         default_factory=dict,
     )
 
-    int64_map_value: "dict[str, ProtoInt64]" = _Field(
+    int64_map_value: dict[str, ProtoInt64] = _Field(
         default_factory=dict,
     )
 
-    uint32_map_value: "dict[str, int]" = _Field(
+    uint32_map_value: dict[str, int] = _Field(
         default_factory=dict,
     )
 
-    uint64_map_value: "dict[str, ProtoUInt64]" = _Field(
+    uint64_map_value: dict[str, ProtoUInt64] = _Field(
         default_factory=dict,
     )
 
-    fixed32_map_value: "dict[str, int]" = _Field(
+    fixed32_map_value: dict[str, int] = _Field(
         default_factory=dict,
     )
 
-    fixed64_map_value: "dict[str, ProtoUInt64]" = _Field(
+    fixed64_map_value: dict[str, ProtoUInt64] = _Field(
         default_factory=dict,
     )
 
-    sint32_map_value: "dict[str, int]" = _Field(
+    sint32_map_value: dict[str, int] = _Field(
         default_factory=dict,
     )
 
-    sint64_map_value: "dict[str, ProtoInt64]" = _Field(
+    sint64_map_value: dict[str, ProtoInt64] = _Field(
         default_factory=dict,
     )
 
-    sfixed32_map_value: "dict[str, int]" = _Field(
+    sfixed32_map_value: dict[str, int] = _Field(
         default_factory=dict,
     )
 
-    sfixed64_map_value: "dict[str, ProtoInt64]" = _Field(
+    sfixed64_map_value: dict[str, ProtoInt64] = _Field(
         default_factory=dict,
     )
 
-    bool_map_value: "dict[str, bool]" = _Field(
+    bool_map_value: dict[str, bool] = _Field(
         default_factory=dict,
     )
 
-    float_map_value: "dict[str, float]" = _Field(
+    float_map_value: dict[str, float] = _Field(
         default_factory=dict,
     )
 
-    double_map_value: "dict[str, float]" = _Field(
+    double_map_value: dict[str, float] = _Field(
         default_factory=dict,
     )
 
-    string_map_value: "dict[str, str]" = _Field(
+    string_map_value: dict[str, str] = _Field(
         default_factory=dict,
     )
 
-    bytes_map_value: "dict[str, bytes]" = _Field(
+    bytes_map_value: dict[str, bytes] = _Field(
         default_factory=dict,
     )
 
-    enum_map_value: "dict[str, Enum]" = _Field(
+    enum_map_value: dict[str, Enum] = _Field(
         default_factory=dict,
     )
 
-    nested_enum_map_value: "dict[str, Scalars.NestedEnum]" = _Field(
+    nested_enum_map_value: dict[str, Scalars.NestedEnum] = _Field(
         default_factory=dict,
     )
 
-    message_map_value: "dict[str, Message]" = _Field(
+    message_map_value: dict[str, Message] = _Field(
         default_factory=dict,
     )
 
-    nested_message_map_value: "dict[str, Scalars.NestedMessage]" = _Field(
+    nested_message_map_value: dict[str, Scalars.NestedMessage] = _Field(
         default_factory=dict,
     )
+
+    __proto_wire__ = ProtoWire(
+        (1, "int32_repeated", "packed int32"),
+        (2, "int64_repeated", "packed int64"),
+        (3, "uint32_repeated", "packed uint32"),
+        (4, "uint64_repeated", "packed uint64"),
+        (5, "fixed32_repeated", "packed fixed32"),
+        (6, "fixed64_repeated", "packed fixed64"),
+        (7, "sint32_repeated", "packed sint32"),
+        (8, "sint64_repeated", "packed sint64"),
+        (9, "sfixed32_repeated", "packed sfixed32"),
+        (10, "sfixed64_repeated", "packed sfixed64"),
+        (11, "bool_repeated", "packed bool"),
+        (12, "float_repeated", "packed float"),
+        (13, "double_repeated", "packed double"),
+        (14, "string_repeated", "repeated string"),
+        (15, "bytes_repeated", "repeated bytes"),
+        (16, "enum_repeated", "packed enum", "Enum"),
+        (17, "nested_enum_repeated", "packed enum", "Scalars.NestedEnum"),
+        (18, "message_repeated", "repeated message", "Message"),
+        (19, "nested_message_repeated", "repeated message", "Scalars.NestedMessage"),
+        (21, "int32_map_key", "map<int32, string>"),
+        (22, "int64_map_key", "map<int64, string>"),
+        (23, "uint32_map_key", "map<uint32, string>"),
+        (24, "uint64_map_key", "map<uint64, string>"),
+        (25, "fixed32_map_key", "map<fixed32, string>"),
+        (26, "fixed64_map_key", "map<fixed64, string>"),
+        (27, "sint32_map_key", "map<sint32, string>"),
+        (28, "sint64_map_key", "map<sint64, string>"),
+        (29, "sfixed32_map_key", "map<sfixed32, string>"),
+        (30, "sfixed64_map_key", "map<sfixed64, string>"),
+        (31, "bool_map_key", "map<bool, string>"),
+        (32, "string_map_key", "map<string, string>"),
+        (33, "int32_map_value", "map<string, int32>"),
+        (34, "int64_map_value", "map<string, int64>"),
+        (35, "uint32_map_value", "map<string, uint32>"),
+        (36, "uint64_map_value", "map<string, uint64>"),
+        (37, "fixed32_map_value", "map<string, fixed32>"),
+        (38, "fixed64_map_value", "map<string, fixed64>"),
+        (39, "sint32_map_value", "map<string, sint32>"),
+        (40, "sint64_map_value", "map<string, sint64>"),
+        (41, "sfixed32_map_value", "map<string, sfixed32>"),
+        (42, "sfixed64_map_value", "map<string, sfixed64>"),
+        (43, "bool_map_value", "map<string, bool>"),
+        (44, "float_map_value", "map<string, float>"),
+        (45, "double_map_value", "map<string, double>"),
+        (46, "string_map_value", "map<string, string>"),
+        (47, "bytes_map_value", "map<string, bytes>"),
+        (48, "enum_map_value", "map<string, enum>", "Enum"),
+        (49, "nested_enum_map_value", "map<string, enum>", "Scalars.NestedEnum"),
+        (50, "message_map_value", "map<string, message>", "Message"),
+        (
+            51,
+            "nested_message_map_value",
+            "map<string, message>",
+            "Scalars.NestedMessage",
+        ),
+    )
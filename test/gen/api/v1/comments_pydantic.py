@@ -4,8 +4,10 @@ from enum import Enum as _Enum
 
 from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
 
+from ._proto_types import ProtoModelMixin, ProtoWire
 
-class _ProtoModel(_BaseModel):
+
+class _ProtoModel(ProtoModelMixin, _BaseModel):
     """Base class for generated Pydantic models with ProtoJSON helpers."""
 
     model_config = _ConfigDict(
@@ -15,36 +17,6 @@ class _ProtoModel(_BaseModel):
         ser_json_inf_nan="strings",
     )
 
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
-
 
 class CommentedMessage(_ProtoModel):
     """
@@ -81,6 +53,12 @@ class CommentedMessage(_ProtoModel):
         INACTIVE = "INACTIVE"  # 2
         # Right comment on INACTIVE.
 
+        __proto_numbers__ = {
+            "UNSPECIFIED": 0,
+            "ACTIVE": 1,
+            "INACTIVE": 2,
+        }
+
     class NestedMessage(_ProtoModel):
         """
         Leading comment on NestedMessage.
@@ -100,7 +78,7 @@ class CommentedMessage(_ProtoModel):
 
         # Leading comment on nested first_name.
         # The given name in the nested message.
-        first_name: "str" = _Field(
+        first_name: str = _Field(
             default="",
             description="Leading comment on nested first_name.\nThe given name in the nested message.",
         )
@@ -108,18 +86,23 @@ class CommentedMessage(_ProtoModel):
 
         # Leading comment on nested last_name.
         # The family name in the nested message.
-        last_name: "str" = _Field(
+        last_name: str = _Field(
             default="",
             description="Leading comment on nested last_name.\nThe family name in the nested message.",
         )
         # Right comment on nested last_name.
 
+        __proto_wire__ = ProtoWire(
+            (1, "first_name", "string"),
+            (2, "last_name", "string"),
+        )
+
     # Trailing comment on CommentedMessage.
     # Documents internal structure.
 
     # Leading comment on first_name.
     # The given name of the person.
-    first_name: "str" = _Field(
+    first_name: str = _Field(
         default="",
         description="Leading comment on first_name.\nThe given name of the person.",
     )
@@ -127,12 +110,17 @@ class CommentedMessage(_ProtoModel):
 
     # Leading comment on last_name.
     # The family name of the person.
-    last_name: "str" = _Field(
+    last_name: str = _Field(
         default="",
         description="Leading comment on last_name.\nThe family name of the person.",
     )
     # Right comment on last_name.
 
+    __proto_wire__ = ProtoWire(
+        (1, "first_name", "string"),
+        (2, "last_name", "string"),
+    )
+
 
 class Outer(_ProtoModel):
     """
@@ -152,6 +140,11 @@ class Outer(_ProtoModel):
 
         X = "X"  # 1
 
+        __proto_numbers__ = {
+            "UNSPECIFIED": 0,
+            "X": 1,
+        }
+
     class Inner(_ProtoModel):
         """
         Inner message comment.
@@ -170,6 +163,11 @@ class Outer(_ProtoModel):
 
             A = "A"  # 1
 
+            __proto_numbers__ = {
+                "UNSPECIFIED": 0,
+                "A": 1,
+            }
+
         class Deepest(_ProtoModel):
             """
             Deepest message comment.
@@ -180,19 +178,31 @@ class Outer(_ProtoModel):
             """
 
             # Deepest field comment.
-            deepest_field: "str" = _Field(
+            deepest_field: str = _Field(
                 default="",
                 description="Deepest field comment.",
             )
 
+            __proto_wire__ = ProtoWire(
+                (1, "deepest_field", "string"),
+            )
+
         # Inner field comment.
-        inner_field: "str" = _Field(
+        inner_field: str = _Field(
             default="",
             description="Inner field comment.",
         )
 
+        __proto_wire__ = ProtoWire(
+            (1, "inner_field", "string"),
+        )
+
     # Outer field comment.
-    outer_field: "str" = _Field(
+    outer_field: str = _Field(
         default="",
         description="Outer field comment.",
     )
+
+    __proto_wire__ = ProtoWire(
+        (1, "outer_field", "string"),
+    )
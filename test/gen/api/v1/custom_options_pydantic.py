@@ -66,6 +66,13 @@ class Currency(_ProtoEnum):
         ),
     )  # 3
 
+    __proto_numbers__ = {
+        "UNSPECIFIED": 0,
+        "USD": 1,
+        "EUR": 2,
+        "GBP": 3,
+    }
+
 
 class Color(str, _Enum):
     """
@@ -79,3 +86,10 @@ class Color(str, _Enum):
     GREEN = "GREEN"  # 2
 
     BLUE = "BLUE"  # 3
+
+    __proto_numbers__ = {
+        "UNSPECIFIED": 0,
+        "RED": 1,
+        "GREEN": 2,
+        "BLUE": 3,
+    }
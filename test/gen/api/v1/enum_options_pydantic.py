@@ -53,3 +53,10 @@ class Status(_ProtoEnum):
         "ARCHIVED",
         _EnumValueOptions(number=3, deprecated=True, debug_redact=True),
     )  # 3
+
+    __proto_numbers__ = {
+        "UNSPECIFIED": 0,
+        "ACTIVE": 1,
+        "INACTIVE": 2,
+        "ARCHIVED": 3,
+    }
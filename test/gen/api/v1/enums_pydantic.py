@@ -11,3 +11,9 @@ class Enum(str, _Enum):
     ACTIVE = "ACTIVE"  # 1
 
     INACTIVE = "INACTIVE"  # 2
+
+    __proto_numbers__ = {
+        "UNSPECIFIED": 0,
+        "ACTIVE": 1,
+        "INACTIVE": 2,
+    }
@@ -4,10 +4,17 @@ from typing import Any as _Any
 
 from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
 
-from ._proto_types import ProtoDuration, ProtoInt64, ProtoTimestamp, ProtoUInt64
+from ._proto_types import (
+    ProtoDuration,
+    ProtoInt64,
+    ProtoModelMixin,
+    ProtoTimestamp,
+    ProtoUInt64,
+    ProtoWire,
+)
 
 
-class _ProtoModel(_BaseModel):
+class _ProtoModel(ProtoModelMixin, _BaseModel):
     """Base class for generated Pydantic models with ProtoJSON helpers."""
 
     model_config = _ConfigDict(
@@ -17,36 +24,6 @@ class _ProtoModel(_BaseModel):
         ser_json_inf_nan="strings",
     )
 
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
-
 
 class WellKnownTypes(_ProtoModel):
     """
@@ -71,36 +48,56 @@ class WellKnownTypes(_ProtoModel):
       wkt_empty (None):
     """
 
-    wkt_timestamp: "ProtoTimestamp | None" = _Field(default=None)
+    wkt_timestamp: ProtoTimestamp | None = _Field(default=None)
 
-    wkt_duration: "ProtoDuration | None" = _Field(default=None)
+    wkt_duration: ProtoDuration | None = _Field(default=None)
 
-    wkt_struct: "dict[str, _Any] | None" = _Field(default=None)
+    wkt_struct: dict[str, _Any] | None = _Field(default=None)
 
-    wkt_value: "_Any | None" = _Field(default=None)
+    wkt_value: _Any | None = _Field(default=None)
 
-    wkt_list_value: "list[_Any] | None" = _Field(default=None)
+    wkt_list_value: list[_Any] | None = _Field(default=None)
 
-    wkt_any: "_Any | None" = _Field(default=None)
+    wkt_any: _Any | None = _Field(default=None)
 
-    wkt_field_mask: "list[str] | None" = _Field(default=None)
+    wkt_field_mask: list[str] | None = _Field(default=None)
 
-    wkt_bool: "bool | None" = _Field(default=None)
+    wkt_bool: bool | None = _Field(default=None)
 
-    wkt_int32: "int | None" = _Field(default=None)
+    wkt_int32: int | None = _Field(default=None)
 
-    wkt_int64: "ProtoInt64 | None" = _Field(default=None)
+    wkt_int64: ProtoInt64 | None = _Field(default=None)
 
-    wkt_uint32: "int | None" = _Field(default=None)
+    wkt_uint32: int | None = _Field(default=None)
 
-    wkt_uint64: "ProtoUInt64 | None" = _Field(default=None)
+    wkt_uint64: ProtoUInt64 | None = _Field(default=None)
 
-    wkt_float: "float | None" = _Field(default=None)
+    wkt_float: float | None = _Field(default=None)
 
-    wkt_double: "float | None" = _Field(default=None)
+    wkt_double: float | None = _Field(default=None)
 
-    wkt_string: "str | None" = _Field(default=None)
+    wkt_string: str | None = _Field(default=None)
 
-    wkt_bytes: "bytes | None" = _Field(default=None)
+    wkt_bytes: bytes | None = _Field(default=None)
 
-    wkt_empty: "None" = _Field(default=None)
+    wkt_empty: None = _Field(default=None)
+
+    __proto_wire__ = ProtoWire(
+        (1, "wkt_timestamp", "google.protobuf.Timestamp"),
+        (2, "wkt_duration", "google.protobuf.Duration"),
+        (3, "wkt_struct", "google.protobuf.Struct"),
+        (4, "wkt_value", "google.protobuf.Value"),
+        (5, "wkt_list_value", "google.protobuf.ListValue"),
+        (6, "wkt_any", "google.protobuf.Any"),
+        (7, "wkt_field_mask", "google.protobuf.FieldMask"),
+        (8, "wkt_bool", "google.protobuf.BoolValue"),
+        (9, "wkt_int32", "google.protobuf.Int32Value"),
+        (10, "wkt_int64", "google.protobuf.Int64Value"),
+        (11, "wkt_uint32", "google.protobuf.UInt32Value"),
+        (12, "wkt_uint64", "google.protobuf.UInt64Value"),
+        (13, "wkt_float", "google.protobuf.FloatValue"),
+        (14, "wkt_double", "google.protobuf.DoubleValue"),
+        (15, "wkt_string", "google.protobuf.StringValue"),
+        (16, "wkt_bytes", "google.protobuf.BytesValue"),
+        (17, "wkt_empty", "google.protobuf.Empty"),
+    )
@@ -3,8 +3,10 @@
 
 from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
 
+from ._proto_types import ProtoModelMixin, ProtoWire
 
-class _ProtoModel(_BaseModel):
+
+class _ProtoModel(ProtoModelMixin, _BaseModel):
     """Base class for generated Pydantic models with ProtoJSON helpers."""
 
     model_config = _ConfigDict(
@@ -14,36 +16,6 @@ class _ProtoModel(_BaseModel):
         ser_json_inf_nan="strings",
     )
 
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
-
 
 class Message(_ProtoModel):
     """
@@ -53,9 +25,14 @@ class Message(_ProtoModel):
       last_name (str):
     """
 
-    first_name: "str" = _Field(default="")
+    first_name: str = _Field(default="")
 
-    last_name: "str" = _Field(default="")
+    last_name: str = _Field(default="")
+
+    __proto_wire__ = ProtoWire(
+        (1, "first_name", "string"),
+        (2, "last_name", "string"),
+    )
 
 
 class Empty(_ProtoModel):
@@ -64,4 +41,4 @@ class Empty(_ProtoModel):
     Attributes:
     """
 
-    pass
+    __proto_wire__ = ProtoWire()
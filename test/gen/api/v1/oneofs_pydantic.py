@@ -1,10 +1,17 @@
 # DO NOT EDIT. Generated by protoc-gen-pydantic.
 
 
-from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
+from pydantic import (
+    BaseModel as _BaseModel,
+    ConfigDict as _ConfigDict,
+    Field as _Field,
+    model_validator as _model_validator,
+)
 
+from ._proto_types import ProtoModelMixin, ProtoWire
 
-class _ProtoModel(_BaseModel):
+
+class _ProtoModel(ProtoModelMixin, _BaseModel):
     """Base class for generated Pydantic models with ProtoJSON helpers."""
 
     model_config = _ConfigDict(
@@ -14,36 +21,6 @@ class _ProtoModel(_BaseModel):
         ser_json_inf_nan="strings",
     )
 
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
-
 
 class Oneofs(_ProtoModel):
     """
@@ -53,12 +30,24 @@ class Oneofs(_ProtoModel):
       b (str | None):
     """
 
-    a: "int | None" = _Field(
+    a: int | None = _Field(
         default=None,
         description="Only one of the fields can be specified with: [a b] (oneof union)",
     )
 
-    b: "str | None" = _Field(
+    b: str | None = _Field(
         default=None,
         description="Only one of the fields can be specified with: [a b] (oneof union)",
     )
+
+    @_model_validator(mode="after")
+    def _check_oneofs(self):
+        return self.__proto_wire__.check_oneofs(self)
+
+    __proto_wire__ = ProtoWire(
+        (1, "a", "optional int32"),
+        (2, "b", "optional string"),
+        oneofs={
+            "union": ("a", "b"),
+        },
+    )
@@ -3,8 +3,10 @@
 
 from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
 
+from ._proto_types import ProtoModelMixin, ProtoWire
 
-class _ProtoModel(_BaseModel):
+
+class _ProtoModel(ProtoModelMixin, _BaseModel):
     """Base class for generated Pydantic models with ProtoJSON helpers."""
 
     model_config = _ConfigDict(
@@ -14,36 +16,6 @@ class _ProtoModel(_BaseModel):
         ser_json_inf_nan="strings",
     )
 
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
-
 
 class ReservedFieldNames(_ProtoModel):
     """
@@ -52,21 +24,34 @@ class ReservedFieldNames(_ProtoModel):
       model_config_ (str):
       model_fields_ (str):
       model_dump_ (str):
+      merge_from_ (str):
     """
 
     model_config = _ConfigDict(populate_by_name=True)
 
-    model_config_: "str" = _Field(
+    model_config_: str = _Field(
         default="",
         alias="model_config",
     )
 
-    model_fields_: "str" = _Field(
+    model_fields_: str = _Field(
         default="",
         alias="model_fields",
     )
 
-    model_dump_: "str" = _Field(
+    model_dump_: str = _Field(
         default="",
         alias="model_dump",
     )
+
+    merge_from_: str = _Field(
+        default="",
+        alias="merge_from",
+    )
+
+    __proto_wire__ = ProtoWire(
+        (1, "model_config_", "string"),
+        (2, "model_fields_", "string"),
+        (3, "model_dump_", "string"),
+        (4, "merge_from_", "string"),
+    )
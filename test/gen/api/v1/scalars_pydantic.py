@@ -2,16 +2,21 @@
 
 from enum import Enum as _Enum
 
-from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
+from pydantic import (
+    BaseModel as _BaseModel,
+    ConfigDict as _ConfigDict,
+    Field as _Field,
+    model_serializer as _model_serializer,
+)
 
-from ._proto_types import ProtoInt64, ProtoUInt64
+from ._proto_types import ProtoInt64, ProtoModelMixin, ProtoUInt64, ProtoWire
 
 from .enums_pydantic import Enum
 
 from .messages_pydantic import Message
 
 
-class _ProtoModel(_BaseModel):
+class _ProtoModel(ProtoModelMixin, _BaseModel):
     """Base class for generated Pydantic models with ProtoJSON helpers."""
 
     model_config = _ConfigDict(
@@ -21,36 +26,6 @@ class _ProtoModel(_BaseModel):
         ser_json_inf_nan="strings",
     )
 
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
-
 
 class Scalars(_ProtoModel):
     """
@@ -107,6 +82,12 @@ class Scalars(_ProtoModel):
 
         INACTIVE = "INACTIVE"  # 2
 
+        __proto_numbers__ = {
+            "UNSPECIFIED": 0,
+            "ACTIVE": 1,
+            "INACTIVE": 2,
+        }
+
     class NestedMessage(_ProtoModel):
         """
 
@@ -115,91 +96,141 @@ class Scalars(_ProtoModel):
           last_name (str):
         """
 
-        first_name: "str" = _Field(default="")
+        first_name: str = _Field(default="")
+
+        last_name: str = _Field(default="")
 
-        last_name: "str" = _Field(default="")
+        __proto_wire__ = ProtoWire(
+            (1, "first_name", "string"),
+            (2, "last_name", "string"),
+        )
 
-    int32: "int" = _Field(default=0)
+    int32: int = _Field(default=0)
 
-    int64: "ProtoInt64" = _Field(default=0)
+    int64: ProtoInt64 = _Field(default=0)
 
-    uint32: "int" = _Field(default=0)
+    uint32: int = _Field(default=0)
 
-    uint64: "ProtoUInt64" = _Field(default=0)
+    uint64: ProtoUInt64 = _Field(default=0)
 
-    fixed32: "int" = _Field(default=0)
+    fixed32: int = _Field(default=0)
 
-    fixed64: "ProtoUInt64" = _Field(default=0)
+    fixed64: ProtoUInt64 = _Field(default=0)
 
-    sint32: "int" = _Field(default=0)
+    sint32: int = _Field(default=0)
 
-    sint64: "ProtoInt64" = _Field(default=0)
+    sint64: ProtoInt64 = _Field(default=0)
 
-    sfixed32: "int" = _Field(default=0)
+    sfixed32: int = _Field(default=0)
 
-    sfixed64: "ProtoInt64" = _Field(default=0)
+    sfixed64: ProtoInt64 = _Field(default=0)
 
-    bool_: "bool" = _Field(
+    bool_: bool = _Field(
         default=False,
         alias="bool",
     )
 
-    float_: "float" = _Field(
+    float_: float = _Field(
         default=0.0,
         alias="float",
     )
 
-    double: "float" = _Field(default=0.0)
+    double: float = _Field(default=0.0)
 
-    string: "str" = _Field(default="")
+    string: str = _Field(default="")
 
-    bytes_: "bytes" = _Field(
+    bytes_: bytes = _Field(
         default=b"",
         alias="bytes",
     )
 
-    enum: "Enum | None" = _Field(default=None)
+    enum: Enum | None = _Field(default=None)
 
-    nested_enum: "Scalars.NestedEnum | None" = _Field(default=None)
+    nested_enum: NestedEnum | None = _Field(default=None)
 
-    message: "Message | None" = _Field(default=None)
+    message: Message | None = _Field(default=None)
 
-    nested_message: "Scalars.NestedMessage | None" = _Field(default=None)
+    nested_message: NestedMessage | None = _Field(default=None)
 
-    int32_optional: "int | None" = _Field(default=None)
+    int32_optional: int | None = _Field(default=None)
 
-    int64_optional: "ProtoInt64 | None" = _Field(default=None)
+    int64_optional: ProtoInt64 | None = _Field(default=None)
 
-    uint32_optional: "int | None" = _Field(default=None)
+    uint32_optional: int | None = _Field(default=None)
 
-    uint64_optional: "ProtoUInt64 | None" = _Field(default=None)
+    uint64_optional: ProtoUInt64 | None = _Field(default=None)
 
-    fixed32_optional: "int | None" = _Field(default=None)
+    fixed32_optional: int | None = _Field(default=None)
 
-    fixed64_optional: "ProtoUInt64 | None" = _Field(default=None)
+    fixed64_optional: ProtoUInt64 | None = _Field(default=None)
 
-    sint32_optional: "int | None" = _Field(default=None)
+    sint32_optional: int | None = _Field(default=None)
 
-    sint64_optional: "ProtoInt64 | None" = _Field(default=None)
+    sint64_optional: ProtoInt64 | None = _Field(default=None)
 
-    sfixed32_optional: "int | None" = _Field(default=None)
+    sfixed32_optional: int | None = _Field(default=None)
 
-    sfixed64_optional: "ProtoInt64 | None" = _Field(default=None)
+    sfixed64_optional: ProtoInt64 | None = _Field(default=None)
 
-    bool_optional: "bool | None" = _Field(default=None)
+    bool_optional: bool | None = _Field(default=None)
 
-    float_optional: "float | None" = _Field(default=None)
+    float_optional: float | None = _Field(default=None)
 
-    double_optional: "float | None" = _Field(default=None)
+    double_optional: float | None = _Field(default=None)
 
-    string_optional: "str | None" = _Field(default=None)
+    string_optional: str | None = _Field(default=None)
 
-    bytes_optional: "bytes | None" = _Field(default=None)
+    bytes_optional: bytes | None = _Field(default=None)
 
-    enum_optional: "Enum | None" = _Field(default=None)
+    enum_optional: Enum | None = _Field(default=None)
 
-    nested_enum_optional: "Scalars.NestedEnum | None" = _Field(default=None)
+    nested_enum_optional: NestedEnum | None = _Field(default=None)
 
-    message_optional: "Message | None" = _Field(default=None)
+    message_optional: Message | None = _Field(default=None)
 
-    nested_message_optional: "Scalars.NestedMessage | None" = _Field(default=None)
+    nested_message_optional: NestedMessage | None = _Field(default=None)
+
+    @_model_serializer(mode="wrap")
+    def _omit_zero_enums(self, handler, info):
+        return self.__proto_wire__.omit_zero_enums(self, handler(self), info)
+
+    __proto_wire__ = ProtoWire(
+        (2, "int32", "int32"),
+        (3, "int64", "int64"),
+        (4, "uint32", "uint32"),
+        (5, "uint64", "uint64"),
+        (6, "fixed32", "fixed32"),
+        (7, "fixed64", "fixed64"),
+        (8, "sint32", "sint32"),
+        (9, "sint64", "sint64"),
+        (10, "sfixed32", "sfixed32"),
+        (11, "sfixed64", "sfixed64"),
+        (12, "bool_", "bool"),
+        (13, "float_", "float"),
+        (14, "double", "double"),
+        (15, "string", "string"),
+        (16, "bytes_", "bytes"),
+        (17, "enum", "enum", "Enum"),
+        (18, "nested_enum", "enum", "Scalars.NestedEnum"),
+        (19, "message", "message", "Message"),
+        (20, "nested_message", "message", "Scalars.NestedMessage"),
+        (23, "int32_optional", "optional int32"),
+        (24, "int64_optional", "optional int64"),
+        (25, "uint32_optional", "optional uint32"),
+        (26, "uint64_optional", "optional uint64"),
+        (27, "fixed32_optional", "optional fixed32"),
+        (28, "fixed64_optional", "optional fixed64"),
+        (29, "sint32_optional", "optional sint32"),
+        (30, "sint64_optional", "optional sint64"),
+        (31, "sfixed32_optional", "optional sfixed32"),
+        (32, "sfixed64_optional", "optional sfixed64"),
+        (33, "bool_optional", "optional bool"),
+        (34, "float_optional", "optional float"),
+        (35, "double_optional", "optional double"),
+        (36, "string_optional", "optional string"),
+        (37, "bytes_optional", "optional bytes"),
+        (38, "enum_optional", "optional enum", "Enum"),
+        (39, "nested_enum_optional", "optional enum", "Scalars.NestedEnum"),
+        (40, "message_optional", "message", "Message"),
+        (41, "nested_message_optional", "message", "Scalars.NestedMessage"),
+    )
@@ -3,8 +3,10 @@
 
 from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
 
+from ._proto_types import ProtoModelMixin, ProtoWire
 
-class _ProtoModel(_BaseModel):
+
+class _ProtoModel(ProtoModelMixin, _BaseModel):
     """Base class for generated Pydantic models with ProtoJSON helpers."""
 
     model_config = _ConfigDict(
@@ -14,36 +16,6 @@ class _ProtoModel(_BaseModel):
         ser_json_inf_nan="strings",
     )
 
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
-
 
 class TreeNode(_ProtoModel):
     """
@@ -54,10 +26,34 @@ class TreeNode(_ProtoModel):
       parent (TreeNode | None):
     """
 
-    name: "str" = _Field(default="")
+    name: str = _Field(default="")
 
     children: "list[TreeNode]" = _Field(
         default_factory=list,
     )
 
     parent: "TreeNode | None" = _Field(default=None)
+
+    __proto_wire__ = ProtoWire(
+        (1, "name", "string"),
+        (2, "children", "repeated message", "TreeNode"),
+        (3, "parent", "message", "TreeNode"),
+    )
+
+
+class Forest(_ProtoModel):
+    """
+    Declared before TreeNode; generated after it so that the annotation of
+    trees needs no forward reference.
+
+    Attributes:
+      trees (list[TreeNode]):
+    """
+
+    trees: list[TreeNode] = _Field(
+        default_factory=list,
+    )
+
+    __proto_wire__ = ProtoWire(
+        (1, "trees", "repeated message", "TreeNode"),
+    )
@@ -1,5 +1,7 @@
 # DO NOT EDIT. Generated by protoc-gen-pydantic.
 
+import re as _re
+from enum import Enum as _Enum
 from typing import Annotated as _Annotated, Literal as _Literal
 
 from pydantic import (
@@ -7,18 +9,24 @@ from pydantic import (
     BaseModel as _BaseModel,
     ConfigDict as _ConfigDict,
     Field as _Field,
+    field_validator as _field_validator,
+    model_serializer as _model_serializer,
+    model_validator as _model_validator,
 )
 
 from ._proto_types import (
     ProtoDuration,
     ProtoInt64,
+    ProtoModelMixin,
     ProtoTimestamp,
     ProtoUInt64,
-    _make_const_validator,
-    _make_in_validator,
+    ProtoWire,
+    _InValues,
     _make_not_in_validator,
     _require_finite,
     _require_unique,
+    _require_unique_floats,
+    _require_unique_messages,
     _validate_email,
     _validate_ip,
     _validate_ipv4,
@@ -28,7 +36,7 @@ from ._proto_types import (
 )
 
 
-class _ProtoModel(_BaseModel):
+class _ProtoModel(ProtoModelMixin, _BaseModel):
     """Base class for generated Pydantic models with ProtoJSON helpers."""
 
     model_config = _ConfigDict(
@@ -38,36 +46,6 @@ class _ProtoModel(_BaseModel):
         ser_json_inf_nan="strings",
     )
 
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
-
 
 class ValidatedScalars(_ProtoModel):
     """
@@ -91,7 +69,7 @@ class ValidatedScalars(_ProtoModel):
     """
 
     # Age must be between 0 and 150 exclusive of 0.
-    age: "int" = _Field(
+    age: int = _Field(
         default=0,
         description="Age must be between 0 and 150 exclusive of 0.",
         gt=0,
@@ -99,7 +77,7 @@ class ValidatedScalars(_ProtoModel):
     )
 
     # Score must be in [0.0, 100.0].
-    score: "float" = _Field(
+    score: float = _Field(
         default=0.0,
         description="Score must be in [0.0, 100.0].",
         ge=0.0,
@@ -107,14 +85,14 @@ class ValidatedScalars(_ProtoModel):
     )
 
     # Priority must be positive.
-    priority: "ProtoInt64" = _Field(
+    priority: ProtoInt64 = _Field(
         default=0,
         description="Priority must be positive.",
         gt=0,
     )
 
     # Ratio must be non-negative and less than 1.
-    ratio: "float" = _Field(
+    ratio: float = _Field(
         default=0.0,
         description="Ratio must be non-negative and less than 1.",
         ge=0.0,
@@ -122,7 +100,7 @@ class ValidatedScalars(_ProtoModel):
     )
 
     # Rank must be in [1, 10].
-    rank: "int" = _Field(
+    rank: int = _Field(
         default=0,
         description="Rank must be in [1, 10].",
         ge=1,
@@ -130,19 +108,29 @@ class ValidatedScalars(_ProtoModel):
     )
 
     # Count must be non-zero (covers uint64 / fixed64 literal formatting).
-    count: "ProtoUInt64 | None" = _Field(
+    count: ProtoUInt64 | None = _Field(
         default=None,
         description="Count must be non-zero (covers uint64 / fixed64 literal formatting).",
         gt=0,
     )
 
     # Offset must be non-negative (covers sint32 / sfixed32 literal formatting).
-    offset: "int | None" = _Field(
+    offset: int | None = _Field(
         default=None,
         description="Offset must be non-negative (covers sint32 / sfixed32 literal formatting).",
         ge=0,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "age", "int32"),
+        (2, "score", "double"),
+        (3, "priority", "int64"),
+        (4, "ratio", "float"),
+        (5, "rank", "uint32"),
+        (6, "count", "optional uint64"),
+        (7, "offset", "optional sint32"),
+    )
+
 
 class ValidatedStrings(_ProtoModel):
     """
@@ -160,7 +148,7 @@ class ValidatedStrings(_ProtoModel):
     """
 
     # Name must be between 1 and 100 characters.
-    name: "str" = _Field(
+    name: str = _Field(
         default="",
         description="Name must be between 1 and 100 characters.",
         min_length=1,
@@ -168,26 +156,33 @@ class ValidatedStrings(_ProtoModel):
     )
 
     # Code must match uppercase letters only.
-    code: "str" = _Field(
+    code: str = _Field(
         default="",
         description="Code must match uppercase letters only.",
         pattern="^[A-Z]+$",
     )
 
     # Bio has only a max length.
-    bio: "str" = _Field(
+    bio: str = _Field(
         default="",
         description="Bio has only a max length.",
         max_length=500,
     )
 
     # Tag has only a min length.
-    tag: "str" = _Field(
+    tag: str = _Field(
         default="",
         description="Tag has only a min length.",
         min_length=2,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "name", "string"),
+        (2, "code", "string"),
+        (3, "bio", "string"),
+        (4, "tag", "string"),
+    )
+
 
 class ValidatedRepeated(_ProtoModel):
     """
@@ -201,7 +196,7 @@ class ValidatedRepeated(_ProtoModel):
     """
 
     # Items must have between 1 and 10 elements.
-    items: "list[str]" = _Field(
+    items: list[str] = _Field(
         default_factory=list,
         description="Items must have between 1 and 10 elements.",
         min_length=1,
@@ -209,12 +204,17 @@ class ValidatedRepeated(_ProtoModel):
     )
 
     # Tags must have at least 1 element.
-    tags: "list[str]" = _Field(
+    tags: list[str] = _Field(
         default_factory=list,
         description="Tags must have at least 1 element.",
         min_length=1,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "items", "repeated string"),
+        (2, "tags", "repeated string"),
+    )
+
 
 class ValidatedMap(_ProtoModel):
     """
@@ -226,13 +226,17 @@ class ValidatedMap(_ProtoModel):
     """
 
     # Labels must have between 1 and 10 entries.
-    labels: "dict[str, str]" = _Field(
+    labels: dict[str, str] = _Field(
         default_factory=dict,
         description="Labels must have between 1 and 10 entries.",
         min_length=1,
         max_length=10,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "labels", "map<string, string>"),
+    )
+
 
 class ValidatedReserved(_ProtoModel):
     """
@@ -248,13 +252,17 @@ class ValidatedReserved(_ProtoModel):
     model_config = _ConfigDict(populate_by_name=True)
 
     # Score must be positive.
-    float_: "float" = _Field(
+    float_: float = _Field(
         default=0.0,
         description="Score must be positive.",
         alias="float",
         gt=0.0,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "float_", "float"),
+    )
+
 
 class ValidatedOneof(_ProtoModel):
     """
@@ -268,19 +276,31 @@ class ValidatedOneof(_ProtoModel):
     """
 
     # Must be positive when set.
-    small: "int | None" = _Field(
+    small: int | None = _Field(
         default=None,
         description="Must be positive when set.\nOnly one of the fields can be specified with: [small large] (oneof value)",
         gt=0,
     )
 
     # Must be positive when set.
-    large: "ProtoInt64 | None" = _Field(
+    large: ProtoInt64 | None = _Field(
         default=None,
         description="Must be positive when set.\nOnly one of the fields can be specified with: [small large] (oneof value)",
         gt=0,
     )
 
+    @_model_validator(mode="after")
+    def _check_oneofs(self):
+        return self.__proto_wire__.check_oneofs(self)
+
+    __proto_wire__ = ProtoWire(
+        (1, "small", "optional int32"),
+        (2, "large", "optional int64"),
+        oneofs={
+            "value": ("small", "large"),
+        },
+    )
+
 
 class ValidatedDuration(_ProtoModel):
     """
@@ -294,13 +314,17 @@ class ValidatedDuration(_ProtoModel):
     """
 
     # Timeout must be positive and at most one hour.
-    timeout: "ProtoDuration | None" = _Field(
+    timeout: ProtoDuration | None = _Field(
         default=None,
         description="Timeout must be positive and at most one hour.",
         # buf.validate: gt (not translated)
         # buf.validate: lte (not translated)
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "timeout", "google.protobuf.Duration"),
+    )
+
 
 class ValidatedTimestamp(_ProtoModel):
     """
@@ -313,12 +337,16 @@ class ValidatedTimestamp(_ProtoModel):
     """
 
     # CreatedAt must be after the Unix epoch.
-    created_at: "ProtoTimestamp | None" = _Field(
+    created_at: ProtoTimestamp | None = _Field(
         default=None,
         description="CreatedAt must be after the Unix epoch.",
         # buf.validate: gt (not translated)
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "created_at", "google.protobuf.Timestamp"),
+    )
+
 
 class ValidatedStringLen(_ProtoModel):
     """
@@ -330,13 +358,17 @@ class ValidatedStringLen(_ProtoModel):
     """
 
     # Code must be exactly 5 characters.
-    code: "str" = _Field(
+    code: str = _Field(
         default="",
         description="Code must be exactly 5 characters.",
         min_length=5,
         max_length=5,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "code", "string"),
+    )
+
 
 class ValidatedStringAffix(_ProtoModel):
     """
@@ -354,34 +386,41 @@ class ValidatedStringAffix(_ProtoModel):
     """
 
     # Url must start with "https://".
-    url: "str" = _Field(
+    url: str = _Field(
         default="",
         description='Url must start with "https://".',
         pattern="^https://",
     )
 
     # Filename must end with ".go".
-    filename: "str" = _Field(
+    filename: str = _Field(
         default="",
         description='Filename must end with ".go".',
         pattern="\\.go$",
     )
 
     # Path must start with "/home/" and end with ".txt".
-    path: "str" = _Field(
+    path: str = _Field(
         default="",
         description='Path must start with "/home/" and end with ".txt".',
         pattern="^/home/.*\\.txt$",
     )
 
     # Content must match a pattern; prefix is also set (conflict → prefix dropped).
-    content: "str" = _Field(
+    content: str = _Field(
         default="",
         description="Content must match a pattern; prefix is also set (conflict → prefix dropped).",
         pattern="^[a-z]+$",
         # buf.validate: prefix (not translated)
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "url", "string"),
+        (2, "filename", "string"),
+        (3, "path", "string"),
+        (4, "content", "string"),
+    )
+
 
 class ValidatedExamples(_ProtoModel):
     """
@@ -395,7 +434,7 @@ class ValidatedExamples(_ProtoModel):
     """
 
     # Count with integer examples.
-    count: "int" = _Field(
+    count: int = _Field(
         default=0,
         description="Count with integer examples.",
         gt=0,
@@ -403,13 +442,18 @@ class ValidatedExamples(_ProtoModel):
     )
 
     # Name with string examples.
-    name: "str" = _Field(
+    name: str = _Field(
         default="",
         description="Name with string examples.",
         min_length=1,
         examples=["alice", "bob"],
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "count", "int32"),
+        (2, "name", "string"),
+    )
+
 
 class ValidatedFormats(_ProtoModel):
     """
@@ -434,47 +478,57 @@ class ValidatedFormats(_ProtoModel):
     """
 
     # Email must be a valid email address.
-    email: "_Annotated[str, _AfterValidator(_validate_email)]" = _Field(
+    email: _Annotated[str, _AfterValidator(_validate_email)] = _Field(
         default="",
         description="Email must be a valid email address.",
     )
 
     # Website must be a valid URI.
-    website: "_Annotated[str, _AfterValidator(_validate_uri)]" = _Field(
+    website: _Annotated[str, _AfterValidator(_validate_uri)] = _Field(
         default="",
         description="Website must be a valid URI.",
     )
 
     # Address must be a valid IP address.
-    address: "_Annotated[str, _AfterValidator(_validate_ip)]" = _Field(
+    address: _Annotated[str, _AfterValidator(_validate_ip)] = _Field(
         default="",
         description="Address must be a valid IP address.",
     )
 
     # Ratio must be finite (not inf or NaN).
-    ratio: "_Annotated[float, _AfterValidator(_require_finite)]" = _Field(
+    ratio: _Annotated[float, _AfterValidator(_require_finite)] = _Field(
         default=0.0,
         description="Ratio must be finite (not inf or NaN).",
     )
 
     # Token must be a valid UUID.
-    token: "_Annotated[str, _AfterValidator(_validate_uuid)]" = _Field(
+    token: _Annotated[str, _AfterValidator(_validate_uuid)] = _Field(
         default="",
         description="Token must be a valid UUID.",
     )
 
     # Host must be a valid IPv4 address.
-    host_v4: "_Annotated[str, _AfterValidator(_validate_ipv4)]" = _Field(
+    host_v4: _Annotated[str, _AfterValidator(_validate_ipv4)] = _Field(
         default="",
         description="Host must be a valid IPv4 address.",
     )
 
     # Host must be a valid IPv6 address.
-    host_v6: "_Annotated[str, _AfterValidator(_validate_ipv6)]" = _Field(
+    host_v6: _Annotated[str, _AfterValidator(_validate_ipv6)] = _Field(
         default="",
         description="Host must be a valid IPv6 address.",
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "email", "string"),
+        (2, "website", "string"),
+        (3, "address", "string"),
+        (4, "ratio", "float"),
+        (5, "token", "string"),
+        (6, "host_v4", "string"),
+        (7, "host_v6", "string"),
+    )
+
 
 class ValidatedDropped(_ProtoModel):
     """
@@ -490,27 +544,33 @@ class ValidatedDropped(_ProtoModel):
     """
 
     # Name is required; the required constraint is not translated.
-    name: "str" = _Field(
+    name: str = _Field(
         default="",
         description="Name is required; the required constraint is not translated.",
         # buf.validate: required (not translated)
     )
 
     # Blob has a bytes.const constraint which is not translated (bytes kind unsupported).
-    blob: "bytes" = _Field(
+    blob: bytes = _Field(
         default=b"",
         description="Blob has a bytes.const constraint which is not translated (bytes kind unsupported).",
         # buf.validate: const (not translated)
     )
 
     # Score must be positive; required is also set but not translated.
-    score: "int" = _Field(
+    score: int = _Field(
         default=0,
         description="Score must be positive; required is also set but not translated.",
         gt=0,
         # buf.validate: required (not translated)
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "name", "string"),
+        (2, "blob", "bytes"),
+        (3, "score", "int32"),
+    )
+
 
 class ValidatedConst(_ProtoModel):
     """
@@ -520,66 +580,108 @@ class ValidatedConst(_ProtoModel):
       tag (_Literal['fixed']):
       count (_Literal[42]):
       active (_Literal[True]):
-      score (_Annotated[float, _AfterValidator(_make_const_validator(3.14))]):
+      score (_Annotated[float, _InValues(3.14)]):
     """
 
-    tag: "_Literal['fixed']" = _Field(
+    tag: _Literal["fixed"] = _Field(
         default="fixed",
     )
 
-    count: "_Literal[42]" = _Field(
+    count: _Literal[42] = _Field(
         default=42,
     )
 
-    active: "_Literal[True]" = _Field(
+    active: _Literal[True] = _Field(
         default=True,
     )
 
-    score: "_Annotated[float, _AfterValidator(_make_const_validator(3.14))]" = _Field(
+    score: _Annotated[float, _InValues(3.14)] = _Field(
         default=3.14,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "tag", "string"),
+        (2, "count", "int32"),
+        (3, "active", "bool"),
+        (4, "score", "double"),
+    )
+
 
 class ValidatedIn(_ProtoModel):
     """
-    ValidatedIn exercises in and not_in constraints translated to AfterValidator.
+    ValidatedIn exercises in constraints checked by pydantic-core and not_in
+    constraints translated to AfterValidator.
 
     Attributes:
-      status (_Annotated[str, _AfterValidator(_make_in_validator(frozenset({'active', 'inactive'})))]):
+      status (_Annotated[str, _InValues('active', 'inactive')]):
       code (_Annotated[str, _AfterValidator(_make_not_in_validator(frozenset({'deleted', 'archived'})))]):
-      priority (_Annotated[int, _AfterValidator(_make_in_validator(frozenset({1, 2, 3})))]):
+      priority (_Annotated[int, _InValues(1, 2, 3)]):
     """
 
-    status: "_Annotated[str, _AfterValidator(_make_in_validator(frozenset({'active', 'inactive'})))]" = _Field(
+    status: _Annotated[str, _InValues("active", "inactive")] = _Field(
         default="",
     )
 
-    code: "_Annotated[str, _AfterValidator(_make_not_in_validator(frozenset({'deleted', 'archived'})))]" = _Field(
+    code: _Annotated[
+        str, _AfterValidator(_make_not_in_validator(frozenset({"deleted", "archived"})))
+    ] = _Field(
         default="",
     )
 
-    priority: "_Annotated[int, _AfterValidator(_make_in_validator(frozenset({1, 2, 3})))]" = _Field(
+    priority: _Annotated[int, _InValues(1, 2, 3)] = _Field(
         default=0,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "status", "string"),
+        (2, "code", "string"),
+        (3, "priority", "int32"),
+    )
+
 
 class ValidatedUnique(_ProtoModel):
     """
-    ValidatedUnique exercises repeated.unique translated to AfterValidator.
+    ValidatedUnique exercises repeated.unique translated to AfterValidator,
+    with the helper chosen by element kind.
 
     Attributes:
       tags (_Annotated[list[str], _AfterValidator(_require_unique)]):
       scores (_Annotated[list[int], _AfterValidator(_require_unique)]):
+      ratios (_Annotated[list[float], _AfterValidator(_require_unique_floats)]):
+      digests (_Annotated[list[bytes], _AfterValidator(_require_unique)]):
+      entries (_Annotated[list[ValidatedMap], _AfterValidator(_require_unique_messages)]):
     """
 
-    tags: "_Annotated[list[str], _AfterValidator(_require_unique)]" = _Field(
+    tags: _Annotated[list[str], _AfterValidator(_require_unique)] = _Field(
+        default_factory=list,
+    )
+
+    scores: _Annotated[list[int], _AfterValidator(_require_unique)] = _Field(
+        default_factory=list,
+    )
+
+    ratios: _Annotated[list[float], _AfterValidator(_require_unique_floats)] = _Field(
+        default_factory=list,
+    )
+
+    digests: _Annotated[list[bytes], _AfterValidator(_require_unique)] = _Field(
         default_factory=list,
     )
 
-    scores: "_Annotated[list[int], _AfterValidator(_require_unique)]" = _Field(
+    entries: _Annotated[
+        list[ValidatedMap], _AfterValidator(_require_unique_messages)
+    ] = _Field(
         default_factory=list,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "tags", "repeated string"),
+        (2, "scores", "packed int32"),
+        (3, "ratios", "packed double"),
+        (4, "digests", "repeated bytes"),
+        (5, "entries", "repeated message", "ValidatedMap"),
+    )
+
 
 class ValidatedBytes(_ProtoModel):
     """
@@ -597,14 +699,14 @@ class ValidatedBytes(_ProtoModel):
     model_config = _ConfigDict(populate_by_name=True)
 
     # Token must be at least 16 bytes.
-    token: "bytes" = _Field(
+    token: bytes = _Field(
         default=b"",
         description="Token must be at least 16 bytes.",
         min_length=16,
     )
 
     # Hash must be exactly 32 bytes.
-    hash_: "bytes" = _Field(
+    hash_: bytes = _Field(
         default=b"",
         description="Hash must be exactly 32 bytes.",
         alias="hash",
@@ -613,12 +715,18 @@ class ValidatedBytes(_ProtoModel):
     )
 
     # Payload must be at most 1024 bytes.
-    payload: "bytes" = _Field(
+    payload: bytes = _Field(
         default=b"",
         description="Payload must be at most 1024 bytes.",
         max_length=1024,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "token", "bytes"),
+        (2, "hash_", "bytes"),
+        (3, "payload", "bytes"),
+    )
+
 
 class ValidatedStringContains(_ProtoModel):
     """
@@ -633,7 +741,7 @@ class ValidatedStringContains(_ProtoModel):
     """
 
     # Topic must contain "protobuf".
-    topic: "str" = _Field(
+    topic: str = _Field(
         default="",
         description='Topic must contain "protobuf".',
         pattern="protobuf",
@@ -641,13 +749,18 @@ class ValidatedStringContains(_ProtoModel):
 
     # Label must start with "env-" and contain "prod".
     # The contains conflicts with prefix so contains is dropped.
-    label: "str" = _Field(
+    label: str = _Field(
         default="",
         description='Label must start with "env-" and contain "prod".\nThe contains conflicts with prefix so contains is dropped.',
         pattern="^env-",
         # buf.validate: contains (not translated)
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "topic", "string"),
+        (2, "label", "string"),
+    )
+
 
 class ValidatedRequired(_ProtoModel):
     """
@@ -673,31 +786,205 @@ class ValidatedRequired(_ProtoModel):
           value (str):
         """
 
-        value: "str" = _Field(default="")
+        value: str = _Field(default="")
+
+        __proto_wire__ = ProtoWire(
+            (1, "value", "string"),
+        )
 
     # required on proto3 optional scalar: | None stripped, field becomes required.
-    required_name: "str" = _Field(
+    required_name: str = _Field(
         default=...,
         description="required on proto3 optional scalar: | None stripped, field becomes required.",
     )
 
     # required on proto3 optional scalar with an additional constraint.
-    required_score: "int" = _Field(
+    required_score: int = _Field(
         default=...,
         description="required on proto3 optional scalar with an additional constraint.",
         gt=0,
     )
 
     # required on message-typed optional: not translated, emits dropped comment.
-    required_detail: "ValidatedRequired.Detail | None" = _Field(
+    required_detail: Detail | None = _Field(
         default=None,
         description="required on message-typed optional: not translated, emits dropped comment.",
         # buf.validate: required (not translated)
     )
 
     # required on plain proto3 scalar: not translated, emits dropped comment.
-    plain_name: "str" = _Field(
+    plain_name: str = _Field(
         default="",
         description="required on plain proto3 scalar: not translated, emits dropped comment.",
         # buf.validate: required (not translated)
     )
+
+    __proto_wire__ = ProtoWire(
+        (1, "required_name", "optional string"),
+        (2, "required_score", "optional int32"),
+        (3, "required_detail", "message", "ValidatedRequired.Detail"),
+        (4, "plain_name", "string"),
+    )
+
+
+class ValidatedCel(_ProtoModel):
+    """
+    ValidatedCel exercises CEL rules compiled into Python validators.
+
+    Attributes:
+      quantity (int):
+        Quantity must be positive.
+      tags (list[str]):
+        Every tag is at most 8 characters.
+      code (str):
+        Code is three capitals; the rule returns its own error message.
+      note (str | None):
+      window (ValidatedCel.Window | None):
+      level (ValidatedCel.Level | None):
+      limits (dict[str, int]):
+      legacy (int):
+        Not in the compiled subset: stays a comment.
+    """
+
+    class Level(str, _Enum):
+        """
+        Level is a nested enum used to test enum comparisons.
+        """
+
+        UNSPECIFIED = "UNSPECIFIED"  # 0
+
+        LOW = "LOW"  # 1
+
+        HIGH = "HIGH"  # 2
+
+        __proto_numbers__ = {
+            "UNSPECIFIED": 0,
+            "LOW": 1,
+            "HIGH": 2,
+        }
+
+    class Window(_ProtoModel):
+        """
+        Window is a nested message used to test selection through unset fields.
+
+        Attributes:
+          start (int):
+          end (int):
+        """
+
+        start: int = _Field(default=0)
+
+        end: int = _Field(default=0)
+
+        __proto_wire__ = ProtoWire(
+            (1, "start", "int32"),
+            (2, "end", "int32"),
+        )
+
+    # Quantity must be positive.
+    quantity: int = _Field(
+        default=0,
+        description="Quantity must be positive.",
+    )
+
+    # Every tag is at most 8 characters.
+    tags: list[str] = _Field(
+        default_factory=list,
+        description="Every tag is at most 8 characters.",
+    )
+
+    # Code is three capitals; the rule returns its own error message.
+    code: str = _Field(
+        default="",
+        description="Code is three capitals; the rule returns its own error message.",
+    )
+
+    note: str | None = _Field(default=None)
+
+    window: Window | None = _Field(default=None)
+
+    level: Level | None = _Field(default=None)
+
+    limits: dict[str, int] = _Field(
+        default_factory=dict,
+    )
+
+    # Not in the compiled subset: stays a comment.
+    legacy: int = _Field(
+        default=0,
+        description="Not in the compiled subset: stays a comment.",
+        # buf.validate: cel (not translated)
+    )
+
+    @_model_serializer(mode="wrap")
+    def _omit_zero_enums(self, handler, info):
+        return self.__proto_wire__.omit_zero_enums(self, handler(self), info)
+
+    # buf.validate: cel (not translated)
+
+    @_field_validator("quantity")
+    @classmethod
+    def _validate_quantity_cel(cls, value):
+        if not value > 0:
+            raise ValueError("quantity must be positive")
+        return value
+
+    @_field_validator("tags")
+    @classmethod
+    def _validate_tags_cel(cls, value):
+        if not all(len(t) <= 8 for t in value):
+            raise ValueError("tags must be short")
+        return value
+
+    @_field_validator("code")
+    @classmethod
+    def _validate_code_cel(cls, value):
+        message = (
+            ""
+            if _re.search("^[A-Z]{3}$", value) is not None
+            else "code must be three capitals"
+        )
+        if message:
+            raise ValueError(message)
+        return value
+
+    @_field_validator("level")
+    @classmethod
+    def _validate_level_cel(cls, value):
+        if value is None:
+            return value
+        if value not in ["LOW", "HIGH"]:
+            raise ValueError("level must be set")
+        return value
+
+    @_field_validator("limits")
+    @classmethod
+    def _validate_limits_cel(cls, value):
+        try:
+            valid = value["default"] > 0
+        except LookupError:
+            valid = False
+        if not valid:
+            raise ValueError("limits need a positive default")
+        return value
+
+    @_model_validator(mode="after")
+    def _validate_cel(self):
+        if not getattr(self.window, "end", 0) >= getattr(self.window, "start", 0):
+            raise ValueError("window end must not precede its start")
+        if not (self.note is None or (self.note or "").startswith("#")):
+            raise ValueError("note.prefix")
+        if not ((self.level or "UNSPECIFIED") != "HIGH" or len(self.tags) > 0):
+            raise ValueError("high level needs a tag")
+        return self
+
+    __proto_wire__ = ProtoWire(
+        (1, "quantity", "int32"),
+        (2, "tags", "repeated string"),
+        (3, "code", "string"),
+        (4, "note", "optional string"),
+        (5, "window", "message", "ValidatedCel.Window"),
+        (6, "level", "enum", "ValidatedCel.Level"),
+        (7, "limits", "map<string, int32>"),
+        (8, "legacy", "int32"),
+    )
@@ -0,0 +1,2188 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+import base64 as _base64
+import datetime as _datetime
+import math as _math
+import struct as _struct
+import sys as _sys
+from collections.abc import Iterable as _Iterable
+from typing import Annotated as _Annotated
+
+from pydantic import AfterValidator as _AfterValidator
+from pydantic import BeforeValidator as _BeforeValidator
+from pydantic import PlainSerializer as _PlainSerializer
+from pydantic import PlainValidator as _PlainValidator
+from pydantic import TypeAdapter as _TypeAdapter
+from pydantic import WrapValidator as _WrapValidator
+from pydantic import with_config as _with_config
+from pydantic_core import core_schema as _core_schema
+from typing_extensions import NotRequired as _NotRequired
+from typing_extensions import TypedDict as _TypedDict
+
+
+class _JsonStringInt:
+    """Integer that is a decimal string in JSON, as ProtoJSON encodes 64-bit ints.
+
+    Both directions run inside pydantic-core: lax int validation parses
+    numeric strings, and the to-string serializer formats the value.
+    """
+
+    def __get_pydantic_core_schema__(self, source, handler):
+        schema = handler(source)
+        schema["serialization"] = _core_schema.to_string_ser_schema(when_used="json")
+        return schema
+
+
+ProtoInt64 = _Annotated[int, _JsonStringInt()]
+
+ProtoUInt64 = _Annotated[int, _JsonStringInt()]
+
+
+_UTC = _datetime.timezone.utc
+
+_EPOCH = _datetime.datetime(1970, 1, 1, tzinfo=_UTC)
+
+# google.protobuf.Duration spans +-10000 years.
+_MAX_DURATION_SECONDS = 315_576_000_000
+
+
+def _split_timestamp(s):
+    """Split an RFC 3339 timestamp into integer fields without losing nanoseconds.
+
+    Returns (year, month, day, hour, minute, second, nanos, offset_seconds).
+    """
+    n = len(s)
+    zone_start = n - 1 if s[-1:] in ("Z", "z") else n - 6
+    if (
+        zone_start < 19
+        or s[4] != "-"
+        or s[7] != "-"
+        or s[10] not in ("T", "t", " ")
+        or s[13] != ":"
+        or s[16] != ":"
+    ):
+        raise ValueError(f"Invalid timestamp: {s!r}")
+    fields = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+    if not (fields.isdigit() and fields.isascii()):
+        raise ValueError(f"Invalid timestamp: {s!r}")
+    frac = s[20:zone_start]
+    if zone_start > 19 and (
+        s[19] != "."
+        or not 0 < len(frac) <= 9
+        or not (frac.isdigit() and frac.isascii())
+    ):
+        raise ValueError(f"Invalid timestamp: {s!r}")
+    offset = 0
+    if zone_start == n - 6:
+        hhmm = s[n - 5 : n - 3] + s[n - 2 :]
+        if (
+            s[zone_start] not in ("+", "-")
+            or s[n - 3] != ":"
+            or not (hhmm.isdigit() and hhmm.isascii())
+        ):
+            raise ValueError(f"Invalid timestamp: {s!r}")
+        offset = (int(hhmm[:2]) * 60 + int(hhmm[2:])) * 60
+        if s[zone_start] == "-":
+            offset = -offset
+    return (
+        int(s[0:4]),
+        int(s[5:7]),
+        int(s[8:10]),
+        int(s[11:13]),
+        int(s[14:16]),
+        int(s[17:19]),
+        int(frac) * 10 ** (9 - len(frac)) if frac else 0,
+        offset,
+    )
+
+
+# Canonical UTC timestamps with at most microsecond precision are handed to
+# the C parser, which accepts the Z suffix from Python 3.11. Indexed by
+# length, the separators v[4:20:3] picks from them: date, time, and fraction
+# or Z. Other lengths map to None.
+_CANONICAL_TIMESTAMP_SEPARATORS = tuple(
+    "--T::Z" if n == 20 else "--T::." if 21 < n else None for n in range(28)
+)
+_fromisoformat = _datetime.datetime.fromisoformat
+
+
+def _parse_timestamp(v):
+    # The fast path runs first: LookupError and TypeError mean v is too long
+    # or not a string, ValueError that the C parser rejects it.
+    try:
+        if v[4:20:3] == _CANONICAL_TIMESTAMP_SEPARATORS[len(v)] and v[-1] == "Z":
+            return _fromisoformat(v)
+    except (LookupError, TypeError, ValueError):
+        pass
+    if isinstance(v, str):
+        year, month, day, hour, minute, second, nanos, offset = _split_timestamp(v)
+        tz = (
+            _UTC
+            if not offset
+            else _datetime.timezone(_datetime.timedelta(seconds=offset))
+        )
+        return _datetime.datetime(
+            year, month, day, hour, minute, second, nanos // 1000, tz
+        )
+    if isinstance(v, _datetime.datetime):
+        return v
+    raise ValueError(f"Cannot parse timestamp from {type(v)}")
+
+
+def _format_timestamp(v, nanos):
+    s = f"{v.year:04d}-{v.month:02d}-{v.day:02d}T{v.hour:02d}:{v.minute:02d}:{v.second:02d}"
+    if nanos:
+        s += f".{nanos:09d}".rstrip("0")
+    return s + "Z"
+
+
+def _serialize_timestamp(v):
+    if v.tzinfo is not None and v.utcoffset():
+        v = v.astimezone(_UTC)
+    return _format_timestamp(v, v.microsecond * 1000)
+
+
+def _timestamp_to_seconds_nanos(v):
+    if v.tzinfo is None:
+        v = v.replace(tzinfo=_UTC)
+    delta = v - _EPOCH
+    return delta.days * 86400 + delta.seconds, delta.microseconds * 1000
+
+
+def _timestamp_from_seconds_nanos(seconds, nanos):
+    return _EPOCH + _datetime.timedelta(seconds=seconds, microseconds=nanos // 1000)
+
+
+ProtoTimestamp = _Annotated[
+    _datetime.datetime,
+    _BeforeValidator(_parse_timestamp),
+    _PlainSerializer(_serialize_timestamp, return_type=str, when_used="json"),
+]
+
+
+def _split_duration(s):
+    """Split a ProtoJSON duration such as "-1.5s" into exact (seconds, nanos).
+
+    Both parts carry the sign of the duration.
+    """
+    whole, dot, frac = s[:-1].partition(".")
+    negative = whole[:1] == "-"
+    if negative:
+        whole = whole[1:]
+    if (
+        s[-1:] != "s"
+        or not (whole.isdigit() and whole.isascii())
+        or (dot and not (0 < len(frac) <= 9 and frac.isdigit() and frac.isascii()))
+    ):
+        raise ValueError(f"Invalid duration: {s!r}")
+    seconds = int(whole)
+    if seconds > _MAX_DURATION_SECONDS:
+        raise ValueError(f"Duration out of range: {s!r}")
+    nanos = int(frac) * 10 ** (9 - len(frac)) if frac else 0
+    if negative:
+        return -seconds, -nanos
+    return seconds, nanos
+
+
+def _duration_to_seconds_nanos(v):
+    micros = (v.days * 86400 + v.seconds) * 1_000_000 + v.microseconds
+    seconds, micros = divmod(abs(micros), 1_000_000)
+    sign = -1 if v < _datetime.timedelta(0) else 1
+    return sign * seconds, sign * micros * 1000
+
+
+def _duration_from_seconds_nanos(seconds, nanos):
+    # timedelta holds microseconds: truncate toward zero like the seconds part.
+    return _datetime.timedelta(0, seconds, int(nanos / 1000))
+
+
+def _parse_duration(v):
+    if isinstance(v, str):
+        return _duration_from_seconds_nanos(*_split_duration(v))
+    if isinstance(v, _datetime.timedelta):
+        return v
+    raise ValueError(f"Cannot parse duration from {type(v)}")
+
+
+def _format_duration(negative, seconds, nanos):
+    sign = "-" if negative else ""
+    if nanos:
+        return f"{sign}{seconds}.{nanos:09d}".rstrip("0") + "s"
+    return f"{sign}{seconds}s"
+
+
+def _serialize_duration(v):
+    micros = (v.days * 86400 + v.seconds) * 1_000_000 + v.microseconds
+    seconds, rest = divmod(abs(micros), 1_000_000)
+    return _format_duration(micros < 0, seconds, rest * 1000)
+
+
+ProtoDuration = _Annotated[
+    _datetime.timedelta,
+    _BeforeValidator(_parse_duration),
+    _PlainSerializer(_serialize_duration, return_type=str, when_used="json"),
+]
+
+
+def _check_unique(v, keys):
+    seen = {}
+    for i, key in enumerate(keys):
+        first = seen.setdefault(key, i)
+        if first != i:
+            raise ValueError(
+                f"list items must be unique, item {i} repeats item {first}"
+            )
+    return v
+
+
+def _require_unique(v):
+    if len(set(v)) == len(v):
+        return v
+    return _check_unique(v, v)
+
+
+def _require_unique_floats(v):
+    if len(set(v)) == len(v):
+        return v
+    # NaN never equals itself, so NaNs are never duplicates; the set above
+    # can still merge one NaN object listed twice, hence the second pass.
+    return _check_unique(v, [x if x == x else object() for x in v])
+
+
+class _InValues:
+    """Annotated marker that restricts a field to a fixed set of values.
+
+    The field's own schema runs first, so lax inputs such as the ProtoJSON
+    string form of an integer still parse; a literal schema then checks
+    membership inside pydantic-core, without a Python call per value.
+    """
+
+    def __init__(self, *values):
+        self.values = values
+
+    def __get_pydantic_core_schema__(self, source, handler):
+        schema = handler(source)
+        return _core_schema.chain_schema(
+            [schema, _core_schema.literal_schema(list(self.values))],
+            serialization=schema.get("serialization"),
+        )
+
+    def __get_pydantic_json_schema__(self, schema, handler):
+        json_schema = handler(schema)
+        json_schema["enum"] = list(self.values)
+        return json_schema
+
+
+def _make_not_in_validator(excluded_values):
+    def _validate(v):
+        if v in excluded_values:
+            raise ValueError(f"value must not be one of {sorted(excluded_values)}")
+        return v
+
+    return _validate
+
+
+_WIRE_VARINT = 0
+_WIRE_I64 = 1
+_WIRE_LEN = 2
+_WIRE_I32 = 5
+
+_object_setattr = object.__setattr__
+
+
+def _is_default(v):
+    # -0.0 is not the default value: like NaN, it is written.
+    return not v and (not isinstance(v, float) or _math.copysign(1.0, v) > 0)
+
+
+def _write_varint(out, v):
+    while v > 0x7F:
+        out.append((v & 0x7F) | 0x80)
+        v >>= 7
+    out.append(v)
+
+
+def _read_varint(data, pos):
+    b = data[pos]
+    if b < 0x80:
+        return b, pos + 1
+    result = b & 0x7F
+    shift = 7
+    while True:
+        pos += 1
+        b = data[pos]
+        result |= (b & 0x7F) << shift
+        if b < 0x80:
+            return result, pos + 1
+        shift += 7
+
+
+def _write_len(out, payload):
+    _write_varint(out, len(payload))
+    out += payload
+
+
+def _to_int32(v):
+    v &= 0xFFFFFFFF
+    return v - 0x100000000 if v & 0x80000000 else v
+
+
+def _to_int64(v):
+    v &= 0xFFFFFFFFFFFFFFFF
+    return v - 0x10000000000000000 if v & 0x8000000000000000 else v
+
+
+def _zigzag(v):
+    return (v << 1) ^ (v >> 63)
+
+
+def _unzigzag(v):
+    return (v >> 1) ^ -(v & 1)
+
+
+def _varint_kind(to_raw, from_raw, is_default=None):
+    def write(out, v):
+        _write_varint(out, to_raw(v))
+
+    return _WIRE_VARINT, write, from_raw, is_default or _is_default
+
+
+def _fixed_kind(fmt):
+    packer = _struct.Struct(fmt)
+    wire_type = _WIRE_I32 if packer.size == 4 else _WIRE_I64
+
+    def write(out, v):
+        out += packer.pack(v)
+
+    def read(raw):
+        return packer.unpack(raw)[0]
+
+    return wire_type, write, read, _is_default
+
+
+def _write_str(out, v):
+    _write_len(out, v.encode())
+
+
+# kind -> (wire type, write(out, value), read(raw) -> value, is_default(value))
+_SCALAR_KINDS = {
+    "int32": _varint_kind(lambda v: v & 0xFFFFFFFFFFFFFFFF, _to_int32),
+    "int64": _varint_kind(lambda v: v & 0xFFFFFFFFFFFFFFFF, _to_int64),
+    "uint32": _varint_kind(int, lambda v: v & 0xFFFFFFFF),
+    "uint64": _varint_kind(int, lambda v: v & 0xFFFFFFFFFFFFFFFF),
+    "sint32": _varint_kind(_zigzag, lambda v: _to_int32(_unzigzag(v))),
+    "sint64": _varint_kind(_zigzag, _unzigzag),
+    "bool": _varint_kind(int, bool),
+    "fixed32": _fixed_kind("<I"),
+    "fixed64": _fixed_kind("<Q"),
+    "sfixed32": _fixed_kind("<i"),
+    "sfixed64": _fixed_kind("<q"),
+    "float": _fixed_kind("<f"),
+    "double": _fixed_kind("<d"),
+    "string": (_WIRE_LEN, _write_str, bytes.decode, _is_default),
+    "bytes": (_WIRE_LEN, _write_len, bytes, _is_default),
+}
+
+
+def _iter_fields(data):
+    """Yield (number, wire type, raw value) for each record in data."""
+    pos = 0
+    end = len(data)
+    while pos < end:
+        key, pos = _read_varint(data, pos)
+        wire_type = key & 7
+        if wire_type == _WIRE_VARINT:
+            raw, pos = _read_varint(data, pos)
+        elif wire_type == _WIRE_LEN:
+            size, pos = _read_varint(data, pos)
+            raw = data[pos : pos + size]
+            pos += size
+        elif wire_type == _WIRE_I64:
+            raw = data[pos : pos + 8]
+            pos += 8
+        elif wire_type == _WIRE_I32:
+            raw = data[pos : pos + 4]
+            pos += 4
+        else:
+            raise ValueError(f"unsupported wire type {wire_type}")
+        if pos > end:
+            raise ValueError("truncated message")
+        yield key >> 3, wire_type, raw
+
+
+def _default_value(spec):
+    """Return the value read from a field that is absent on the wire."""
+    wire_type, _, read, _ = spec
+    if wire_type == _WIRE_VARINT:
+        return read(0)
+    if wire_type == _WIRE_LEN:
+        return read(b"")
+    return read(bytes(4 if wire_type == _WIRE_I32 else 8))
+
+
+def _iter_packed(wire_type, raw):
+    if wire_type == _WIRE_VARINT:
+        pos = 0
+        while pos < len(raw):
+            v, pos = _read_varint(raw, pos)
+            yield v
+    else:
+        size = 4 if wire_type == _WIRE_I32 else 8
+        for pos in range(0, len(raw), size):
+            yield raw[pos : pos + size]
+
+
+def _message_kind(encode, decode):
+    def write(out, v):
+        _write_len(out, encode(v))
+
+    return _WIRE_LEN, write, decode, _is_none
+
+
+def _is_none(v):
+    return v is None
+
+
+def _encode_timestamp(v):
+    return _encode_seconds_nanos(*_timestamp_to_seconds_nanos(v))
+
+
+def _decode_timestamp(raw):
+    return _timestamp_from_seconds_nanos(*_decode_seconds_nanos(raw))
+
+
+def _encode_duration(v):
+    return _encode_seconds_nanos(*_duration_to_seconds_nanos(v))
+
+
+def _decode_duration(raw):
+    return _duration_from_seconds_nanos(*_decode_seconds_nanos(raw))
+
+
+def _encode_seconds_nanos(seconds, nanos):
+    out = bytearray()
+    if seconds:
+        out.append(0x08)
+        _write_varint(out, seconds & 0xFFFFFFFFFFFFFFFF)
+    if nanos:
+        out.append(0x10)
+        _write_varint(out, nanos & 0xFFFFFFFFFFFFFFFF)
+    return out
+
+
+def _decode_seconds_nanos(raw):
+    seconds = nanos = 0
+    for number, _, v in _iter_fields(raw):
+        if number == 1:
+            seconds = _to_int64(v)
+        elif number == 2:
+            nanos = _to_int32(v)
+    return seconds, nanos
+
+
+def _encode_value(v):
+    out = bytearray()
+    if v is None:
+        out += b"\x08\x00"
+    elif isinstance(v, bool):
+        out += b"\x20\x01" if v else b"\x20\x00"
+    elif isinstance(v, (int, float)):
+        out.append(0x11)
+        out += _struct.pack("<d", v)
+    elif isinstance(v, str):
+        out.append(0x1A)
+        _write_str(out, v)
+    elif isinstance(v, dict):
+        out.append(0x2A)
+        _write_len(out, _encode_struct(v))
+    elif isinstance(v, (list, tuple)):
+        out.append(0x32)
+        _write_len(out, _encode_list_value(v))
+    else:
+        raise TypeError(f"cannot encode {type(v).__name__} as google.protobuf.Value")
+    return out
+
+
+def _decode_value(raw):
+    value = None
+    for number, _, v in _iter_fields(raw):
+        if number == 1:
+            value = None
+        elif number == 2:
+            value = _struct.unpack("<d", v)[0]
+        elif number == 3:
+            value = v.decode()
+        elif number == 4:
+            value = bool(v)
+        elif number == 5:
+            value = _decode_struct(v)
+        elif number == 6:
+            value = _decode_list_value(v)
+    return value
+
+
+def _encode_struct(v):
+    out = bytearray()
+    for key, item in v.items():
+        entry = bytearray(b"\x0a")
+        _write_str(entry, key)
+        entry.append(0x12)
+        _write_len(entry, _encode_value(item))
+        out.append(0x0A)
+        _write_len(out, entry)
+    return out
+
+
+def _decode_struct(raw):
+    result = {}
+    for number, _, entry in _iter_fields(raw):
+        if number == 1:
+            key, value = "", None
+            for entry_number, _, v in _iter_fields(entry):
+                if entry_number == 1:
+                    key = v.decode()
+                elif entry_number == 2:
+                    value = _decode_value(v)
+            result[key] = value
+    return result
+
+
+def _encode_list_value(v):
+    out = bytearray()
+    for item in v:
+        out.append(0x0A)
+        _write_len(out, _encode_value(item))
+    return out
+
+
+def _decode_list_value(raw):
+    return [_decode_value(v) for number, _, v in _iter_fields(raw) if number == 1]
+
+
+def _encode_field_mask(v):
+    out = bytearray()
+    for path in v:
+        out.append(0x0A)
+        _write_str(out, path)
+    return out
+
+
+def _decode_field_mask(raw):
+    return [v.decode() for number, _, v in _iter_fields(raw) if number == 1]
+
+
+def _unsupported_any(_):
+    raise ValueError("google.protobuf.Any is not supported by the binary codec")
+
+
+def _wrapper_kind(kind):
+    wire_type, write, read, is_default = _SCALAR_KINDS[kind]
+    tag = bytes([0x08 | wire_type])
+    default = _default_value(_SCALAR_KINDS[kind])
+
+    def encode(v):
+        out = bytearray()
+        if not is_default(v):
+            out += tag
+            write(out, v)
+        return out
+
+    def decode(raw):
+        value = default
+        for number, _, v in _iter_fields(raw):
+            if number == 1:
+                value = read(v)
+        return value
+
+    return _message_kind(encode, decode)
+
+
+_WELL_KNOWN_KINDS = {
+    "google.protobuf.Timestamp": _message_kind(_encode_timestamp, _decode_timestamp),
+    "google.protobuf.Duration": _message_kind(_encode_duration, _decode_duration),
+    "google.protobuf.Struct": _message_kind(_encode_struct, _decode_struct),
+    "google.protobuf.Value": _message_kind(_encode_value, _decode_value),
+    "google.protobuf.ListValue": _message_kind(_encode_list_value, _decode_list_value),
+    "google.protobuf.FieldMask": _message_kind(_encode_field_mask, _decode_field_mask),
+    "google.protobuf.Empty": _message_kind(lambda v: b"", lambda raw: None),
+    "google.protobuf.Any": _message_kind(_unsupported_any, _unsupported_any),
+    "google.protobuf.BoolValue": _wrapper_kind("bool"),
+    "google.protobuf.Int32Value": _wrapper_kind("int32"),
+    "google.protobuf.Int64Value": _wrapper_kind("int64"),
+    "google.protobuf.UInt32Value": _wrapper_kind("uint32"),
+    "google.protobuf.UInt64Value": _wrapper_kind("uint64"),
+    "google.protobuf.FloatValue": _wrapper_kind("float"),
+    "google.protobuf.DoubleValue": _wrapper_kind("double"),
+    "google.protobuf.StringValue": _wrapper_kind("string"),
+    "google.protobuf.BytesValue": _wrapper_kind("bytes"),
+}
+
+
+# pb2 converters of the well-known types: (get, put) pairs that read a value
+# from a protobuf message object and write one into it. Timestamp, Duration,
+# FieldMask and the wrappers copy attributes; the JSON-like types go through
+# the binary codecs above.
+def _pb2_get_timestamp(sub):
+    return _timestamp_from_seconds_nanos(sub.seconds, sub.nanos)
+
+
+def _pb2_put_timestamp(sub, v):
+    sub.seconds, sub.nanos = _timestamp_to_seconds_nanos(v)
+
+
+def _pb2_get_duration(sub):
+    return _duration_from_seconds_nanos(sub.seconds, sub.nanos)
+
+
+def _pb2_put_duration(sub, v):
+    sub.seconds, sub.nanos = _duration_to_seconds_nanos(v)
+
+
+def _pb2_get_field_mask(sub):
+    return list(sub.paths)
+
+
+def _pb2_put_field_mask(sub, v):
+    sub.paths.extend(v)
+
+
+def _pb2_get_wrapper(sub):
+    return sub.value
+
+
+def _pb2_put_wrapper(sub, v):
+    sub.value = v
+
+
+def _pb2_via_wire(encode, decode):
+    def get(sub):
+        return decode(sub.SerializeToString())
+
+    def put(sub, v):
+        sub.ParseFromString(bytes(encode(v)))
+
+    return get, put
+
+
+def _pb2_unsupported_any(*_):
+    raise ValueError("google.protobuf.Any is not supported by the pb2 converters")
+
+
+_PB2_WRAPPER = (_pb2_get_wrapper, _pb2_put_wrapper)
+
+_WELL_KNOWN_PB2 = {
+    "google.protobuf.Timestamp": (_pb2_get_timestamp, _pb2_put_timestamp),
+    "google.protobuf.Duration": (_pb2_get_duration, _pb2_put_duration),
+    "google.protobuf.Struct": _pb2_via_wire(_encode_struct, _decode_struct),
+    "google.protobuf.Value": _pb2_via_wire(_encode_value, _decode_value),
+    "google.protobuf.ListValue": _pb2_via_wire(_encode_list_value, _decode_list_value),
+    "google.protobuf.FieldMask": (_pb2_get_field_mask, _pb2_put_field_mask),
+    "google.protobuf.Empty": (lambda sub: None, lambda sub, v: None),
+    "google.protobuf.Any": (_pb2_unsupported_any, _pb2_unsupported_any),
+    "google.protobuf.BoolValue": _PB2_WRAPPER,
+    "google.protobuf.Int32Value": _PB2_WRAPPER,
+    "google.protobuf.Int64Value": _PB2_WRAPPER,
+    "google.protobuf.UInt32Value": _PB2_WRAPPER,
+    "google.protobuf.UInt64Value": _PB2_WRAPPER,
+    "google.protobuf.FloatValue": _PB2_WRAPPER,
+    "google.protobuf.DoubleValue": _PB2_WRAPPER,
+    "google.protobuf.StringValue": _PB2_WRAPPER,
+    "google.protobuf.BytesValue": _PB2_WRAPPER,
+}
+
+# Distinct fields sets kept per frozen model for instances to share.
+_MAX_SHARED_FIELDS_SETS = 1024
+
+# FieldMask projections kept per model, by mask.
+_MAX_PROJECTIONS = 256
+
+# The Annotated form of a field validator, by mode.
+_FIELD_VALIDATORS = {
+    "after": _AfterValidator,
+    "before": _BeforeValidator,
+    "plain": _PlainValidator,
+    "wrap": _WrapValidator,
+}
+
+
+def _hashable(value):
+    """Return value, with lists and dicts turned into tuples and frozensets."""
+    if isinstance(value, list):
+        return tuple(map(_hashable, value))
+    if isinstance(value, dict):
+        return frozenset([(k, _hashable(v)) for k, v in value.items()])
+    return value
+
+
+def _mask_paths(field_mask):
+    """Return FieldMask paths as a tuple, splitting the ProtoJSON string form."""
+    if isinstance(field_mask, str):
+        return tuple(field_mask.split(",")) if field_mask else ()
+    return tuple(field_mask)
+
+
+def _mask_tree(paths):
+    """Return FieldMask paths as a tree of dicts, None marking a whole field."""
+    tree = {}
+    for path in paths:
+        node = tree
+        *parents, last = path.split(".")
+        for segment in parents:
+            node = node.setdefault(segment, {})
+            if node is None:
+                break
+        else:
+            node[last] = None
+    return tree
+
+
+class _Projection:
+    """The fields of a message that a FieldMask selects.
+
+    typed_dict validates the selected fields of ProtoJSON data and ignores
+    the others; build turns its output into a model instance.
+    """
+
+    __slots__ = ("typed_dict", "adapter", "_wire", "_fields")
+
+    def __init__(self, wire, typed_dict, fields):
+        self.typed_dict = typed_dict
+        self.adapter = None
+        self._wire = wire
+        self._fields = fields
+
+    def build(self, data):
+        values = {}
+        for key, name, nested in self._fields:
+            if key in data:
+                v = data[key]
+                values[name] = v if nested is None or v is None else nested.build(v)
+        return self._wire.instance(values)
+
+
+class ProtoFieldMask:
+    """A FieldMask compiled against a message class.
+
+    Built by Model.proto_field_mask(). paths lists the selected fields by
+    their ProtoJSON keys. Merges follow the FieldMask rules of the protobuf
+    runtimes: a path through a message field only applies when the source
+    sets it, masked repeated fields and maps are appended to and updated,
+    and masked message fields are merged unless replace_message_field is
+    set. Nested messages are never changed in place: merged ones are new
+    instances, and those taken from the source are deep copies.
+    """
+
+    __slots__ = ("_fields", "_wire", "paths")
+
+    def __init__(self, wire, tree):
+        self.paths = []
+        self._wire = wire
+        self._fields = []
+        for entry, subtree, nested_wire in wire._mask_fields(tree):
+            key, name, kind, type_name, _, _ = entry
+            nested = None
+            if nested_wire is not None:
+                nested = ProtoFieldMask(nested_wire, subtree)
+                self.paths.extend(f"{key}.{path}" for path in nested.paths)
+            else:
+                self.paths.append(key)
+            label, _, base = kind.rpartition(" ")
+            messages = base in ("message", "message>")
+            if kind.startswith("map<"):
+                kind = "map"
+            elif label in ("packed", "repeated"):
+                kind = "repeated"
+            elif base == "message":
+                kind = "message"
+            else:
+                kind = "value"
+            self._fields.append((key, name, kind, type_name, nested, messages))
+
+    def project(self, message):
+        """Return a new message holding only the masked fields of message."""
+        return self._merged(None, message, False, False)
+
+    def merge_into(
+        self,
+        destination,
+        source,
+        replace_message_field: bool = False,
+        replace_repeated_field: bool = False,
+    ) -> None:
+        """Merge the masked fields of source into destination, in place."""
+        if destination.model_config.get("frozen"):
+            raise TypeError(f"{type(destination).__name__} is frozen")
+        merged = self._merged(
+            destination, source, replace_message_field, replace_repeated_field
+        )
+        _object_setattr(destination, "__dict__", merged.__dict__)
+        _object_setattr(
+            destination, "__pydantic_fields_set__", set(merged.__pydantic_fields_set__)
+        )
+
+    def diff(self, a, b) -> list:
+        """Return the paths of the masked fields whose values differ in a and b.
+
+        Message fields set on both sides are compared field by field, so the
+        paths name the innermost fields that differ.
+        """
+        paths = []
+        self._diff(a, b, "", paths)
+        return paths
+
+    def _diff(self, a, b, prefix, paths):
+        for key, name, kind, type_name, nested, _ in self._fields:
+            va, vb = getattr(a, name), getattr(b, name)
+            if va == vb:
+                continue
+            if nested is None and kind == "message" and None not in (va, vb):
+                nested = self._wire._resolve(type_name).__proto_wire__.field_mask()
+            if nested is None:
+                paths.append(prefix + key)
+                continue
+            empty = nested._wire.instance({})
+            nested._diff(
+                empty if va is None else va,
+                empty if vb is None else vb,
+                prefix + key + ".",
+                paths,
+            )
+
+    def _merged(self, destination, source, replace_message, replace_repeated):
+        """Return a new instance: destination, or an empty message when it is
+        None, with the masked fields of source merged in.
+        """
+        wire = self._wire
+        values = {}
+        if destination is not None:
+            fields_set = destination.__pydantic_fields_set__
+            values = {k: v for k, v in destination.__dict__.items() if k in fields_set}
+        for _, name, kind, type_name, nested, messages in self._fields:
+            v = getattr(source, name)
+            old = None if destination is None else getattr(destination, name)
+            if nested is not None:
+                if v is None:
+                    continue
+                v = nested._merged(old, v, replace_message, replace_repeated)
+            elif kind == "repeated":
+                if messages:
+                    v = [m.__deepcopy__() for m in v]
+                v = list(v) if replace_repeated or old is None else old + v
+            elif kind == "map":
+                if messages:
+                    v = {k: m.__deepcopy__() for k, m in v.items()}
+                v = dict(v) if replace_repeated or old is None else {**old, **v}
+            elif kind == "message" and v is not None:
+                if replace_message or old is None:
+                    v = v.__deepcopy__()
+                else:
+                    v = wire._resolve(type_name).__proto_wire__.merged(old, v)
+            elif kind == "message" and not replace_message:
+                continue
+            wire.set_value(values, name, v)
+        return wire.instance(values)
+
+
+class _SharedFieldsSet(set):
+    """A fields set shared by the frozen instances of a model; read-only.
+
+    pydantic-core serializes with exclude_unset only from a set, so the
+    shared set cannot be a frozenset; its mutating methods raise instead.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args):
+        raise TypeError("the fields set of a frozen message is shared and read-only")
+
+    add = discard = remove = pop = clear = update = _read_only
+    difference_update = intersection_update = _read_only
+    symmetric_difference_update = _read_only
+    __ior__ = __iand__ = __isub__ = __ixor__ = _read_only
+
+
+class ProtoWire:
+    """Protobuf binary codec of a generated message.
+
+    Each field is a (number, name, kind[, type]) tuple. kind is a proto scalar
+    type, "enum", "message", a well-known type name or "map<K, V>", optionally
+    prefixed by "optional", "repeated" or "packed". type is the dotted name of
+    the enum or message class, resolved in the module that defines the model
+    on first use.
+
+    The same table drives the conversion from and to protobuf message objects
+    (from_pb2 and to_pb2); their attribute names are looked up by field number
+    in the message descriptor.
+
+    unions maps the members of oneofs modelled as discriminated unions, by
+    Python name and ProtoJSON key, to the attribute holding the union and the
+    branch model of the member. Such members are read through properties and
+    folded into, or flattened out of, their union attribute.
+    """
+
+    def __init__(self, *fields, oneofs=None, unions=None):
+        self._fields = fields
+        self._oneofs = oneofs or {}
+        self._oneof_members = frozenset(
+            name for members in self._oneofs.values() for name in members
+        )
+        self._unions = unions or {}
+        self._union_keys = frozenset(self._unions)
+        self._union_cases = {
+            key: branch.model_fields["case"].default
+            for key, (_, branch) in self._unions.items()
+        }
+        self._union_aliases = {
+            case: key for key, case in self._union_cases.items() if key != case
+        }
+        self._union_attrs = {
+            self._unions[members[0]][0]: name
+            for name, members in self._oneofs.items()
+            if members[0] in self._unions
+        }
+        self._model = None
+        self._compiled = False
+        self._writers = []
+        self._readers = {}
+        self._pb2 = {}
+        self._json_compiled = False
+        self._json_decoders = {}
+        self._json_fast = False
+        self._json_defaults = {}
+        self._json_factories = []
+        self._json_required = []
+        self._json_frozen = False
+        self._fields_sets = {}
+        self._projections = {}
+        self._field_masks = {}
+        self._table = None
+        self._mergers = None
+        self._zero_enums = None
+
+    def __set_name__(self, owner, name):
+        self._model = owner
+
+    def encode(self, message) -> bytes:
+        """Encode a model instance to wire-format bytes."""
+        if not self._compiled:
+            self._compile()
+        out = bytearray()
+        for write in self._writers:
+            write(out, message)
+        return bytes(out)
+
+    def decode(self, data: bytes) -> dict:
+        """Decode wire-format bytes into a dict of field values.
+
+        Unknown fields are skipped. The result is meant for model_validate;
+        nested messages are decoded to dicts as well. A message field that
+        occurs more than once is merged, as the protobuf runtimes do.
+        """
+        if not self._compiled:
+            self._compile()
+        data = bytes(data)
+        readers = self._readers
+        values = {}
+        # Raw bytes of the message fields read so far, by name.
+        messages = {}
+        try:
+            for number, wire_type, raw in _iter_fields(data):
+                read = readers.get(number)
+                if read is not None:
+                    read(values, wire_type, raw, messages)
+        except (IndexError, _struct.error):
+            raise ValueError("truncated message") from None
+        return values
+
+    def construct(self, data: dict):
+        """Build a model instance from trusted ProtoJSON dict data.
+
+        Nothing is validated: values are only converted from their ProtoJSON
+        form (int64 strings, base64 bytes, Timestamp and Duration strings,
+        nested messages) and set on the instance like model_construct does.
+        Unknown keys and null values are dropped.
+        """
+        if not self._json_compiled:
+            self._compile_json()
+        decoders = self._json_decoders
+        values = {}
+        for key, v in data.items():
+            entry = decoders.get(key)
+            if entry is not None and v is not None:
+                name, decode = entry
+                values[name] = v if decode is None else decode(v)
+        return self.instance(values)
+
+    def instance(self, values):
+        """Build a model instance from field values, like model_construct.
+
+        values are keyed by Python name; members of discriminated unions are
+        folded into their union attribute.
+        """
+        if not self._json_compiled:
+            self._compile_json()
+        if not self._union_keys.isdisjoint(values):
+            for name in self._union_keys.intersection(values):
+                attr, branch = self._unions[name]
+                values[attr] = branch.model_construct(value=values.pop(name))
+        model = self._model
+        if not self._json_fast:
+            instance = model.model_construct(**values)
+        else:
+            # model_construct, minus the per-field alias and default lookups;
+            # copying the defaults keeps the field order of __dict__.
+            fields_values = self._json_defaults.copy()
+            fields_values.update(values)
+            for name, factory in self._json_factories:
+                if name not in values:
+                    fields_values[name] = factory()
+            for name in self._json_required:
+                if name not in values:
+                    del fields_values[name]
+            instance = model.__new__(model)
+            _object_setattr(instance, "__dict__", fields_values)
+            _object_setattr(instance, "__pydantic_fields_set__", set(values))
+            _object_setattr(instance, "__pydantic_extra__", None)
+            _object_setattr(instance, "__pydantic_private__", None)
+        if self._json_frozen:
+            self.share_fields_set(instance)
+        return instance
+
+    def set_value(self, values, name, value):
+        """Set field name in values, the field values of a message to build.
+
+        None unsets the field. A oneof member that is set unsets the other
+        members of its oneof.
+        """
+        union = self._unions.get(name)
+        if value is None:
+            values.pop(name, None)
+            if union is not None:
+                branch = values.get(union[0])
+                if branch is not None and branch.case == name:
+                    del values[union[0]]
+            return
+        if name in self._oneof_members:
+            for members in self._oneofs.values():
+                if name in members:
+                    for member in members:
+                        values.pop(member, None)
+            if union is not None:
+                values.pop(union[0], None)
+        values[name] = value
+
+    def project_json(self, data, field_mask, **kwargs):
+        """Build a model instance from the fields field_mask selects in data.
+
+        field_mask is a list of FieldMask paths or their comma-separated
+        ProtoJSON form. Each mask is compiled once into a TypedDict of the
+        selected fields, nested messages included, so pydantic-core validates
+        those and skips the rest of the JSON. The instance is then assembled
+        like construct does: unselected fields keep their defaults and
+        model-level checks (oneofs, CEL) do not run.
+        """
+        key = _mask_paths(field_mask)
+        projection = self._projections.get(key)
+        if projection is None:
+            projection = self._projection(_mask_tree(key))
+            projection.adapter = _TypeAdapter(projection.typed_dict)
+            if len(self._projections) < _MAX_PROJECTIONS:
+                self._projections[key] = projection
+        return projection.build(projection.adapter.validate_json(data, **kwargs))
+
+    def field_mask(self, paths=None):
+        """Return paths compiled into a ProtoFieldMask, once per mask.
+
+        paths is a list of FieldMask paths or their comma-separated ProtoJSON
+        form; None selects every field of the message.
+        """
+        key = None if paths is None else _mask_paths(paths)
+        mask = self._field_masks.get(key)
+        if mask is None:
+            if key is None:
+                tree = dict.fromkeys(name for _, name, *_ in self._fields)
+            else:
+                tree = _mask_tree(key)
+            mask = ProtoFieldMask(self, tree)
+            if len(self._field_masks) < _MAX_PROJECTIONS:
+                self._field_masks[key] = mask
+        return mask
+
+    def _field_table(self):
+        # Fields by Python name and ProtoJSON key: (key, name, kind, type
+        # name, FieldInfo, required).
+        table = self._table
+        if table is not None:
+            return table
+        model = self._model
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+        table = {}
+        for _, name, kind, *type_name in self._fields:
+            type_name = type_name[0] if type_name else None
+            field = model.model_fields.get(name)
+            if field is None:
+                # A member of a discriminated union: the value of its branch.
+                field = self._unions[name][1].model_fields["value"]
+                key, required = self._union_aliases.get(name, name), False
+            else:
+                key, required = field.alias or name, field.is_required()
+            entry = (key, name, kind, type_name, field, required)
+            table[name] = table[key] = entry
+        self._table = table
+        return table
+
+    def _mask_fields(self, tree):
+        """Resolve the top level of a FieldMask tree against the field table.
+
+        Yields (entry, subtree, wire): wire is the ProtoWire of the message
+        whose fields subtree selects, or None when the whole field is.
+        """
+        table = self._field_table()
+        model = self._model
+        for segment, subtree in tree.items():
+            entry = table.get(segment)
+            if entry is None:
+                raise ValueError(f"{model.__name__} has no field {segment!r}")
+            if subtree is None:
+                yield entry, None, None
+            elif entry[2] == "message":
+                yield entry, subtree, self._resolve(entry[3]).__proto_wire__
+            else:
+                raise ValueError(
+                    f"{model.__name__}.{entry[1]} is not a singular message"
+                )
+
+    def _field_validators(self, name):
+        """Return the model's field validators of name, as Annotated metadata.
+
+        A projection validates into a TypedDict, which the model's decorators
+        do not reach; CEL field rules among them must still hold.
+        """
+        return [
+            _FIELD_VALIDATORS[d.info.mode](d.func)
+            for d in self._model.__pydantic_decorators__.field_validators.values()
+            if name in d.info.fields or "*" in d.info.fields
+        ]
+
+    def _projection(self, tree):
+        annotations = {}
+        fields = []
+        for entry, subtree, wire in self._mask_fields(tree):
+            key, name, _, _, field, required = entry
+            if wire is None:
+                nested = None
+                typ = field.annotation
+                metadata = [*field.metadata, *self._field_validators(name)]
+                if metadata:
+                    typ = _Annotated[(typ, *metadata)]
+            else:
+                nested = wire._projection(subtree)
+                typ = nested.typed_dict | None
+            annotations[key] = typ if required else _NotRequired[typ]
+            fields.append((key, name, nested))
+        model = self._model
+        typed_dict = _with_config(model.model_config)(
+            _TypedDict(model.__name__ + "Projection", annotations)
+        )
+        return _Projection(self, typed_dict, fields)
+
+    def typed_dict(self):
+        """Return the TypedDict mirror of the model, generated by typed_dicts."""
+        return self._resolve(self._model.__qualname__.replace(".", "") + "Dict")
+
+    def hash(self, message) -> int:
+        """Hash the field values of a frozen message.
+
+        Lists and maps are hashed as tuples and frozensets of their items;
+        nested messages, frozen as well, hash themselves.
+        """
+        return hash(tuple(map(_hashable, message.__dict__.values())))
+
+    def share_fields_set(self, message):
+        """Swap the fields set of a frozen message for an equal, shared one.
+
+        A frozen message never adds to its fields set, so instances with the
+        same fields set can hold one read-only set instead of a set each. Only
+        instances of frozen classes share: a mutable subclass adds to and
+        discards from its own set. Returns message.
+        """
+        if not type(message).model_config.get("frozen"):
+            return message
+        key = frozenset(message.__pydantic_fields_set__)
+        shared = self._fields_sets.get(key)
+        if shared is None:
+            if len(self._fields_sets) >= _MAX_SHARED_FIELDS_SETS:
+                return message
+            shared = self._fields_sets[key] = _SharedFieldsSet(key)
+        _object_setattr(message, "__pydantic_fields_set__", shared)
+        return message
+
+    @staticmethod
+    def own_fields_set(message):
+        """Give a copy of a frozen message a fields set of its own.
+
+        model_copy(update=...) adds the updated fields to the copy's set,
+        which cannot be the read-only shared one. Returns message.
+        """
+        fields_set = set(message.__pydantic_fields_set__)
+        _object_setattr(message, "__pydantic_fields_set__", fields_set)
+        return message
+
+    def check_oneofs(self, message):
+        """Raise ValueError when more than one member of a oneof is set.
+
+        A member is set when it is in model_fields_set and not None.
+        """
+        fields_set = message.__pydantic_fields_set__
+        if self._oneof_members.isdisjoint(fields_set):
+            return message
+        values = message.__dict__
+        for name, members in self._oneofs.items():
+            found = [m for m in members if m in fields_set and values[m] is not None]
+            if len(found) > 1:
+                raise ValueError(
+                    f"oneof {name} has more than one member set: {', '.join(found)}"
+                )
+        return message
+
+    def which_oneof(self, message, name):
+        """Return the name of the member of oneof name set on message, or None.
+
+        A oneof of plain fields is scanned member by member: a record kept at
+        validation would go stale on assignment. A discriminated union holds
+        its case, which is read directly.
+        """
+        members = self._oneofs.get(name)
+        if members is None:
+            raise ValueError(f"{self._model.__name__} has no oneof {name!r}")
+        if members[0] in self._unions:
+            branch = message.__dict__[self._unions[members[0]][0]]
+            return None if branch is None else branch.case
+        fields_set = message.__pydantic_fields_set__
+        values = message.__dict__
+        for member in members:
+            if member in fields_set and values[member] is not None:
+                return member
+        return None
+
+    def clear_oneof(self, message, name):
+        """Unset every member of oneof name on message."""
+        members = self._oneofs.get(name)
+        if members is None:
+            raise ValueError(f"{self._model.__name__} has no oneof {name!r}")
+        if message.model_config.get("frozen"):
+            raise TypeError(f"{self._model.__name__} is frozen")
+        if members[0] in self._unions:
+            members = (self._unions[members[0]][0],)
+        fields_set = message.__pydantic_fields_set__
+        values = message.__dict__
+        for member in members:
+            values[member] = None
+            fields_set.discard(member)
+
+    def merge_from(self, message, other):
+        """Merge other into message in place, as MergeFrom does.
+
+        A field other sets overwrites that of message when it is not None, or
+        not the zero value for fields without presence. Repeated fields are
+        appended to, maps updated key by key and message fields merged field
+        by field; well-known types are values and replaced. Nested messages
+        are never changed in place: a merged one is a new instance, and one
+        taken from other is a deep copy, so the two messages share none.
+        """
+        if message.model_config.get("frozen"):
+            raise TypeError(f"{self._model.__name__} is frozen")
+        if not isinstance(other, self._model):
+            raise TypeError(
+                f"cannot merge {type(other).__name__} into {self._model.__name__}"
+            )
+        self._merge(message, other)
+
+    def merged(self, message, other):
+        """Return a copy of message with other merged in, as by merge_from."""
+        message = message.__copy__()
+        self._merge(message, other)
+        if self._json_frozen:
+            self.share_fields_set(message)
+        return message
+
+    def _merge(self, message, other):
+        mergers = self._mergers
+        if mergers is None:
+            mergers = self._mergers = self._compile_mergers()
+        values = message.__dict__
+        fields_set = message.__pydantic_fields_set__
+        source = other.__dict__
+        # A field other does not set holds its default, which merges to nothing.
+        for name in other.__pydantic_fields_set__:
+            merge = mergers.get(name)
+            if merge is not None:
+                merge(values, fields_set, source[name])
+
+    def fold_unions(self, data):
+        """Move the oneof members in input data into their union attributes.
+
+        Each member key becomes {"case": name, "value": value} under the
+        attribute, so the discriminated union validates only that branch.
+        """
+        if not isinstance(data, dict) or self._union_keys.isdisjoint(data):
+            return data
+        unions = self._unions
+        data = dict(data)
+        for key in [key for key in data if key in unions]:
+            value = data.pop(key)
+            if value is None:
+                continue
+            attr, _ = unions[key]
+            if data.get(attr) is not None:
+                name = self._union_attrs[attr]
+                raise ValueError(f"oneof {name} has more than one member set")
+            data[attr] = {"case": self._union_cases[key], "value": value}
+        return data
+
+    def flatten_unions(self, message, data, info):
+        """Replace each union attribute in serialized data by its member key."""
+        values = message.__dict__
+        for attr in self._union_attrs:
+            dumped = data.pop(attr, None)
+            branch = values[attr]
+            if isinstance(dumped, dict) and "value" in dumped and branch is not None:
+                key = branch.case
+                if info.by_alias:
+                    key = self._union_aliases.get(key, key)
+                data[key] = dumped["value"]
+        return self.omit_zero_enums(message, data, info)
+
+    def omit_zero_enums(self, message, data, info):
+        """Drop enum fields without presence at their zero value from data.
+
+        Such fields default to None, so exclude_defaults keeps a zero that
+        was set; ProtoJSON omits it as it does every other zero value.
+        """
+        if not info.exclude_defaults:
+            return data
+        zeros = self._zero_enums
+        if zeros is None:
+            zeros = self._zero_enums = self._compile_zero_enums()
+        for name, alias, zero in zeros:
+            key = alias if info.by_alias else name
+            if data.get(key) == zero:
+                del data[key]
+        return data
+
+    def union_member(self, message, name):
+        """Return the value of union member name on message, or None."""
+        attr, branch = self._unions[name]
+        value = message.__dict__[attr]
+        return value.value if isinstance(value, branch) else None
+
+    @staticmethod
+    def iter_delimited(fp, chunk_size=65536):
+        """Yield the payloads of a varint length-delimited binary stream.
+
+        fp is read chunk_size bytes at a time; a payload that does not fit
+        in a chunk is read in one go.
+        """
+        buf = b""
+        pos = 0
+        while True:
+            need = chunk_size
+            if pos < len(buf):
+                try:
+                    size, start = _read_varint(buf, pos)
+                except IndexError:
+                    pass
+                else:
+                    end = start + size
+                    if end <= len(buf):
+                        yield buf[start:end]
+                        pos = end
+                        continue
+                    need = max(need, end - len(buf))
+            chunk = fp.read(need)
+            if not chunk:
+                if pos < len(buf):
+                    raise ValueError("truncated message")
+                return
+            buf = buf[pos:] + chunk
+            pos = 0
+
+    @staticmethod
+    def write_delimited(fp, payload):
+        """Write payload to fp, prefixed by its varint length."""
+        out = bytearray()
+        _write_len(out, payload)
+        fp.write(out)
+
+    def from_pb2(self, message) -> dict:
+        """Copy the fields of a protobuf message object into a dict of values.
+
+        Like decode, the result is meant for model_validate and leaves out the
+        fields without presence that hold their default, so that they are not
+        in model_fields_set.
+        """
+        table = self._pb2.get(message.DESCRIPTOR)
+        if table is None:
+            table = self._compile_pb2(message.DESCRIPTOR)
+        values = {}
+        for get, _ in table:
+            get(values, message)
+        return values
+
+    def to_pb2(self, message, target):
+        """Copy the fields of a model instance into the protobuf message target."""
+        table = self._pb2.get(target.DESCRIPTOR)
+        if table is None:
+            table = self._compile_pb2(target.DESCRIPTOR)
+        for _, put in table:
+            put(target, message)
+        return target
+
+    def _resolve(self, path):
+        obj = _sys.modules[self._model.__module__]
+        for part in path.split("."):
+            obj = getattr(obj, part)
+        return obj
+
+    def _kind(self, kind, type_name):
+        if kind in _SCALAR_KINDS:
+            return _SCALAR_KINDS[kind]
+        if kind in _WELL_KNOWN_KINDS:
+            return _WELL_KNOWN_KINDS[kind]
+        cls = self._resolve(type_name)
+        if kind == "message":
+            wire = cls.__proto_wire__
+            return _message_kind(wire.encode, wire.decode)
+        # Enums: string-valued enums carry their numbers, integer ones are numbers.
+        numbers = getattr(cls, "__proto_numbers__", None)
+        if numbers is None:
+            return _varint_kind(
+                lambda v: v & 0xFFFFFFFFFFFFFFFF,
+                _to_int32,
+                lambda v: v is None or v == 0,
+            )
+        names = {number: name for name, number in numbers.items()}
+
+        def to_raw(v):
+            return numbers[v] & 0xFFFFFFFFFFFFFFFF
+
+        def from_raw(v):
+            v = _to_int32(v)
+            return names.get(v, v)
+
+        def is_default(v):
+            return v is None or numbers[v] == 0
+
+        return _varint_kind(to_raw, from_raw, is_default)
+
+    def _compile(self):
+        writers = []
+        readers = {}
+        siblings = {
+            name: members for members in self._oneofs.values() for name in members
+        }
+        for number, name, kind, *type_name in sorted(self._fields):
+            type_name = type_name[0] if type_name else None
+            if kind.startswith("map<"):
+                key_kind, _, value_kind = kind[4:-1].partition(", ")
+                key_spec = self._kind(key_kind, None)
+                value_spec = self._kind(value_kind, type_name)
+                writer, reader = self._map_field(number, name, key_spec, value_spec)
+            else:
+                label, _, kind = kind.rpartition(" ")
+                writer, reader = _field(
+                    number,
+                    name,
+                    label,
+                    self._kind(kind, type_name),
+                    siblings.get(name, ()),
+                )
+            writers.append(writer)
+            readers[number] = reader
+        self._readers = readers
+        self._writers = writers
+        self._compiled = True
+
+    def _compile_mergers(self):
+        # Field kinds as the binary codec reads them: the merge of two
+        # messages is the message decoded from their concatenated encodings.
+        mergers = {}
+        members = {}
+        siblings = {
+            name: tuple(m for m in oneof if m != name)
+            for oneof in self._oneofs.values()
+            for name in oneof
+        }
+        for _, name, kind, *type_name in self._fields:
+            type_name = type_name[0] if type_name else None
+            label, _, kind = kind.rpartition(" ")
+            if label.startswith("map<"):
+                label = "map"
+                kind = kind[:-1]
+            wire = None
+            if kind == "message" and label in ("", "optional"):
+                wire = self._resolve(type_name).__proto_wire__
+            if name in self._unions:
+                members[name] = wire
+                continue
+            if label in ("map", "packed", "repeated"):
+                is_default = None
+            elif label == "optional":
+                is_default = _is_none
+            else:
+                is_default = self._kind(kind, type_name)[3]
+            mergers[name] = _merge_field(
+                name, label, is_default, wire, kind == "message", siblings.get(name, ())
+            )
+        for attr in self._union_attrs:
+            mergers[attr] = _merge_union(attr, members)
+        return mergers
+
+    def _compile_zero_enums(self):
+        zeros = []
+        fields = self._model.model_fields
+        for _, name, kind, *type_name in self._fields:
+            if kind != "enum":
+                continue
+            # Values are stored as the enum's values: names, or numbers.
+            numbers = getattr(self._resolve(type_name[0]), "__proto_numbers__", None)
+            zero = 0
+            if numbers is not None:
+                zero = next(k for k, v in numbers.items() if v == 0)
+            zeros.append((name, fields[name].alias or name, zero))
+        return zeros
+
+    def _map_field(self, number, name, key_kind, value_kind):
+        tag = _tag(number, _WIRE_LEN)
+        key_wire, write_key, read_key, _ = key_kind
+        value_wire, write_value, read_value, _ = value_kind
+        key_tag = bytes([0x08 | key_wire])
+        value_tag = bytes([0x10 | value_wire])
+        key_zero = _default_value(key_kind)
+        value_zero = _default_value(value_kind)
+
+        def write(out, message):
+            for k, v in getattr(message, name).items():
+                entry = bytearray(key_tag)
+                write_key(entry, k)
+                entry += value_tag
+                write_value(entry, v)
+                out += tag
+                _write_len(out, entry)
+
+        def read(values, wire_type, raw, messages):
+            k, v = key_zero, value_zero
+            for entry_number, _, item in _iter_fields(raw):
+                if entry_number == 1:
+                    k = read_key(item)
+                elif entry_number == 2:
+                    v = read_value(item)
+            values.setdefault(name, {})[k] = v
+
+        return write, read
+
+    def _pb2_kind(self, kind, type_name):
+        if kind in _SCALAR_KINDS:
+            return "scalar", None, None
+        if kind in _WELL_KNOWN_PB2:
+            return ("message", *_WELL_KNOWN_PB2[kind])
+        cls = self._resolve(type_name)
+        if kind == "message":
+            wire = cls.__proto_wire__
+
+            def put(sub, v):
+                wire.to_pb2(v, sub)
+
+            return "message", wire.from_pb2, put
+        numbers = getattr(cls, "__proto_numbers__", None)
+        if numbers is None:
+            return "enum", None, None
+        names = {number: name for name, number in numbers.items()}
+
+        def get(v):
+            return names.get(v, v)
+
+        return "enum", get, numbers.__getitem__
+
+    def _json_kind(self, kind, type_name):
+        if kind in _JSON_DECODERS:
+            return _JSON_DECODERS[kind]
+        if kind == "message":
+            construct = self._resolve(type_name).__proto_wire__.construct
+
+            def decode(v):
+                return construct(v) if isinstance(v, dict) else v
+
+            return decode
+        return None
+
+    def _compile_json(self):
+        decoders = {}
+        model_fields = self._model.model_fields
+        for _, name, kind, *type_name in self._fields:
+            type_name = type_name[0] if type_name else None
+            if kind.startswith("map<"):
+                key_kind, _, value_kind = kind[4:-1].partition(", ")
+                decode = _json_map(
+                    _JSON_KEY_DECODERS.get(key_kind),
+                    self._json_kind(value_kind, type_name),
+                )
+            else:
+                label, _, kind = kind.rpartition(" ")
+                decode = self._json_kind(kind, type_name)
+                if label in ("packed", "repeated"):
+                    decode = _json_list(decode)
+            decoders[name] = (name, decode)
+            field = model_fields.get(name)
+            if field is not None and field.alias:
+                decoders[field.alias] = (name, decode)
+        for case, alias in self._union_aliases.items():
+            decoders[alias] = decoders[case]
+        self._json_decoders = decoders
+        # Models that need more than plain field values go through
+        # model_construct itself.
+        model = self._model
+        self._json_frozen = bool(model.model_config.get("frozen"))
+        if not (
+            model.__private_attributes__
+            or model.__pydantic_post_init__
+            or model.model_config.get("extra") == "allow"
+        ):
+            for name, field in model_fields.items():
+                self._json_defaults[name] = field.default
+                if field.default_factory is not None:
+                    self._json_factories.append((name, field.default_factory))
+                elif field.is_required():
+                    self._json_required.append(name)
+            self._json_fast = True
+        self._json_compiled = True
+
+    def _compile_pb2(self, descriptor):
+        table = []
+        for number, name, kind, *type_name in self._fields:
+            type_name = type_name[0] if type_name else None
+            attr = descriptor.fields_by_number[number].name
+            if kind.startswith("map<"):
+                value_kind = kind[4:-1].partition(", ")[2]
+                spec = self._pb2_kind(value_kind, type_name)
+                table.append(_pb2_map_field(attr, name, spec))
+            else:
+                label, _, kind = kind.rpartition(" ")
+                spec = self._pb2_kind(kind, type_name)
+                table.append(_pb2_field(attr, name, label, spec))
+        self._pb2[descriptor] = table
+        return table
+
+
+def _tag(number, wire_type):
+    out = bytearray()
+    _write_varint(out, number << 3 | wire_type)
+    return bytes(out)
+
+
+def _field(number, name, label, spec, siblings):
+    wire_type, write_value, read_value, is_default = spec
+    tag = _tag(number, wire_type)
+    presence = label == "optional" or is_default is _is_none
+
+    if label == "packed":
+        packed_tag = _tag(number, _WIRE_LEN)
+
+        def write(out, message):
+            items = getattr(message, name)
+            if items:
+                payload = bytearray()
+                for v in items:
+                    write_value(payload, v)
+                out += packed_tag
+                _write_len(out, payload)
+
+    elif label == "repeated":
+
+        def write(out, message):
+            for v in getattr(message, name):
+                out += tag
+                write_value(out, v)
+
+    elif presence:
+
+        def write(out, message):
+            v = getattr(message, name)
+            if v is not None:
+                out += tag
+                write_value(out, v)
+
+    else:
+
+        def write(out, message):
+            v = getattr(message, name)
+            if not is_default(v):
+                out += tag
+                write_value(out, v)
+
+    if label in ("packed", "repeated"):
+
+        def read(values, wire_type, raw, messages):
+            items = values.setdefault(name, [])
+            if wire_type == _WIRE_LEN and spec[0] != _WIRE_LEN:
+                items.extend(map(read_value, _iter_packed(spec[0], raw)))
+            else:
+                items.append(read_value(raw))
+
+    elif is_default is _is_none:
+        # The concatenation of two encodings of a message decodes to their
+        # merge, so a repeated message field is read from all its records.
+
+        def read(values, wire_type, raw, messages):
+            previous = messages.get(name)
+            for sibling in siblings:
+                values.pop(sibling, None)
+                messages.pop(sibling, None)
+            if previous is not None:
+                raw = previous + raw
+            messages[name] = raw
+            values[name] = read_value(raw)
+
+    else:
+
+        def read(values, wire_type, raw, messages):
+            for sibling in siblings:
+                values.pop(sibling, None)
+                messages.pop(sibling, None)
+            values[name] = read_value(raw)
+
+    return write, read
+
+
+def _merge_field(name, label, is_default, wire, messages, siblings):
+    """Return merge(values, fields_set, v), which merges v, the value of field
+    name in the source message, into the fields of the destination. Messages
+    taken from the source, when the field holds messages, are deep copies."""
+    if label == "map":
+
+        def merge(values, fields_set, v):
+            if v:
+                if messages:
+                    v = {k: m.__deepcopy__() for k, m in v.items()}
+                values[name] = {**values[name], **v}
+                fields_set.add(name)
+
+    elif label in ("packed", "repeated"):
+
+        def merge(values, fields_set, v):
+            if v:
+                if messages:
+                    v = [m.__deepcopy__() for m in v]
+                values[name] = values[name] + v
+                fields_set.add(name)
+
+    else:
+
+        def merge(values, fields_set, v):
+            if is_default(v):
+                return
+            for sibling in siblings:
+                values[sibling] = None
+                fields_set.discard(sibling)
+            if wire is not None:
+                old = values[name]
+                v = v.__deepcopy__() if old is None else wire.merged(old, v)
+            values[name] = v
+            fields_set.add(name)
+
+    return merge
+
+
+def _merge_union(attr, members):
+    """Return merge(values, fields_set, v) for the branch v of union attr.
+
+    members maps the member names to the ProtoWire of their message type, or
+    None for other types; a message member set on both sides is merged. The
+    branch taken from the source is a deep copy.
+    """
+
+    def merge(values, fields_set, v):
+        if v is None:
+            return
+        old = values[attr]
+        wire = members[v.case]
+        if wire is not None and old is not None and old.case == v.case:
+            v = type(v).model_construct(value=wire.merged(old.value, v.value))
+        else:
+            v = v.__deepcopy__()
+        values[attr] = v
+        fields_set.add(attr)
+
+    return merge
+
+
+def _pb2_field(attr, name, label, spec):
+    shape, get_value, put_value = spec
+
+    if label in ("packed", "repeated"):
+
+        def get(values, pb):
+            items = getattr(pb, attr)
+            if items:
+                values[name] = list(
+                    items if get_value is None else map(get_value, items)
+                )
+
+        if shape == "message":
+
+            def put(pb, message):
+                items = getattr(pb, attr)
+                for v in getattr(message, name):
+                    put_value(items.add(), v)
+
+        else:
+
+            def put(pb, message):
+                items = getattr(message, name)
+                getattr(pb, attr).extend(
+                    items if put_value is None else map(put_value, items)
+                )
+
+    elif shape == "message":
+
+        def get(values, pb):
+            if pb.HasField(attr):
+                values[name] = get_value(getattr(pb, attr))
+
+        def put(pb, message):
+            v = getattr(message, name)
+            if v is not None:
+                sub = getattr(pb, attr)
+                sub.SetInParent()
+                put_value(sub, v)
+
+    else:
+        presence = label == "optional"
+
+        # Like decode, leave fields without presence unset at their default.
+        def get(values, pb):
+            if presence and not pb.HasField(attr):
+                return
+            v = getattr(pb, attr)
+            if not presence and _is_default(v):
+                return
+            values[name] = v if get_value is None else get_value(v)
+
+        def put(pb, message):
+            v = getattr(message, name)
+            if v is not None:
+                setattr(pb, attr, v if put_value is None else put_value(v))
+
+    return get, put
+
+
+def _pb2_map_field(attr, name, spec):
+    shape, get_value, put_value = spec
+
+    def get(values, pb):
+        entries = getattr(pb, attr)
+        if not entries:
+            return
+        if get_value is None:
+            values[name] = dict(entries)
+        else:
+            values[name] = {k: get_value(v) for k, v in entries.items()}
+
+    def put(pb, message):
+        entries = getattr(pb, attr)
+        items = getattr(message, name)
+        if shape == "message":
+            for k, v in items.items():
+                put_value(entries[k], v)
+        elif put_value is None:
+            entries.update(items)
+        else:
+            entries.update({k: put_value(v) for k, v in items.items()})
+
+    return get, put
+
+
+# ProtoJSON decoders of the trusted construct path, for the kinds whose
+# ProtoJSON form differs from the model value. Values already in model form
+# are passed through.
+def _json_bytes(v):
+    if isinstance(v, str):
+        return _base64.b64decode(v + "=" * (-len(v) % 4), altchars=b"-_")
+    return v
+
+
+def _json_bool_key(v):
+    return v == "true" if isinstance(v, str) else v
+
+
+_JSON_DECODERS = {
+    "int64": int,
+    "uint64": int,
+    "sint64": int,
+    "fixed64": int,
+    "sfixed64": int,
+    "float": float,
+    "double": float,
+    "bytes": _json_bytes,
+    "google.protobuf.Timestamp": _parse_timestamp,
+    "google.protobuf.Duration": _parse_duration,
+    "google.protobuf.Int64Value": int,
+    "google.protobuf.UInt64Value": int,
+    "google.protobuf.FloatValue": float,
+    "google.protobuf.DoubleValue": float,
+    "google.protobuf.BytesValue": _json_bytes,
+}
+
+_JSON_KEY_DECODERS = {
+    kind: int
+    for kind in (
+        "int32",
+        "int64",
+        "uint32",
+        "uint64",
+        "sint32",
+        "sint64",
+        "fixed32",
+        "fixed64",
+        "sfixed32",
+        "sfixed64",
+    )
+}
+_JSON_KEY_DECODERS["bool"] = _json_bool_key
+
+
+def _json_list(decode):
+    if decode is None:
+        return list
+
+    def decode_list(v):
+        return [decode(item) for item in v]
+
+    return decode_list
+
+
+def _json_map(decode_key, decode_value):
+    if decode_key is None and decode_value is None:
+        return dict
+    if decode_key is None:
+        decode_key = _identity
+    if decode_value is None:
+        decode_value = _identity
+
+    def decode_map(v):
+        return {decode_key(k): decode_value(item) for k, item in v.items()}
+
+    return decode_map
+
+
+def _identity(v):
+    return v
+
+
+class ProtoModelMixin:
+    """Methods of the generated _ProtoModel base classes.
+
+    _ProtoModel derives from this class and BaseModel and adds only its
+    config and option hooks, so generated files do not repeat the helpers.
+    """
+
+    __slots__ = ()
+
+    def to_proto_dict(self, **kwargs) -> dict:
+        """Serialize to a dict using ProtoJSON conventions.
+
+        Omits fields with default (zero) values and uses original proto
+        field names (camelCase aliases).
+        """
+        kwargs.setdefault("exclude_defaults", True)
+        kwargs.setdefault("by_alias", True)
+        return super().model_dump(**kwargs)
+
+    def to_proto_json(self, **kwargs) -> str:
+        """Serialize to a JSON string using ProtoJSON conventions.
+
+        Omits fields with default (zero) values and uses original proto
+        field names (camelCase aliases).
+        """
+        kwargs.setdefault("exclude_defaults", True)
+        kwargs.setdefault("by_alias", True)
+        return super().model_dump_json(**kwargs)
+
+    @classmethod
+    def from_proto_dict(cls, data: dict, **kwargs):
+        """Deserialize from a dict using ProtoJSON conventions."""
+        return cls.model_validate(data, **kwargs)
+
+    @classmethod
+    def from_proto_dict_trusted(cls, data: dict):
+        """Deserialize from a trusted dict using ProtoJSON conventions.
+
+        Skips validation, including buf.validate constraints: only use it for
+        data this code base produced itself, e.g. to_proto_dict output read
+        back from storage. Nested messages are built with model_construct.
+        """
+        return cls.__proto_wire__.construct(data)
+
+    @classmethod
+    def from_proto_json(
+        cls, json_str: str, field_mask: _Iterable[str] | None = None, **kwargs
+    ):
+        """Deserialize from a JSON string using ProtoJSON conventions.
+
+        With field_mask, a list of FieldMask paths such as ["name",
+        "address.city"], only the selected fields are validated: the JSON of
+        the others is skipped and they keep their defaults.
+        """
+        if field_mask is not None:
+            return cls.__proto_wire__.project_json(json_str, field_mask, **kwargs)
+        return cls.model_validate_json(json_str, **kwargs)
+
+    @classmethod
+    def from_proto_dicts(cls, items: _Iterable[dict], **kwargs) -> list:
+        """Deserialize a batch of dicts using ProtoJSON conventions.
+
+        The whole batch is validated in a single call of a cached
+        TypeAdapter(list[cls]).
+        """
+        if not isinstance(items, list):
+            items = list(items)
+        return cls._proto_list_adapter().validate_python(items, **kwargs)
+
+    @classmethod
+    def from_proto_json_many(cls, data: str | bytes, **kwargs) -> list:
+        """Deserialize a JSON array of messages using ProtoJSON conventions.
+
+        The whole array is validated in a single call of a cached
+        TypeAdapter(list[cls]).
+        """
+        return cls._proto_list_adapter().validate_json(data, **kwargs)
+
+    @classmethod
+    def to_proto_dicts(cls, models: _Iterable["ProtoModelMixin"], **kwargs) -> list:
+        """Serialize a batch of models to dicts, like to_proto_dict."""
+        kwargs.setdefault("exclude_defaults", True)
+        kwargs.setdefault("by_alias", True)
+        if not isinstance(models, list):
+            models = list(models)
+        return cls._proto_list_adapter().dump_python(models, **kwargs)
+
+    @classmethod
+    def to_proto_json_many(
+        cls, models: _Iterable["ProtoModelMixin"], **kwargs
+    ) -> bytes:
+        """Serialize a batch of models to a JSON array, like to_proto_json."""
+        kwargs.setdefault("exclude_defaults", True)
+        kwargs.setdefault("by_alias", True)
+        if not isinstance(models, list):
+            models = list(models)
+        return cls._proto_list_adapter().dump_json(models, **kwargs)
+
+    @classmethod
+    def _proto_list_adapter(cls) -> _TypeAdapter:
+        # Built on first use and cached on the class itself, not inherited.
+        adapter = cls.__dict__.get("__proto_list_adapter__")
+        if adapter is None:
+            adapter = cls.__proto_list_adapter__ = ProtoModelMixin._new_list_adapter(
+                cls
+            )
+        return adapter
+
+    @staticmethod
+    def _new_list_adapter(model) -> _TypeAdapter:
+        return _TypeAdapter(list[model])
+
+    def to_proto_bytes(self) -> bytes:
+        """Serialize to the protobuf binary wire format."""
+        return self.__proto_wire__.encode(self)
+
+    @classmethod
+    def from_proto_bytes(cls, data: bytes, **kwargs):
+        """Deserialize from the protobuf binary wire format.
+
+        Unknown fields are skipped; the decoded values are validated like
+        from_proto_dict input.
+        """
+        return cls.model_validate(cls.__proto_wire__.decode(data), **kwargs)
+
+    @classmethod
+    def iter_proto_ndjson(cls, fp, **kwargs):
+        """Read models from a newline-delimited JSON stream, like from_proto_json.
+
+        fp is a text or binary file object, consumed one line at a time;
+        blank lines are skipped.
+        """
+        for line in fp:
+            if line.strip():
+                yield cls.from_proto_json(line, **kwargs)
+
+    @classmethod
+    def write_proto_ndjson(
+        cls, fp, models: _Iterable["ProtoModelMixin"], **kwargs
+    ) -> None:
+        """Write models to the text file object fp as newline-delimited JSON.
+
+        Each line is the to_proto_json output of a model.
+        """
+        for model in models:
+            fp.write(model.to_proto_json(**kwargs) + "\n")
+
+    @classmethod
+    def iter_proto_delimited(cls, fp, chunk_size: int = 65536, **kwargs):
+        """Read models from a varint length-delimited binary stream.
+
+        This is the framing written by writeDelimitedTo in the Java and C++
+        protobuf runtimes. fp is read in chunks, so memory use does not grow
+        with the length of the stream.
+        """
+        for data in cls.__proto_wire__.iter_delimited(fp, chunk_size):
+            yield cls.from_proto_bytes(data, **kwargs)
+
+    @classmethod
+    def write_proto_delimited(cls, fp, models: _Iterable["ProtoModelMixin"]) -> None:
+        """Write models to the binary file object fp, each prefixed by its length."""
+        write = cls.__proto_wire__.write_delimited
+        for model in models:
+            write(fp, model.to_proto_bytes())
+
+    @classmethod
+    def proto_field_mask(cls, paths: _Iterable[str] | str | None = None):
+        """Compile FieldMask paths against the model, once per mask.
+
+        paths is a list of paths such as ["name", "address.city"] or their
+        comma-separated ProtoJSON form; None selects every field. The result
+        projects, merges and diffs models through the selected fields.
+        """
+        return cls.__proto_wire__.field_mask(paths)
+
+    def which_oneof(self, name: str) -> str | None:
+        """Return the name of the member of oneof name that is set, or None.
+
+        Raises ValueError if the message has no oneof called name.
+        """
+        return self.__proto_wire__.which_oneof(self, name)
+
+    def clear_oneof(self, name: str) -> None:
+        """Unset every member of oneof name."""
+        self.__proto_wire__.clear_oneof(self, name)
+
+    def merge_from(self, other) -> None:
+        """Merge other, a message of the same class, into this one in place.
+
+        Follows MergeFrom of the protobuf runtimes: the fields other sets
+        overwrite these, repeated fields are appended to, maps are updated
+        key by key and message fields are merged recursively.
+        """
+        self.__proto_wire__.merge_from(self, other)
+
+    def to_pb2(self, message_class):
+        """Convert to an instance of message_class, the protoc-generated class."""
+        return self.__proto_wire__.to_pb2(self, message_class())
+
+    @classmethod
+    def from_pb2(cls, message, **kwargs):
+        """Convert from a protoc-generated message object.
+
+        Fields are copied attribute by attribute; the values are validated like
+        from_proto_dict input.
+        """
+        return cls.model_validate(cls.__proto_wire__.from_pb2(message), **kwargs)
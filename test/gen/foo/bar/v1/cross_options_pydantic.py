@@ -63,3 +63,10 @@ class Language(_ProtoEnum):
             priority=1,
         ),
     )  # 3
+
+    __proto_numbers__ = {
+        "UNSPECIFIED": 0,
+        "PYTHON": 1,
+        "GOLANG": 2,
+        "RUST": 3,
+    }
@@ -3,12 +3,14 @@
 
 from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
 
+from ._proto_types import ProtoModelMixin, ProtoWire
+
 from api.v1.messages_pydantic import Message
 
 from api.v1.scalars_pydantic import Scalars
 
 
-class _ProtoModel(_BaseModel):
+class _ProtoModel(ProtoModelMixin, _BaseModel):
     """Base class for generated Pydantic models with ProtoJSON helpers."""
 
     model_config = _ConfigDict(
@@ -18,36 +20,6 @@ class _ProtoModel(_BaseModel):
         ser_json_inf_nan="strings",
     )
 
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
-
 
 class CrossRefMessage(_ProtoModel):
     """
@@ -60,13 +32,19 @@ class CrossRefMessage(_ProtoModel):
 
     model_config = _ConfigDict(populate_by_name=True)
 
-    id_: "str" = _Field(
+    id_: str = _Field(
         default="",
         alias="id",
     )
 
-    referenced_message: "Message | None" = _Field(default=None)
+    referenced_message: Message | None = _Field(default=None)
 
-    scalars_list: "list[Scalars]" = _Field(
+    scalars_list: list[Scalars] = _Field(
         default_factory=list,
     )
+
+    __proto_wire__ = ProtoWire(
+        (1, "id_", "string"),
+        (2, "referenced_message", "message", "Message"),
+        (3, "scalars_list", "repeated message", "Scalars"),
+    )
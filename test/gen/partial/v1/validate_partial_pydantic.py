@@ -9,10 +9,10 @@ from pydantic import (
     Field as _Field,
 )
 
-from ._proto_types import _validate_email, _validate_uuid
+from ._proto_types import ProtoModelMixin, ProtoWire, _validate_email, _validate_uuid
 
 
-class _ProtoModel(_BaseModel):
+class _ProtoModel(ProtoModelMixin, _BaseModel):
     """Base class for generated Pydantic models with ProtoJSON helpers."""
 
     model_config = _ConfigDict(
@@ -22,36 +22,6 @@ class _ProtoModel(_BaseModel):
         ser_json_inf_nan="strings",
     )
 
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
-
 
 class ValidatedEmail(_ProtoModel):
     """
@@ -63,11 +33,15 @@ class ValidatedEmail(_ProtoModel):
     """
 
     # Address must be a valid email address.
-    address: "_Annotated[str, _AfterValidator(_validate_email)]" = _Field(
+    address: _Annotated[str, _AfterValidator(_validate_email)] = _Field(
         default="",
         description="Address must be a valid email address.",
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "address", "string"),
+    )
+
 
 class ValidatedUUID(_ProtoModel):
     """
@@ -81,8 +55,12 @@ class ValidatedUUID(_ProtoModel):
     model_config = _ConfigDict(populate_by_name=True)
 
     # Id must be a valid UUID.
-    id_: "_Annotated[str, _AfterValidator(_validate_uuid)]" = _Field(
+    id_: _Annotated[str, _AfterValidator(_validate_uuid)] = _Field(
         default="",
         description="Id must be a valid UUID.",
         alias="id",
     )
+
+    __proto_wire__ = ProtoWire(
+        (1, "id_", "string"),
+    )
@@ -0,0 +1,33 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+
+class ProtoInt64(int):
+    """A 64-bit integer, which ProtoJSON writes as a decimal string.
+
+    msgspec has no string form for integers: pass enc_hook and dec_hook to
+    encoders and decoders, e.g. msgspec.json.decode(data, type=Model,
+    dec_hook=dec_hook). Decoded fields hold ProtoInt64 values; construct
+    them as ProtoInt64 too, as plain ints are written as JSON numbers.
+    """
+
+
+def enc_hook(obj):
+    """Write ProtoInt64 values as decimal strings."""
+    if isinstance(obj, ProtoInt64):
+        return int.__repr__(obj)
+    raise NotImplementedError(f"Objects of type {type(obj).__name__} are not supported")
+
+
+def dec_hook(type_, obj):
+    """Read ProtoInt64 values from decimal strings or JSON numbers."""
+    if type_ is not ProtoInt64:
+        raise NotImplementedError(f"Objects of type {type_.__name__} are not supported")
+    if isinstance(obj, str):
+        digits = obj[1:] if obj[:1] == "-" else obj
+        if digits.isdigit() and digits.isascii():
+            return ProtoInt64(obj)
+    elif isinstance(obj, int) and not isinstance(obj, bool):
+        return ProtoInt64(obj)
+    elif isinstance(obj, float) and obj.is_integer():
+        return ProtoInt64(obj)
+    raise ValueError(f"Invalid 64-bit integer: {obj!r}")
@@ -0,0 +1,176 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+import msgspec as _msgspec
+
+from ._proto_types import ProtoInt64
+
+from .enums_msgspec import Enum
+
+from .scalars_msgspec import Scalars
+
+from .messages_msgspec import Message
+
+
+class Collections(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+
+    Attributes:
+      int32_repeated (list[int]):
+      int64_repeated (list[ProtoInt64]):
+      uint32_repeated (list[int]):
+      uint64_repeated (list[ProtoInt64]):
+      fixed32_repeated (list[int]):
+      fixed64_repeated (list[ProtoInt64]):
+      sint32_repeated (list[int]):
+      sint64_repeated (list[ProtoInt64]):
+      sfixed32_repeated (list[int]):
+      sfixed64_repeated (list[ProtoInt64]):
+      bool_repeated (list[bool]):
+      float_repeated (list[float]):
+      double_repeated (list[float]):
+      string_repeated (list[str]):
+      bytes_repeated (list[bytes]):
+      enum_repeated (list[Enum]):
+      nested_enum_repeated (list[Scalars.NestedEnum]):
+      message_repeated (list[Message]):
+      nested_message_repeated (list[Scalars.NestedMessage]):
+      int32_map_key (dict[int, str]):
+      int64_map_key (dict[ProtoInt64, str]):
+      uint32_map_key (dict[int, str]):
+      uint64_map_key (dict[ProtoInt64, str]):
+      fixed32_map_key (dict[int, str]):
+      fixed64_map_key (dict[ProtoInt64, str]):
+      sint32_map_key (dict[int, str]):
+      sint64_map_key (dict[ProtoInt64, str]):
+      sfixed32_map_key (dict[int, str]):
+      sfixed64_map_key (dict[ProtoInt64, str]):
+      bool_map_key (dict[bool, str]):
+      string_map_key (dict[str, str]):
+      int32_map_value (dict[str, int]):
+      int64_map_value (dict[str, ProtoInt64]):
+      uint32_map_value (dict[str, int]):
+      uint64_map_value (dict[str, ProtoInt64]):
+      fixed32_map_value (dict[str, int]):
+      fixed64_map_value (dict[str, ProtoInt64]):
+      sint32_map_value (dict[str, int]):
+      sint64_map_value (dict[str, ProtoInt64]):
+      sfixed32_map_value (dict[str, int]):
+      sfixed64_map_value (dict[str, ProtoInt64]):
+      bool_map_value (dict[str, bool]):
+      float_map_value (dict[str, float]):
+      double_map_value (dict[str, float]):
+      string_map_value (dict[str, str]):
+      bytes_map_value (dict[str, bytes]):
+      enum_map_value (dict[str, Enum]):
+      nested_enum_map_value (dict[str, Scalars.NestedEnum]):
+      message_map_value (dict[str, Message]):
+      nested_message_map_value (dict[str, Scalars.NestedMessage]):
+    """
+
+    int32_repeated: list[int] = _msgspec.field(default_factory=list)
+
+    int64_repeated: list[ProtoInt64] = _msgspec.field(default_factory=list)
+
+    uint32_repeated: list[int] = _msgspec.field(default_factory=list)
+
+    uint64_repeated: list[ProtoInt64] = _msgspec.field(default_factory=list)
+
+    fixed32_repeated: list[int] = _msgspec.field(default_factory=list)
+
+    fixed64_repeated: list[ProtoInt64] = _msgspec.field(default_factory=list)
+
+    sint32_repeated: list[int] = _msgspec.field(default_factory=list)
+
+    sint64_repeated: list[ProtoInt64] = _msgspec.field(default_factory=list)
+
+    sfixed32_repeated: list[int] = _msgspec.field(default_factory=list)
+
+    sfixed64_repeated: list[ProtoInt64] = _msgspec.field(default_factory=list)
+
+    bool_repeated: list[bool] = _msgspec.field(default_factory=list)
+
+    float_repeated: list[float] = _msgspec.field(default_factory=list)
+
+    double_repeated: list[float] = _msgspec.field(default_factory=list)
+
+    string_repeated: list[str] = _msgspec.field(default_factory=list)
+
+    bytes_repeated: list[bytes] = _msgspec.field(default_factory=list)
+
+    enum_repeated: list[Enum] = _msgspec.field(default_factory=list)
+
+    nested_enum_repeated: list[Scalars.NestedEnum] = _msgspec.field(
+        default_factory=list
+    )
+
+    message_repeated: list[Message] = _msgspec.field(default_factory=list)
+
+    nested_message_repeated: list[Scalars.NestedMessage] = _msgspec.field(
+        default_factory=list
+    )
+
+    int32_map_key: dict[int, str] = _msgspec.field(default_factory=dict)
+
+    int64_map_key: dict[ProtoInt64, str] = _msgspec.field(default_factory=dict)
+
+    uint32_map_key: dict[int, str] = _msgspec.field(default_factory=dict)
+
+    uint64_map_key: dict[ProtoInt64, str] = _msgspec.field(default_factory=dict)
+
+    fixed32_map_key: dict[int, str] = _msgspec.field(default_factory=dict)
+
+    fixed64_map_key: dict[ProtoInt64, str] = _msgspec.field(default_factory=dict)
+
+    sint32_map_key: dict[int, str] = _msgspec.field(default_factory=dict)
+
+    sint64_map_key: dict[ProtoInt64, str] = _msgspec.field(default_factory=dict)
+
+    sfixed32_map_key: dict[int, str] = _msgspec.field(default_factory=dict)
+
+    sfixed64_map_key: dict[ProtoInt64, str] = _msgspec.field(default_factory=dict)
+
+    bool_map_key: dict[bool, str] = _msgspec.field(default_factory=dict)
+
+    string_map_key: dict[str, str] = _msgspec.field(default_factory=dict)
+
+    int32_map_value: dict[str, int] = _msgspec.field(default_factory=dict)
+
+    int64_map_value: dict[str, ProtoInt64] = _msgspec.field(default_factory=dict)
+
+    uint32_map_value: dict[str, int] = _msgspec.field(default_factory=dict)
+
+    uint64_map_value: dict[str, ProtoInt64] = _msgspec.field(default_factory=dict)
+
+    fixed32_map_value: dict[str, int] = _msgspec.field(default_factory=dict)
+
+    fixed64_map_value: dict[str, ProtoInt64] = _msgspec.field(default_factory=dict)
+
+    sint32_map_value: dict[str, int] = _msgspec.field(default_factory=dict)
+
+    sint64_map_value: dict[str, ProtoInt64] = _msgspec.field(default_factory=dict)
+
+    sfixed32_map_value: dict[str, int] = _msgspec.field(default_factory=dict)
+
+    sfixed64_map_value: dict[str, ProtoInt64] = _msgspec.field(default_factory=dict)
+
+    bool_map_value: dict[str, bool] = _msgspec.field(default_factory=dict)
+
+    float_map_value: dict[str, float] = _msgspec.field(default_factory=dict)
+
+    double_map_value: dict[str, float] = _msgspec.field(default_factory=dict)
+
+    string_map_value: dict[str, str] = _msgspec.field(default_factory=dict)
+
+    bytes_map_value: dict[str, bytes] = _msgspec.field(default_factory=dict)
+
+    enum_map_value: dict[str, Enum] = _msgspec.field(default_factory=dict)
+
+    nested_enum_map_value: dict[str, Scalars.NestedEnum] = _msgspec.field(
+        default_factory=dict
+    )
+
+    message_map_value: dict[str, Message] = _msgspec.field(default_factory=dict)
+
+    nested_message_map_value: dict[str, Scalars.NestedMessage] = _msgspec.field(
+        default_factory=dict
+    )
@@ -0,0 +1,152 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+from enum import Enum as _Enum
+
+import msgspec as _msgspec
+
+
+class CommentedMessage(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    Leading comment on CommentedMessage.
+    CommentedMessage exercises all comment positions.
+
+    Attributes:
+      first_name (str):
+        Leading comment on first_name.
+        The given name of the person.
+      last_name (str):
+        Leading comment on last_name.
+        The family name of the person.
+    """
+
+    class NestedEnum(str, _Enum):
+        """
+        Leading comment on NestedEnum.
+        An enum nested inside CommentedMessage.
+        """
+
+        # Trailing comment on NestedEnum.
+        # Documents the enum values.
+
+        # Leading comment on UNSPECIFIED value.
+        UNSPECIFIED = "UNSPECIFIED"  # 0
+        # Right comment on UNSPECIFIED.
+
+        # Leading comment on ACTIVE value.
+        ACTIVE = "ACTIVE"  # 1
+        # Right comment on ACTIVE.
+
+        # Leading comment on INACTIVE value.
+        INACTIVE = "INACTIVE"  # 2
+        # Right comment on INACTIVE.
+
+        __proto_numbers__ = {
+            "UNSPECIFIED": 0,
+            "ACTIVE": 1,
+            "INACTIVE": 2,
+        }
+
+    class NestedMessage(_msgspec.Struct, omit_defaults=True, kw_only=True):
+        """
+        Leading comment on NestedMessage.
+        A message nested inside CommentedMessage.
+
+        Attributes:
+          first_name (str):
+            Leading comment on nested first_name.
+            The given name in the nested message.
+          last_name (str):
+            Leading comment on nested last_name.
+            The family name in the nested message.
+        """
+
+        # Trailing comment on NestedMessage.
+        # Documents internal structure.
+
+        # Leading comment on nested first_name.
+        # The given name in the nested message.
+        first_name: str = ""
+        # Right comment on nested first_name.
+
+        # Leading comment on nested last_name.
+        # The family name in the nested message.
+        last_name: str = ""
+        # Right comment on nested last_name.
+
+    # Trailing comment on CommentedMessage.
+    # Documents internal structure.
+
+    # Leading comment on first_name.
+    # The given name of the person.
+    first_name: str = ""
+    # Right comment on first_name.
+
+    # Leading comment on last_name.
+    # The family name of the person.
+    last_name: str = ""
+    # Right comment on last_name.
+
+
+class Outer(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    Outer message comment.
+
+    Attributes:
+      outer_field (str):
+        Outer field comment.
+    """
+
+    class OuterEnum(str, _Enum):
+        """
+        Outer enum comment.
+        """
+
+        UNSPECIFIED = "UNSPECIFIED"  # 0
+
+        X = "X"  # 1
+
+        __proto_numbers__ = {
+            "UNSPECIFIED": 0,
+            "X": 1,
+        }
+
+    class Inner(_msgspec.Struct, omit_defaults=True, kw_only=True):
+        """
+        Inner message comment.
+
+        Attributes:
+          inner_field (str):
+            Inner field comment.
+        """
+
+        class InnerEnum(str, _Enum):
+            """
+            Inner enum comment.
+            """
+
+            UNSPECIFIED = "UNSPECIFIED"  # 0
+
+            A = "A"  # 1
+
+            __proto_numbers__ = {
+                "UNSPECIFIED": 0,
+                "A": 1,
+            }
+
+        class Deepest(_msgspec.Struct, omit_defaults=True, kw_only=True):
+            """
+            Deepest message comment.
+
+            Attributes:
+              deepest_field (str):
+                Deepest field comment.
+            """
+
+            # Deepest field comment.
+            deepest_field: str = ""
+
+        # Inner field comment.
+        inner_field: str = ""
+
+    # Outer field comment.
+    outer_field: str = ""
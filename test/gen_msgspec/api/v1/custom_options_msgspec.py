@@ -0,0 +1,95 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+from enum import Enum as _Enum
+from dataclasses import dataclass as _dataclass
+
+
+@_dataclass(frozen=True)
+class _EnumValueOptions:
+    number: int
+    deprecated: bool = False
+    debug_redact: bool = False
+    display_name: str | None = None
+    is_default: bool | None = None
+    priority: int | None = None
+
+
+class _ProtoEnum(str, _Enum):
+    _options_: _EnumValueOptions
+
+    def __new__(cls, value: str, options: _EnumValueOptions | None = None):
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        if options is not None:
+            obj._options_ = options
+        return obj
+
+    @property
+    def options(self) -> _EnumValueOptions:
+        return self._options_
+
+
+class Currency(_ProtoEnum):
+    """
+    Currency enum with custom options.
+    """
+
+    UNSPECIFIED = (
+        "UNSPECIFIED",
+        _EnumValueOptions(number=0),
+    )  # 0
+
+    USD = (
+        "USD",
+        _EnumValueOptions(
+            number=1,
+            display_name="US Dollar",
+            is_default=True,
+            priority=1,
+        ),
+    )  # 1
+
+    EUR = (
+        "EUR",
+        _EnumValueOptions(
+            number=2,
+            display_name="Euro",
+            priority=2,
+        ),
+    )  # 2
+
+    GBP = (
+        "GBP",
+        _EnumValueOptions(
+            number=3,
+            display_name="British Pound",
+        ),
+    )  # 3
+
+    __proto_numbers__ = {
+        "UNSPECIFIED": 0,
+        "USD": 1,
+        "EUR": 2,
+        "GBP": 3,
+    }
+
+
+class Color(str, _Enum):
+    """
+    Color enum without custom options (regression test).
+    """
+
+    UNSPECIFIED = "UNSPECIFIED"  # 0
+
+    RED = "RED"  # 1
+
+    GREEN = "GREEN"  # 2
+
+    BLUE = "BLUE"  # 3
+
+    __proto_numbers__ = {
+        "UNSPECIFIED": 0,
+        "RED": 1,
+        "GREEN": 2,
+        "BLUE": 3,
+    }
@@ -0,0 +1,62 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+from enum import Enum as _Enum
+from dataclasses import dataclass as _dataclass
+
+
+@_dataclass(frozen=True)
+class _EnumValueOptions:
+    number: int
+    deprecated: bool = False
+    debug_redact: bool = False
+    display_name: str | None = None
+    is_default: bool | None = None
+    priority: int | None = None
+
+
+class _ProtoEnum(str, _Enum):
+    _options_: _EnumValueOptions
+
+    def __new__(cls, value: str, options: _EnumValueOptions | None = None):
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        if options is not None:
+            obj._options_ = options
+        return obj
+
+    @property
+    def options(self) -> _EnumValueOptions:
+        return self._options_
+
+
+class Status(_ProtoEnum):
+    """
+    Status enum with value options.
+    """
+
+    UNSPECIFIED = (
+        "UNSPECIFIED",
+        _EnumValueOptions(number=0),
+    )  # 0
+
+    ACTIVE = (
+        "ACTIVE",
+        _EnumValueOptions(number=1),
+    )  # 1
+
+    INACTIVE = (
+        "INACTIVE",
+        _EnumValueOptions(number=2),
+    )  # 2
+
+    ARCHIVED = (
+        "ARCHIVED",
+        _EnumValueOptions(number=3, deprecated=True, debug_redact=True),
+    )  # 3
+
+    __proto_numbers__ = {
+        "UNSPECIFIED": 0,
+        "ACTIVE": 1,
+        "INACTIVE": 2,
+        "ARCHIVED": 3,
+    }
@@ -0,0 +1,19 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+from enum import Enum as _Enum
+
+
+class Enum(str, _Enum):
+    """ """
+
+    UNSPECIFIED = "UNSPECIFIED"  # 0
+
+    ACTIVE = "ACTIVE"  # 1
+
+    INACTIVE = "INACTIVE"  # 2
+
+    __proto_numbers__ = {
+        "UNSPECIFIED": 0,
+        "ACTIVE": 1,
+        "INACTIVE": 2,
+    }
@@ -0,0 +1,66 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+import datetime as _datetime
+from typing import Any as _Any
+
+import msgspec as _msgspec
+
+from ._proto_types import ProtoInt64
+
+
+class WellKnownTypes(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+
+    Attributes:
+      wkt_timestamp (_datetime.datetime | None):
+      wkt_duration (str | None):
+      wkt_struct (dict[str, _Any] | None):
+      wkt_value (_Any | None):
+      wkt_list_value (list[_Any] | None):
+      wkt_any (_Any | None):
+      wkt_field_mask (list[str] | None):
+      wkt_bool (bool | None):
+      wkt_int32 (int | None):
+      wkt_int64 (ProtoInt64 | None):
+      wkt_uint32 (int | None):
+      wkt_uint64 (ProtoInt64 | None):
+      wkt_float (float | None):
+      wkt_double (float | None):
+      wkt_string (str | None):
+      wkt_bytes (bytes | None):
+      wkt_empty (None):
+    """
+
+    wkt_timestamp: _datetime.datetime | None = None
+
+    wkt_duration: str | None = None
+
+    wkt_struct: dict[str, _Any] | None = None
+
+    wkt_value: _Any | None = None
+
+    wkt_list_value: list[_Any] | None = None
+
+    wkt_any: _Any | None = None
+
+    wkt_field_mask: list[str] | None = None
+
+    wkt_bool: bool | None = None
+
+    wkt_int32: int | None = None
+
+    wkt_int64: ProtoInt64 | None = None
+
+    wkt_uint32: int | None = None
+
+    wkt_uint64: ProtoInt64 | None = None
+
+    wkt_float: float | None = None
+
+    wkt_double: float | None = None
+
+    wkt_string: str | None = None
+
+    wkt_bytes: bytes | None = None
+
+    wkt_empty: None = None
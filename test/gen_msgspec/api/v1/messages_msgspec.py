@@ -0,0 +1,23 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+import msgspec as _msgspec
+
+
+class Message(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+
+    Attributes:
+      first_name (str):
+      last_name (str):
+    """
+
+    first_name: str = ""
+
+    last_name: str = ""
+
+
+class Empty(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+
+    Attributes:
+    """
@@ -0,0 +1,16 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+import msgspec as _msgspec
+
+
+class Oneofs(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+
+    Attributes:
+      a (int | None):
+      b (str | None):
+    """
+
+    a: int | None = None
+
+    b: str | None = None
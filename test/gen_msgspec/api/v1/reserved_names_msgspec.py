@@ -0,0 +1,32 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+import msgspec as _msgspec
+
+
+class ReservedFieldNames(
+    _msgspec.Struct,
+    omit_defaults=True,
+    kw_only=True,
+    rename={
+        "merge_from_": "merge_from",
+        "model_config_": "model_config",
+        "model_dump_": "model_dump",
+        "model_fields_": "model_fields",
+    },
+):
+    """
+
+    Attributes:
+      model_config_ (str):
+      model_fields_ (str):
+      model_dump_ (str):
+      merge_from_ (str):
+    """
+
+    model_config_: str = ""
+
+    model_fields_: str = ""
+
+    model_dump_: str = ""
+
+    merge_from_: str = ""
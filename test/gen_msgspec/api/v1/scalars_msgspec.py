@@ -0,0 +1,168 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+from enum import Enum as _Enum
+
+import msgspec as _msgspec
+
+from ._proto_types import ProtoInt64
+
+from .enums_msgspec import Enum
+
+from .messages_msgspec import Message
+
+
+class Scalars(
+    _msgspec.Struct,
+    omit_defaults=True,
+    kw_only=True,
+    rename={
+        "bool_": "bool",
+        "bytes_": "bytes",
+        "float_": "float",
+    },
+):
+    """
+
+    Attributes:
+      int32 (int):
+      int64 (ProtoInt64):
+      uint32 (int):
+      uint64 (ProtoInt64):
+      fixed32 (int):
+      fixed64 (ProtoInt64):
+      sint32 (int):
+      sint64 (ProtoInt64):
+      sfixed32 (int):
+      sfixed64 (ProtoInt64):
+      bool_ (bool):
+      float_ (float):
+      double (float):
+      string (str):
+      bytes_ (bytes):
+      enum (Enum | None):
+      nested_enum (Scalars.NestedEnum | None):
+      message (Message | None):
+      nested_message (Scalars.NestedMessage | None):
+      int32_optional (int | None):
+      int64_optional (ProtoInt64 | None):
+      uint32_optional (int | None):
+      uint64_optional (ProtoInt64 | None):
+      fixed32_optional (int | None):
+      fixed64_optional (ProtoInt64 | None):
+      sint32_optional (int | None):
+      sint64_optional (ProtoInt64 | None):
+      sfixed32_optional (int | None):
+      sfixed64_optional (ProtoInt64 | None):
+      bool_optional (bool | None):
+      float_optional (float | None):
+      double_optional (float | None):
+      string_optional (str | None):
+      bytes_optional (bytes | None):
+      enum_optional (Enum | None):
+      nested_enum_optional (Scalars.NestedEnum | None):
+      message_optional (Message | None):
+      nested_message_optional (Scalars.NestedMessage | None):
+    """
+
+    class NestedEnum(str, _Enum):
+        """ """
+
+        UNSPECIFIED = "UNSPECIFIED"  # 0
+
+        ACTIVE = "ACTIVE"  # 1
+
+        INACTIVE = "INACTIVE"  # 2
+
+        __proto_numbers__ = {
+            "UNSPECIFIED": 0,
+            "ACTIVE": 1,
+            "INACTIVE": 2,
+        }
+
+    class NestedMessage(_msgspec.Struct, omit_defaults=True, kw_only=True):
+        """
+
+        Attributes:
+          first_name (str):
+          last_name (str):
+        """
+
+        first_name: str = ""
+
+        last_name: str = ""
+
+    int32: int = 0
+
+    int64: ProtoInt64 = 0
+
+    uint32: int = 0
+
+    uint64: ProtoInt64 = 0
+
+    fixed32: int = 0
+
+    fixed64: ProtoInt64 = 0
+
+    sint32: int = 0
+
+    sint64: ProtoInt64 = 0
+
+    sfixed32: int = 0
+
+    sfixed64: ProtoInt64 = 0
+
+    bool_: bool = False
+
+    float_: float = 0.0
+
+    double: float = 0.0
+
+    string: str = ""
+
+    bytes_: bytes = b""
+
+    enum: Enum | None = None
+
+    nested_enum: NestedEnum | None = None
+
+    message: Message | None = None
+
+    nested_message: NestedMessage | None = None
+
+    int32_optional: int | None = None
+
+    int64_optional: ProtoInt64 | None = None
+
+    uint32_optional: int | None = None
+
+    uint64_optional: ProtoInt64 | None = None
+
+    fixed32_optional: int | None = None
+
+    fixed64_optional: ProtoInt64 | None = None
+
+    sint32_optional: int | None = None
+
+    sint64_optional: ProtoInt64 | None = None
+
+    sfixed32_optional: int | None = None
+
+    sfixed64_optional: ProtoInt64 | None = None
+
+    bool_optional: bool | None = None
+
+    float_optional: float | None = None
+
+    double_optional: float | None = None
+
+    string_optional: str | None = None
+
+    bytes_optional: bytes | None = None
+
+    enum_optional: Enum | None = None
+
+    nested_enum_optional: NestedEnum | None = None
+
+    message_optional: Message | None = None
+
+    nested_message_optional: NestedMessage | None = None
@@ -0,0 +1,31 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+import msgspec as _msgspec
+
+
+class TreeNode(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+
+    Attributes:
+      name (str):
+      children (list[TreeNode]):
+      parent (TreeNode | None):
+    """
+
+    name: str = ""
+
+    children: "list[TreeNode]" = _msgspec.field(default_factory=list)
+
+    parent: "TreeNode | None" = None
+
+
+class Forest(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    Declared before TreeNode; generated after it so that the annotation of
+    trees needs no forward reference.
+
+    Attributes:
+      trees (list[TreeNode]):
+    """
+
+    trees: list[TreeNode] = _msgspec.field(default_factory=list)
@@ -0,0 +1,570 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+import datetime as _datetime
+from enum import Enum as _Enum
+from typing import Annotated as _Annotated, Literal as _Literal
+
+import msgspec as _msgspec
+
+from ._proto_types import ProtoInt64
+
+
+class ValidatedScalars(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedScalars exercises numeric bound constraints.
+
+    Attributes:
+      age (_Annotated[int, _msgspec.Meta(gt=0, le=150)]):
+        Age must be between 0 and 150 exclusive of 0.
+      score (_Annotated[float, _msgspec.Meta(ge=0.0, le=100.0)]):
+        Score must be in [0.0, 100.0].
+      priority (ProtoInt64):
+        Priority must be positive.
+      ratio (_Annotated[float, _msgspec.Meta(ge=0.0, lt=1.0)]):
+        Ratio must be non-negative and less than 1.
+      rank (_Annotated[int, _msgspec.Meta(ge=1, le=10)]):
+        Rank must be in [1, 10].
+      count (ProtoInt64 | None):
+        Count must be non-zero (covers uint64 / fixed64 literal formatting).
+      offset (_Annotated[int, _msgspec.Meta(ge=0)] | None):
+        Offset must be non-negative (covers sint32 / sfixed32 literal formatting).
+    """
+
+    # Age must be between 0 and 150 exclusive of 0.
+    age: _Annotated[int, _msgspec.Meta(gt=0, le=150)] = 0
+
+    # Score must be in [0.0, 100.0].
+    score: _Annotated[float, _msgspec.Meta(ge=0.0, le=100.0)] = 0.0
+
+    # Priority must be positive.
+    # buf.validate: gt (not translated)
+    priority: ProtoInt64 = 0
+
+    # Ratio must be non-negative and less than 1.
+    ratio: _Annotated[float, _msgspec.Meta(ge=0.0, lt=1.0)] = 0.0
+
+    # Rank must be in [1, 10].
+    rank: _Annotated[int, _msgspec.Meta(ge=1, le=10)] = 0
+
+    # Count must be non-zero (covers uint64 / fixed64 literal formatting).
+    # buf.validate: gt (not translated)
+    count: ProtoInt64 | None = None
+
+    # Offset must be non-negative (covers sint32 / sfixed32 literal formatting).
+    offset: _Annotated[int, _msgspec.Meta(ge=0)] | None = None
+
+
+class ValidatedStrings(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedStrings exercises string length and pattern constraints.
+
+    Attributes:
+      name (_Annotated[str, _msgspec.Meta(min_length=1, max_length=100)]):
+        Name must be between 1 and 100 characters.
+      code (_Annotated[str, _msgspec.Meta(pattern='^[A-Z]+$')]):
+        Code must match uppercase letters only.
+      bio (_Annotated[str, _msgspec.Meta(max_length=500)]):
+        Bio has only a max length.
+      tag (_Annotated[str, _msgspec.Meta(min_length=2)]):
+        Tag has only a min length.
+    """
+
+    # Name must be between 1 and 100 characters.
+    name: _Annotated[str, _msgspec.Meta(min_length=1, max_length=100)] = ""
+
+    # Code must match uppercase letters only.
+    code: _Annotated[str, _msgspec.Meta(pattern="^[A-Z]+$")] = ""
+
+    # Bio has only a max length.
+    bio: _Annotated[str, _msgspec.Meta(max_length=500)] = ""
+
+    # Tag has only a min length.
+    tag: _Annotated[str, _msgspec.Meta(min_length=2)] = ""
+
+
+class ValidatedRepeated(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedRepeated exercises repeated field length constraints.
+
+    Attributes:
+      items (_Annotated[list[str], _msgspec.Meta(min_length=1, max_length=10)]):
+        Items must have between 1 and 10 elements.
+      tags (_Annotated[list[str], _msgspec.Meta(min_length=1)]):
+        Tags must have at least 1 element.
+    """
+
+    # Items must have between 1 and 10 elements.
+    items: _Annotated[list[str], _msgspec.Meta(min_length=1, max_length=10)] = (
+        _msgspec.field(default_factory=list)
+    )
+
+    # Tags must have at least 1 element.
+    tags: _Annotated[list[str], _msgspec.Meta(min_length=1)] = _msgspec.field(
+        default_factory=list
+    )
+
+
+class ValidatedMap(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedMap exercises map field length constraints.
+
+    Attributes:
+      labels (_Annotated[dict[str, str], _msgspec.Meta(min_length=1, max_length=10)]):
+        Labels must have between 1 and 10 entries.
+    """
+
+    # Labels must have between 1 and 10 entries.
+    labels: _Annotated[dict[str, str], _msgspec.Meta(min_length=1, max_length=10)] = (
+        _msgspec.field(default_factory=dict)
+    )
+
+
+class ValidatedReserved(
+    _msgspec.Struct,
+    omit_defaults=True,
+    kw_only=True,
+    rename={
+        "float_": "float",
+    },
+):
+    """
+    ValidatedReserved exercises a field whose name is a Python reserved word and
+    also carries a buf.validate constraint. The generated field must emit both
+    alias= and the constraint kwargs in a single _Field() call.
+
+    Attributes:
+      float_ (_Annotated[float, _msgspec.Meta(gt=0.0)]):
+        Score must be positive.
+    """
+
+    # Score must be positive.
+    float_: _Annotated[float, _msgspec.Meta(gt=0.0)] = 0.0
+
+
+class ValidatedOneof(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedOneof exercises a oneof field that also carries a constraint.
+
+    Attributes:
+      small (_Annotated[int, _msgspec.Meta(gt=0)] | None):
+        Must be positive when set.
+      large (ProtoInt64 | None):
+        Must be positive when set.
+    """
+
+    # Must be positive when set.
+    small: _Annotated[int, _msgspec.Meta(gt=0)] | None = None
+
+    # Must be positive when set.
+    # buf.validate: gt (not translated)
+    large: ProtoInt64 | None = None
+
+
+class ValidatedDuration(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedDuration exercises Duration bound constraints, which use
+    message-typed rule fields and cannot be translated to Pydantic Field() args.
+    The generator must not panic; instead it emits dropped-constraint comments.
+
+    Attributes:
+      timeout (str | None):
+        Timeout must be positive and at most one hour.
+    """
+
+    # Timeout must be positive and at most one hour.
+    # buf.validate: gt (not translated)
+    # buf.validate: lte (not translated)
+    timeout: str | None = None
+
+
+class ValidatedTimestamp(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedTimestamp exercises Timestamp bound constraints, which also use
+    message-typed rule fields and must not panic.
+
+    Attributes:
+      created_at (_datetime.datetime | None):
+        CreatedAt must be after the Unix epoch.
+    """
+
+    # CreatedAt must be after the Unix epoch.
+    # buf.validate: gt (not translated)
+    created_at: _datetime.datetime | None = None
+
+
+class ValidatedStringLen(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedStringLen exercises the string.len exact-length constraint.
+
+    Attributes:
+      code (_Annotated[str, _msgspec.Meta(min_length=5, max_length=5)]):
+        Code must be exactly 5 characters.
+    """
+
+    # Code must be exactly 5 characters.
+    code: _Annotated[str, _msgspec.Meta(min_length=5, max_length=5)] = ""
+
+
+class ValidatedStringAffix(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedStringAffix exercises string.prefix and string.suffix constraints.
+
+    Attributes:
+      url (_Annotated[str, _msgspec.Meta(pattern='^https://')]):
+        Url must start with "https://".
+      filename (_Annotated[str, _msgspec.Meta(pattern='\\.go$')]):
+        Filename must end with ".go".
+      path (_Annotated[str, _msgspec.Meta(pattern='^/home/.*\\.txt$')]):
+        Path must start with "/home/" and end with ".txt".
+      content (_Annotated[str, _msgspec.Meta(pattern='^[a-z]+$')]):
+        Content must match a pattern; prefix is also set (conflict → prefix dropped).
+    """
+
+    # Url must start with "https://".
+    url: _Annotated[str, _msgspec.Meta(pattern="^https://")] = ""
+
+    # Filename must end with ".go".
+    filename: _Annotated[str, _msgspec.Meta(pattern="\\.go$")] = ""
+
+    # Path must start with "/home/" and end with ".txt".
+    path: _Annotated[str, _msgspec.Meta(pattern="^/home/.*\\.txt$")] = ""
+
+    # Content must match a pattern; prefix is also set (conflict → prefix dropped).
+    # buf.validate: prefix (not translated)
+    content: _Annotated[str, _msgspec.Meta(pattern="^[a-z]+$")] = ""
+
+
+class ValidatedExamples(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedExamples exercises the field examples annotation.
+
+    Attributes:
+      count (_Annotated[int, _msgspec.Meta(gt=0)]):
+        Count with integer examples.
+      name (_Annotated[str, _msgspec.Meta(min_length=1)]):
+        Name with string examples.
+    """
+
+    # Count with integer examples.
+    count: _Annotated[int, _msgspec.Meta(gt=0)] = 0
+
+    # Name with string examples.
+    name: _Annotated[str, _msgspec.Meta(min_length=1)] = ""
+
+
+class ValidatedFormats(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedFormats exercises format and semantic validators: email, URI,
+    IP address (v4/v6), UUID, and float finite.
+
+    Attributes:
+      email (str):
+        Email must be a valid email address.
+      website (str):
+        Website must be a valid URI.
+      address (str):
+        Address must be a valid IP address.
+      ratio (float):
+        Ratio must be finite (not inf or NaN).
+      token (str):
+        Token must be a valid UUID.
+      host_v4 (str):
+        Host must be a valid IPv4 address.
+      host_v6 (str):
+        Host must be a valid IPv6 address.
+    """
+
+    # Email must be a valid email address.
+    # buf.validate: email (not translated)
+    email: str = ""
+
+    # Website must be a valid URI.
+    # buf.validate: uri (not translated)
+    website: str = ""
+
+    # Address must be a valid IP address.
+    # buf.validate: ip (not translated)
+    address: str = ""
+
+    # Ratio must be finite (not inf or NaN).
+    # buf.validate: finite (not translated)
+    ratio: float = 0.0
+
+    # Token must be a valid UUID.
+    # buf.validate: uuid (not translated)
+    token: str = ""
+
+    # Host must be a valid IPv4 address.
+    # buf.validate: ipv4 (not translated)
+    host_v4: str = ""
+
+    # Host must be a valid IPv6 address.
+    # buf.validate: ipv6 (not translated)
+    host_v6: str = ""
+
+
+class ValidatedDropped(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedDropped exercises constraints that are recognised but not translated.
+
+    Attributes:
+      name (str):
+        Name is required; the required constraint is not translated.
+      blob (bytes):
+        Blob has a bytes.const constraint which is not translated (bytes kind unsupported).
+      score (_Annotated[int, _msgspec.Meta(gt=0)]):
+        Score must be positive; required is also set but not translated.
+    """
+
+    # Name is required; the required constraint is not translated.
+    # buf.validate: required (not translated)
+    name: str = ""
+
+    # Blob has a bytes.const constraint which is not translated (bytes kind unsupported).
+    # buf.validate: const (not translated)
+    blob: bytes = b""
+
+    # Score must be positive; required is also set but not translated.
+    # buf.validate: required (not translated)
+    score: _Annotated[int, _msgspec.Meta(gt=0)] = 0
+
+
+class ValidatedConst(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedConst exercises the const constraint translated to Literal[...].
+
+    Attributes:
+      tag (_Literal['fixed']):
+      count (_Literal[42]):
+      active (_Literal[True]):
+      score (float):
+    """
+
+    tag: _Literal["fixed"] = "fixed"
+
+    count: _Literal[42] = 42
+
+    active: _Literal[True] = True
+
+    # buf.validate: const (not translated)
+    score: float = 0.0
+
+
+class ValidatedIn(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedIn exercises in constraints checked by pydantic-core and not_in
+    constraints translated to AfterValidator.
+
+    Attributes:
+      status (str):
+      code (str):
+      priority (int):
+    """
+
+    # buf.validate: in (not translated)
+    status: str = ""
+
+    # buf.validate: not_in (not translated)
+    code: str = ""
+
+    # buf.validate: in (not translated)
+    priority: int = 0
+
+
+class ValidatedUnique(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedUnique exercises repeated.unique translated to AfterValidator,
+    with the helper chosen by element kind.
+
+    Attributes:
+      tags (list[str]):
+      scores (list[int]):
+      ratios (list[float]):
+      digests (list[bytes]):
+      entries (list[ValidatedMap]):
+    """
+
+    # buf.validate: unique (not translated)
+    tags: list[str] = _msgspec.field(default_factory=list)
+
+    # buf.validate: unique (not translated)
+    scores: list[int] = _msgspec.field(default_factory=list)
+
+    # buf.validate: unique (not translated)
+    ratios: list[float] = _msgspec.field(default_factory=list)
+
+    # buf.validate: unique (not translated)
+    digests: list[bytes] = _msgspec.field(default_factory=list)
+
+    # buf.validate: unique (not translated)
+    entries: list[ValidatedMap] = _msgspec.field(default_factory=list)
+
+
+class ValidatedBytes(
+    _msgspec.Struct,
+    omit_defaults=True,
+    kw_only=True,
+    rename={
+        "hash_": "hash",
+    },
+):
+    """
+    ValidatedBytes exercises bytes length constraints.
+
+    Attributes:
+      token (_Annotated[bytes, _msgspec.Meta(min_length=16)]):
+        Token must be at least 16 bytes.
+      hash_ (_Annotated[bytes, _msgspec.Meta(min_length=32, max_length=32)]):
+        Hash must be exactly 32 bytes.
+      payload (_Annotated[bytes, _msgspec.Meta(max_length=1024)]):
+        Payload must be at most 1024 bytes.
+    """
+
+    # Token must be at least 16 bytes.
+    token: _Annotated[bytes, _msgspec.Meta(min_length=16)] = b""
+
+    # Hash must be exactly 32 bytes.
+    hash_: _Annotated[bytes, _msgspec.Meta(min_length=32, max_length=32)] = b""
+
+    # Payload must be at most 1024 bytes.
+    payload: _Annotated[bytes, _msgspec.Meta(max_length=1024)] = b""
+
+
+class ValidatedStringContains(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedStringContains exercises the string.contains constraint.
+
+    Attributes:
+      topic (_Annotated[str, _msgspec.Meta(pattern='protobuf')]):
+        Topic must contain "protobuf".
+      label (_Annotated[str, _msgspec.Meta(pattern='^env-')]):
+        Label must start with "env-" and contain "prod".
+        The contains conflicts with prefix so contains is dropped.
+    """
+
+    # Topic must contain "protobuf".
+    topic: _Annotated[str, _msgspec.Meta(pattern="protobuf")] = ""
+
+    # Label must start with "env-" and contain "prod".
+    # The contains conflicts with prefix so contains is dropped.
+    # buf.validate: contains (not translated)
+    label: _Annotated[str, _msgspec.Meta(pattern="^env-")] = ""
+
+
+class ValidatedRequired(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedRequired exercises required = true on proto3 optional scalar fields
+    (where it strips | None) vs. message-typed and plain scalar fields (dropped).
+
+    Attributes:
+      required_name (str):
+        required on proto3 optional scalar: | None stripped, field becomes required.
+      required_score (_Annotated[int, _msgspec.Meta(gt=0)]):
+        required on proto3 optional scalar with an additional constraint.
+      required_detail (ValidatedRequired.Detail | None):
+        required on message-typed optional: not translated, emits dropped comment.
+      plain_name (str):
+        required on plain proto3 scalar: not translated, emits dropped comment.
+    """
+
+    class Detail(_msgspec.Struct, omit_defaults=True, kw_only=True):
+        """
+        Detail is a nested message used to test message-typed required handling.
+
+        Attributes:
+          value (str):
+        """
+
+        value: str = ""
+
+    # required on proto3 optional scalar: | None stripped, field becomes required.
+    required_name: str
+
+    # required on proto3 optional scalar with an additional constraint.
+    required_score: _Annotated[int, _msgspec.Meta(gt=0)]
+
+    # required on message-typed optional: not translated, emits dropped comment.
+    # buf.validate: required (not translated)
+    required_detail: Detail | None = None
+
+    # required on plain proto3 scalar: not translated, emits dropped comment.
+    # buf.validate: required (not translated)
+    plain_name: str = ""
+
+
+class ValidatedCel(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedCel exercises CEL rules compiled into Python validators.
+
+    Attributes:
+      quantity (int):
+        Quantity must be positive.
+      tags (list[str]):
+        Every tag is at most 8 characters.
+      code (str):
+        Code is three capitals; the rule returns its own error message.
+      note (str | None):
+      window (ValidatedCel.Window | None):
+      level (ValidatedCel.Level | None):
+      limits (dict[str, int]):
+      legacy (int):
+        Not in the compiled subset: stays a comment.
+    """
+
+    class Level(str, _Enum):
+        """
+        Level is a nested enum used to test enum comparisons.
+        """
+
+        UNSPECIFIED = "UNSPECIFIED"  # 0
+
+        LOW = "LOW"  # 1
+
+        HIGH = "HIGH"  # 2
+
+        __proto_numbers__ = {
+            "UNSPECIFIED": 0,
+            "LOW": 1,
+            "HIGH": 2,
+        }
+
+    class Window(_msgspec.Struct, omit_defaults=True, kw_only=True):
+        """
+        Window is a nested message used to test selection through unset fields.
+
+        Attributes:
+          start (int):
+          end (int):
+        """
+
+        start: int = 0
+
+        end: int = 0
+
+    # Quantity must be positive.
+    # buf.validate: cel (not translated)
+    quantity: int = 0
+
+    # Every tag is at most 8 characters.
+    # buf.validate: cel (not translated)
+    tags: list[str] = _msgspec.field(default_factory=list)
+
+    # Code is three capitals; the rule returns its own error message.
+    # buf.validate: cel (not translated)
+    code: str = ""
+
+    note: str | None = None
+
+    window: Window | None = None
+
+    # buf.validate: cel (not translated)
+    level: Level | None = None
+
+    # buf.validate: cel (not translated)
+    limits: dict[str, int] = _msgspec.field(default_factory=dict)
+
+    # Not in the compiled subset: stays a comment.
+    # buf.validate: cel (not translated)
+    legacy: int = 0
+
+    # buf.validate: cel (not translated)
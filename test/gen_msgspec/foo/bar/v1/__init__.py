@@ -0,0 +1 @@
+# Generated by protoc-gen-pydantic.
@@ -0,0 +1,72 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+from enum import Enum as _Enum
+from dataclasses import dataclass as _dataclass
+
+
+@_dataclass(frozen=True)
+class _EnumValueOptions:
+    number: int
+    deprecated: bool = False
+    debug_redact: bool = False
+    display_name: str | None = None
+    is_default: bool | None = None
+    priority: int | None = None
+
+
+class _ProtoEnum(str, _Enum):
+    _options_: _EnumValueOptions
+
+    def __new__(cls, value: str, options: _EnumValueOptions | None = None):
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        if options is not None:
+            obj._options_ = options
+        return obj
+
+    @property
+    def options(self) -> _EnumValueOptions:
+        return self._options_
+
+
+class Language(_ProtoEnum):
+    """
+    Language enum using custom options defined in another package.
+    """
+
+    UNSPECIFIED = (
+        "UNSPECIFIED",
+        _EnumValueOptions(number=0),
+    )  # 0
+
+    PYTHON = (
+        "PYTHON",
+        _EnumValueOptions(
+            number=1,
+            display_name="Python",
+        ),
+    )  # 1
+
+    GOLANG = (
+        "GOLANG",
+        _EnumValueOptions(
+            number=2,
+            display_name="Golang",
+        ),
+    )  # 2
+
+    RUST = (
+        "RUST",
+        _EnumValueOptions(
+            number=3,
+            display_name="Rust",
+            priority=1,
+        ),
+    )  # 3
+
+    __proto_numbers__ = {
+        "UNSPECIFIED": 0,
+        "PYTHON": 1,
+        "GOLANG": 2,
+        "RUST": 3,
+    }
@@ -0,0 +1,30 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+import msgspec as _msgspec
+
+from api.v1.messages_msgspec import Message
+
+from api.v1.scalars_msgspec import Scalars
+
+
+class CrossRefMessage(
+    _msgspec.Struct,
+    omit_defaults=True,
+    kw_only=True,
+    rename={
+        "id_": "id",
+    },
+):
+    """
+
+    Attributes:
+      id_ (str):
+      referenced_message (Message | None):
+      scalars_list (list[Scalars]):
+    """
+
+    id_: str = ""
+
+    referenced_message: Message | None = None
+
+    scalars_list: list[Scalars] = _msgspec.field(default_factory=list)
@@ -0,0 +1,38 @@
+# DO NOT EDIT. Generated by protoc-gen-pydantic.
+
+import msgspec as _msgspec
+
+
+class ValidatedEmail(_msgspec.Struct, omit_defaults=True, kw_only=True):
+    """
+    ValidatedEmail exercises the string.email format constraint.
+
+    Attributes:
+      address (str):
+        Address must be a valid email address.
+    """
+
+    # Address must be a valid email address.
+    # buf.validate: email (not translated)
+    address: str = ""
+
+
+class ValidatedUUID(
+    _msgspec.Struct,
+    omit_defaults=True,
+    kw_only=True,
+    rename={
+        "id_": "id",
+    },
+):
+    """
+    ValidatedUUID exercises the string.uuid format constraint.
+
+    Attributes:
+      id_ (str):
+        Id must be a valid UUID.
+    """
+
+    # Id must be a valid UUID.
+    # buf.validate: uuid (not translated)
+    id_: str = ""
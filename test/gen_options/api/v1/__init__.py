@@ -1 +1,288 @@
 # Generated by protoc-gen-pydantic.
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from .collections_pydantic import Collections, CollectionsDict
+    from .comments_pydantic import (
+        CommentedMessage,
+        CommentedMessageDict,
+        CommentedMessageNestedMessageDict,
+        Outer,
+        OuterDict,
+        OuterInnerDeepestDict,
+        OuterInnerDict,
+    )
+    from .custom_options_pydantic import Color, Currency
+    from .enum_options_pydantic import Status
+    from .enums_pydantic import Enum
+    from .known_types_pydantic import WellKnownTypes, WellKnownTypesDict
+    from .messages_pydantic import Empty, EmptyDict, Message, MessageDict
+    from .oneofs_pydantic import Oneofs, OneofsDict
+    from .reserved_names_pydantic import ReservedFieldNames, ReservedFieldNamesDict
+    from .scalars_pydantic import Scalars, ScalarsDict, ScalarsNestedMessageDict
+    from .self_reference_pydantic import Forest, ForestDict, TreeNode, TreeNodeDict
+    from .validate_pydantic import (
+        ValidatedBytes,
+        ValidatedBytesDict,
+        ValidatedCel,
+        ValidatedCelDict,
+        ValidatedCelWindowDict,
+        ValidatedConst,
+        ValidatedConstDict,
+        ValidatedDropped,
+        ValidatedDroppedDict,
+        ValidatedDuration,
+        ValidatedDurationDict,
+        ValidatedExamples,
+        ValidatedExamplesDict,
+        ValidatedFormats,
+        ValidatedFormatsDict,
+        ValidatedIn,
+        ValidatedInDict,
+        ValidatedMap,
+        ValidatedMapDict,
+        ValidatedOneof,
+        ValidatedOneofDict,
+        ValidatedRepeated,
+        ValidatedRepeatedDict,
+        ValidatedRequired,
+        ValidatedRequiredDetailDict,
+        ValidatedRequiredDict,
+        ValidatedReserved,
+        ValidatedReservedDict,
+        ValidatedScalars,
+        ValidatedScalarsDict,
+        ValidatedStringAffix,
+        ValidatedStringAffixDict,
+        ValidatedStringContains,
+        ValidatedStringContainsDict,
+        ValidatedStringLen,
+        ValidatedStringLenDict,
+        ValidatedStrings,
+        ValidatedStringsDict,
+        ValidatedTimestamp,
+        ValidatedTimestampDict,
+        ValidatedUnique,
+        ValidatedUniqueDict,
+    )
+
+_EXPORTS = {
+    "Collections": ".collections_pydantic",
+    "CollectionsDict": ".collections_pydantic",
+    "Color": ".custom_options_pydantic",
+    "CommentedMessage": ".comments_pydantic",
+    "CommentedMessageDict": ".comments_pydantic",
+    "CommentedMessageNestedMessageDict": ".comments_pydantic",
+    "Currency": ".custom_options_pydantic",
+    "Empty": ".messages_pydantic",
+    "EmptyDict": ".messages_pydantic",
+    "Enum": ".enums_pydantic",
+    "Forest": ".self_reference_pydantic",
+    "ForestDict": ".self_reference_pydantic",
+    "Message": ".messages_pydantic",
+    "MessageDict": ".messages_pydantic",
+    "Oneofs": ".oneofs_pydantic",
+    "OneofsDict": ".oneofs_pydantic",
+    "Outer": ".comments_pydantic",
+    "OuterDict": ".comments_pydantic",
+    "OuterInnerDeepestDict": ".comments_pydantic",
+    "OuterInnerDict": ".comments_pydantic",
+    "ReservedFieldNames": ".reserved_names_pydantic",
+    "ReservedFieldNamesDict": ".reserved_names_pydantic",
+    "Scalars": ".scalars_pydantic",
+    "ScalarsDict": ".scalars_pydantic",
+    "ScalarsNestedMessageDict": ".scalars_pydantic",
+    "Status": ".enum_options_pydantic",
+    "TreeNode": ".self_reference_pydantic",
+    "TreeNodeDict": ".self_reference_pydantic",
+    "ValidatedBytes": ".validate_pydantic",
+    "ValidatedBytesDict": ".validate_pydantic",
+    "ValidatedCel": ".validate_pydantic",
+    "ValidatedCelDict": ".validate_pydantic",
+    "ValidatedCelWindowDict": ".validate_pydantic",
+    "ValidatedConst": ".validate_pydantic",
+    "ValidatedConstDict": ".validate_pydantic",
+    "ValidatedDropped": ".validate_pydantic",
+    "ValidatedDroppedDict": ".validate_pydantic",
+    "ValidatedDuration": ".validate_pydantic",
+    "ValidatedDurationDict": ".validate_pydantic",
+    "ValidatedExamples": ".validate_pydantic",
+    "ValidatedExamplesDict": ".validate_pydantic",
+    "ValidatedFormats": ".validate_pydantic",
+    "ValidatedFormatsDict": ".validate_pydantic",
+    "ValidatedIn": ".validate_pydantic",
+    "ValidatedInDict": ".validate_pydantic",
+    "ValidatedMap": ".validate_pydantic",
+    "ValidatedMapDict": ".validate_pydantic",
+    "ValidatedOneof": ".validate_pydantic",
+    "ValidatedOneofDict": ".validate_pydantic",
+    "ValidatedRepeated": ".validate_pydantic",
+    "ValidatedRepeatedDict": ".validate_pydantic",
+    "ValidatedRequired": ".validate_pydantic",
+    "ValidatedRequiredDetailDict": ".validate_pydantic",
+    "ValidatedRequiredDict": ".validate_pydantic",
+    "ValidatedReserved": ".validate_pydantic",
+    "ValidatedReservedDict": ".validate_pydantic",
+    "ValidatedScalars": ".validate_pydantic",
+    "ValidatedScalarsDict": ".validate_pydantic",
+    "ValidatedStringAffix": ".validate_pydantic",
+    "ValidatedStringAffixDict": ".validate_pydantic",
+    "ValidatedStringContains": ".validate_pydantic",
+    "ValidatedStringContainsDict": ".validate_pydantic",
+    "ValidatedStringLen": ".validate_pydantic",
+    "ValidatedStringLenDict": ".validate_pydantic",
+    "ValidatedStrings": ".validate_pydantic",
+    "ValidatedStringsDict": ".validate_pydantic",
+    "ValidatedTimestamp": ".validate_pydantic",
+    "ValidatedTimestampDict": ".validate_pydantic",
+    "ValidatedUnique": ".validate_pydantic",
+    "ValidatedUniqueDict": ".validate_pydantic",
+    "WellKnownTypes": ".known_types_pydantic",
+    "WellKnownTypesDict": ".known_types_pydantic",
+}
+
+__all__ = [
+    "Collections",
+    "CollectionsDict",
+    "Color",
+    "CommentedMessage",
+    "CommentedMessageDict",
+    "CommentedMessageNestedMessageDict",
+    "Currency",
+    "Empty",
+    "EmptyDict",
+    "Enum",
+    "Forest",
+    "ForestDict",
+    "Message",
+    "MessageDict",
+    "Oneofs",
+    "OneofsDict",
+    "Outer",
+    "OuterDict",
+    "OuterInnerDeepestDict",
+    "OuterInnerDict",
+    "ReservedFieldNames",
+    "ReservedFieldNamesDict",
+    "Scalars",
+    "ScalarsDict",
+    "ScalarsNestedMessageDict",
+    "Status",
+    "TreeNode",
+    "TreeNodeDict",
+    "ValidatedBytes",
+    "ValidatedBytesDict",
+    "ValidatedCel",
+    "ValidatedCelDict",
+    "ValidatedCelWindowDict",
+    "ValidatedConst",
+    "ValidatedConstDict",
+    "ValidatedDropped",
+    "ValidatedDroppedDict",
+    "ValidatedDuration",
+    "ValidatedDurationDict",
+    "ValidatedExamples",
+    "ValidatedExamplesDict",
+    "ValidatedFormats",
+    "ValidatedFormatsDict",
+    "ValidatedIn",
+    "ValidatedInDict",
+    "ValidatedMap",
+    "ValidatedMapDict",
+    "ValidatedOneof",
+    "ValidatedOneofDict",
+    "ValidatedRepeated",
+    "ValidatedRepeatedDict",
+    "ValidatedRequired",
+    "ValidatedRequiredDetailDict",
+    "ValidatedRequiredDict",
+    "ValidatedReserved",
+    "ValidatedReservedDict",
+    "ValidatedScalars",
+    "ValidatedScalarsDict",
+    "ValidatedStringAffix",
+    "ValidatedStringAffixDict",
+    "ValidatedStringContains",
+    "ValidatedStringContainsDict",
+    "ValidatedStringLen",
+    "ValidatedStringLenDict",
+    "ValidatedStrings",
+    "ValidatedStringsDict",
+    "ValidatedTimestamp",
+    "ValidatedTimestampDict",
+    "ValidatedUnique",
+    "ValidatedUniqueDict",
+    "WellKnownTypes",
+    "WellKnownTypesDict",
+]
+
+_MODELS = [
+    (".messages_pydantic", "Message"),
+    (".messages_pydantic", "Empty"),
+    (".scalars_pydantic", "Scalars.NestedMessage"),
+    (".scalars_pydantic", "Scalars"),
+    (".collections_pydantic", "Collections"),
+    (".comments_pydantic", "CommentedMessage"),
+    (".comments_pydantic", "CommentedMessage.NestedMessage"),
+    (".comments_pydantic", "Outer"),
+    (".comments_pydantic", "Outer.Inner"),
+    (".comments_pydantic", "Outer.Inner.Deepest"),
+    (".known_types_pydantic", "WellKnownTypes"),
+    (".oneofs_pydantic", "Oneofs.UnionA"),
+    (".oneofs_pydantic", "Oneofs.UnionB"),
+    (".oneofs_pydantic", "Oneofs"),
+    (".reserved_names_pydantic", "ReservedFieldNames"),
+    (".self_reference_pydantic", "TreeNode"),
+    (".self_reference_pydantic", "Forest"),
+    (".validate_pydantic", "ValidatedScalars"),
+    (".validate_pydantic", "ValidatedStrings"),
+    (".validate_pydantic", "ValidatedRepeated"),
+    (".validate_pydantic", "ValidatedMap"),
+    (".validate_pydantic", "ValidatedReserved"),
+    (".validate_pydantic", "ValidatedOneof.ValueSmall"),
+    (".validate_pydantic", "ValidatedOneof.ValueLarge"),
+    (".validate_pydantic", "ValidatedOneof"),
+    (".validate_pydantic", "ValidatedDuration"),
+    (".validate_pydantic", "ValidatedTimestamp"),
+    (".validate_pydantic", "ValidatedStringLen"),
+    (".validate_pydantic", "ValidatedStringAffix"),
+    (".validate_pydantic", "ValidatedExamples"),
+    (".validate_pydantic", "ValidatedFormats"),
+    (".validate_pydantic", "ValidatedDropped"),
+    (".validate_pydantic", "ValidatedConst"),
+    (".validate_pydantic", "ValidatedIn"),
+    (".validate_pydantic", "ValidatedUnique"),
+    (".validate_pydantic", "ValidatedBytes"),
+    (".validate_pydantic", "ValidatedStringContains"),
+    (".validate_pydantic", "ValidatedRequired.Detail"),
+    (".validate_pydantic", "ValidatedRequired"),
+    (".validate_pydantic", "ValidatedCel.Window"),
+    (".validate_pydantic", "ValidatedCel"),
+]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
+
+
+def warm_up() -> None:
+    """Build the schema of every model in this package ahead of first use.
+
+    Models are rebuilt in dependency order, so each one reuses the already
+    built schemas of the messages it refers to.
+    """
+    for module, qualname in _MODELS:
+        model = _importlib.import_module(module, __name__)
+        for part in qualname.split("."):
+            model = getattr(model, part)
+        model.model_rebuild()
@@ -1,52 +1,153 @@
 # DO NOT EDIT. Generated by protoc-gen-pydantic.
 import datetime as _datetime
+import functools as _functools
 import ipaddress as _ipaddress
 import math as _math
-import re as _re
 import uuid as _uuid_lib
 from typing import Annotated as _Annotated
 
 from pydantic import AnyUrl as _AnyUrl
+from pydantic import BaseModel as _BaseModel
 from pydantic import BeforeValidator as _BeforeValidator
 from pydantic import PlainSerializer as _PlainSerializer
 from pydantic import TypeAdapter as _TypeAdapter
+from pydantic.networks import validate_email as _pydantic_validate_email
+from pydantic_core import core_schema as _core_schema
 
 _url_adapter = _TypeAdapter(_AnyUrl)
 
 
-def _coerce_int(v):
-    return int(v)
-
-
-ProtoInt64 = _Annotated[
-    int,
-    _BeforeValidator(_coerce_int),
-    _PlainSerializer(lambda v: str(v), return_type=str, when_used="json"),
-]
-
-ProtoUInt64 = _Annotated[
-    int,
-    _BeforeValidator(_coerce_int),
-    _PlainSerializer(lambda v: str(v), return_type=str, when_used="json"),
-]
+class _JsonStringInt:
+    """Integer that is a decimal string in JSON, as ProtoJSON encodes 64-bit ints.
+
+    Both directions run inside pydantic-core: lax int validation parses
+    numeric strings, and the to-string serializer formats the value.
+    """
+
+    def __get_pydantic_core_schema__(self, source, handler):
+        schema = handler(source)
+        schema["serialization"] = _core_schema.to_string_ser_schema(when_used="json")
+        return schema
+
+
+ProtoInt64 = _Annotated[int, _JsonStringInt()]
+
+ProtoUInt64 = _Annotated[int, _JsonStringInt()]
+
+
+_UTC = _datetime.timezone.utc
+
+_EPOCH = _datetime.datetime(1970, 1, 1, tzinfo=_UTC)
+
+# google.protobuf.Duration spans +-10000 years.
+_MAX_DURATION_SECONDS = 315_576_000_000
+
+
+def _split_timestamp(s):
+    """Split an RFC 3339 timestamp into integer fields without losing nanoseconds.
+
+    Returns (year, month, day, hour, minute, second, nanos, offset_seconds).
+    """
+    n = len(s)
+    zone_start = n - 1 if s[-1:] in ("Z", "z") else n - 6
+    if (
+        zone_start < 19
+        or s[4] != "-"
+        or s[7] != "-"
+        or s[10] not in ("T", "t", " ")
+        or s[13] != ":"
+        or s[16] != ":"
+    ):
+        raise ValueError(f"Invalid timestamp: {s!r}")
+    fields = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+    if not (fields.isdigit() and fields.isascii()):
+        raise ValueError(f"Invalid timestamp: {s!r}")
+    frac = s[20:zone_start]
+    if zone_start > 19 and (
+        s[19] != "."
+        or not 0 < len(frac) <= 9
+        or not (frac.isdigit() and frac.isascii())
+    ):
+        raise ValueError(f"Invalid timestamp: {s!r}")
+    offset = 0
+    if zone_start == n - 6:
+        hhmm = s[n - 5 : n - 3] + s[n - 2 :]
+        if (
+            s[zone_start] not in ("+", "-")
+            or s[n - 3] != ":"
+            or not (hhmm.isdigit() and hhmm.isascii())
+        ):
+            raise ValueError(f"Invalid timestamp: {s!r}")
+        offset = (int(hhmm[:2]) * 60 + int(hhmm[2:])) * 60
+        if s[zone_start] == "-":
+            offset = -offset
+    return (
+        int(s[0:4]),
+        int(s[5:7]),
+        int(s[8:10]),
+        int(s[11:13]),
+        int(s[14:16]),
+        int(s[17:19]),
+        int(frac) * 10 ** (9 - len(frac)) if frac else 0,
+        offset,
+    )
+
+
+# Canonical UTC timestamps with at most microsecond precision are handed to
+# the C parser, which accepts the Z suffix from Python 3.11. Indexed by
+# length, the separators v[4:20:3] picks from them: date, time, and fraction
+# or Z. Other lengths map to None.
+_CANONICAL_TIMESTAMP_SEPARATORS = tuple(
+    "--T::Z" if n == 20 else "--T::." if 21 < n else None for n in range(28)
+)
+_fromisoformat = _datetime.datetime.fromisoformat
 
 
 def _parse_timestamp(v):
+    # The fast path runs first: LookupError and TypeError mean v is too long
+    # or not a string, ValueError that the C parser rejects it.
+    try:
+        if v[4:20:3] == _CANONICAL_TIMESTAMP_SEPARATORS[len(v)] and v[-1] == "Z":
+            return _fromisoformat(v)
+    except (LookupError, TypeError, ValueError):
+        pass
     if isinstance(v, str):
-        return _datetime.datetime.fromisoformat(v.replace("Z", "+00:00"))
+        year, month, day, hour, minute, second, nanos, offset = _split_timestamp(v)
+        tz = (
+            _UTC
+            if not offset
+            else _datetime.timezone(_datetime.timedelta(seconds=offset))
+        )
+        return _datetime.datetime(
+            year, month, day, hour, minute, second, nanos // 1000, tz
+        )
     if isinstance(v, _datetime.datetime):
         return v
     raise ValueError(f"Cannot parse timestamp from {type(v)}")
 
 
+def _format_timestamp(v, nanos):
+    s = f"{v.year:04d}-{v.month:02d}-{v.day:02d}T{v.hour:02d}:{v.minute:02d}:{v.second:02d}"
+    if nanos:
+        s += f".{nanos:09d}".rstrip("0")
+    return s + "Z"
+
+
 def _serialize_timestamp(v):
+    if v.tzinfo is not None and v.utcoffset():
+        v = v.astimezone(_UTC)
+    return _format_timestamp(v, v.microsecond * 1000)
+
+
+def _timestamp_to_seconds_nanos(v):
     if v.tzinfo is None:
-        v = v.replace(tzinfo=_datetime.timezone.utc)
-    s = v.strftime("%Y-%m-%dT%H:%M:%S")
-    us = v.microsecond
-    if us:
-        s += f".{us:06d}".rstrip("0")
-    return s + "Z"
+        v = v.replace(tzinfo=_UTC)
+    delta = v - _EPOCH
+    return delta.days * 86400 + delta.seconds, delta.microseconds * 1000
+
+
+def _timestamp_from_seconds_nanos(seconds, nanos):
+    return _EPOCH + _datetime.timedelta(seconds=seconds, microseconds=nanos // 1000)
 
 
 ProtoTimestamp = _Annotated[
@@ -56,22 +157,61 @@ ProtoTimestamp = _Annotated[
 ]
 
 
+def _split_duration(s):
+    """Split a ProtoJSON duration such as "-1.5s" into exact (seconds, nanos).
+
+    Both parts carry the sign of the duration.
+    """
+    whole, dot, frac = s[:-1].partition(".")
+    negative = whole[:1] == "-"
+    if negative:
+        whole = whole[1:]
+    if (
+        s[-1:] != "s"
+        or not (whole.isdigit() and whole.isascii())
+        or (dot and not (0 < len(frac) <= 9 and frac.isdigit() and frac.isascii()))
+    ):
+        raise ValueError(f"Invalid duration: {s!r}")
+    seconds = int(whole)
+    if seconds > _MAX_DURATION_SECONDS:
+        raise ValueError(f"Duration out of range: {s!r}")
+    nanos = int(frac) * 10 ** (9 - len(frac)) if frac else 0
+    if negative:
+        return -seconds, -nanos
+    return seconds, nanos
+
+
+def _duration_to_seconds_nanos(v):
+    micros = (v.days * 86400 + v.seconds) * 1_000_000 + v.microseconds
+    seconds, micros = divmod(abs(micros), 1_000_000)
+    sign = -1 if v < _datetime.timedelta(0) else 1
+    return sign * seconds, sign * micros * 1000
+
+
+def _duration_from_seconds_nanos(seconds, nanos):
+    # timedelta holds microseconds: truncate toward zero like the seconds part.
+    return _datetime.timedelta(0, seconds, int(nanos / 1000))
+
+
 def _parse_duration(v):
     if isinstance(v, str):
-        m = _re.match(r"^(-?\d+(?:\.\d+)?)s$", v)
-        if not m:
-            raise ValueError(f"Invalid duration: {v}")
-        return _datetime.timedelta(seconds=float(m.group(1)))
+        return _duration_from_seconds_nanos(*_split_duration(v))
     if isinstance(v, _datetime.timedelta):
         return v
     raise ValueError(f"Cannot parse duration from {type(v)}")
 
 
+def _format_duration(negative, seconds, nanos):
+    sign = "-" if negative else ""
+    if nanos:
+        return f"{sign}{seconds}.{nanos:09d}".rstrip("0") + "s"
+    return f"{sign}{seconds}s"
+
+
 def _serialize_duration(v):
-    total = v.total_seconds()
-    if total == int(total):
-        return f"{int(total)}s"
-    return f"{total}s"
+    micros = (v.days * 86400 + v.seconds) * 1_000_000 + v.microseconds
+    seconds, rest = divmod(abs(micros), 1_000_000)
+    return _format_duration(micros < 0, seconds, rest * 1000)
 
 
 ProtoDuration = _Annotated[
@@ -81,19 +221,53 @@ ProtoDuration = _Annotated[
 ]
 
 
-def _require_unique(v):
-    if len(v) != len(set(v)):
-        raise ValueError("list items must be unique")
+def _check_unique(v, keys):
+    seen = {}
+    for i, key in enumerate(keys):
+        first = seen.setdefault(key, i)
+        if first != i:
+            raise ValueError(
+                f"list items must be unique, item {i} repeats item {first}"
+            )
     return v
 
 
-def _make_in_validator(valid_values):
-    def _validate(v):
-        if v not in valid_values:
-            raise ValueError(f"value must be one of {sorted(valid_values)}")
+def _require_unique(v):
+    if len(set(v)) == len(v):
         return v
+    return _check_unique(v, v)
 
-    return _validate
+
+def _require_unique_floats(v):
+    if len(set(v)) == len(v):
+        return v
+    # NaN never equals itself, so NaNs are never duplicates; the set above
+    # can still merge one NaN object listed twice, hence the second pass.
+    return _check_unique(v, [x if x == x else object() for x in v])
+
+
+class _InValues:
+    """Annotated marker that restricts a field to a fixed set of values.
+
+    The field's own schema runs first, so lax inputs such as the ProtoJSON
+    string form of an integer still parse; a literal schema then checks
+    membership inside pydantic-core, without a Python call per value.
+    """
+
+    def __init__(self, *values):
+        self.values = values
+
+    def __get_pydantic_core_schema__(self, source, handler):
+        schema = handler(source)
+        return _core_schema.chain_schema(
+            [schema, _core_schema.literal_schema(list(self.values))],
+            serialization=schema.get("serialization"),
+        )
+
+    def __get_pydantic_json_schema__(self, schema, handler):
+        json_schema = handler(schema)
+        json_schema["enum"] = list(self.values)
+        return json_schema
 
 
 def _make_not_in_validator(excluded_values):
@@ -108,8 +282,6 @@ def _make_not_in_validator(excluded_values):
 def _validate_email(v: str) -> str:
     if not v:
         return v
-    from pydantic.networks import validate_email as _pydantic_validate_email
-
     _pydantic_validate_email(v)
     return v
 
@@ -149,16 +321,112 @@ def _validate_uuid(v: str) -> str:
     return v
 
 
+# format_validator_cache_size: values that passed a format check are
+# remembered, failures are checked again on every call.
+_validate_email = _functools.lru_cache(maxsize=1024)(_validate_email)
+_validate_uri = _functools.lru_cache(maxsize=1024)(_validate_uri)
+_validate_ip = _functools.lru_cache(maxsize=1024)(_validate_ip)
+_validate_ipv4 = _functools.lru_cache(maxsize=1024)(_validate_ipv4)
+_validate_ipv6 = _functools.lru_cache(maxsize=1024)(_validate_ipv6)
+_validate_uuid = _functools.lru_cache(maxsize=1024)(_validate_uuid)
+
+
+def format_validator_cache_info() -> dict:
+    """Return the hits, misses and size of each format validator cache."""
+    return {
+        "email": _validate_email.cache_info(),
+        "uri": _validate_uri.cache_info(),
+        "ip": _validate_ip.cache_info(),
+        "ipv4": _validate_ipv4.cache_info(),
+        "ipv6": _validate_ipv6.cache_info(),
+        "uuid": _validate_uuid.cache_info(),
+    }
+
+
+def format_validator_cache_clear() -> None:
+    """Empty the format validator caches and reset their counters."""
+    _validate_email.cache_clear()
+    _validate_uri.cache_clear()
+    _validate_ip.cache_clear()
+    _validate_ipv4.cache_clear()
+    _validate_ipv6.cache_clear()
+    _validate_uuid.cache_clear()
+
+
 def _require_finite(v: float) -> float:
     if not _math.isfinite(v):
         raise ValueError("value must be finite")
     return v
 
 
-def _make_const_validator(c):
-    def _validate(v):
-        if v != c:
-            raise ValueError(f"value must equal {c!r}")
-        return v
+def _unique_key(v):
+    if isinstance(v, _BaseModel):
+        return (type(v), tuple(map(_unique_key, v.__dict__.values())))
+    if isinstance(v, dict):
+        return frozenset((k, _unique_key(x)) for k, x in v.items())
+    if isinstance(v, list):
+        return tuple(map(_unique_key, v))
+    if v != v:
+        return object()
+    return v
 
-    return _validate
+
+def _require_unique_messages(v):
+    return _check_unique(v, map(_unique_key, v))
+
+
+_NANOS_PER_SECOND = 1_000_000_000
+
+
+def _parse_timestamp_nanos(v):
+    if isinstance(v, str):
+        year, month, day, hour, minute, second, nanos, offset = _split_timestamp(v)
+        seconds, _ = _timestamp_to_seconds_nanos(
+            _datetime.datetime(year, month, day, hour, minute, second, tzinfo=_UTC)
+        )
+        return (seconds - offset) * _NANOS_PER_SECOND + nanos
+    if isinstance(v, _datetime.datetime):
+        seconds, nanos = _timestamp_to_seconds_nanos(v)
+        return seconds * _NANOS_PER_SECOND + nanos
+    return v
+
+
+def _serialize_timestamp_nanos(v):
+    seconds, nanos = divmod(v, _NANOS_PER_SECOND)
+    return _format_timestamp(_timestamp_from_seconds_nanos(seconds, 0), nanos)
+
+
+ProtoTimestampNanos = _Annotated[
+    int,
+    _BeforeValidator(_parse_timestamp_nanos),
+    _PlainSerializer(_serialize_timestamp_nanos, return_type=str, when_used="json"),
+]
+
+
+def _duration_nanos_to_seconds_nanos(v):
+    seconds, nanos = divmod(abs(v), _NANOS_PER_SECOND)
+    if v < 0:
+        return -seconds, -nanos
+    return seconds, nanos
+
+
+def _parse_duration_nanos(v):
+    if isinstance(v, str):
+        seconds, nanos = _split_duration(v)
+        return seconds * _NANOS_PER_SECOND + nanos
+    if isinstance(v, _datetime.timedelta):
+        seconds, nanos = _duration_to_seconds_nanos(v)
+        return seconds * _NANOS_PER_SECOND + nanos
+    return v
+
+
+def _serialize_duration_nanos(v):
+    seconds, nanos = divmod(abs(v), _NANOS_PER_SECOND)
+    return _format_duration(v < 0, seconds, nanos)
+
+
+ProtoDurationNanos = _Annotated[
+    int,
+    _BeforeValidator(_parse_duration_nanos),
+    _PlainSerializer(_serialize_duration_nanos, return_type=str, when_used="json"),
+]
@@ -1,7 +1,10 @@
 # DO NOT EDIT. Generated by protoc-gen-pydantic.
 
 
-from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
+from pydantic import Field as _Field, with_config as _with_config
+from typing_extensions import NotRequired as _NotRequired, TypedDict as _TypedDict
+
+from _proto_runtime import ProtoWire, _ProtoModel
 
 from ._proto_types import ProtoInt64, ProtoUInt64
 
@@ -11,46 +14,9 @@ from .scalars_pydantic import Scalars
 
 from .messages_pydantic import Message
 
+from .messages_pydantic import MessageDict
 
-class _ProtoModel(_BaseModel):
-    """Base class for generated Pydantic models with ProtoJSON helpers."""
-
-    model_config = _ConfigDict(
-        use_enum_values=True,
-        ser_json_bytes="base64",
-        val_json_bytes="base64",
-        ser_json_inf_nan="strings",
-    )
-
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
+from .scalars_pydantic import ScalarsNestedMessageDict
 
 
 class Collections(_ProtoModel):
@@ -109,202 +75,314 @@ class Collections(_ProtoModel):
       nestedMessageMapValue (dict[str, Scalars.NestedMessage]):
     """
 
-    int32Repeated: "list[int]" = _Field(
+    int32Repeated: list[int] = _Field(
         default_factory=list,
     )
 
-    int64Repeated: "list[ProtoInt64]" = _Field(
+    int64Repeated: list[ProtoInt64] = _Field(
         default_factory=list,
     )
 
-    uint32Repeated: "list[int]" = _Field(
+    uint32Repeated: list[int] = _Field(
         default_factory=list,
     )
 
-    uint64Repeated: "list[ProtoUInt64]" = _Field(
+    uint64Repeated: list[ProtoUInt64] = _Field(
         default_factory=list,
     )
 
-    fixed32Repeated: "list[int]" = _Field(
+    fixed32Repeated: list[int] = _Field(
         default_factory=list,
     )
 
-    fixed64Repeated: "list[ProtoUInt64]" = _Field(
+    fixed64Repeated: list[ProtoUInt64] = _Field(
         default_factory=list,
     )
 
-    sint32Repeated: "list[int]" = _Field(
+    sint32Repeated: list[int] = _Field(
         default_factory=list,
     )
 
-    sint64Repeated: "list[ProtoInt64]" = _Field(
+    sint64Repeated: list[ProtoInt64] = _Field(
         default_factory=list,
     )
 
-    sfixed32Repeated: "list[int]" = _Field(
+    sfixed32Repeated: list[int] = _Field(
         default_factory=list,
     )
 
-    sfixed64Repeated: "list[ProtoInt64]" = _Field(
+    sfixed64Repeated: list[ProtoInt64] = _Field(
         default_factory=list,
     )
 
-    boolRepeated: "list[bool]" = _Field(
+    boolRepeated: list[bool] = _Field(
         default_factory=list,
     )
 
-    floatRepeated: "list[float]" = _Field(
+    floatRepeated: list[float] = _Field(
         default_factory=list,
     )
 
-    doubleRepeated: "list[float]" = _Field(
+    doubleRepeated: list[float] = _Field(
         default_factory=list,
     )
 
-    stringRepeated: "list[str]" = _Field(
+    stringRepeated: list[str] = _Field(
         default_factory=list,
     )
 
-    bytesRepeated: "list[bytes]" = _Field(
+    bytesRepeated: list[bytes] = _Field(
         default_factory=list,
     )
 
-    enumRepeated: "list[Enum]" = _Field(
+    enumRepeated: list[Enum] = _Field(
         default_factory=list,
     )
 
-    nestedEnumRepeated: "list[Scalars.NestedEnum]" = _Field(
+    nestedEnumRepeated: list[Scalars.NestedEnum] = _Field(
         default_factory=list,
     )
 
-    messageRepeated: "list[Message]" = _Field(
+    messageRepeated: list[Message] = _Field(
         default_factory=list,
     )
 
-    nestedMessageRepeated: "list[Scalars.NestedMessage]" = _Field(
+    nestedMessageRepeated: list[Scalars.NestedMessage] = _Field(
         default_factory=list,
     )
 
-    int32MapKey: "dict[int, str]" = _Field(
+    int32MapKey: dict[int, str] = _Field(
         default_factory=dict,
     )
 
-    int64MapKey: "dict[ProtoInt64, str]" = _Field(
+    int64MapKey: dict[ProtoInt64, str] = _Field(
         default_factory=dict,
     )
 
-    uint32MapKey: "dict[int, str]" = _Field(
+    uint32MapKey: dict[int, str] = _Field(
         default_factory=dict,
     )
 
-    uint64MapKey: "dict[ProtoUInt64, str]" = _Field(
+    uint64MapKey: dict[ProtoUInt64, str] = _Field(
         default_factory=dict,
     )
 
-    fixed32MapKey: "dict[int, str]" = _Field(
+    fixed32MapKey: dict[int, str] = _Field(
         default_factory=dict,
     )
 
-    fixed64MapKey: "dict[ProtoUInt64, str]" = _Field(
+    fixed64MapKey: dict[ProtoUInt64, str] = _Field(
         default_factory=dict,
     )
 
-    sint32MapKey: "dict[int, str]" = _Field(
+    sint32MapKey: dict[int, str] = _Field(
         default_factory=dict,
     )
 
-    sint64MapKey: "dict[ProtoInt64, str]" = _Field(
+    sint64MapKey: dict[ProtoInt64, str] = _Field(
         default_factory=dict,
     )
 
-    sfixed32MapKey: "dict[int, str]" = _Field(
+    sfixed32MapKey: dict[int, str] = _Field(
         default_factory=dict,
     )
 
-    sfixed64MapKey: "dict[ProtoInt64, str]" = _Field(
+    sfixed64MapKey: dict[ProtoInt64, str] = _Field(
         default_factory=dict,
     )
 
-    boolMapKey: "dict[bool, str]" = _Field(
+    boolMapKey: dict[bool, str] = _Field(
         default_factory=dict,
     )
 
-    stringMapKey: "dict[str, str]" = _Field(
+    stringMapKey: dict[str, str] = _Field(
         default_factory=dict,
     )
 
-    int32MapValue: "dict[str, int]" = _Field(
+    int32MapValue: dict[str, int] = _Field(
         default_factory=dict,
     )
 
-    int64MapValue: "dict[str, ProtoInt64]" = _Field(
+    int64MapValue: dict[str, ProtoInt64] = _Field(
         default_factory=dict,
     )
 
-    uint32MapValue: "dict[str, int]" = _Field(
+    uint32MapValue: dict[str, int] = _Field(
         default_factory=dict,
     )
 
-    uint64MapValue: "dict[str, ProtoUInt64]" = _Field(
+    uint64MapValue: dict[str, ProtoUInt64] = _Field(
         default_factory=dict,
     )
 
-    fixed32MapValue: "dict[str, int]" = _Field(
+    fixed32MapValue: dict[str, int] = _Field(
         default_factory=dict,
     )
 
-    fixed64MapValue: "dict[str, ProtoUInt64]" = _Field(
+    fixed64MapValue: dict[str, ProtoUInt64] = _Field(
         default_factory=dict,
     )
 
-    sint32MapValue: "dict[str, int]" = _Field(
+    sint32MapValue: dict[str, int] = _Field(
         default_factory=dict,
     )
 
-    sint64MapValue: "dict[str, ProtoInt64]" = _Field(
+    sint64MapValue: dict[str, ProtoInt64] = _Field(
         default_factory=dict,
     )
 
-    sfixed32MapValue: "dict[str, int]" = _Field(
+    sfixed32MapValue: dict[str, int] = _Field(
         default_factory=dict,
     )
 
-    sfixed64MapValue: "dict[str, ProtoInt64]" = _Field(
+    sfixed64MapValue: dict[str, ProtoInt64] = _Field(
         default_factory=dict,
     )
 
-    boolMapValue: "dict[str, bool]" = _Field(
+    boolMapValue: dict[str, bool] = _Field(
         default_factory=dict,
     )
 
-    floatMapValue: "dict[str, float]" = _Field(
+    floatMapValue: dict[str, float] = _Field(
         default_factory=dict,
     )
 
-    doubleMapValue: "dict[str, float]" = _Field(
+    doubleMapValue: dict[str, float] = _Field(
         default_factory=dict,
     )
 
-    stringMapValue: "dict[str, str]" = _Field(
+    stringMapValue: dict[str, str] = _Field(
         default_factory=dict,
     )
 
-    bytesMapValue: "dict[str, bytes]" = _Field(
+    bytesMapValue: dict[str, bytes] = _Field(
         default_factory=dict,
     )
 
-    enumMapValue: "dict[str, Enum]" = _Field(
+    enumMapValue: dict[str, Enum] = _Field(
         default_factory=dict,
     )
 
-    nestedEnumMapValue: "dict[str, Scalars.NestedEnum]" = _Field(
+    nestedEnumMapValue: dict[str, Scalars.NestedEnum] = _Field(
         default_factory=dict,
     )
 
-    messageMapValue: "dict[str, Message]" = _Field(
+    messageMapValue: dict[str, Message] = _Field(
         default_factory=dict,
     )
 
-    nestedMessageMapValue: "dict[str, Scalars.NestedMessage]" = _Field(
+    nestedMessageMapValue: dict[str, Scalars.NestedMessage] = _Field(
         default_factory=dict,
     )
+
+    __proto_wire__ = ProtoWire(
+        (1, "int32Repeated", "packed int32"),
+        (2, "int64Repeated", "packed int64"),
+        (3, "uint32Repeated", "packed uint32"),
+        (4, "uint64Repeated", "packed uint64"),
+        (5, "fixed32Repeated", "packed fixed32"),
+        (6, "fixed64Repeated", "packed fixed64"),
+        (7, "sint32Repeated", "packed sint32"),
+        (8, "sint64Repeated", "packed sint64"),
+        (9, "sfixed32Repeated", "packed sfixed32"),
+        (10, "sfixed64Repeated", "packed sfixed64"),
+        (11, "boolRepeated", "packed bool"),
+        (12, "floatRepeated", "packed float"),
+        (13, "doubleRepeated", "packed double"),
+        (14, "stringRepeated", "repeated string"),
+        (15, "bytesRepeated", "repeated bytes"),
+        (16, "enumRepeated", "packed enum", "Enum"),
+        (17, "nestedEnumRepeated", "packed enum", "Scalars.NestedEnum"),
+        (18, "messageRepeated", "repeated message", "Message"),
+        (19, "nestedMessageRepeated", "repeated message", "Scalars.NestedMessage"),
+        (21, "int32MapKey", "map<int32, string>"),
+        (22, "int64MapKey", "map<int64, string>"),
+        (23, "uint32MapKey", "map<uint32, string>"),
+        (24, "uint64MapKey", "map<uint64, string>"),
+        (25, "fixed32MapKey", "map<fixed32, string>"),
+        (26, "fixed64MapKey", "map<fixed64, string>"),
+        (27, "sint32MapKey", "map<sint32, string>"),
+        (28, "sint64MapKey", "map<sint64, string>"),
+        (29, "sfixed32MapKey", "map<sfixed32, string>"),
+        (30, "sfixed64MapKey", "map<sfixed64, string>"),
+        (31, "boolMapKey", "map<bool, string>"),
+        (32, "stringMapKey", "map<string, string>"),
+        (33, "int32MapValue", "map<string, int32>"),
+        (34, "int64MapValue", "map<string, int64>"),
+        (35, "uint32MapValue", "map<string, uint32>"),
+        (36, "uint64MapValue", "map<string, uint64>"),
+        (37, "fixed32MapValue", "map<string, fixed32>"),
+        (38, "fixed64MapValue", "map<string, fixed64>"),
+        (39, "sint32MapValue", "map<string, sint32>"),
+        (40, "sint64MapValue", "map<string, sint64>"),
+        (41, "sfixed32MapValue", "map<string, sfixed32>"),
+        (42, "sfixed64MapValue", "map<string, sfixed64>"),
+        (43, "boolMapValue", "map<string, bool>"),
+        (44, "floatMapValue", "map<string, float>"),
+        (45, "doubleMapValue", "map<string, double>"),
+        (46, "stringMapValue", "map<string, string>"),
+        (47, "bytesMapValue", "map<string, bytes>"),
+        (48, "enumMapValue", "map<string, enum>", "Enum"),
+        (49, "nestedEnumMapValue", "map<string, enum>", "Scalars.NestedEnum"),
+        (50, "messageMapValue", "map<string, message>", "Message"),
+        (51, "nestedMessageMapValue", "map<string, message>", "Scalars.NestedMessage"),
+    )
+
+
+CollectionsDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "CollectionsDict",
+        {
+            "int32Repeated": _NotRequired[list[int]],
+            "int64Repeated": _NotRequired[list[ProtoInt64]],
+            "uint32Repeated": _NotRequired[list[int]],
+            "uint64Repeated": _NotRequired[list[ProtoUInt64]],
+            "fixed32Repeated": _NotRequired[list[int]],
+            "fixed64Repeated": _NotRequired[list[ProtoUInt64]],
+            "sint32Repeated": _NotRequired[list[int]],
+            "sint64Repeated": _NotRequired[list[ProtoInt64]],
+            "sfixed32Repeated": _NotRequired[list[int]],
+            "sfixed64Repeated": _NotRequired[list[ProtoInt64]],
+            "boolRepeated": _NotRequired[list[bool]],
+            "floatRepeated": _NotRequired[list[float]],
+            "doubleRepeated": _NotRequired[list[float]],
+            "stringRepeated": _NotRequired[list[str]],
+            "bytesRepeated": _NotRequired[list[bytes]],
+            "enumRepeated": _NotRequired[list[Enum]],
+            "nestedEnumRepeated": _NotRequired[list[Scalars.NestedEnum]],
+            "messageRepeated": _NotRequired[list[MessageDict]],
+            "nestedMessageRepeated": _NotRequired[list[ScalarsNestedMessageDict]],
+            "int32MapKey": _NotRequired[dict[int, str]],
+            "int64MapKey": _NotRequired[dict[ProtoInt64, str]],
+            "uint32MapKey": _NotRequired[dict[int, str]],
+            "uint64MapKey": _NotRequired[dict[ProtoUInt64, str]],
+            "fixed32MapKey": _NotRequired[dict[int, str]],
+            "fixed64MapKey": _NotRequired[dict[ProtoUInt64, str]],
+            "sint32MapKey": _NotRequired[dict[int, str]],
+            "sint64MapKey": _NotRequired[dict[ProtoInt64, str]],
+            "sfixed32MapKey": _NotRequired[dict[int, str]],
+            "sfixed64MapKey": _NotRequired[dict[ProtoInt64, str]],
+            "boolMapKey": _NotRequired[dict[bool, str]],
+            "stringMapKey": _NotRequired[dict[str, str]],
+            "int32MapValue": _NotRequired[dict[str, int]],
+            "int64MapValue": _NotRequired[dict[str, ProtoInt64]],
+            "uint32MapValue": _NotRequired[dict[str, int]],
+            "uint64MapValue": _NotRequired[dict[str, ProtoUInt64]],
+            "fixed32MapValue": _NotRequired[dict[str, int]],
+            "fixed64MapValue": _NotRequired[dict[str, ProtoUInt64]],
+            "sint32MapValue": _NotRequired[dict[str, int]],
+            "sint64MapValue": _NotRequired[dict[str, ProtoInt64]],
+            "sfixed32MapValue": _NotRequired[dict[str, int]],
+            "sfixed64MapValue": _NotRequired[dict[str, ProtoInt64]],
+            "boolMapValue": _NotRequired[dict[str, bool]],
+            "floatMapValue": _NotRequired[dict[str, float]],
+            "doubleMapValue": _NotRequired[dict[str, float]],
+            "stringMapValue": _NotRequired[dict[str, str]],
+            "bytesMapValue": _NotRequired[dict[str, bytes]],
+            "enumMapValue": _NotRequired[dict[str, Enum]],
+            "nestedEnumMapValue": _NotRequired[dict[str, Scalars.NestedEnum]],
+            "messageMapValue": _NotRequired[dict[str, Message]],
+            "nestedMessageMapValue": _NotRequired[dict[str, Scalars.NestedMessage]],
+        },
+    )
+)
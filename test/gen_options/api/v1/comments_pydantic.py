@@ -2,48 +2,10 @@
 
 from enum import Enum as _Enum
 
-from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
+from pydantic import Field as _Field, with_config as _with_config
+from typing_extensions import NotRequired as _NotRequired, TypedDict as _TypedDict
 
-
-class _ProtoModel(_BaseModel):
-    """Base class for generated Pydantic models with ProtoJSON helpers."""
-
-    model_config = _ConfigDict(
-        use_enum_values=True,
-        ser_json_bytes="base64",
-        val_json_bytes="base64",
-        ser_json_inf_nan="strings",
-    )
-
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
+from _proto_runtime import ProtoWire, _ProtoModel
 
 
 class CommentedMessage(_ProtoModel):
@@ -100,27 +62,37 @@ class CommentedMessage(_ProtoModel):
 
         # Leading comment on nested first_name.
         # The given name in the nested message.
-        firstName: "str" = _Field(default="")
+        firstName: str = _Field(default="")
         # Right comment on nested first_name.
 
         # Leading comment on nested last_name.
         # The family name in the nested message.
-        lastName: "str" = _Field(default="")
+        lastName: str = _Field(default="")
         # Right comment on nested last_name.
 
+        __proto_wire__ = ProtoWire(
+            (1, "firstName", "string"),
+            (2, "lastName", "string"),
+        )
+
     # Trailing comment on CommentedMessage.
     # Documents internal structure.
 
     # Leading comment on first_name.
     # The given name of the person.
-    firstName: "str" = _Field(default="")
+    firstName: str = _Field(default="")
     # Right comment on first_name.
 
     # Leading comment on last_name.
     # The family name of the person.
-    lastName: "str" = _Field(default="")
+    lastName: str = _Field(default="")
     # Right comment on last_name.
 
+    __proto_wire__ = ProtoWire(
+        (1, "firstName", "string"),
+        (2, "lastName", "string"),
+    )
+
 
 class Outer(_ProtoModel):
     """
@@ -168,10 +140,70 @@ class Outer(_ProtoModel):
             """
 
             # Deepest field comment.
-            deepestField: "str" = _Field(default="")
+            deepestField: str = _Field(default="")
+
+            __proto_wire__ = ProtoWire(
+                (1, "deepestField", "string"),
+            )
 
         # Inner field comment.
-        innerField: "str" = _Field(default="")
+        innerField: str = _Field(default="")
+
+        __proto_wire__ = ProtoWire(
+            (1, "innerField", "string"),
+        )
 
     # Outer field comment.
-    outerField: "str" = _Field(default="")
+    outerField: str = _Field(default="")
+
+    __proto_wire__ = ProtoWire(
+        (1, "outerField", "string"),
+    )
+
+
+CommentedMessageNestedMessageDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "CommentedMessageNestedMessageDict",
+        {
+            "firstName": _NotRequired[str],
+            "lastName": _NotRequired[str],
+        },
+    )
+)
+
+CommentedMessageDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "CommentedMessageDict",
+        {
+            "firstName": _NotRequired[str],
+            "lastName": _NotRequired[str],
+        },
+    )
+)
+
+OuterInnerDeepestDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "OuterInnerDeepestDict",
+        {
+            "deepestField": _NotRequired[str],
+        },
+    )
+)
+
+OuterInnerDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "OuterInnerDict",
+        {
+            "innerField": _NotRequired[str],
+        },
+    )
+)
+
+OuterDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "OuterDict",
+        {
+            "outerField": _NotRequired[str],
+        },
+    )
+)
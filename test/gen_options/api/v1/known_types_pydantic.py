@@ -2,58 +2,25 @@
 
 from typing import Any as _Any, Optional as _Optional
 
-from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
+from pydantic import Field as _Field, with_config as _with_config
+from typing_extensions import NotRequired as _NotRequired, TypedDict as _TypedDict
 
-from ._proto_types import ProtoDuration, ProtoInt64, ProtoTimestamp, ProtoUInt64
+from _proto_runtime import ProtoWire, _ProtoModel
 
-
-class _ProtoModel(_BaseModel):
-    """Base class for generated Pydantic models with ProtoJSON helpers."""
-
-    model_config = _ConfigDict(
-        use_enum_values=True,
-        ser_json_bytes="base64",
-        val_json_bytes="base64",
-        ser_json_inf_nan="strings",
-    )
-
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
+from ._proto_types import (
+    ProtoDurationNanos,
+    ProtoInt64,
+    ProtoTimestampNanos,
+    ProtoUInt64,
+)
 
 
 class WellKnownTypes(_ProtoModel):
     """
 
     Attributes:
-      wktTimestamp (_Optional[ProtoTimestamp]):
-      wktDuration (_Optional[ProtoDuration]):
+      wktTimestamp (_Optional[ProtoTimestampNanos]):
+      wktDuration (_Optional[ProtoDurationNanos]):
       wktStruct (_Optional[dict[str, _Any]]):
       wktValue (_Optional[_Any]):
       wktListValue (_Optional[list[_Any]]):
@@ -71,36 +38,82 @@ class WellKnownTypes(_ProtoModel):
       wktEmpty (None):
     """
 
-    wktTimestamp: "_Optional[ProtoTimestamp]" = _Field(default=None)
+    wktTimestamp: _Optional[ProtoTimestampNanos] = _Field(default=None)
 
-    wktDuration: "_Optional[ProtoDuration]" = _Field(default=None)
+    wktDuration: _Optional[ProtoDurationNanos] = _Field(default=None)
 
-    wktStruct: "_Optional[dict[str, _Any]]" = _Field(default=None)
+    wktStruct: _Optional[dict[str, _Any]] = _Field(default=None)
 
-    wktValue: "_Optional[_Any]" = _Field(default=None)
+    wktValue: _Optional[_Any] = _Field(default=None)
 
-    wktListValue: "_Optional[list[_Any]]" = _Field(default=None)
+    wktListValue: _Optional[list[_Any]] = _Field(default=None)
 
-    wktAny: "_Optional[_Any]" = _Field(default=None)
+    wktAny: _Optional[_Any] = _Field(default=None)
 
-    wktFieldMask: "_Optional[list[str]]" = _Field(default=None)
+    wktFieldMask: _Optional[list[str]] = _Field(default=None)
 
-    wktBool: "_Optional[bool]" = _Field(default=None)
+    wktBool: _Optional[bool] = _Field(default=None)
 
-    wktInt32: "_Optional[int]" = _Field(default=None)
+    wktInt32: _Optional[int] = _Field(default=None)
 
-    wktInt64: "_Optional[ProtoInt64]" = _Field(default=None)
+    wktInt64: _Optional[ProtoInt64] = _Field(default=None)
 
-    wktUint32: "_Optional[int]" = _Field(default=None)
+    wktUint32: _Optional[int] = _Field(default=None)
 
-    wktUint64: "_Optional[ProtoUInt64]" = _Field(default=None)
+    wktUint64: _Optional[ProtoUInt64] = _Field(default=None)
 
-    wktFloat: "_Optional[float]" = _Field(default=None)
+    wktFloat: _Optional[float] = _Field(default=None)
 
-    wktDouble: "_Optional[float]" = _Field(default=None)
+    wktDouble: _Optional[float] = _Field(default=None)
 
-    wktString: "_Optional[str]" = _Field(default=None)
+    wktString: _Optional[str] = _Field(default=None)
 
-    wktBytes: "_Optional[bytes]" = _Field(default=None)
+    wktBytes: _Optional[bytes] = _Field(default=None)
 
-    wktEmpty: "None" = _Field(default=None)
+    wktEmpty: None = _Field(default=None)
+
+    __proto_wire__ = ProtoWire(
+        (1, "wktTimestamp", "google.protobuf.Timestamp:nanos"),
+        (2, "wktDuration", "google.protobuf.Duration:nanos"),
+        (3, "wktStruct", "google.protobuf.Struct"),
+        (4, "wktValue", "google.protobuf.Value"),
+        (5, "wktListValue", "google.protobuf.ListValue"),
+        (6, "wktAny", "google.protobuf.Any"),
+        (7, "wktFieldMask", "google.protobuf.FieldMask"),
+        (8, "wktBool", "google.protobuf.BoolValue"),
+        (9, "wktInt32", "google.protobuf.Int32Value"),
+        (10, "wktInt64", "google.protobuf.Int64Value"),
+        (11, "wktUint32", "google.protobuf.UInt32Value"),
+        (12, "wktUint64", "google.protobuf.UInt64Value"),
+        (13, "wktFloat", "google.protobuf.FloatValue"),
+        (14, "wktDouble", "google.protobuf.DoubleValue"),
+        (15, "wktString", "google.protobuf.StringValue"),
+        (16, "wktBytes", "google.protobuf.BytesValue"),
+        (17, "wktEmpty", "google.protobuf.Empty"),
+    )
+
+
+WellKnownTypesDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "WellKnownTypesDict",
+        {
+            "wktTimestamp": _NotRequired[_Optional[ProtoTimestampNanos]],
+            "wktDuration": _NotRequired[_Optional[ProtoDurationNanos]],
+            "wktStruct": _NotRequired[_Optional[dict[str, _Any]]],
+            "wktValue": _NotRequired[_Optional[_Any]],
+            "wktListValue": _NotRequired[_Optional[list[_Any]]],
+            "wktAny": _NotRequired[_Optional[_Any]],
+            "wktFieldMask": _NotRequired[_Optional[list[str]]],
+            "wktBool": _NotRequired[_Optional[bool]],
+            "wktInt32": _NotRequired[_Optional[int]],
+            "wktInt64": _NotRequired[_Optional[ProtoInt64]],
+            "wktUint32": _NotRequired[_Optional[int]],
+            "wktUint64": _NotRequired[_Optional[ProtoUInt64]],
+            "wktFloat": _NotRequired[_Optional[float]],
+            "wktDouble": _NotRequired[_Optional[float]],
+            "wktString": _NotRequired[_Optional[str]],
+            "wktBytes": _NotRequired[_Optional[bytes]],
+            "wktEmpty": _NotRequired[None],
+        },
+    )
+)
@@ -1,59 +1,99 @@
 # DO NOT EDIT. Generated by protoc-gen-pydantic.
 
-from typing import Optional as _Optional
+from typing import Annotated as _Annotated, Literal as _Literal, Optional as _Optional
 
-from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
+from pydantic import (
+    Field as _Field,
+    model_serializer as _model_serializer,
+    model_validator as _model_validator,
+    with_config as _with_config,
+)
+from typing_extensions import NotRequired as _NotRequired, TypedDict as _TypedDict
 
+from _proto_runtime import ProtoWire, _ProtoModel
 
-class _ProtoModel(_BaseModel):
-    """Base class for generated Pydantic models with ProtoJSON helpers."""
 
-    model_config = _ConfigDict(
-        use_enum_values=True,
-        ser_json_bytes="base64",
-        val_json_bytes="base64",
-        ser_json_inf_nan="strings",
-    )
+class Oneofs(_ProtoModel):
+    """
 
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
+    Attributes:
+      union (_Optional[_Annotated[Oneofs.UnionA | Oneofs.UnionB, _Field(discriminator='case')]]):
+    """
 
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
+    class UnionA(_ProtoModel):
         """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
+        Member a of oneof union.
 
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
+        Attributes:
+          case (_Literal['a']):
+          value (int):
+        """
 
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
+        case: _Literal["a"] = _Field(default="a")
+
+        value: int = _Field(default=...)
+
+        __proto_wire__ = ProtoWire(
+            (1, "value", "optional int32"),
+        )
+
+    class UnionB(_ProtoModel):
         """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
+        Member b of oneof union.
 
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
+        Attributes:
+          case (_Literal['b']):
+          value (str):
+        """
 
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
+        case: _Literal["b"] = _Field(default="b")
 
+        value: str = _Field(default=...)
 
-class Oneofs(_ProtoModel):
-    """
+        __proto_wire__ = ProtoWire(
+            (2, "value", "optional string"),
+        )
 
-    Attributes:
-      a (_Optional[int]):
-      b (_Optional[str]):
-    """
+    union: _Optional[_Annotated[UnionA | UnionB, _Field(discriminator="case")]] = (
+        _Field(default=None)
+    )
 
-    a: "_Optional[int]" = _Field(default=None)
+    @_model_validator(mode="before")
+    @classmethod
+    def _fold_oneofs(cls, data):
+        return cls.__proto_wire__.fold_unions(data)
+
+    @_model_serializer(mode="wrap")
+    def _flatten_oneofs(self, handler, info):
+        return self.__proto_wire__.flatten_unions(self, handler(self), info)
+
+    @property
+    def a(self):
+        return self.__proto_wire__.union_member(self, "a")
+
+    @property
+    def b(self):
+        return self.__proto_wire__.union_member(self, "b")
+
+    __proto_wire__ = ProtoWire(
+        (1, "a", "optional int32"),
+        (2, "b", "optional string"),
+        oneofs={
+            "union": ("a", "b"),
+        },
+        unions={
+            "a": ("union", UnionA),
+            "b": ("union", UnionB),
+        },
+    )
 
-    b: "_Optional[str]" = _Field(default=None)
+
+OneofsDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "OneofsDict",
+        {
+            "a": _NotRequired[_Optional[int]],
+            "b": _NotRequired[_Optional[str]],
+        },
+    )
+)
@@ -1,48 +1,10 @@
 # DO NOT EDIT. Generated by protoc-gen-pydantic.
 
 
-from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
+from pydantic import Field as _Field, with_config as _with_config
+from typing_extensions import NotRequired as _NotRequired, TypedDict as _TypedDict
 
-
-class _ProtoModel(_BaseModel):
-    """Base class for generated Pydantic models with ProtoJSON helpers."""
-
-    model_config = _ConfigDict(
-        use_enum_values=True,
-        ser_json_bytes="base64",
-        val_json_bytes="base64",
-        ser_json_inf_nan="strings",
-    )
-
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
+from _proto_runtime import ProtoWire, _ProtoModel
 
 
 class ReservedFieldNames(_ProtoModel):
@@ -52,10 +14,33 @@ class ReservedFieldNames(_ProtoModel):
       modelConfig (str):
       modelFields (str):
       modelDump (str):
+      mergeFrom (str):
     """
 
-    modelConfig: "str" = _Field(default="")
+    modelConfig: str = _Field(default="")
+
+    modelFields: str = _Field(default="")
 
-    modelFields: "str" = _Field(default="")
+    modelDump: str = _Field(default="")
 
-    modelDump: "str" = _Field(default="")
+    mergeFrom: str = _Field(default="")
+
+    __proto_wire__ = ProtoWire(
+        (1, "modelConfig", "string"),
+        (2, "modelFields", "string"),
+        (3, "modelDump", "string"),
+        (4, "mergeFrom", "string"),
+    )
+
+
+ReservedFieldNamesDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ReservedFieldNamesDict",
+        {
+            "modelConfig": _NotRequired[str],
+            "modelFields": _NotRequired[str],
+            "modelDump": _NotRequired[str],
+            "mergeFrom": _NotRequired[str],
+        },
+    )
+)
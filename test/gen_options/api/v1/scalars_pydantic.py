@@ -3,7 +3,15 @@
 from enum import Enum as _Enum
 from typing import Optional as _Optional
 
-from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
+from pydantic import (
+    ConfigDict as _ConfigDict,
+    Field as _Field,
+    model_serializer as _model_serializer,
+    with_config as _with_config,
+)
+from typing_extensions import NotRequired as _NotRequired, TypedDict as _TypedDict
+
+from _proto_runtime import ProtoWire, _ProtoModel
 
 from ._proto_types import ProtoInt64, ProtoUInt64
 
@@ -11,46 +19,7 @@ from .enums_pydantic import Enum
 
 from .messages_pydantic import Message
 
-
-class _ProtoModel(_BaseModel):
-    """Base class for generated Pydantic models with ProtoJSON helpers."""
-
-    model_config = _ConfigDict(
-        use_enum_values=True,
-        ser_json_bytes="base64",
-        val_json_bytes="base64",
-        ser_json_inf_nan="strings",
-    )
-
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
+from .messages_pydantic import MessageDict
 
 
 class Scalars(_ProtoModel):
@@ -116,91 +85,198 @@ class Scalars(_ProtoModel):
           lastName (str):
         """
 
-        firstName: "str" = _Field(default="")
+        firstName: str = _Field(default="")
+
+        lastName: str = _Field(default="")
 
-        lastName: "str" = _Field(default="")
+        __proto_wire__ = ProtoWire(
+            (1, "firstName", "string"),
+            (2, "lastName", "string"),
+        )
 
-    int32: "int" = _Field(default=0)
+    int32: int = _Field(default=0)
 
-    int64: "ProtoInt64" = _Field(default=0)
+    int64: ProtoInt64 = _Field(default=0)
 
-    uint32: "int" = _Field(default=0)
+    uint32: int = _Field(default=0)
 
-    uint64: "ProtoUInt64" = _Field(default=0)
+    uint64: ProtoUInt64 = _Field(default=0)
 
-    fixed32: "int" = _Field(default=0)
+    fixed32: int = _Field(default=0)
 
-    fixed64: "ProtoUInt64" = _Field(default=0)
+    fixed64: ProtoUInt64 = _Field(default=0)
 
-    sint32: "int" = _Field(default=0)
+    sint32: int = _Field(default=0)
 
-    sint64: "ProtoInt64" = _Field(default=0)
+    sint64: ProtoInt64 = _Field(default=0)
 
-    sfixed32: "int" = _Field(default=0)
+    sfixed32: int = _Field(default=0)
 
-    sfixed64: "ProtoInt64" = _Field(default=0)
+    sfixed64: ProtoInt64 = _Field(default=0)
 
-    bool_: "bool" = _Field(
+    bool_: bool = _Field(
         default=False,
         alias="bool",
     )
 
-    float_: "float" = _Field(
+    float_: float = _Field(
         default=0.0,
         alias="float",
     )
 
-    double: "float" = _Field(default=0.0)
+    double: float = _Field(default=0.0)
 
-    string: "str" = _Field(default="")
+    string: str = _Field(default="")
 
-    bytes_: "bytes" = _Field(
+    bytes_: bytes = _Field(
         default=b"",
         alias="bytes",
     )
 
-    enum: "_Optional[Enum]" = _Field(default=None)
+    enum: _Optional[Enum] = _Field(default=None)
+
+    nestedEnum: _Optional[NestedEnum] = _Field(default=None)
+
+    message: _Optional[Message] = _Field(default=None)
 
-    nestedEnum: "_Optional[Scalars.NestedEnum]" = _Field(default=None)
+    nestedMessage: _Optional[NestedMessage] = _Field(default=None)
 
-    message: "_Optional[Message]" = _Field(default=None)
+    int32Optional: _Optional[int] = _Field(default=None)
 
-    nestedMessage: "_Optional[Scalars.NestedMessage]" = _Field(default=None)
+    int64Optional: _Optional[ProtoInt64] = _Field(default=None)
 
-    int32Optional: "_Optional[int]" = _Field(default=None)
+    uint32Optional: _Optional[int] = _Field(default=None)
 
-    int64Optional: "_Optional[ProtoInt64]" = _Field(default=None)
+    uint64Optional: _Optional[ProtoUInt64] = _Field(default=None)
 
-    uint32Optional: "_Optional[int]" = _Field(default=None)
+    fixed32Optional: _Optional[int] = _Field(default=None)
 
-    uint64Optional: "_Optional[ProtoUInt64]" = _Field(default=None)
+    fixed64Optional: _Optional[ProtoUInt64] = _Field(default=None)
 
-    fixed32Optional: "_Optional[int]" = _Field(default=None)
+    sint32Optional: _Optional[int] = _Field(default=None)
 
-    fixed64Optional: "_Optional[ProtoUInt64]" = _Field(default=None)
+    sint64Optional: _Optional[ProtoInt64] = _Field(default=None)
 
-    sint32Optional: "_Optional[int]" = _Field(default=None)
+    sfixed32Optional: _Optional[int] = _Field(default=None)
 
-    sint64Optional: "_Optional[ProtoInt64]" = _Field(default=None)
+    sfixed64Optional: _Optional[ProtoInt64] = _Field(default=None)
 
-    sfixed32Optional: "_Optional[int]" = _Field(default=None)
+    boolOptional: _Optional[bool] = _Field(default=None)
 
-    sfixed64Optional: "_Optional[ProtoInt64]" = _Field(default=None)
+    floatOptional: _Optional[float] = _Field(default=None)
 
-    boolOptional: "_Optional[bool]" = _Field(default=None)
+    doubleOptional: _Optional[float] = _Field(default=None)
 
-    floatOptional: "_Optional[float]" = _Field(default=None)
+    stringOptional: _Optional[str] = _Field(default=None)
 
-    doubleOptional: "_Optional[float]" = _Field(default=None)
+    bytesOptional: _Optional[bytes] = _Field(default=None)
 
-    stringOptional: "_Optional[str]" = _Field(default=None)
+    enumOptional: _Optional[Enum] = _Field(default=None)
 
-    bytesOptional: "_Optional[bytes]" = _Field(default=None)
+    nestedEnumOptional: _Optional[NestedEnum] = _Field(default=None)
 
-    enumOptional: "_Optional[Enum]" = _Field(default=None)
+    messageOptional: _Optional[Message] = _Field(default=None)
 
-    nestedEnumOptional: "_Optional[Scalars.NestedEnum]" = _Field(default=None)
+    nestedMessageOptional: _Optional[NestedMessage] = _Field(default=None)
 
-    messageOptional: "_Optional[Message]" = _Field(default=None)
+    @_model_serializer(mode="wrap")
+    def _omit_zero_enums(self, handler, info):
+        return self.__proto_wire__.omit_zero_enums(self, handler(self), info)
 
-    nestedMessageOptional: "_Optional[Scalars.NestedMessage]" = _Field(default=None)
+    __proto_wire__ = ProtoWire(
+        (2, "int32", "int32"),
+        (3, "int64", "int64"),
+        (4, "uint32", "uint32"),
+        (5, "uint64", "uint64"),
+        (6, "fixed32", "fixed32"),
+        (7, "fixed64", "fixed64"),
+        (8, "sint32", "sint32"),
+        (9, "sint64", "sint64"),
+        (10, "sfixed32", "sfixed32"),
+        (11, "sfixed64", "sfixed64"),
+        (12, "bool_", "bool"),
+        (13, "float_", "float"),
+        (14, "double", "double"),
+        (15, "string", "string"),
+        (16, "bytes_", "bytes"),
+        (17, "enum", "enum", "Enum"),
+        (18, "nestedEnum", "enum", "Scalars.NestedEnum"),
+        (19, "message", "message", "Message"),
+        (20, "nestedMessage", "message", "Scalars.NestedMessage"),
+        (23, "int32Optional", "optional int32"),
+        (24, "int64Optional", "optional int64"),
+        (25, "uint32Optional", "optional uint32"),
+        (26, "uint64Optional", "optional uint64"),
+        (27, "fixed32Optional", "optional fixed32"),
+        (28, "fixed64Optional", "optional fixed64"),
+        (29, "sint32Optional", "optional sint32"),
+        (30, "sint64Optional", "optional sint64"),
+        (31, "sfixed32Optional", "optional sfixed32"),
+        (32, "sfixed64Optional", "optional sfixed64"),
+        (33, "boolOptional", "optional bool"),
+        (34, "floatOptional", "optional float"),
+        (35, "doubleOptional", "optional double"),
+        (36, "stringOptional", "optional string"),
+        (37, "bytesOptional", "optional bytes"),
+        (38, "enumOptional", "optional enum", "Enum"),
+        (39, "nestedEnumOptional", "optional enum", "Scalars.NestedEnum"),
+        (40, "messageOptional", "message", "Message"),
+        (41, "nestedMessageOptional", "message", "Scalars.NestedMessage"),
+    )
+
+
+ScalarsNestedMessageDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ScalarsNestedMessageDict",
+        {
+            "firstName": _NotRequired[str],
+            "lastName": _NotRequired[str],
+        },
+    )
+)
+
+ScalarsDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ScalarsDict",
+        {
+            "int32": _NotRequired[int],
+            "int64": _NotRequired[ProtoInt64],
+            "uint32": _NotRequired[int],
+            "uint64": _NotRequired[ProtoUInt64],
+            "fixed32": _NotRequired[int],
+            "fixed64": _NotRequired[ProtoUInt64],
+            "sint32": _NotRequired[int],
+            "sint64": _NotRequired[ProtoInt64],
+            "sfixed32": _NotRequired[int],
+            "sfixed64": _NotRequired[ProtoInt64],
+            "bool": _NotRequired[bool],
+            "float": _NotRequired[float],
+            "double": _NotRequired[float],
+            "string": _NotRequired[str],
+            "bytes": _NotRequired[bytes],
+            "enum": _NotRequired[_Optional[Enum]],
+            "nestedEnum": _NotRequired[_Optional[Scalars.NestedEnum]],
+            "message": _NotRequired[_Optional[MessageDict]],
+            "nestedMessage": _NotRequired[_Optional[ScalarsNestedMessageDict]],
+            "int32Optional": _NotRequired[_Optional[int]],
+            "int64Optional": _NotRequired[_Optional[ProtoInt64]],
+            "uint32Optional": _NotRequired[_Optional[int]],
+            "uint64Optional": _NotRequired[_Optional[ProtoUInt64]],
+            "fixed32Optional": _NotRequired[_Optional[int]],
+            "fixed64Optional": _NotRequired[_Optional[ProtoUInt64]],
+            "sint32Optional": _NotRequired[_Optional[int]],
+            "sint64Optional": _NotRequired[_Optional[ProtoInt64]],
+            "sfixed32Optional": _NotRequired[_Optional[int]],
+            "sfixed64Optional": _NotRequired[_Optional[ProtoInt64]],
+            "boolOptional": _NotRequired[_Optional[bool]],
+            "floatOptional": _NotRequired[_Optional[float]],
+            "doubleOptional": _NotRequired[_Optional[float]],
+            "stringOptional": _NotRequired[_Optional[str]],
+            "bytesOptional": _NotRequired[_Optional[bytes]],
+            "enumOptional": _NotRequired[_Optional[Enum]],
+            "nestedEnumOptional": _NotRequired[_Optional[Scalars.NestedEnum]],
+            "messageOptional": _NotRequired[_Optional[MessageDict]],
+            "nestedMessageOptional": _NotRequired[_Optional[ScalarsNestedMessageDict]],
+        },
+    )
+)
@@ -2,48 +2,10 @@
 
 from typing import Optional as _Optional
 
-from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
+from pydantic import Field as _Field, with_config as _with_config
+from typing_extensions import NotRequired as _NotRequired, TypedDict as _TypedDict
 
-
-class _ProtoModel(_BaseModel):
-    """Base class for generated Pydantic models with ProtoJSON helpers."""
-
-    model_config = _ConfigDict(
-        use_enum_values=True,
-        ser_json_bytes="base64",
-        val_json_bytes="base64",
-        ser_json_inf_nan="strings",
-    )
-
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
+from _proto_runtime import ProtoWire, _ProtoModel
 
 
 class TreeNode(_ProtoModel):
@@ -55,10 +17,55 @@ class TreeNode(_ProtoModel):
       parent (_Optional[TreeNode]):
     """
 
-    name: "str" = _Field(default="")
+    name: str = _Field(default="")
 
     children: "list[TreeNode]" = _Field(
         default_factory=list,
     )
 
     parent: "_Optional[TreeNode]" = _Field(default=None)
+
+    __proto_wire__ = ProtoWire(
+        (1, "name", "string"),
+        (2, "children", "repeated message", "TreeNode"),
+        (3, "parent", "message", "TreeNode"),
+    )
+
+
+class Forest(_ProtoModel):
+    """
+    Declared before TreeNode; generated after it so that the annotation of
+    trees needs no forward reference.
+
+    Attributes:
+      trees (list[TreeNode]):
+    """
+
+    trees: list[TreeNode] = _Field(
+        default_factory=list,
+    )
+
+    __proto_wire__ = ProtoWire(
+        (1, "trees", "repeated message", "TreeNode"),
+    )
+
+
+TreeNodeDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "TreeNodeDict",
+        {
+            "name": _NotRequired[str],
+            "children": _NotRequired["list[TreeNodeDict]"],
+            "parent": _NotRequired["_Optional[TreeNodeDict]"],
+        },
+    )
+)
+
+ForestDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ForestDict",
+        {
+            "trees": _NotRequired[list[TreeNodeDict]],
+        },
+    )
+)
@@ -1,24 +1,33 @@
 # DO NOT EDIT. Generated by protoc-gen-pydantic.
 
+import re as _re
+from enum import Enum as _Enum
 from typing import Annotated as _Annotated, Literal as _Literal, Optional as _Optional
 
 from pydantic import (
     AfterValidator as _AfterValidator,
-    BaseModel as _BaseModel,
     ConfigDict as _ConfigDict,
     Field as _Field,
+    field_validator as _field_validator,
+    model_serializer as _model_serializer,
+    model_validator as _model_validator,
+    with_config as _with_config,
 )
+from typing_extensions import NotRequired as _NotRequired, TypedDict as _TypedDict
+
+from _proto_runtime import ProtoWire, _ProtoModel
 
 from ._proto_types import (
-    ProtoDuration,
+    ProtoDurationNanos,
     ProtoInt64,
-    ProtoTimestamp,
+    ProtoTimestampNanos,
     ProtoUInt64,
-    _make_const_validator,
-    _make_in_validator,
+    _InValues,
     _make_not_in_validator,
     _require_finite,
     _require_unique,
+    _require_unique_floats,
+    _require_unique_messages,
     _validate_email,
     _validate_ip,
     _validate_ipv4,
@@ -28,47 +37,6 @@ from ._proto_types import (
 )
 
 
-class _ProtoModel(_BaseModel):
-    """Base class for generated Pydantic models with ProtoJSON helpers."""
-
-    model_config = _ConfigDict(
-        use_enum_values=True,
-        ser_json_bytes="base64",
-        val_json_bytes="base64",
-        ser_json_inf_nan="strings",
-    )
-
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
-
-
 class ValidatedScalars(_ProtoModel):
     """
     ValidatedScalars exercises numeric bound constraints.
@@ -91,51 +59,61 @@ class ValidatedScalars(_ProtoModel):
     """
 
     # Age must be between 0 and 150 exclusive of 0.
-    age: "int" = _Field(
+    age: int = _Field(
         default=0,
         gt=0,
         le=150,
     )
 
     # Score must be in [0.0, 100.0].
-    score: "float" = _Field(
+    score: float = _Field(
         default=0.0,
         ge=0.0,
         le=100.0,
     )
 
     # Priority must be positive.
-    priority: "ProtoInt64" = _Field(
+    priority: ProtoInt64 = _Field(
         default=0,
         gt=0,
     )
 
     # Ratio must be non-negative and less than 1.
-    ratio: "float" = _Field(
+    ratio: float = _Field(
         default=0.0,
         ge=0.0,
         lt=1.0,
     )
 
     # Rank must be in [1, 10].
-    rank: "int" = _Field(
+    rank: int = _Field(
         default=0,
         ge=1,
         le=10,
     )
 
     # Count must be non-zero (covers uint64 / fixed64 literal formatting).
-    count: "_Optional[ProtoUInt64]" = _Field(
+    count: _Optional[ProtoUInt64] = _Field(
         default=None,
         gt=0,
     )
 
     # Offset must be non-negative (covers sint32 / sfixed32 literal formatting).
-    offset: "_Optional[int]" = _Field(
+    offset: _Optional[int] = _Field(
         default=None,
         ge=0,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "age", "int32"),
+        (2, "score", "double"),
+        (3, "priority", "int64"),
+        (4, "ratio", "float"),
+        (5, "rank", "uint32"),
+        (6, "count", "optional uint64"),
+        (7, "offset", "optional sint32"),
+    )
+
 
 class ValidatedStrings(_ProtoModel):
     """
@@ -153,30 +131,37 @@ class ValidatedStrings(_ProtoModel):
     """
 
     # Name must be between 1 and 100 characters.
-    name: "str" = _Field(
+    name: str = _Field(
         default="",
         min_length=1,
         max_length=100,
     )
 
     # Code must match uppercase letters only.
-    code: "str" = _Field(
+    code: str = _Field(
         default="",
         pattern="^[A-Z]+$",
     )
 
     # Bio has only a max length.
-    bio: "str" = _Field(
+    bio: str = _Field(
         default="",
         max_length=500,
     )
 
     # Tag has only a min length.
-    tag: "str" = _Field(
+    tag: str = _Field(
         default="",
         min_length=2,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "name", "string"),
+        (2, "code", "string"),
+        (3, "bio", "string"),
+        (4, "tag", "string"),
+    )
+
 
 class ValidatedRepeated(_ProtoModel):
     """
@@ -190,18 +175,23 @@ class ValidatedRepeated(_ProtoModel):
     """
 
     # Items must have between 1 and 10 elements.
-    items: "list[str]" = _Field(
+    items: list[str] = _Field(
         default_factory=list,
         min_length=1,
         max_length=10,
     )
 
     # Tags must have at least 1 element.
-    tags: "list[str]" = _Field(
+    tags: list[str] = _Field(
         default_factory=list,
         min_length=1,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "items", "repeated string"),
+        (2, "tags", "repeated string"),
+    )
+
 
 class ValidatedMap(_ProtoModel):
     """
@@ -213,12 +203,16 @@ class ValidatedMap(_ProtoModel):
     """
 
     # Labels must have between 1 and 10 entries.
-    labels: "dict[str, str]" = _Field(
+    labels: dict[str, str] = _Field(
         default_factory=dict,
         min_length=1,
         max_length=10,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "labels", "map<string, string>"),
+    )
+
 
 class ValidatedReserved(_ProtoModel):
     """
@@ -234,34 +228,100 @@ class ValidatedReserved(_ProtoModel):
     model_config = _ConfigDict(populate_by_name=True)
 
     # Score must be positive.
-    float_: "float" = _Field(
+    float_: float = _Field(
         default=0.0,
         alias="float",
         gt=0.0,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "float_", "float"),
+    )
+
 
 class ValidatedOneof(_ProtoModel):
     """
     ValidatedOneof exercises a oneof field that also carries a constraint.
 
     Attributes:
-      small (_Optional[int]):
-        Must be positive when set.
-      large (_Optional[ProtoInt64]):
-        Must be positive when set.
+      value (_Optional[_Annotated[ValidatedOneof.ValueSmall | ValidatedOneof.ValueLarge, _Field(discriminator='case')]]):
     """
 
-    # Must be positive when set.
-    small: "_Optional[int]" = _Field(
-        default=None,
-        gt=0,
-    )
+    class ValueSmall(_ProtoModel):
+        """
+        Member small of oneof value.
 
-    # Must be positive when set.
-    large: "_Optional[ProtoInt64]" = _Field(
-        default=None,
-        gt=0,
+        Attributes:
+          case (_Literal['small']):
+          value (int):
+            Must be positive when set.
+        """
+
+        case: _Literal["small"] = _Field(default="small")
+
+        # Must be positive when set.
+        value: int = _Field(
+            default=...,
+            gt=0,
+        )
+
+        __proto_wire__ = ProtoWire(
+            (1, "value", "optional int32"),
+        )
+
+    class ValueLarge(_ProtoModel):
+        """
+        Member large of oneof value.
+
+        Attributes:
+          case (_Literal['large']):
+          value (ProtoInt64):
+            Must be positive when set.
+        """
+
+        case: _Literal["large"] = _Field(default="large")
+
+        # Must be positive when set.
+        value: ProtoInt64 = _Field(
+            default=...,
+            gt=0,
+        )
+
+        __proto_wire__ = ProtoWire(
+            (2, "value", "optional int64"),
+        )
+
+    value: _Optional[
+        _Annotated[ValueSmall | ValueLarge, _Field(discriminator="case")]
+    ] = _Field(default=None)
+
+    @_model_validator(mode="before")
+    @classmethod
+    def _fold_oneofs(cls, data):
+        return cls.__proto_wire__.fold_unions(data)
+
+    @_model_serializer(mode="wrap")
+    def _flatten_oneofs(self, handler, info):
+        return self.__proto_wire__.flatten_unions(self, handler(self), info)
+
+    @property
+    def small(self):
+        return self.__proto_wire__.union_member(self, "small")
+
+    @property
+    def large(self):
+        return self.__proto_wire__.union_member(self, "large")
+
+    __proto_wire__ = ProtoWire(
+        (1, "small", "optional int32"),
+        (2, "large", "optional int64"),
+        oneofs={
+            "value": ("small", "large"),
+        },
+        unions={
+            "small": ("value", ValueSmall),
+            "large": ("value", ValueLarge),
+        },
     )
 
 
@@ -272,17 +332,21 @@ class ValidatedDuration(_ProtoModel):
     The generator must not panic; instead it emits dropped-constraint comments.
 
     Attributes:
-      timeout (_Optional[ProtoDuration]):
+      timeout (_Optional[ProtoDurationNanos]):
         Timeout must be positive and at most one hour.
     """
 
     # Timeout must be positive and at most one hour.
-    timeout: "_Optional[ProtoDuration]" = _Field(
+    timeout: _Optional[ProtoDurationNanos] = _Field(
         default=None,
         # buf.validate: gt (not translated)
         # buf.validate: lte (not translated)
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "timeout", "google.protobuf.Duration:nanos"),
+    )
+
 
 class ValidatedTimestamp(_ProtoModel):
     """
@@ -290,16 +354,20 @@ class ValidatedTimestamp(_ProtoModel):
     message-typed rule fields and must not panic.
 
     Attributes:
-      createdAt (_Optional[ProtoTimestamp]):
+      createdAt (_Optional[ProtoTimestampNanos]):
         CreatedAt must be after the Unix epoch.
     """
 
     # CreatedAt must be after the Unix epoch.
-    createdAt: "_Optional[ProtoTimestamp]" = _Field(
+    createdAt: _Optional[ProtoTimestampNanos] = _Field(
         default=None,
         # buf.validate: gt (not translated)
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "createdAt", "google.protobuf.Timestamp:nanos"),
+    )
+
 
 class ValidatedStringLen(_ProtoModel):
     """
@@ -311,12 +379,16 @@ class ValidatedStringLen(_ProtoModel):
     """
 
     # Code must be exactly 5 characters.
-    code: "str" = _Field(
+    code: str = _Field(
         default="",
         min_length=5,
         max_length=5,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "code", "string"),
+    )
+
 
 class ValidatedStringAffix(_ProtoModel):
     """
@@ -334,30 +406,37 @@ class ValidatedStringAffix(_ProtoModel):
     """
 
     # Url must start with "https://".
-    url: "str" = _Field(
+    url: str = _Field(
         default="",
         pattern="^https://",
     )
 
     # Filename must end with ".go".
-    filename: "str" = _Field(
+    filename: str = _Field(
         default="",
         pattern="\\.go$",
     )
 
     # Path must start with "/home/" and end with ".txt".
-    path: "str" = _Field(
+    path: str = _Field(
         default="",
         pattern="^/home/.*\\.txt$",
     )
 
     # Content must match a pattern; prefix is also set (conflict → prefix dropped).
-    content: "str" = _Field(
+    content: str = _Field(
         default="",
         pattern="^[a-z]+$",
         # buf.validate: prefix (not translated)
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "url", "string"),
+        (2, "filename", "string"),
+        (3, "path", "string"),
+        (4, "content", "string"),
+    )
+
 
 class ValidatedExamples(_ProtoModel):
     """
@@ -371,19 +450,24 @@ class ValidatedExamples(_ProtoModel):
     """
 
     # Count with integer examples.
-    count: "int" = _Field(
+    count: int = _Field(
         default=0,
         gt=0,
         examples=[1, 42],
     )
 
     # Name with string examples.
-    name: "str" = _Field(
+    name: str = _Field(
         default="",
         min_length=1,
         examples=["alice", "bob"],
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "count", "int32"),
+        (2, "name", "string"),
+    )
+
 
 class ValidatedFormats(_ProtoModel):
     """
@@ -408,40 +492,50 @@ class ValidatedFormats(_ProtoModel):
     """
 
     # Email must be a valid email address.
-    email: "_Annotated[str, _AfterValidator(_validate_email)]" = _Field(
+    email: _Annotated[str, _AfterValidator(_validate_email)] = _Field(
         default="",
     )
 
     # Website must be a valid URI.
-    website: "_Annotated[str, _AfterValidator(_validate_uri)]" = _Field(
+    website: _Annotated[str, _AfterValidator(_validate_uri)] = _Field(
         default="",
     )
 
     # Address must be a valid IP address.
-    address: "_Annotated[str, _AfterValidator(_validate_ip)]" = _Field(
+    address: _Annotated[str, _AfterValidator(_validate_ip)] = _Field(
         default="",
     )
 
     # Ratio must be finite (not inf or NaN).
-    ratio: "_Annotated[float, _AfterValidator(_require_finite)]" = _Field(
+    ratio: _Annotated[float, _AfterValidator(_require_finite)] = _Field(
         default=0.0,
     )
 
     # Token must be a valid UUID.
-    token: "_Annotated[str, _AfterValidator(_validate_uuid)]" = _Field(
+    token: _Annotated[str, _AfterValidator(_validate_uuid)] = _Field(
         default="",
     )
 
     # Host must be a valid IPv4 address.
-    hostV4: "_Annotated[str, _AfterValidator(_validate_ipv4)]" = _Field(
+    hostV4: _Annotated[str, _AfterValidator(_validate_ipv4)] = _Field(
         default="",
     )
 
     # Host must be a valid IPv6 address.
-    hostV6: "_Annotated[str, _AfterValidator(_validate_ipv6)]" = _Field(
+    hostV6: _Annotated[str, _AfterValidator(_validate_ipv6)] = _Field(
         default="",
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "email", "string"),
+        (2, "website", "string"),
+        (3, "address", "string"),
+        (4, "ratio", "float"),
+        (5, "token", "string"),
+        (6, "hostV4", "string"),
+        (7, "hostV6", "string"),
+    )
+
 
 class ValidatedDropped(_ProtoModel):
     """
@@ -457,24 +551,30 @@ class ValidatedDropped(_ProtoModel):
     """
 
     # Name is required; the required constraint is not translated.
-    name: "str" = _Field(
+    name: str = _Field(
         default="",
         # buf.validate: required (not translated)
     )
 
     # Blob has a bytes.const constraint which is not translated (bytes kind unsupported).
-    blob: "bytes" = _Field(
+    blob: bytes = _Field(
         default=b"",
         # buf.validate: const (not translated)
     )
 
     # Score must be positive; required is also set but not translated.
-    score: "int" = _Field(
+    score: int = _Field(
         default=0,
         gt=0,
         # buf.validate: required (not translated)
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "name", "string"),
+        (2, "blob", "bytes"),
+        (3, "score", "int32"),
+    )
+
 
 class ValidatedConst(_ProtoModel):
     """
@@ -484,66 +584,106 @@ class ValidatedConst(_ProtoModel):
       tag (_Literal['fixed']):
       count (_Literal[42]):
       active (_Literal[True]):
-      score (_Annotated[float, _AfterValidator(_make_const_validator(3.14))]):
+      score (_Annotated[float, _InValues(3.14)]):
     """
 
-    tag: "_Literal['fixed']" = _Field(
+    tag: _Literal["fixed"] = _Field(
         default="fixed",
     )
 
-    count: "_Literal[42]" = _Field(
+    count: _Literal[42] = _Field(
         default=42,
     )
 
-    active: "_Literal[True]" = _Field(
+    active: _Literal[True] = _Field(
         default=True,
     )
 
-    score: "_Annotated[float, _AfterValidator(_make_const_validator(3.14))]" = _Field(
+    score: _Annotated[float, _InValues(3.14)] = _Field(
         default=3.14,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "tag", "string"),
+        (2, "count", "int32"),
+        (3, "active", "bool"),
+        (4, "score", "double"),
+    )
+
 
 class ValidatedIn(_ProtoModel):
     """
-    ValidatedIn exercises in and not_in constraints translated to AfterValidator.
+    ValidatedIn exercises in constraints checked by pydantic-core and not_in
+    constraints translated to AfterValidator.
 
     Attributes:
-      status (_Annotated[str, _AfterValidator(_make_in_validator(frozenset({'active', 'inactive'})))]):
+      status (_Annotated[str, _InValues('active', 'inactive')]):
       code (_Annotated[str, _AfterValidator(_make_not_in_validator(frozenset({'deleted', 'archived'})))]):
-      priority (_Annotated[int, _AfterValidator(_make_in_validator(frozenset({1, 2, 3})))]):
+      priority (_Annotated[int, _InValues(1, 2, 3)]):
     """
 
-    status: "_Annotated[str, _AfterValidator(_make_in_validator(frozenset({'active', 'inactive'})))]" = _Field(
+    status: _Annotated[str, _InValues("active", "inactive")] = _Field(
         default="",
     )
 
-    code: "_Annotated[str, _AfterValidator(_make_not_in_validator(frozenset({'deleted', 'archived'})))]" = _Field(
+    code: _Annotated[
+        str, _AfterValidator(_make_not_in_validator(frozenset({"deleted", "archived"})))
+    ] = _Field(
         default="",
     )
 
-    priority: "_Annotated[int, _AfterValidator(_make_in_validator(frozenset({1, 2, 3})))]" = _Field(
+    priority: _Annotated[int, _InValues(1, 2, 3)] = _Field(
         default=0,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "status", "string"),
+        (2, "code", "string"),
+        (3, "priority", "int32"),
+    )
+
 
 class ValidatedUnique(_ProtoModel):
     """
-    ValidatedUnique exercises repeated.unique translated to AfterValidator.
+    ValidatedUnique exercises repeated.unique translated to AfterValidator,
+    with the helper chosen by element kind.
 
     Attributes:
       tags (_Annotated[list[str], _AfterValidator(_require_unique)]):
       scores (_Annotated[list[int], _AfterValidator(_require_unique)]):
+      ratios (_Annotated[list[float], _AfterValidator(_require_unique_floats)]):
+      digests (_Annotated[list[bytes], _AfterValidator(_require_unique)]):
+      entries (_Annotated[list[ValidatedMap], _AfterValidator(_require_unique)]):
     """
 
-    tags: "_Annotated[list[str], _AfterValidator(_require_unique)]" = _Field(
+    tags: _Annotated[list[str], _AfterValidator(_require_unique)] = _Field(
+        default_factory=list,
+    )
+
+    scores: _Annotated[list[int], _AfterValidator(_require_unique)] = _Field(
+        default_factory=list,
+    )
+
+    ratios: _Annotated[list[float], _AfterValidator(_require_unique_floats)] = _Field(
+        default_factory=list,
+    )
+
+    digests: _Annotated[list[bytes], _AfterValidator(_require_unique)] = _Field(
         default_factory=list,
     )
 
-    scores: "_Annotated[list[int], _AfterValidator(_require_unique)]" = _Field(
+    entries: _Annotated[list[ValidatedMap], _AfterValidator(_require_unique)] = _Field(
         default_factory=list,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "tags", "repeated string"),
+        (2, "scores", "packed int32"),
+        (3, "ratios", "packed double"),
+        (4, "digests", "repeated bytes"),
+        (5, "entries", "repeated message", "ValidatedMap"),
+    )
+
 
 class ValidatedBytes(_ProtoModel):
     """
@@ -561,13 +701,13 @@ class ValidatedBytes(_ProtoModel):
     model_config = _ConfigDict(populate_by_name=True)
 
     # Token must be at least 16 bytes.
-    token: "bytes" = _Field(
+    token: bytes = _Field(
         default=b"",
         min_length=16,
     )
 
     # Hash must be exactly 32 bytes.
-    hash_: "bytes" = _Field(
+    hash_: bytes = _Field(
         default=b"",
         alias="hash",
         min_length=32,
@@ -575,11 +715,17 @@ class ValidatedBytes(_ProtoModel):
     )
 
     # Payload must be at most 1024 bytes.
-    payload: "bytes" = _Field(
+    payload: bytes = _Field(
         default=b"",
         max_length=1024,
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "token", "bytes"),
+        (2, "hash_", "bytes"),
+        (3, "payload", "bytes"),
+    )
+
 
 class ValidatedStringContains(_ProtoModel):
     """
@@ -594,19 +740,24 @@ class ValidatedStringContains(_ProtoModel):
     """
 
     # Topic must contain "protobuf".
-    topic: "str" = _Field(
+    topic: str = _Field(
         default="",
         pattern="protobuf",
     )
 
     # Label must start with "env-" and contain "prod".
     # The contains conflicts with prefix so contains is dropped.
-    label: "str" = _Field(
+    label: str = _Field(
         default="",
         pattern="^env-",
         # buf.validate: contains (not translated)
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "topic", "string"),
+        (2, "label", "string"),
+    )
+
 
 class ValidatedRequired(_ProtoModel):
     """
@@ -632,27 +783,457 @@ class ValidatedRequired(_ProtoModel):
           value (str):
         """
 
-        value: "str" = _Field(default="")
+        value: str = _Field(default="")
+
+        __proto_wire__ = ProtoWire(
+            (1, "value", "string"),
+        )
 
     # required on proto3 optional scalar: | None stripped, field becomes required.
-    requiredName: "str" = _Field(
+    requiredName: str = _Field(
         default=...,
     )
 
     # required on proto3 optional scalar with an additional constraint.
-    requiredScore: "int" = _Field(
+    requiredScore: int = _Field(
         default=...,
         gt=0,
     )
 
     # required on message-typed optional: not translated, emits dropped comment.
-    requiredDetail: "_Optional[ValidatedRequired.Detail]" = _Field(
+    requiredDetail: _Optional[Detail] = _Field(
         default=None,
         # buf.validate: required (not translated)
     )
 
     # required on plain proto3 scalar: not translated, emits dropped comment.
-    plainName: "str" = _Field(
+    plainName: str = _Field(
         default="",
         # buf.validate: required (not translated)
     )
+
+    __proto_wire__ = ProtoWire(
+        (1, "requiredName", "optional string"),
+        (2, "requiredScore", "optional int32"),
+        (3, "requiredDetail", "message", "ValidatedRequired.Detail"),
+        (4, "plainName", "string"),
+    )
+
+
+class ValidatedCel(_ProtoModel):
+    """
+    ValidatedCel exercises CEL rules compiled into Python validators.
+
+    Attributes:
+      quantity (int):
+        Quantity must be positive.
+      tags (list[str]):
+        Every tag is at most 8 characters.
+      code (str):
+        Code is three capitals; the rule returns its own error message.
+      note (_Optional[str]):
+      window (_Optional[ValidatedCel.Window]):
+      level (_Optional[ValidatedCel.Level]):
+      limits (dict[str, int]):
+      legacy (int):
+        Not in the compiled subset: stays a comment.
+    """
+
+    class Level(int, _Enum):
+        """
+        Level is a nested enum used to test enum comparisons.
+        """
+
+        LEVEL_UNSPECIFIED = 0  # LEVEL_UNSPECIFIED
+
+        LEVEL_LOW = 1  # LEVEL_LOW
+
+        LEVEL_HIGH = 2  # LEVEL_HIGH
+
+    class Window(_ProtoModel):
+        """
+        Window is a nested message used to test selection through unset fields.
+
+        Attributes:
+          start (int):
+          end (int):
+        """
+
+        start: int = _Field(default=0)
+
+        end: int = _Field(default=0)
+
+        __proto_wire__ = ProtoWire(
+            (1, "start", "int32"),
+            (2, "end", "int32"),
+        )
+
+    # Quantity must be positive.
+    quantity: int = _Field(default=0)
+
+    # Every tag is at most 8 characters.
+    tags: list[str] = _Field(
+        default_factory=list,
+    )
+
+    # Code is three capitals; the rule returns its own error message.
+    code: str = _Field(default="")
+
+    note: _Optional[str] = _Field(default=None)
+
+    window: _Optional[Window] = _Field(default=None)
+
+    level: _Optional[Level] = _Field(default=None)
+
+    limits: dict[str, int] = _Field(
+        default_factory=dict,
+    )
+
+    # Not in the compiled subset: stays a comment.
+    legacy: int = _Field(
+        default=0,
+        # buf.validate: cel (not translated)
+    )
+
+    @_model_serializer(mode="wrap")
+    def _omit_zero_enums(self, handler, info):
+        return self.__proto_wire__.omit_zero_enums(self, handler(self), info)
+
+    # buf.validate: cel (not translated)
+
+    @_field_validator("quantity")
+    @classmethod
+    def _validate_quantity_cel(cls, value):
+        if not value > 0:
+            raise ValueError("quantity must be positive")
+        return value
+
+    @_field_validator("tags")
+    @classmethod
+    def _validate_tags_cel(cls, value):
+        if not all(len(t) <= 8 for t in value):
+            raise ValueError("tags must be short")
+        return value
+
+    @_field_validator("code")
+    @classmethod
+    def _validate_code_cel(cls, value):
+        message = (
+            ""
+            if _re.search("^[A-Z]{3}$", value) is not None
+            else "code must be three capitals"
+        )
+        if message:
+            raise ValueError(message)
+        return value
+
+    @_field_validator("level")
+    @classmethod
+    def _validate_level_cel(cls, value):
+        if value is None:
+            return value
+        if value not in [1, 2]:
+            raise ValueError("level must be set")
+        return value
+
+    @_field_validator("limits")
+    @classmethod
+    def _validate_limits_cel(cls, value):
+        try:
+            valid = value["default"] > 0
+        except LookupError:
+            valid = False
+        if not valid:
+            raise ValueError("limits need a positive default")
+        return value
+
+    @_model_validator(mode="after")
+    def _validate_cel(self):
+        if not getattr(self.window, "end", 0) >= getattr(self.window, "start", 0):
+            raise ValueError("window end must not precede its start")
+        if not (self.note is None or (self.note or "").startswith("#")):
+            raise ValueError("note.prefix")
+        if not ((self.level or 0) != 2 or len(self.tags) > 0):
+            raise ValueError("high level needs a tag")
+        return self
+
+    __proto_wire__ = ProtoWire(
+        (1, "quantity", "int32"),
+        (2, "tags", "repeated string"),
+        (3, "code", "string"),
+        (4, "note", "optional string"),
+        (5, "window", "message", "ValidatedCel.Window"),
+        (6, "level", "enum", "ValidatedCel.Level"),
+        (7, "limits", "map<string, int32>"),
+        (8, "legacy", "int32"),
+    )
+
+
+ValidatedScalarsDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedScalarsDict",
+        {
+            "age": _NotRequired[_Annotated[int, _Field(gt=0, le=150)]],
+            "score": _NotRequired[_Annotated[float, _Field(ge=0.0, le=100.0)]],
+            "priority": _NotRequired[_Annotated[ProtoInt64, _Field(gt=0)]],
+            "ratio": _NotRequired[_Annotated[float, _Field(ge=0.0, lt=1.0)]],
+            "rank": _NotRequired[_Annotated[int, _Field(ge=1, le=10)]],
+            "count": _NotRequired[_Optional[_Annotated[ProtoUInt64, _Field(gt=0)]]],
+            "offset": _NotRequired[_Optional[_Annotated[int, _Field(ge=0)]]],
+        },
+    )
+)
+
+ValidatedStringsDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedStringsDict",
+        {
+            "name": _NotRequired[_Annotated[str, _Field(min_length=1, max_length=100)]],
+            "code": _NotRequired[_Annotated[str, _Field(pattern="^[A-Z]+$")]],
+            "bio": _NotRequired[_Annotated[str, _Field(max_length=500)]],
+            "tag": _NotRequired[_Annotated[str, _Field(min_length=2)]],
+        },
+    )
+)
+
+ValidatedRepeatedDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedRepeatedDict",
+        {
+            "items": _NotRequired[
+                _Annotated[list[str], _Field(min_length=1, max_length=10)]
+            ],
+            "tags": _NotRequired[_Annotated[list[str], _Field(min_length=1)]],
+        },
+    )
+)
+
+ValidatedMapDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedMapDict",
+        {
+            "labels": _NotRequired[
+                _Annotated[dict[str, str], _Field(min_length=1, max_length=10)]
+            ],
+        },
+    )
+)
+
+ValidatedReservedDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedReservedDict",
+        {
+            "float": _NotRequired[_Annotated[float, _Field(gt=0.0)]],
+        },
+    )
+)
+
+ValidatedOneofDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedOneofDict",
+        {
+            "small": _NotRequired[_Optional[_Annotated[int, _Field(gt=0)]]],
+            "large": _NotRequired[_Optional[_Annotated[ProtoInt64, _Field(gt=0)]]],
+        },
+    )
+)
+
+ValidatedDurationDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedDurationDict",
+        {
+            "timeout": _NotRequired[_Optional[ProtoDurationNanos]],
+        },
+    )
+)
+
+ValidatedTimestampDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedTimestampDict",
+        {
+            "createdAt": _NotRequired[_Optional[ProtoTimestampNanos]],
+        },
+    )
+)
+
+ValidatedStringLenDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedStringLenDict",
+        {
+            "code": _NotRequired[_Annotated[str, _Field(min_length=5, max_length=5)]],
+        },
+    )
+)
+
+ValidatedStringAffixDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedStringAffixDict",
+        {
+            "url": _NotRequired[_Annotated[str, _Field(pattern="^https://")]],
+            "filename": _NotRequired[_Annotated[str, _Field(pattern="\\.go$")]],
+            "path": _NotRequired[_Annotated[str, _Field(pattern="^/home/.*\\.txt$")]],
+            "content": _NotRequired[_Annotated[str, _Field(pattern="^[a-z]+$")]],
+        },
+    )
+)
+
+ValidatedExamplesDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedExamplesDict",
+        {
+            "count": _NotRequired[_Annotated[int, _Field(gt=0)]],
+            "name": _NotRequired[_Annotated[str, _Field(min_length=1)]],
+        },
+    )
+)
+
+ValidatedFormatsDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedFormatsDict",
+        {
+            "email": _NotRequired[_Annotated[str, _AfterValidator(_validate_email)]],
+            "website": _NotRequired[_Annotated[str, _AfterValidator(_validate_uri)]],
+            "address": _NotRequired[_Annotated[str, _AfterValidator(_validate_ip)]],
+            "ratio": _NotRequired[_Annotated[float, _AfterValidator(_require_finite)]],
+            "token": _NotRequired[_Annotated[str, _AfterValidator(_validate_uuid)]],
+            "hostV4": _NotRequired[_Annotated[str, _AfterValidator(_validate_ipv4)]],
+            "hostV6": _NotRequired[_Annotated[str, _AfterValidator(_validate_ipv6)]],
+        },
+    )
+)
+
+ValidatedDroppedDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedDroppedDict",
+        {
+            "name": _NotRequired[str],
+            "blob": _NotRequired[bytes],
+            "score": _NotRequired[_Annotated[int, _Field(gt=0)]],
+        },
+    )
+)
+
+ValidatedConstDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedConstDict",
+        {
+            "tag": _NotRequired[_Literal["fixed"]],
+            "count": _NotRequired[_Literal[42]],
+            "active": _NotRequired[_Literal[True]],
+            "score": _NotRequired[_Annotated[float, _InValues(3.14)]],
+        },
+    )
+)
+
+ValidatedInDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedInDict",
+        {
+            "status": _NotRequired[_Annotated[str, _InValues("active", "inactive")]],
+            "code": _NotRequired[
+                _Annotated[
+                    str,
+                    _AfterValidator(
+                        _make_not_in_validator(frozenset({"deleted", "archived"}))
+                    ),
+                ]
+            ],
+            "priority": _NotRequired[_Annotated[int, _InValues(1, 2, 3)]],
+        },
+    )
+)
+
+ValidatedUniqueDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedUniqueDict",
+        {
+            "tags": _NotRequired[
+                _Annotated[list[str], _AfterValidator(_require_unique)]
+            ],
+            "scores": _NotRequired[
+                _Annotated[list[int], _AfterValidator(_require_unique)]
+            ],
+            "ratios": _NotRequired[
+                _Annotated[list[float], _AfterValidator(_require_unique_floats)]
+            ],
+            "digests": _NotRequired[
+                _Annotated[list[bytes], _AfterValidator(_require_unique)]
+            ],
+            "entries": _NotRequired[
+                _Annotated[
+                    list[ValidatedMapDict], _AfterValidator(_require_unique_messages)
+                ]
+            ],
+        },
+    )
+)
+
+ValidatedBytesDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedBytesDict",
+        {
+            "token": _NotRequired[_Annotated[bytes, _Field(min_length=16)]],
+            "hash": _NotRequired[
+                _Annotated[bytes, _Field(min_length=32, max_length=32)]
+            ],
+            "payload": _NotRequired[_Annotated[bytes, _Field(max_length=1024)]],
+        },
+    )
+)
+
+ValidatedStringContainsDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedStringContainsDict",
+        {
+            "topic": _NotRequired[_Annotated[str, _Field(pattern="protobuf")]],
+            "label": _NotRequired[_Annotated[str, _Field(pattern="^env-")]],
+        },
+    )
+)
+
+ValidatedRequiredDetailDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedRequiredDetailDict",
+        {
+            "value": _NotRequired[str],
+        },
+    )
+)
+
+ValidatedRequiredDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedRequiredDict",
+        {
+            "requiredName": str,
+            "requiredScore": _Annotated[int, _Field(gt=0)],
+            "requiredDetail": _NotRequired[_Optional[ValidatedRequiredDetailDict]],
+            "plainName": _NotRequired[str],
+        },
+    )
+)
+
+ValidatedCelWindowDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedCelWindowDict",
+        {
+            "start": _NotRequired[int],
+            "end": _NotRequired[int],
+        },
+    )
+)
+
+ValidatedCelDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedCelDict",
+        {
+            "quantity": _NotRequired[int],
+            "tags": _NotRequired[list[str]],
+            "code": _NotRequired[str],
+            "note": _NotRequired[_Optional[str]],
+            "window": _NotRequired[_Optional[ValidatedCelWindowDict]],
+            "level": _NotRequired[_Optional[ValidatedCel.Level]],
+            "limits": _NotRequired[dict[str, int]],
+            "legacy": _NotRequired[int],
+        },
+    )
+)
@@ -1 +1,49 @@
 # Generated by protoc-gen-pydantic.
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from .cross_options_pydantic import Language
+    from .cross_reference_pydantic import CrossRefMessage, CrossRefMessageDict
+
+_EXPORTS = {
+    "CrossRefMessage": ".cross_reference_pydantic",
+    "CrossRefMessageDict": ".cross_reference_pydantic",
+    "Language": ".cross_options_pydantic",
+}
+
+__all__ = [
+    "CrossRefMessage",
+    "CrossRefMessageDict",
+    "Language",
+]
+
+_MODELS = [
+    (".cross_reference_pydantic", "CrossRefMessage"),
+]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
+
+
+def warm_up() -> None:
+    """Build the schema of every model in this package ahead of first use.
+
+    Models are rebuilt in dependency order, so each one reuses the already
+    built schemas of the messages it refers to.
+    """
+    for module, qualname in _MODELS:
+        model = _importlib.import_module(module, __name__)
+        for part in qualname.split("."):
+            model = getattr(model, part)
+        model.model_rebuild()
@@ -2,52 +2,22 @@
 
 from typing import Optional as _Optional
 
-from pydantic import BaseModel as _BaseModel, ConfigDict as _ConfigDict, Field as _Field
+from pydantic import (
+    ConfigDict as _ConfigDict,
+    Field as _Field,
+    with_config as _with_config,
+)
+from typing_extensions import NotRequired as _NotRequired, TypedDict as _TypedDict
 
-from api.v1.messages_pydantic import Message
-
-from api.v1.scalars_pydantic import Scalars
-
-
-class _ProtoModel(_BaseModel):
-    """Base class for generated Pydantic models with ProtoJSON helpers."""
-
-    model_config = _ConfigDict(
-        use_enum_values=True,
-        ser_json_bytes="base64",
-        val_json_bytes="base64",
-        ser_json_inf_nan="strings",
-    )
-
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
+from _proto_runtime import ProtoWire, _ProtoModel
 
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
+from api.v1.messages_pydantic import Message
 
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
+from api.v1.messages_pydantic import MessageDict
 
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
+from api.v1.scalars_pydantic import Scalars
 
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
+from api.v1.scalars_pydantic import ScalarsDict
 
 
 class CrossRefMessage(_ProtoModel):
@@ -61,13 +31,31 @@ class CrossRefMessage(_ProtoModel):
 
     model_config = _ConfigDict(populate_by_name=True)
 
-    id_: "str" = _Field(
+    id_: str = _Field(
         default="",
         alias="id",
     )
 
-    referencedMessage: "_Optional[Message]" = _Field(default=None)
+    referencedMessage: _Optional[Message] = _Field(default=None)
 
-    scalarsList: "list[Scalars]" = _Field(
+    scalarsList: list[Scalars] = _Field(
         default_factory=list,
     )
+
+    __proto_wire__ = ProtoWire(
+        (1, "id_", "string"),
+        (2, "referencedMessage", "message", "Message"),
+        (3, "scalarsList", "repeated message", "Scalars"),
+    )
+
+
+CrossRefMessageDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "CrossRefMessageDict",
+        {
+            "id": _NotRequired[str],
+            "referencedMessage": _NotRequired[_Optional[MessageDict]],
+            "scalarsList": _NotRequired[list[ScalarsDict]],
+        },
+    )
+)
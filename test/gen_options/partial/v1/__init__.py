@@ -1 +1,56 @@
 # Generated by protoc-gen-pydantic.
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
+
+if _TYPE_CHECKING:
+    from .validate_partial_pydantic import (
+        ValidatedEmail,
+        ValidatedEmailDict,
+        ValidatedUUID,
+        ValidatedUUIDDict,
+    )
+
+_EXPORTS = {
+    "ValidatedEmail": ".validate_partial_pydantic",
+    "ValidatedEmailDict": ".validate_partial_pydantic",
+    "ValidatedUUID": ".validate_partial_pydantic",
+    "ValidatedUUIDDict": ".validate_partial_pydantic",
+}
+
+__all__ = [
+    "ValidatedEmail",
+    "ValidatedEmailDict",
+    "ValidatedUUID",
+    "ValidatedUUIDDict",
+]
+
+_MODELS = [
+    (".validate_partial_pydantic", "ValidatedEmail"),
+    (".validate_partial_pydantic", "ValidatedUUID"),
+]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(_importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_EXPORTS})
+
+
+def warm_up() -> None:
+    """Build the schema of every model in this package ahead of first use.
+
+    Models are rebuilt in dependency order, so each one reuses the already
+    built schemas of the messages it refers to.
+    """
+    for module, qualname in _MODELS:
+        model = _importlib.import_module(module, __name__)
+        for part in qualname.split("."):
+            model = getattr(model, part)
+        model.model_rebuild()
@@ -4,53 +4,15 @@ from typing import Annotated as _Annotated
 
 from pydantic import (
     AfterValidator as _AfterValidator,
-    BaseModel as _BaseModel,
     ConfigDict as _ConfigDict,
     Field as _Field,
+    with_config as _with_config,
 )
+from typing_extensions import NotRequired as _NotRequired, TypedDict as _TypedDict
 
-from ._proto_types import _validate_email, _validate_uuid
-
-
-class _ProtoModel(_BaseModel):
-    """Base class for generated Pydantic models with ProtoJSON helpers."""
-
-    model_config = _ConfigDict(
-        use_enum_values=True,
-        ser_json_bytes="base64",
-        val_json_bytes="base64",
-        ser_json_inf_nan="strings",
-    )
-
-    def to_proto_dict(self, **kwargs) -> dict:
-        """Serialize to a dict using ProtoJSON conventions.
+from _proto_runtime import ProtoWire, _ProtoModel
 
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump(**kwargs)
-
-    def to_proto_json(self, **kwargs) -> str:
-        """Serialize to a JSON string using ProtoJSON conventions.
-
-        Omits fields with default (zero) values and uses original proto
-        field names (camelCase aliases).
-        """
-        kwargs.setdefault("exclude_defaults", True)
-        kwargs.setdefault("by_alias", True)
-        return super().model_dump_json(**kwargs)
-
-    @classmethod
-    def from_proto_dict(cls, data: dict, **kwargs):
-        """Deserialize from a dict using ProtoJSON conventions."""
-        return cls.model_validate(data, **kwargs)
-
-    @classmethod
-    def from_proto_json(cls, json_str: str, **kwargs):
-        """Deserialize from a JSON string using ProtoJSON conventions."""
-        return cls.model_validate_json(json_str, **kwargs)
+from ._proto_types import _validate_email, _validate_uuid
 
 
 class ValidatedEmail(_ProtoModel):
@@ -63,10 +25,14 @@ class ValidatedEmail(_ProtoModel):
     """
 
     # Address must be a valid email address.
-    address: "_Annotated[str, _AfterValidator(_validate_email)]" = _Field(
+    address: _Annotated[str, _AfterValidator(_validate_email)] = _Field(
         default="",
     )
 
+    __proto_wire__ = ProtoWire(
+        (1, "address", "string"),
+    )
+
 
 class ValidatedUUID(_ProtoModel):
     """
@@ -80,7 +46,30 @@ class ValidatedUUID(_ProtoModel):
     model_config = _ConfigDict(populate_by_name=True)
 
     # Id must be a valid UUID.
-    id_: "_Annotated[str, _AfterValidator(_validate_uuid)]" = _Field(
+    id_: _Annotated[str, _AfterValidator(_validate_uuid)] = _Field(
         default="",
         alias="id",
     )
+
+    __proto_wire__ = ProtoWire(
+        (1, "id_", "string"),
+    )
+
+
+ValidatedEmailDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedEmailDict",
+        {
+            "address": _NotRequired[_Annotated[str, _AfterValidator(_validate_email)]],
+        },
+    )
+)
+
+ValidatedUUIDDict = _with_config(_ProtoModel.model_config)(
+    _TypedDict(
+        "ValidatedUUIDDict",
+        {
+            "id": _NotRequired[_Annotated[str, _AfterValidator(_validate_uuid)]],
+        },
+    )
+)
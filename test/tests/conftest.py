@@ -17,8 +17,12 @@ _PROTO_DIR = _TEST_ROOT / "proto"
 _GENERATED_FILES = sorted(
     list(Path("gen").rglob("*_pydantic.py"))
     + list(Path("gen_options").rglob("*_pydantic.py"))
+    + list(Path("gen_msgspec").rglob("*_msgspec.py"))
     + list(Path("gen").rglob("_proto_types.py"))
     + list(Path("gen_options").rglob("_proto_types.py"))
+    + list(Path("gen_msgspec").rglob("_proto_types.py"))
+    + list(Path("gen_options").glob("_proto_runtime.py"))
+    + list(Path("gen_options").rglob("__init__.py"))
 )
 
 
@@ -54,6 +58,18 @@ def load_module():
     return _load_module
 
 
+@pytest.fixture(scope="session")
+def gen_options_runtime():
+    """Register the gen_options shared runtime module under its import name.
+
+    gen_options is generated with runtime_module=_proto_runtime, so its
+    message modules import _ProtoModel with an absolute import.
+    """
+    mod = _load_module("_proto_runtime", _TEST_ROOT / "gen_options/_proto_runtime.py")
+    sys.modules.setdefault("_proto_runtime", mod)
+    return mod
+
+
 def _load_module(name, filepath):
     """Load a module from an arbitrary path under a unique name to avoid conflicts."""
     full_name = f"gen_options_test.{name}"
@@ -0,0 +1,187 @@
+"""Tests for the backend=msgspec output in gen_msgspec/."""
+
+import datetime
+import importlib.util
+import sys
+from pathlib import Path
+
+import msgspec
+import pytest
+
+GEN_MSGSPEC_DIR = Path(__file__).parent.parent / "gen_msgspec" / "api" / "v1"
+
+
+@pytest.fixture(scope="module")
+def api():
+    """Import gen_msgspec/api/v1 as a package; its modules use relative imports."""
+    pkg_name = "gen_msgspec_api_v1"
+    spec = importlib.util.spec_from_file_location(
+        pkg_name,
+        GEN_MSGSPEC_DIR / "__init__.py",
+        submodule_search_locations=[str(GEN_MSGSPEC_DIR)],
+    )
+    pkg = importlib.util.module_from_spec(spec)
+    sys.modules[pkg_name] = pkg
+    spec.loader.exec_module(pkg)
+    for name in ["scalars", "messages", "validate", "known_types", "oneofs"]:
+        importlib.import_module(f"{pkg_name}.{name}_msgspec")
+    yield pkg
+    for name in [n for n in sys.modules if n.split(".")[0] == pkg_name]:
+        del sys.modules[name]
+
+
+def decode(data, type_):
+    dec_hook = sys.modules["gen_msgspec_api_v1._proto_types"].dec_hook
+    return msgspec.json.decode(data, type=type_, dec_hook=dec_hook)
+
+
+def encode(value):
+    enc_hook = sys.modules["gen_msgspec_api_v1._proto_types"].enc_hook
+    return msgspec.json.encode(value, enc_hook=enc_hook)
+
+
+def test_structs_are_msgspec_structs(api):
+    Scalars = api.scalars_msgspec.Scalars
+    assert issubclass(Scalars, msgspec.Struct)
+    assert issubclass(Scalars.NestedMessage, msgspec.Struct)
+    assert Scalars.__struct_config__.omit_defaults
+    with pytest.raises(TypeError):
+        Scalars(1)
+
+
+def test_defaults_are_omitted(api):
+    """Proto3 zero values are left out of the encoded JSON."""
+    assert encode(api.scalars_msgspec.Scalars()) == b"{}"
+    assert encode(api.messages_msgspec.Message(first_name="")) == b"{}"
+
+
+def test_rename_uses_proto_names(api):
+    """Fields renamed to avoid shadowing builtins keep their proto name on the wire."""
+    Scalars = api.scalars_msgspec.Scalars
+    encoded = encode(Scalars(bool_=True, float_=1.5, bytes_=b"hi"))
+    assert encoded == b'{"bool":true,"float":1.5,"bytes":"aGk="}'
+    assert decode(encoded, Scalars) == Scalars(bool_=True, float_=1.5, bytes_=b"hi")
+
+
+def test_round_trip_nested(api):
+    Scalars = api.scalars_msgspec.Scalars
+    Message = api.messages_msgspec.Message
+    value = Scalars(
+        int32=1,
+        enum=api.enums_msgspec.Enum.ACTIVE,
+        nested_enum=Scalars.NestedEnum.INACTIVE,
+        message=Message(first_name="John"),
+        nested_message=Scalars.NestedMessage(last_name="Doe"),
+    )
+    encoded = encode(value)
+    assert b'"enum":"ACTIVE"' in encoded
+    assert decode(encoded, Scalars) == value
+
+
+def test_int64_round_trips_as_protojson_strings(api):
+    """ProtoJSON writes 64-bit integers as strings; the hooks read and write them."""
+    Scalars = api.scalars_msgspec.Scalars
+    payload = b'{"int64":"-9007199254740993","uint64":"18446744073709551615"}'
+    value = decode(payload, Scalars)
+    assert value.int64 == -9007199254740993
+    assert value.uint64 == 18446744073709551615
+    assert encode(value) == payload
+    assert decode(b'{"int64": 7}', Scalars).int64 == 7
+
+
+def test_int64_is_string_encoded_everywhere(api):
+    """ProtoInt64 values in fields, wrappers, lists and maps encode as strings."""
+    ProtoInt64 = sys.modules["gen_msgspec_api_v1._proto_types"].ProtoInt64
+    Scalars = api.scalars_msgspec.Scalars
+    assert encode(Scalars(int64=ProtoInt64(5), sint64_optional=ProtoInt64(0))) == (
+        b'{"int64":"5","sint64_optional":"0"}'
+    )
+    assert encode(Scalars(int64=0)) == b"{}"
+    WellKnownTypes = api.known_types_msgspec.WellKnownTypes
+    assert encode(WellKnownTypes(wkt_int64=ProtoInt64(3))) == b'{"wkt_int64":"3"}'
+    collections = importlib.import_module("gen_msgspec_api_v1.collections_msgspec")
+    value = collections.Collections(
+        int64_repeated=[ProtoInt64(1), ProtoInt64(-2)],
+        uint64_map_value={"a": ProtoInt64(3)},
+        int64_map_key={4: "b"},
+    )
+    encoded = encode(value)
+    assert b'"int64_repeated":["1","-2"]' in encoded
+    assert b'"int64_map_key":{"4":"b"}' in encoded
+    assert b'"uint64_map_value":{"a":"3"}' in encoded
+    assert decode(encoded, collections.Collections) == value
+
+
+def test_int64_is_converted_by_dec_hook(api):
+    """Decoding makes ProtoInt64 values without a per-instance __post_init__."""
+    ProtoInt64 = sys.modules["gen_msgspec_api_v1._proto_types"].ProtoInt64
+    Scalars = api.scalars_msgspec.Scalars
+    assert not hasattr(Scalars, "__post_init__")
+    value = decode(b'{"int64": "5", "uint64_optional": 6}', Scalars)
+    assert type(value.int64) is ProtoInt64
+    assert type(value.uint64_optional) is ProtoInt64
+    assert encode(Scalars(int64=5)) == b'{"int64":5}'
+
+
+@pytest.mark.parametrize("payload", [b'{"int64": "1e3"}', b'{"int64": true}'])
+def test_int64_rejects_non_integers(api, payload):
+    with pytest.raises(msgspec.ValidationError):
+        decode(payload, api.scalars_msgspec.Scalars)
+
+
+def test_decodes_pydantic_protojson(api):
+    """Both backends read the same ProtoJSON document."""
+    from api.v1.scalars_pydantic import Scalars as PydanticScalars
+
+    payload = PydanticScalars(
+        int64=2, bool_=True, bytes_=b"world", string="hello"
+    ).to_proto_json()
+    value = decode(payload, api.scalars_msgspec.Scalars)
+    expected = api.scalars_msgspec.Scalars(
+        int64=2, bool_=True, bytes_=b"world", string="hello"
+    )
+    assert value == expected
+
+
+def test_timestamp_is_datetime(api):
+    WellKnownTypes = api.known_types_msgspec.WellKnownTypes
+    value = decode(b'{"wkt_timestamp": "2024-01-15T10:30:00.5Z"}', WellKnownTypes)
+    assert value.wkt_timestamp == datetime.datetime(
+        2024, 1, 15, 10, 30, 0, 500000, tzinfo=datetime.timezone.utc
+    )
+    assert encode(value) == b'{"wkt_timestamp":"2024-01-15T10:30:00.500000Z"}'
+
+
+@pytest.mark.parametrize(
+    ("name", "payload"),
+    [
+        ("ValidatedScalars", b'{"age": 0}'),
+        ("ValidatedScalars", b'{"age": 151}'),
+        ("ValidatedScalars", b'{"ratio": 1.0}'),
+        ("ValidatedStrings", b'{"name": ""}'),
+        ("ValidatedStrings", b'{"code": "abc"}'),
+        ("ValidatedRepeated", b'{"items": []}'),
+        ("ValidatedStringAffix", b'{"filename": "main.py"}'),
+        ("ValidatedConst", b'{"tag": "other"}'),
+    ],
+)
+def test_meta_constraints_reject(api, name, payload):
+    with pytest.raises(msgspec.ValidationError):
+        decode(payload, getattr(api.validate_msgspec, name))
+
+
+def test_meta_constraints_accept(api):
+    validate = api.validate_msgspec
+    assert decode(b'{"age": 150, "ratio": 0.5}', validate.ValidatedScalars).age == 150
+    assert (
+        decode(b'{"filename": "main.go"}', validate.ValidatedStringAffix).filename
+        == "main.go"
+    )
+
+
+def test_unsupported_constraints_are_dropped(api):
+    """Constraints msgspec.Meta cannot check are reported, not enforced."""
+    source = (GEN_MSGSPEC_DIR / "validate_msgspec.py").read_text()
+    for name in ["email", "finite", "in", "not_in", "unique", "gt", "cel"]:
+        assert f"# buf.validate: {name} (not translated)" in source
+    assert decode(b'{"email": "not an email"}', api.validate_msgspec.ValidatedFormats)
@@ -1,4 +1,6 @@
+import pytest
 from api.v1.oneofs_pydantic import Oneofs
+from pydantic import ValidationError
 
 
 def test_default_none():
@@ -19,11 +21,43 @@ def test_set_b():
     assert o.a is None
 
 
-def test_set_both():
-    """Pydantic does not enforce oneof exclusivity; both can be set."""
-    o = Oneofs(a=1, b="two")
-    assert o.a == 1
-    assert o.b == "two"
+def test_set_both_rejected():
+    with pytest.raises(ValidationError, match="oneof union has more than one"):
+        Oneofs(a=1, b="two")
+    with pytest.raises(ValidationError, match="oneof union has more than one"):
+        Oneofs.from_proto_json('{"a": 1, "b": "two"}')
+
+
+def test_explicit_none_is_unset():
+    o = Oneofs(a=1, b=None)
+    assert o.which_oneof("union") == "a"
+    assert o.to_proto_dict() == {"a": 1}
+
+
+def test_which_oneof():
+    assert Oneofs().which_oneof("union") is None
+    assert Oneofs(a=0).which_oneof("union") == "a"
+    assert Oneofs(b="x").which_oneof("union") == "b"
+
+
+def test_which_oneof_follows_assignment():
+    o = Oneofs()
+    o.b = "x"
+    assert o.which_oneof("union") == "b"
+
+
+def test_which_oneof_unknown_name():
+    with pytest.raises(ValueError, match="no oneof 'other'"):
+        Oneofs().which_oneof("other")
+
+
+def test_clear_oneof():
+    o = Oneofs(a=5)
+    o.clear_oneof("union")
+    assert o.a is None
+    assert o.which_oneof("union") is None
+    assert o.model_fields_set == set()
+    assert o.to_proto_dict() == {}
 
 
 def test_json_roundtrip():
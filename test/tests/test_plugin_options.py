@@ -6,15 +6,26 @@ All options are set to non-default values:
   - use_integers_for_enums=true
   - disable_field_description=true
   - use_none_union_syntax_instead_of_optional=false
+  - runtime_module=_proto_runtime
+  - lazy_init=true
+  - defer_build=true
+  - use_integer_nanos_for_time=true
+  - format_validator_cache_size=1024
+  - use_discriminated_unions_for_oneofs=true
+  - frozen_models=true
+  - typed_dicts=true
 """
 
+import datetime
 import importlib.machinery
 import importlib.util
 import sys
 from enum import Enum as StdEnum
 from pathlib import Path
+from typing import ForwardRef
 
 import pytest
+from pydantic import ValidationError
 
 from conftest import _load_module
 
@@ -39,7 +50,7 @@ def opts_enums():
 
 
 @pytest.fixture
-def opts_messages(opts_enums):
+def opts_messages(opts_enums, gen_options_runtime):
     pkg_name = "gen_options_test.api_v1_pkg"
     mod_name = f"{pkg_name}.messages_pydantic"
     if mod_name in sys.modules:
@@ -131,6 +142,11 @@ def test_use_integers_for_enums_values_are_ints(opts_scalars):
     assert NestedEnum.NESTED_ENUM_INACTIVE == 2
 
 
+def test_use_integers_for_enums_zero_is_omitted(opts_scalars):
+    """ProtoJSON omits an enum without presence at its zero value."""
+    assert opts_scalars.Scalars(nestedEnum=0).to_proto_dict() == {}
+
+
 # --- disable_field_description=true ---
 
 
@@ -148,3 +164,422 @@ def test_use_none_union_syntax(scalars_source):
     """Source uses `Optional[T]` syntax instead of `| None` when option is false."""
     assert "_Optional" in scalars_source
     assert "| None" not in scalars_source
+
+
+# --- runtime_module=_proto_runtime ---
+
+
+def test_runtime_module_not_defined_per_file(messages_source):
+    """Generated files import _ProtoModel instead of defining their own."""
+    assert "class _ProtoModel" not in messages_source
+    assert "from _proto_runtime import ProtoWire, _ProtoModel" in messages_source
+
+
+def test_runtime_module_written_once():
+    """_ProtoModel is emitted once, at the output root."""
+    assert Path("gen_options/_proto_runtime.py").exists()
+    assert not (GEN_OPTIONS_DIR / "_proto_runtime.py").exists()
+
+
+def test_runtime_module_holds_wire_codec():
+    """The binary codec is emitted with _ProtoModel, not in each _proto_types.py."""
+    assert "class ProtoWire" in Path("gen_options/_proto_runtime.py").read_text()
+    for path in Path("gen_options").rglob("_proto_types.py"):
+        assert "class ProtoWire" not in path.read_text()
+    assert not Path("gen_options/foo/bar/v1/_proto_types.py").exists()
+
+
+def test_runtime_module_shared_base(gen_options_runtime, opts_messages, opts_scalars):
+    """Models from different files share a single base class."""
+    ProtoModel = gen_options_runtime._ProtoModel
+    assert issubclass(opts_messages.Message, ProtoModel)
+    assert issubclass(opts_scalars.Scalars, ProtoModel)
+    assert opts_messages.Message.__mro__[1] is opts_scalars.Scalars.__mro__[1]
+
+
+def test_runtime_module_proto_json_helpers(opts_messages):
+    """ProtoJSON helpers are inherited from the shared base."""
+    msg = opts_messages.Message(firstName="John")
+    assert msg.to_proto_dict() == {"firstName": "John"}
+    assert opts_messages.Message.from_proto_json('{"firstName": "John"}') == msg
+    assert opts_messages.Message.from_proto_json_many(b'[{"firstName": "John"}]') == [
+        msg
+    ]
+
+
+# --- lazy_init=true ---
+
+
+@pytest.fixture
+def opts_lazy_pkg(gen_options_runtime):
+    """Import gen_options/api/v1 as a real package via its lazy __init__.py."""
+    pkg_name = "gen_options_lazy_api_v1"
+    for name in [n for n in sys.modules if n.split(".")[0] == pkg_name]:
+        del sys.modules[name]
+    spec = importlib.util.spec_from_file_location(
+        pkg_name,
+        GEN_OPTIONS_DIR / "__init__.py",
+        submodule_search_locations=[str(GEN_OPTIONS_DIR)],
+    )
+    pkg = importlib.util.module_from_spec(spec)
+    sys.modules[pkg_name] = pkg
+    spec.loader.exec_module(pkg)
+    return pkg
+
+
+def test_lazy_init_does_not_import_modules(opts_lazy_pkg):
+    """Importing the package loads none of the message modules."""
+    assert not [n for n in sys.modules if n.startswith("gen_options_lazy_api_v1.")]
+
+
+def test_lazy_init_imports_on_first_access(opts_lazy_pkg):
+    """Accessing a name imports only the module that defines it."""
+    Message = opts_lazy_pkg.Message
+    assert Message.__module__ == "gen_options_lazy_api_v1.messages_pydantic"
+    assert "gen_options_lazy_api_v1.messages_pydantic" in sys.modules
+    assert "gen_options_lazy_api_v1.scalars_pydantic" not in sys.modules
+    assert opts_lazy_pkg.Message is Message
+
+
+def test_lazy_init_dir_lists_exports(opts_lazy_pkg):
+    names = dir(opts_lazy_pkg)
+    assert "Message" in names
+    assert "Scalars" in names
+    assert set(opts_lazy_pkg.__all__) <= set(names)
+
+
+def test_lazy_init_unknown_name(opts_lazy_pkg):
+    with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+        getattr(opts_lazy_pkg, "Missing")
+
+
+# --- defer_build=true ---
+
+
+def test_defer_build_config(gen_options_runtime):
+    assert gen_options_runtime._ProtoModel.model_config["defer_build"] is True
+
+
+def test_defer_build_models_start_incomplete(opts_lazy_pkg):
+    """Models are not built when their module is imported."""
+    assert opts_lazy_pkg.Scalars.__pydantic_complete__ is False
+
+
+def test_defer_build_builds_on_first_use(opts_lazy_pkg):
+    msg = opts_lazy_pkg.Message(firstName="John")
+    assert msg.to_proto_dict() == {"firstName": "John"}
+    assert opts_lazy_pkg.Message.__pydantic_complete__ is True
+
+
+def test_warm_up_builds_every_model(opts_lazy_pkg):
+    opts_lazy_pkg.warm_up()
+    assert opts_lazy_pkg.Scalars.__pydantic_complete__ is True
+    assert opts_lazy_pkg.Scalars.NestedMessage.__pydantic_complete__ is True
+    assert opts_lazy_pkg.Outer.Inner.Deepest.__pydantic_complete__ is True
+    assert opts_lazy_pkg.TreeNode.__pydantic_complete__ is True
+
+
+def test_warm_up_dependency_order(opts_lazy_pkg):
+    """A model is listed after the messages its fields refer to."""
+    order = [qualname for _, qualname in opts_lazy_pkg._MODELS]
+    assert order.index("Scalars.NestedMessage") < order.index("Scalars")
+    assert order.index("ValidatedRequired.Detail") < order.index("ValidatedRequired")
+
+
+def test_warm_up_builds_oneof_branches_first(opts_lazy_pkg):
+    """The union annotation refers to the branch models nested in the message."""
+    order = [qualname for _, qualname in opts_lazy_pkg._MODELS]
+    assert order.index("Oneofs.UnionA") < order.index("Oneofs")
+    assert order.index("Oneofs.UnionB") < order.index("Oneofs")
+
+
+# --- use_integer_nanos_for_time=true ---
+
+
+@pytest.fixture
+def opts_wkt(opts_lazy_pkg):
+    return opts_lazy_pkg.WellKnownTypes
+
+
+def test_integer_nanos_types_are_int(opts_wkt):
+    wkt = opts_wkt(wktTimestamp=1, wktDuration=-1)
+    assert type(wkt.wktTimestamp) is int
+    assert type(wkt.wktDuration) is int
+
+
+def test_integer_nanos_from_proto_json_is_exact(opts_wkt):
+    wkt = opts_wkt.from_proto_json(
+        '{"wktTimestamp": "2024-01-15T10:30:00.123456789Z",'
+        ' "wktDuration": "-315576000000.000000001s"}'
+    )
+    assert wkt.wktTimestamp == 1705314600_123456789
+    assert wkt.wktDuration == -315576000000_000000001
+
+
+def test_integer_nanos_to_proto_json_strings(opts_wkt):
+    wkt = opts_wkt(wktTimestamp=1705314600_123456789, wktDuration=-1_500_000_000)
+    assert wkt.to_proto_dict(mode="json") == {
+        "wktTimestamp": "2024-01-15T10:30:00.123456789Z",
+        "wktDuration": "-1.5s",
+    }
+    assert opts_wkt(wktTimestamp=-1).to_proto_dict(mode="json") == {
+        "wktTimestamp": "1969-12-31T23:59:59.999999999Z"
+    }
+
+
+def test_integer_nanos_accepts_offsets_and_native_types(opts_wkt):
+    utc = datetime.timezone.utc
+    assert (
+        opts_wkt(wktTimestamp="2024-01-15T12:30:00+02:00").wktTimestamp
+        == opts_wkt(wktTimestamp="2024-01-15T10:30:00Z").wktTimestamp
+        == opts_wkt(
+            wktTimestamp=datetime.datetime(2024, 1, 15, 10, 30, tzinfo=utc)
+        ).wktTimestamp
+    )
+    wkt = opts_wkt(wktDuration=datetime.timedelta(seconds=-1, microseconds=-5))
+    assert wkt.wktDuration == -1_000_005_000
+
+
+def test_integer_nanos_binary_roundtrip(opts_wkt):
+    wkt = opts_wkt(wktTimestamp=-1, wktDuration=-1_000_000_001)
+    assert opts_wkt.from_proto_bytes(wkt.to_proto_bytes()) == wkt
+
+
+def test_integer_nanos_trusted_construct(opts_wkt):
+    data = {"wktTimestamp": "1970-01-01T00:00:01.5Z", "wktDuration": "2.000000001s"}
+    wkt = opts_wkt.from_proto_dict_trusted(data)
+    assert wkt.wktTimestamp == 1_500_000_000
+    assert wkt.wktDuration == 2_000_000_001
+
+
+# --- use_discriminated_unions_for_oneofs=true ---
+
+
+@pytest.fixture
+def opts_oneofs(opts_lazy_pkg):
+    return opts_lazy_pkg.Oneofs
+
+
+def test_discriminated_unions_fold_members(opts_oneofs):
+    o = opts_oneofs(a=1)
+    assert isinstance(o.union, opts_oneofs.UnionA)
+    assert o.union.case == "a"
+    assert o.union.value == 1
+    assert o.a == 1
+    assert o.b is None
+    assert opts_oneofs(union={"case": "b", "value": "x"}).b == "x"
+    assert opts_oneofs().union is None
+
+
+def test_discriminated_unions_validate_branch(opts_oneofs):
+    with pytest.raises(ValidationError, match=r"union\.a\.value"):
+        opts_oneofs(a="not an int")
+    with pytest.raises(ValidationError, match="oneof union has more than one"):
+        opts_oneofs(a=1, b="x")
+
+
+def test_discriminated_unions_proto_json_is_flat(opts_oneofs):
+    o = opts_oneofs.from_proto_json('{"b": "x"}')
+    assert o.union == opts_oneofs.UnionB(value="x")
+    assert o.to_proto_dict() == {"b": "x"}
+    assert opts_oneofs(a=0).to_proto_json() == '{"a":0}'
+    assert opts_oneofs().to_proto_dict() == {}
+
+
+def test_discriminated_unions_which_and_clear(opts_oneofs):
+    # gen_options models are frozen (frozen_models=true); clear_oneof needs a
+    # mutable subclass.
+    class MutableOneofs(opts_oneofs, frozen=False):
+        pass
+
+    o = MutableOneofs(b="x")
+    assert o.which_oneof("union") == "b"
+    o.clear_oneof("union")
+    assert o.which_oneof("union") is None
+    assert o.to_proto_dict() == {}
+
+
+def test_frozen_models_mutable_subclass_keeps_own_fields_set(opts_oneofs):
+    """Mutating a subclass instance leaves the frozen instances' fields sets."""
+
+    class MutableOneofs(opts_oneofs, frozen=False):
+        pass
+
+    mutable = MutableOneofs(b="x")
+    frozen = opts_oneofs(b="y")
+    mutable.clear_oneof("union")
+    assert mutable.model_fields_set == set()
+    assert frozen.model_fields_set == {"union"}
+    assert opts_oneofs(b="z").model_fields_set == {"union"}
+    assert opts_oneofs(a=1).model_dump(exclude_unset=True) == {"a": 1}
+
+
+def test_discriminated_unions_binary_and_trusted(opts_oneofs):
+    o = opts_oneofs(b="x")
+    assert opts_oneofs.from_proto_bytes(o.to_proto_bytes()) == o
+    assert opts_oneofs.from_proto_dict_trusted({"a": 3}).union == (
+        opts_oneofs.UnionA(value=3)
+    )
+
+
+def test_discriminated_unions_field_mask(opts_oneofs):
+    """A FieldMask selects oneof members by their own names."""
+    o = opts_oneofs.from_proto_json('{"a": 3}', field_mask=["a", "b"])
+    assert o.union == opts_oneofs.UnionA(value=3)
+    assert o == opts_oneofs(a=3)
+
+
+def test_discriminated_unions_field_mask_utilities(opts_oneofs):
+    """ProtoFieldMask reads and sets oneof members through their union."""
+    mask = opts_oneofs.proto_field_mask("b")
+    assert mask.project(opts_oneofs(a=1)) == opts_oneofs()
+    assert mask.project(opts_oneofs(b="x")).union == opts_oneofs.UnionB(value="x")
+    full = opts_oneofs.proto_field_mask()
+    assert full.diff(opts_oneofs(a=1), opts_oneofs(b="x")) == ["a", "b"]
+    with pytest.raises(TypeError, match="Oneofs is frozen"):
+        mask.merge_into(opts_oneofs(a=1), opts_oneofs(b="x"))
+
+
+def test_discriminated_unions_merge(opts_oneofs):
+    merged = opts_oneofs.__proto_wire__.merged(opts_oneofs(a=1), opts_oneofs(b="x"))
+    assert merged == opts_oneofs(b="x")
+    assert merged.model_fields_set == {"union"}
+    with pytest.raises(TypeError, match="Oneofs is frozen"):
+        opts_oneofs(a=1).merge_from(opts_oneofs(b="x"))
+
+
+def test_discriminated_unions_keep_member_constraints(opts_lazy_pkg):
+    validated = opts_lazy_pkg.ValidatedOneof
+    assert validated(large="5").large == 5
+    with pytest.raises(ValidationError, match="greater than 0"):
+        validated(small=0)
+
+
+# --- frozen_models=true ---
+
+
+def test_frozen_models_reject_assignment(opts_lazy_pkg):
+    message = opts_lazy_pkg.Message(firstName="a")
+    with pytest.raises(ValidationError, match="frozen"):
+        message.firstName = "b"
+    with pytest.raises(TypeError, match="Oneofs is frozen"):
+        opts_lazy_pkg.Oneofs(a=1).clear_oneof("union")
+
+
+def test_frozen_models_hash_field_values(opts_lazy_pkg):
+    """Equal models hash equal, lists and maps included, and work as keys."""
+    ValidatedMap = opts_lazy_pkg.ValidatedMap
+    a = ValidatedMap(labels={"k": "v", "l": "w"})
+    b = ValidatedMap.from_proto_json('{"labels": {"l": "w", "k": "v"}}')
+    assert a == b
+    assert hash(a) == hash(b)
+    assert {a: 1}[b] == 1
+    repeated = opts_lazy_pkg.Collections(stringRepeated=["x", "y"])
+    assert hash(repeated) == hash(opts_lazy_pkg.Collections(stringRepeated=["x", "y"]))
+    assert len({repeated, opts_lazy_pkg.Collections(stringRepeated=["y", "x"])}) == 2
+
+
+def test_frozen_models_cache_hash(opts_lazy_pkg):
+    message = opts_lazy_pkg.Message(firstName="a")
+    value = hash(message)
+    assert message.__proto_hash__ == value
+    assert hash(message) == value
+    copied = message.model_copy(update={"firstName": "b"})
+    assert hash(copied) != value
+
+
+def test_frozen_models_share_fields_sets(opts_lazy_pkg):
+    """Instances with the same fields set hold one set object."""
+    Message = opts_lazy_pkg.Message
+    a = Message(firstName="a")
+    b = Message.from_proto_json('{"firstName": "b"}')
+    c = Message.from_proto_dict_trusted({"firstName": "c"})
+    assert a.model_fields_set == {"firstName"}
+    assert a.__pydantic_fields_set__ is b.__pydantic_fields_set__
+    assert a.__pydantic_fields_set__ is c.__pydantic_fields_set__
+    assert (
+        Message(lastName="d").__pydantic_fields_set__ is not a.__pydantic_fields_set__
+    )
+    copied = a.model_copy(update={"lastName": "e"})
+    assert copied.model_fields_set == {"firstName", "lastName"}
+    assert a.model_fields_set == {"firstName"}
+
+
+def test_frozen_models_shared_fields_set_is_read_only(opts_lazy_pkg):
+    """The shared set is read-only, so one instance cannot change the others."""
+    Message = opts_lazy_pkg.Message
+    a, b = Message(firstName="a"), Message(firstName="b")
+    with pytest.raises(TypeError, match="read-only"):
+        a.model_fields_set.add("lastName")
+    assert b.model_fields_set == {"firstName"}
+    copied = a.model_copy(update={"lastName": "e"}, deep=True)
+    assert copied.model_fields_set == {"firstName", "lastName"}
+
+
+def test_frozen_models_unique_messages_by_hash(opts_lazy_pkg):
+    """repeated.unique on messages checks the hash set directly."""
+    ValidatedUnique = opts_lazy_pkg.ValidatedUnique
+    entry = {"labels": {"k": "v"}}
+    assert len(ValidatedUnique(entries=[entry, {"labels": {"k": "w"}}]).entries) == 2
+    with pytest.raises(ValidationError, match="unique"):
+        ValidatedUnique(entries=[entry, entry])
+
+
+# --- typed_dicts=true ---
+
+
+def test_typed_dicts_validate_into_plain_dicts(opts_lazy_pkg):
+    """ProtoJSON is converted field by field, nested messages included."""
+    adapter = opts_lazy_pkg.Scalars.proto_dict_adapter()
+    assert adapter is opts_lazy_pkg.Scalars.proto_dict_adapter()
+    value = adapter.validate_json(
+        '{"int64": "-5", "bytes": "aGk=", "bool": true, "double": "NaN",'
+        ' "nestedMessage": {"lastName": "Doe"}}'
+    )
+    assert type(value) is dict
+    assert value["int64"] == -5
+    assert value["bytes"] == b"hi"
+    assert value["bool"] is True
+    assert value["nestedMessage"] == {"lastName": "Doe"}
+    assert "int32" not in value
+
+
+def test_typed_dicts_dump_proto_json(opts_lazy_pkg):
+    """Dumping a mirror writes the same ProtoJSON as the model."""
+    Scalars = opts_lazy_pkg.Scalars
+    payload = '{"int64":"-5","bool":true,"double":"NaN","bytes":"aGk="}'
+    value = Scalars.proto_dict_adapter().validate_json(payload)
+    assert Scalars.proto_dict_adapter().dump_json(value).decode() == payload
+    assert Scalars.from_proto_json(payload).to_proto_json() == payload
+
+
+def test_typed_dicts_are_exported(opts_lazy_pkg):
+    mirror = opts_lazy_pkg.ScalarsNestedMessageDict
+    assert mirror.__name__ == "ScalarsNestedMessageDict"
+    assert mirror.__optional_keys__ == {"firstName", "lastName"}
+    required = opts_lazy_pkg.ValidatedRequiredDict.__required_keys__
+    assert required == {"requiredName", "requiredScore"}
+
+
+def test_typed_dicts_check_constraints(opts_lazy_pkg):
+    adapter = opts_lazy_pkg.ValidatedScalars.proto_dict_adapter()
+    assert adapter.validate_json('{"age": 150}') == {"age": 150}
+    with pytest.raises(ValidationError, match="greater than 0"):
+        adapter.validate_json('{"age": 0}')
+    unique = opts_lazy_pkg.ValidatedUnique.proto_dict_adapter()
+    entry = {"labels": {"k": "v"}}
+    with pytest.raises(ValidationError, match="unique"):
+        unique.validate_python({"entries": [entry, entry]})
+
+
+def test_typed_dicts_wrap_long_entries_unquoted(opts_lazy_pkg):
+    """Entry types too long for one line are wrapped, not made forward refs."""
+    entries = opts_lazy_pkg.ValidatedUniqueDict.__annotations__["entries"]
+    assert not isinstance(entries.__args__[0], ForwardRef)
+
+
+def test_typed_dicts_list_oneof_members(opts_lazy_pkg):
+    """Mirrors list the oneof members, not the discriminated union attribute."""
+    adapter = opts_lazy_pkg.Oneofs.proto_dict_adapter()
+    assert adapter.validate_json('{"b": "x"}') == {"b": "x"}
+    assert opts_lazy_pkg.OneofsDict.__optional_keys__ == {"a", "b"}
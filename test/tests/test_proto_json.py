@@ -8,13 +8,19 @@ Verifies that:
 """
 
 import datetime
+import io
 import json
 
+import pytest
+from pydantic import ValidationError
+
 from api.v1.collections_pydantic import Collections
 from api.v1.enums_pydantic import Enum
 from api.v1.known_types_pydantic import WellKnownTypes
 from api.v1.messages_pydantic import Message
+from api.v1.oneofs_pydantic import Oneofs
 from api.v1.scalars_pydantic import Scalars
+from api.v1.validate_pydantic import ValidatedCel
 
 from conftest import make_scalars
 
@@ -102,6 +108,18 @@ def test_to_proto_json_enum():
     assert result["enum"] == "ACTIVE"
 
 
+def test_to_proto_json_omits_zero_enum():
+    """An enum without presence is omitted at its zero value, set or not."""
+    s = Scalars(enum="UNSPECIFIED", nested_enum="UNSPECIFIED", int32=1)
+    assert s.to_proto_dict() == {"int32": 1}
+    assert json.loads(s.to_proto_json()) == {"int32": 1}
+    assert s.to_proto_dict(by_alias=False) == {"int32": 1}
+    assert s.to_proto_dict(exclude_defaults=False)["nested_enum"] == "UNSPECIFIED"
+    assert Scalars(enum_optional="UNSPECIFIED").to_proto_dict() == {
+        "enum_optional": "UNSPECIFIED"
+    }
+
+
 def test_to_proto_json_override_exclude_defaults():
     """Callers can override exclude_defaults=False to include all fields."""
     m = Message()
@@ -204,3 +222,424 @@ def test_to_proto_json_collections_roundtrip():
     restored = Collections.from_proto_json(json_str)
     assert restored.int32_repeated == [1, 2, 3]
     assert restored.string_map_key == {"a": "b"}
+
+
+# --- Batch helpers ---
+
+
+def test_from_proto_dicts():
+    """from_proto_dicts validates a batch of dicts, from any iterable."""
+    items = ({"first_name": str(i)} for i in range(3))
+    result = Message.from_proto_dicts(items)
+    assert result == [
+        Message(first_name="0"),
+        Message(first_name="1"),
+        Message(first_name="2"),
+    ]
+
+
+def test_from_proto_json_many():
+    """from_proto_json_many validates a whole JSON array."""
+    data = b'[{"first_name": "John"}, {}, {"int64": "-5"}]'
+    result = Scalars.from_proto_json_many(data)
+    assert result[2].int64 == -5
+    result = Message.from_proto_json_many(b'[{"first_name": "John"}, {}]')
+    assert result == [Message(first_name="John"), Message()]
+
+
+def test_to_proto_dicts_matches_to_proto_dict():
+    """to_proto_dicts applies the same conventions as to_proto_dict."""
+    models = [make_scalars(), Scalars(), Scalars(bytes_=b"\x00")]
+    assert Scalars.to_proto_dicts(models) == [m.to_proto_dict() for m in models]
+    assert Scalars.to_proto_dicts(iter(models), by_alias=False)[2] == {
+        "bytes_": b"\x00"
+    }
+
+
+def test_to_proto_json_many_roundtrip():
+    """to_proto_json_many output is a JSON array of to_proto_json objects."""
+    models = [make_scalars(), Scalars()]
+    data = Scalars.to_proto_json_many(models)
+    assert json.loads(data) == [json.loads(m.to_proto_json()) for m in models]
+    assert Scalars.from_proto_json_many(data) == models
+
+
+def test_list_adapter_cached_per_class():
+    """The list[cls] TypeAdapter is built once per class."""
+    Message.from_proto_dicts([])
+    Scalars.from_proto_dicts([])
+    adapter = Message._proto_list_adapter()
+    assert Message._proto_list_adapter() is adapter
+    assert Scalars._proto_list_adapter() is not adapter
+
+
+# --- Streaming helpers ---
+
+
+def test_ndjson_roundtrip():
+    """write_proto_ndjson writes one to_proto_json line per model."""
+    models = [make_scalars(), Scalars(), Scalars(string="x\ny")]
+    fp = io.StringIO()
+    Scalars.write_proto_ndjson(fp, iter(models))
+    lines = fp.getvalue().splitlines()
+    assert lines == [m.to_proto_json() for m in models]
+    fp.seek(0)
+    assert list(Scalars.iter_proto_ndjson(fp)) == models
+
+
+def test_iter_proto_ndjson_binary_skips_blank_lines():
+    """iter_proto_ndjson reads binary streams and skips blank lines."""
+    fp = io.BytesIO(b'{"first_name": "a"}\n\n{"first_name": "b"}\r\n')
+    result = Message.iter_proto_ndjson(fp)
+    assert next(result) == Message(first_name="a")
+    assert list(result) == [Message(first_name="b")]
+
+
+def test_delimited_roundtrip():
+    """write/iter_proto_delimited roundtrip, whatever the read chunk size."""
+    models = [make_scalars(), Scalars(), Scalars(string="x" * 300)]
+    fp = io.BytesIO()
+    Scalars.write_proto_delimited(fp, models)
+    for chunk_size in (1, 7, 65536):
+        fp.seek(0)
+        assert list(Scalars.iter_proto_delimited(fp, chunk_size=chunk_size)) == models
+
+
+def test_iter_proto_delimited_truncated():
+    """A stream that ends inside a message raises ValueError."""
+    fp = io.BytesIO()
+    Message.write_proto_delimited(fp, [Message(first_name="John")])
+    truncated = io.BytesIO(fp.getvalue()[:-1])
+    with pytest.raises(ValueError, match="truncated"):
+        list(Message.iter_proto_delimited(truncated))
+
+
+# --- Trusted construction ---
+
+
+def test_from_proto_dict_trusted_json_roundtrip():
+    """from_proto_dict_trusted decodes ProtoJSON int64 strings and base64 bytes."""
+    s = make_scalars(int64=-(2**40), uint64=2**64 - 1, int64_optional=0)
+    data = json.loads(s.to_proto_json())
+    assert data["int64"] == str(-(2**40))
+    restored = Scalars.from_proto_dict_trusted(data)
+    assert restored == s
+    assert isinstance(restored.message, Message)
+
+
+def test_from_proto_dict_trusted_python_values():
+    """Values already in model form (to_proto_dict output) are passed through."""
+    s = make_scalars()
+    assert Scalars.from_proto_dict_trusted(s.to_proto_dict()) == s
+
+
+def test_from_proto_dict_trusted_collections():
+    """Lists and maps are rebuilt; JSON map keys are decoded to their types."""
+    c = Collections(
+        int64_repeated=[1, -2],
+        message_repeated=[Message(first_name="a")],
+        sint32_map_key={-3: "x"},
+        bool_map_key={True: "t"},
+        message_map_value={"m": Message(last_name="b")},
+        bytes_map_value={"b": b"\x00\xff"},
+    )
+    restored = Collections.from_proto_dict_trusted(json.loads(c.to_proto_json()))
+    assert restored == c
+    assert isinstance(restored.message_map_value["m"], Message)
+
+
+def test_from_proto_dict_trusted_well_known_types():
+    """Timestamp and Duration strings are parsed."""
+    data = {"wkt_timestamp": "2024-01-15T10:30:00.250Z", "wkt_duration": "1.5s"}
+    w = WellKnownTypes.from_proto_dict_trusted(data)
+    assert w.wkt_timestamp == datetime.datetime(
+        2024, 1, 15, 10, 30, 0, 250000, tzinfo=datetime.timezone.utc
+    )
+    assert w.wkt_duration == datetime.timedelta(seconds=1.5)
+
+
+def test_from_proto_dict_trusted_skips_unknown_and_null():
+    """Unknown keys and nulls are dropped; unset fields keep their defaults."""
+    m = Message.from_proto_dict_trusted({"first_name": "a", "x": 1, "last_name": None})
+    assert m == Message(first_name="a")
+    assert m.model_fields_set == {"first_name"}
+
+
+# --- FieldMask projection ---
+
+
+def test_from_proto_json_field_mask_selects_fields():
+    """Only the selected fields are set; the others keep their defaults."""
+    payload = make_scalars().to_proto_json()
+    s = Scalars.from_proto_json(
+        payload, field_mask=["int64", "bool", "nested_message.last_name"]
+    )
+    assert s.model_fields_set == {"int64", "bool_", "nested_message"}
+    assert s.int64 == make_scalars().int64
+    assert s.string == ""
+    assert s.message is None
+    assert s.nested_message.model_fields_set == {"last_name"}
+    assert s.nested_message.first_name == ""
+
+
+def test_from_proto_json_field_mask_whole_message():
+    payload = make_scalars().to_proto_json()
+    s = Scalars.from_proto_json(payload, field_mask="message,string")
+    assert s.message == make_scalars().message
+    assert s.string == make_scalars().string
+    assert s.model_fields_set == {"message", "string"}
+
+
+def test_from_proto_json_field_mask_validates_selected_fields():
+    with pytest.raises(ValidationError):
+        Scalars.from_proto_json('{"int32": "x"}', field_mask=["int32"])
+    s = Scalars.from_proto_json('{"int32": 1, "string": 2}', field_mask=["int32"])
+    assert s.int32 == 1
+
+
+def test_from_proto_json_field_mask_runs_field_validators():
+    """CEL field rules of the selected fields hold, as they do without a mask."""
+    payload = '{"quantity": -1, "code": "ABC"}'
+    with pytest.raises(ValidationError, match="quantity must be positive"):
+        ValidatedCel.from_proto_json(payload, field_mask=["quantity"])
+    m = ValidatedCel.from_proto_json(payload, field_mask=["code"])
+    assert m.code == "ABC"
+    assert m.quantity == 0
+
+
+def test_from_proto_json_field_mask_unknown_paths():
+    with pytest.raises(ValueError, match="Scalars has no field 'nope'"):
+        Scalars.from_proto_json("{}", field_mask=["nope"])
+    with pytest.raises(ValueError, match="Scalars.int32 is not a singular message"):
+        Scalars.from_proto_json("{}", field_mask=["int32.value"])
+    with pytest.raises(ValueError, match="not a singular message"):
+        Collections.from_proto_json("{}", field_mask=["message_repeated.first_name"])
+
+
+def test_from_proto_json_field_mask_cached():
+    Message.from_proto_json("{}", field_mask=["first_name"])
+    projections = Message.__proto_wire__._projections
+    projection = projections[("first_name",)]
+    Message.from_proto_json('{"first_name": "a"}', field_mask=["first_name"])
+    assert projections[("first_name",)] is projection
+
+
+# --- FieldMask utilities ---
+
+
+def test_field_mask_paths():
+    mask = Scalars.proto_field_mask("int32,bool,message.first_name")
+    assert mask.paths == ["int32", "bool", "message.first_name"]
+    assert Scalars.proto_field_mask(["int32", "bool", "message.first_name"]) is mask
+    assert Message.proto_field_mask().paths == ["first_name", "last_name"]
+    with pytest.raises(ValueError, match="Scalars has no field 'nope'"):
+        Scalars.proto_field_mask("nope")
+
+
+def test_field_mask_project():
+    s = Scalars.proto_field_mask(["int32", "nested_message.last_name"]).project(
+        make_scalars()
+    )
+    assert s.model_fields_set == {"int32", "nested_message"}
+    assert s.int32 == make_scalars().int32
+    assert s.string == ""
+    assert s.nested_message == Scalars.NestedMessage(last_name="Doe")
+
+
+def test_field_mask_merge_into():
+    """Masked scalars are overwritten, repeated fields appended, maps updated."""
+    dst = Collections(
+        int32_repeated=[1], string_map_value={"a": "1", "b": "2"}, bool_repeated=[True]
+    )
+    src = Collections(int32_repeated=[2], string_map_value={"b": "3"})
+    Collections.proto_field_mask("int32_repeated,string_map_value").merge_into(dst, src)
+    assert dst.int32_repeated == [1, 2]
+    assert dst.string_map_value == {"a": "1", "b": "3"}
+    assert dst.bool_repeated == [True]
+
+    Collections.proto_field_mask("int32_repeated,bool_repeated").merge_into(
+        dst, src, replace_repeated_field=True
+    )
+    assert dst.int32_repeated == [2]
+    assert dst.bool_repeated == []
+
+
+def test_field_mask_merge_into_messages():
+    """Message fields are merged, or replaced with replace_message_field."""
+    dst = Scalars(string="a", message=Message(first_name="John", last_name="Doe"))
+    src = Scalars(message=Message(first_name="Jane"))
+    mask = Scalars.proto_field_mask("string,message")
+    mask.merge_into(dst, src)
+    assert dst.string == ""
+    assert dst.message == Message(first_name="Jane", last_name="Doe")
+    mask.merge_into(dst, src, replace_message_field=True)
+    assert dst.message == Message(first_name="Jane")
+    mask.merge_into(dst, Scalars(), replace_message_field=True)
+    assert dst.message is None
+    assert dst.model_fields_set == {"string"}
+
+
+def test_field_mask_merge_into_copies_source_messages():
+    """Messages taken from the source are copies, as merge_from makes them."""
+    src = Collections(
+        message_repeated=[Message(first_name="a")],
+        message_map_value={"k": Message(first_name="b")},
+    )
+    dst = Collections()
+    Collections.proto_field_mask("message_repeated,message_map_value").merge_into(
+        dst, src
+    )
+    dst.message_repeated[0].first_name = "MUT"
+    dst.message_map_value["k"].first_name = "MUT"
+    assert src.message_repeated == [Message(first_name="a")]
+    assert src.message_map_value == {"k": Message(first_name="b")}
+
+    src = Scalars(message=Message(first_name="Jane"))
+    dst = Scalars()
+    Scalars.proto_field_mask("message").merge_into(dst, src)
+    assert dst.message == src.message
+    assert dst.message is not src.message
+
+
+def test_field_mask_merge_into_sub_paths():
+    """A path through a message field only applies when the source sets it."""
+    dst = Scalars(message=Message(first_name="John", last_name="Doe"))
+    mask = Scalars.proto_field_mask("message.first_name")
+    mask.merge_into(dst, Scalars())
+    assert dst.message == Message(first_name="John", last_name="Doe")
+    mask.merge_into(dst, Scalars(message=Message(last_name="Roe")))
+    assert dst.message == Message(last_name="Doe")
+
+
+def test_field_mask_merge_into_oneof():
+    dst = Oneofs(a=1)
+    Oneofs.proto_field_mask("b").merge_into(dst, Oneofs(b="x"))
+    assert dst.which_oneof("union") == "b"
+    assert dst.a is None
+    Oneofs.proto_field_mask("b").merge_into(dst, Oneofs())
+    assert dst.which_oneof("union") is None
+
+
+def test_field_mask_diff():
+    a = make_scalars()
+    b = a.model_copy(
+        update={"int32": 7, "nested_message": Scalars.NestedMessage(first_name="x")}
+    )
+    full = Scalars.proto_field_mask()
+    assert full.diff(a, a) == []
+    assert full.diff(a, b) == [
+        "int32",
+        "nested_message.first_name",
+        "nested_message.last_name",
+    ]
+    assert Scalars.proto_field_mask("string,nested_message").diff(a, b) == [
+        "nested_message.first_name",
+        "nested_message.last_name",
+    ]
+    assert Scalars.proto_field_mask("message").diff(a, Scalars()) == ["message"]
+
+
+# --- merge_from ---
+
+
+def test_merge_from_scalars():
+    """Set fields overwrite; zero values without presence do not."""
+    dst = make_scalars()
+    dst.merge_from(
+        Scalars(int32=0, string="x", int32_optional=0, enum_optional="UNSPECIFIED")
+    )
+    assert dst.int32 == make_scalars().int32
+    assert dst.string == "x"
+    assert dst.int32_optional == 0
+    assert dst.enum_optional == Enum.UNSPECIFIED
+    assert dst.model_fields_set >= {"string", "int32_optional", "enum_optional"}
+
+
+def test_merge_from_messages():
+    """Message fields merge recursively without changing either side's messages."""
+    dst = make_scalars()
+    message = dst.message
+    src = Scalars(message=Message(last_name="Roe"), message_optional=Message())
+    dst.merge_from(src)
+    assert dst.message == Message(first_name="John", last_name="Roe")
+    assert message == Message(first_name="John", last_name="Doe")
+    assert dst.message_optional == src.message_optional
+    assert dst.message_optional is not src.message_optional
+    dst.merge_from(Scalars(message_optional=Message(first_name="a")))
+    assert src.message_optional == Message()
+
+
+def test_merge_from_copies_source_messages():
+    """Messages taken from the source are copies, as MergeFrom makes them."""
+    dst = Collections()
+    src = Collections(
+        message_repeated=[Message(first_name="a")],
+        message_map_value={"k": Message(first_name="b")},
+    )
+    dst.merge_from(src)
+    dst.message_repeated[0].first_name = "MUT"
+    dst.message_map_value["k"].first_name = "MUT"
+    assert src.message_repeated == [Message(first_name="a")]
+    assert src.message_map_value == {"k": Message(first_name="b")}
+
+
+def test_merge_from_collections():
+    """Repeated fields are appended to, maps updated key by key."""
+    dst = Collections(int32_repeated=[1], string_map_value={"a": "1", "b": "2"})
+    src = Collections(
+        int32_repeated=[2, 3], string_map_value={"b": "3"}, message_repeated=[Message()]
+    )
+    dst.merge_from(src)
+    assert dst.int32_repeated == [1, 2, 3]
+    assert dst.string_map_value == {"a": "1", "b": "3"}
+    assert dst.message_repeated == [Message()]
+    assert src.int32_repeated == [2, 3]
+
+
+def test_merge_from_oneof():
+    dst = Oneofs(a=1)
+    dst.merge_from(Oneofs())
+    assert dst.which_oneof("union") == "a"
+    dst.merge_from(Oneofs(b="x"))
+    assert dst.which_oneof("union") == "b"
+    assert dst.a is None
+    assert dst.model_fields_set == {"b"}
+
+
+def test_merge_from_rejects_other_classes():
+    with pytest.raises(TypeError, match="cannot merge Message into Scalars"):
+        Scalars().merge_from(Message())
+
+
+# --- Default omission ---
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        Scalars(),
+        make_scalars(),
+        Scalars(int32_optional=0, string_optional="", enum_optional="UNSPECIFIED"),
+        Scalars(double=-0.0, message=Message(), nested_message={"first_name": ""}),
+        Collections(
+            int32_repeated=[0],
+            message_repeated=[Message(), Message(first_name="a")],
+            message_map_value={"m": Message(), "n": Message(last_name="b")},
+            string_map_key={"": ""},
+        ),
+        WellKnownTypes(wkt_int64=0, wkt_string="", wkt_struct={}, wkt_list_value=[]),
+    ],
+)
+def test_batch_serialization_omits_defaults_like_single(model):
+    """to_proto_dicts/to_proto_json_many omit the same fields as to_proto_dict."""
+    expected = model.to_proto_dict()
+    assert type(model).to_proto_dicts([model, model]) == [expected, expected]
+    assert json.loads(type(model).to_proto_json_many([model])) == [
+        json.loads(model.to_proto_json())
+    ]
+
+
+def test_to_proto_dict_explicit_exclude_keeps_exclude_defaults():
+    """Passing exclude still omits default values."""
+    m = Message(first_name="John", last_name="Doe")
+    assert m.to_proto_dict(exclude={"last_name"}) == {"first_name": "John"}
@@ -10,9 +10,12 @@ Verifies that:
 
 import base64
 import datetime
+import json
 
 import pytest
+from pydantic import ValidationError
 
+from api.v1.collections_pydantic import Collections
 from api.v1.enums_pydantic import Enum
 from api.v1.known_types_pydantic import WellKnownTypes
 from api.v1.messages_pydantic import Message
@@ -137,6 +140,23 @@ def test_int64_accepts_string_input():
     assert wkt.wkt_uint64 == 9007199254740993
 
 
+def test_int64_repeated_json_roundtrip():
+    """Repeated int64 values are strings in JSON and accept strings or numbers."""
+    c = Collections.from_proto_json('{"int64_repeated": ["-1", 2, "9007199254740993"]}')
+    assert c.int64_repeated == [-1, 2, 9007199254740993]
+    assert json.loads(c.to_proto_json()) == {
+        "int64_repeated": ["-1", "2", "9007199254740993"]
+    }
+
+
+def test_int64_rejects_non_integer_string():
+    """Non-integer strings are rejected rather than truncated."""
+    with pytest.raises(ValidationError):
+        make_wkt(wkt_int64="1.5")
+    with pytest.raises(ValidationError):
+        make_wkt(wkt_int64="abc")
+
+
 # --- Timestamp serialization ---
 
 
@@ -176,6 +196,48 @@ def test_timestamp_with_microseconds():
     assert data["wkt_timestamp"] == "2024-01-15T10:30:00.123456Z"
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2024-01-15T10:30:00.123456789Z", "2024-01-15T10:30:00.123456Z"),
+        ("2024-01-15T10:30:00.1Z", "2024-01-15T10:30:00.1Z"),
+        ("2024-01-15t10:30:00z", "2024-01-15T10:30:00Z"),
+        ("2024-01-15T12:30:00.5+02:00", "2024-01-15T10:30:00.5Z"),
+        ("2024-01-15T05:00:00-05:30", "2024-01-15T10:30:00Z"),
+    ],
+)
+def test_timestamp_rfc3339_forms_normalize_to_utc(value, expected):
+    """Any RFC 3339 offset and up to nine fraction digits are accepted; JSON is UTC."""
+    wkt = make_wkt(wkt_timestamp=value)
+    assert wkt.model_dump(mode="json")["wkt_timestamp"] == expected
+
+
+def test_timestamp_aware_datetime_serializes_in_utc():
+    """A datetime with a non-UTC offset is converted, not relabelled, on dump."""
+    tz = datetime.timezone(datetime.timedelta(hours=-8))
+    wkt = make_wkt(wkt_timestamp=datetime.datetime(2024, 1, 15, 2, 30, tzinfo=tz))
+    assert wkt.model_dump(mode="json")["wkt_timestamp"] == "2024-01-15T10:30:00Z"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2024-01-15T10:30:00",
+        "2024-01-15",
+        "2024-01-15T10:30Z",
+        "2024-01-15T10:30:00.Z",
+        "2024-01-15T10:30:00,5Z",
+        "2024-01-15T10:30:00.1234567890Z",
+        "2024-01-15T10:30:00+0100",
+        "2024-W03-1T10:30:00Z",
+        "2024-01-15T24:00:00Z",
+    ],
+)
+def test_timestamp_rejects_non_rfc3339(value):
+    with pytest.raises(ValidationError):
+        make_wkt(wkt_timestamp=value)
+
+
 # --- Duration serialization ---
 
 
@@ -209,6 +271,48 @@ def test_duration_accepts_string():
     assert wkt.wkt_duration == datetime.timedelta(seconds=3, milliseconds=500)
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("-0.5s", "-0.5s"),
+        ("1.000001s", "1.000001s"),
+        ("-1.000000001s", "-1s"),
+        ("315576000000.999999999s", "315576000000.999999s"),
+        ("-315576000000s", "-315576000000s"),
+    ],
+)
+def test_duration_exact_roundtrip(value, expected):
+    """Seconds and nanos are parsed as integers: no float rounding at any size."""
+    wkt = make_wkt(wkt_duration=value)
+    assert wkt.model_dump(mode="json")["wkt_duration"] == expected
+
+
+def test_duration_large_value_serializes_exactly():
+    """Large durations keep their microseconds on dump."""
+    delta = datetime.timedelta(days=1_000_000, microseconds=1)
+    wkt = make_wkt(wkt_duration=delta)
+    assert wkt.model_dump(mode="json")["wkt_duration"] == "86400000000.000001s"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "1",
+        "1.s",
+        ".5s",
+        "+1s",
+        "1_000s",
+        "1e3s",
+        " 1s",
+        "1.0000000001s",
+        "315576000001s",
+    ],
+)
+def test_duration_rejects_invalid_strings(value):
+    with pytest.raises(ValidationError):
+        make_wkt(wkt_duration=value)
+
+
 # --- ConfigDict: bytes and special floats ---
 
 
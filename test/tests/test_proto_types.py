@@ -24,9 +24,25 @@ def test_partial_proto_types_exists():
     assert (GEN / "partial/v1/_proto_types.py").exists()
 
 
-def test_foo_bar_v1_no_proto_types():
-    """foo/bar/v1 has no runtime imports at all; _proto_types.py must not be generated."""
-    assert not (GEN / "foo/bar/v1/_proto_types.py").exists()
+def test_foo_bar_v1_proto_types_has_only_wire_codec():
+    """foo/bar/v1 uses no validators; _proto_types.py only carries the binary codec.
+
+    Without runtime_module there is no shared module for the codec, so each
+    directory with messages gets its own copy.
+    """
+    text = (GEN / "foo/bar/v1/_proto_types.py").read_text()
+    assert "class ProtoWire" in text
+    assert "def _validate_" not in text
+    assert "import math as _math" in text
+    assert "_require_finite" not in text
+
+
+def test_proto_model_helpers_are_defined_once_per_directory():
+    """Each file's _ProtoModel only adds its config to ProtoModelMixin."""
+    assert "class ProtoModelMixin" in (GEN / "foo/bar/v1/_proto_types.py").read_text()
+    text = (GEN / "foo/bar/v1/cross_reference_pydantic.py").read_text()
+    assert "class _ProtoModel(ProtoModelMixin, _BaseModel):" in text
+    assert "def to_proto_dict" not in text
 
 
 # ---------------------------------------------------------------------------
@@ -55,10 +71,9 @@ def test_partial_proto_types_omits_ip_imports():
 
 
 def test_partial_proto_types_omits_uri_imports():
-    """No URI validator used; AnyUrl/TypeAdapter/_url_adapter must be absent."""
+    """No URI validator used; AnyUrl/_url_adapter must be absent."""
     text = (GEN / "partial/v1/_proto_types.py").read_text()
     assert "_AnyUrl" not in text
-    assert "_TypeAdapter" not in text
     assert "_url_adapter" not in text
     assert "_validate_uri" not in text
 
@@ -83,7 +98,7 @@ def test_partial_proto_types_omits_uri_imports():
         "_validate_ipv6",
         "_validate_uuid",
         "_require_finite",
-        "_make_const_validator",
+        "class _InValues",
     ],
 )
 def test_api_v1_proto_types_has_all_format_validators(symbol):
@@ -4,12 +4,15 @@ Verifies that:
 - JSON produced by protobuf library can be parsed by Pydantic models
 - Proto-compatible JSON from Pydantic can be parsed by protobuf library
 - Full roundtrip preserves data
+- The binary wire codec is byte-compatible with the protobuf library
 
 Requires protoc to be installed. The pb2 files are generated on-the-fly
 by the pytest_configure hook in conftest.py.
 """
 
 import datetime
+import importlib.util
+import io
 import json
 import sys
 from pathlib import Path
@@ -26,14 +29,24 @@ import api.v1  # noqa: E402
 api.__path__.append(str(Path(_gen_pb2_path) / "api"))
 api.v1.__path__.append(str(Path(_gen_pb2_path) / "api" / "v1"))
 
+from api.v1 import collections_pb2, oneofs_pb2, scalars_pb2  # noqa: E402
 from api.v1.known_types_pb2 import WellKnownTypes as ProtoWKT  # noqa: E402
 from api.v1.messages_pb2 import Message as ProtoMessage  # noqa: E402
+from api.v1.self_reference_pb2 import TreeNode as ProtoTreeNode  # noqa: E402
 from google.protobuf import wrappers_pb2  # noqa: E402
 from google.protobuf.duration_pb2 import Duration  # noqa: E402
+from google.protobuf.internal.encoder import _VarintBytes  # noqa: E402
 from google.protobuf.json_format import MessageToJson, Parse  # noqa: E402
 from google.protobuf.timestamp_pb2 import Timestamp  # noqa: E402
 
+import pytest  # noqa: E402
+
+from api.v1.collections_pydantic import Collections  # noqa: E402
+from api.v1.known_types_pydantic import WellKnownTypes  # noqa: E402
 from api.v1.messages_pydantic import Message as PydanticMessage  # noqa: E402
+from api.v1.oneofs_pydantic import Oneofs  # noqa: E402
+from api.v1.scalars_pydantic import Scalars  # noqa: E402
+from api.v1.self_reference_pydantic import TreeNode  # noqa: E402
 
 
 # --- Protobuf → Pydantic (via JSON format strings) ---
@@ -152,3 +165,364 @@ def test_message_pydantic_to_protobuf_roundtrip():
     pydantic_msg2 = PydanticMessage.model_validate_json(json_str2)
     assert pydantic_msg2.first_name == "John"
     assert pydantic_msg2.last_name == "Doe"
+
+
+# --- Binary wire format ---
+
+
+def _assert_wire_compatible(model, proto_msg):
+    data = proto_msg.SerializeToString()
+    assert model.to_proto_bytes() == data
+    assert type(model).from_proto_bytes(data) == model
+
+
+def test_wire_empty_message():
+    _assert_wire_compatible(Scalars(), scalars_pb2.Scalars())
+
+
+def test_wire_scalars():
+    values = {
+        "int32": -7,
+        "int64": -(2**40),
+        "uint32": 2**32 - 1,
+        "uint64": 2**64 - 1,
+        "fixed32": 123,
+        "fixed64": 2**63,
+        "sint32": -100,
+        "sint64": -(2**62),
+        "sfixed32": -5,
+        "sfixed64": -(2**50),
+        "bool": True,
+        "float": 1.5,
+        "double": -0.0,
+        "string": "héllo",
+        "bytes": b"\x00\xff",
+    }
+    proto_msg = scalars_pb2.Scalars(**values)
+    _assert_wire_compatible(Scalars.model_validate(values), proto_msg)
+
+
+def test_wire_explicit_presence_zero_values():
+    """proto3 optional fields set to zero are written."""
+    proto_msg = scalars_pb2.Scalars(
+        int32_optional=0, string_optional="", bool_optional=False
+    )
+    model = Scalars(int32_optional=0, string_optional="", bool_optional=False)
+    _assert_wire_compatible(model, proto_msg)
+
+
+def test_wire_enums_use_numbers():
+    proto_msg = scalars_pb2.Scalars(enum=2, nested_enum=1, enum_optional=0)
+    model = Scalars(enum="INACTIVE", nested_enum="ACTIVE", enum_optional="UNSPECIFIED")
+    _assert_wire_compatible(model, proto_msg)
+
+
+def test_wire_nested_messages():
+    proto_msg = scalars_pb2.Scalars()
+    proto_msg.message.first_name = "John"
+    proto_msg.nested_message.SetInParent()
+    model = Scalars(message=PydanticMessage(first_name="John"), nested_message={})
+    _assert_wire_compatible(model, proto_msg)
+
+
+def test_wire_repeated_fields():
+    proto_msg = collections_pb2.Collections(
+        int32_repeated=[1, -1, 300],
+        sint64_repeated=[-2, 2],
+        fixed32_repeated=[7, 8],
+        double_repeated=[0.5, -2.0],
+        bool_repeated=[True, False],
+        string_repeated=["a", ""],
+        bytes_repeated=[b"x"],
+        enum_repeated=[1, 0, 2],
+    )
+    proto_msg.message_repeated.add(first_name="a")
+    proto_msg.message_repeated.add()
+    model = Collections(
+        int32_repeated=[1, -1, 300],
+        sint64_repeated=[-2, 2],
+        fixed32_repeated=[7, 8],
+        double_repeated=[0.5, -2.0],
+        bool_repeated=[True, False],
+        string_repeated=["a", ""],
+        bytes_repeated=[b"x"],
+        enum_repeated=["ACTIVE", "UNSPECIFIED", "INACTIVE"],
+        message_repeated=[{"first_name": "a"}, {}],
+    )
+    _assert_wire_compatible(model, proto_msg)
+
+
+def test_wire_maps():
+    # One entry per map: protobuf does not define the order of map entries.
+    proto_msg = collections_pb2.Collections()
+    proto_msg.sint32_map_key[-3] = "x"
+    proto_msg.bool_map_key[False] = ""
+    proto_msg.enum_map_value["e"] = 1
+    proto_msg.message_map_value["m"].SetInParent()
+    proto_msg.double_map_value["d"] = 0.25
+    model = Collections(
+        sint32_map_key={-3: "x"},
+        bool_map_key={False: ""},
+        enum_map_value={"e": "ACTIVE"},
+        message_map_value={"m": {}},
+        double_map_value={"d": 0.25},
+    )
+    _assert_wire_compatible(model, proto_msg)
+
+
+def test_wire_oneof():
+    _assert_wire_compatible(Oneofs(a=0), oneofs_pb2.Oneofs(a=0))
+    _assert_wire_compatible(Oneofs(b="x"), oneofs_pb2.Oneofs(b="x"))
+
+
+def test_wire_oneof_last_member_wins():
+    data = (
+        oneofs_pb2.Oneofs(a=1).SerializeToString()
+        + oneofs_pb2.Oneofs(b="x").SerializeToString()
+    )
+    assert Oneofs.from_proto_bytes(data) == Oneofs(b="x")
+
+
+def test_wire_repeated_message_fields_merge():
+    """A singular message field that occurs twice is merged, as in pb2."""
+    data = (
+        Scalars(message=PydanticMessage(first_name="a")).to_proto_bytes()
+        + Scalars(message=PydanticMessage(last_name="b")).to_proto_bytes()
+    )
+    model = Scalars.from_proto_bytes(data)
+    assert model.message == PydanticMessage(first_name="a", last_name="b")
+    assert (
+        model.to_proto_bytes()
+        == scalars_pb2.Scalars.FromString(data).SerializeToString()
+    )
+
+    data = (
+        TreeNode(parent=TreeNode(name="up")).to_proto_bytes()
+        + TreeNode(parent=TreeNode(parent=TreeNode(name="top"))).to_proto_bytes()
+    )
+    node = TreeNode.from_proto_bytes(data)
+    assert (node.parent.name, node.parent.parent.name) == ("up", "top")
+    assert node.to_proto_bytes() == ProtoTreeNode.FromString(data).SerializeToString()
+
+
+def test_wire_self_reference():
+    proto_msg = ProtoTreeNode(name="root")
+    proto_msg.children.add(name="leaf")
+    proto_msg.parent.name = "up"
+    model = TreeNode(
+        name="root", children=[TreeNode(name="leaf")], parent=TreeNode(name="up")
+    )
+    _assert_wire_compatible(model, proto_msg)
+
+
+def test_wire_well_known_types():
+    proto_msg = ProtoWKT()
+    proto_msg.wkt_timestamp.FromDatetime(
+        datetime.datetime(2024, 1, 15, 10, 30, 0, 250000)
+    )
+    proto_msg.wkt_duration.FromTimedelta(
+        datetime.timedelta(seconds=-1, microseconds=-500000)
+    )
+    proto_msg.wkt_list_value.extend([1, "a", None])
+    proto_msg.wkt_value.string_value = "v"
+    proto_msg.wkt_field_mask.paths.extend(["a.b", "c"])
+    proto_msg.wkt_bool.value = False
+    proto_msg.wkt_int64.value = -(2**40)
+    proto_msg.wkt_string.value = "s"
+    model = WellKnownTypes(
+        wkt_timestamp=datetime.datetime(
+            2024, 1, 15, 10, 30, 0, 250000, tzinfo=datetime.timezone.utc
+        ),
+        wkt_duration=datetime.timedelta(seconds=-1.5),
+        wkt_list_value=[1.0, "a", None],
+        wkt_value="v",
+        wkt_field_mask=["a.b", "c"],
+        wkt_bool=False,
+        wkt_int64=-(2**40),
+        wkt_string="s",
+    )
+    _assert_wire_compatible(model, proto_msg)
+
+
+def test_wire_struct():
+    proto_msg = ProtoWKT()
+    proto_msg.wkt_struct.update({"k": {"nested": [True]}})
+    model = WellKnownTypes(wkt_struct={"k": {"nested": [True]}})
+    _assert_wire_compatible(model, proto_msg)
+
+
+def test_wire_skips_unknown_fields():
+    data = ProtoMessage(first_name="John").SerializeToString() + b"\xf8\x07\x01"
+    assert PydanticMessage.from_proto_bytes(data) == PydanticMessage(first_name="John")
+
+
+def test_wire_truncated_message():
+    data = ProtoMessage(first_name="John").SerializeToString()[:-1]
+    with pytest.raises(ValueError, match="truncated"):
+        PydanticMessage.from_proto_bytes(data)
+
+
+# --- pb2 message conversion ---
+
+
+def _assert_pb2_compatible(model, proto_msg):
+    assert model.to_pb2(type(proto_msg)) == proto_msg
+    assert type(model).from_pb2(proto_msg) == model
+
+
+def test_pb2_empty_message():
+    _assert_pb2_compatible(Scalars(), scalars_pb2.Scalars())
+
+
+def test_pb2_scalars_and_presence():
+    proto_msg = scalars_pb2.Scalars(
+        int64=-(2**40),
+        uint64=2**64 - 1,
+        double=-0.5,
+        string="héllo",
+        bytes=b"\x00\xff",
+        int32_optional=0,
+        string_optional="",
+    )
+    model = Scalars(
+        int64=-(2**40),
+        uint64=2**64 - 1,
+        double=-0.5,
+        string="héllo",
+        bytes_=b"\x00\xff",
+        int32_optional=0,
+        string_optional="",
+    )
+    _assert_pb2_compatible(model, proto_msg)
+    assert model.to_pb2(scalars_pb2.Scalars).HasField("int32_optional")
+    assert not model.to_pb2(scalars_pb2.Scalars).HasField("bool_optional")
+
+
+def test_pb2_fields_set_matches_wire_decode():
+    """Fields without presence count as set only off their default."""
+    proto_msg = scalars_pb2.Scalars(int64=0, double=-0.0, string="a", int32_optional=0)
+    model = Scalars.from_pb2(proto_msg)
+    wire = Scalars.from_proto_bytes(proto_msg.SerializeToString())
+    assert model.model_fields_set == wire.model_fields_set
+    assert model.model_fields_set == {"double", "string", "int32_optional"}
+    proto_msg = collections_pb2.Collections()
+    assert Collections.from_pb2(proto_msg).model_fields_set == set()
+
+
+def test_pb2_enums_and_nested_messages():
+    proto_msg = scalars_pb2.Scalars(enum=2, enum_optional=0)
+    proto_msg.message.first_name = "John"
+    proto_msg.nested_message.SetInParent()
+    model = Scalars(
+        enum="INACTIVE",
+        enum_optional="UNSPECIFIED",
+        message=PydanticMessage(first_name="John"),
+        nested_message={},
+    )
+    _assert_pb2_compatible(model, proto_msg)
+
+
+def test_pb2_repeated_and_maps():
+    proto_msg = collections_pb2.Collections(
+        int32_repeated=[1, -1],
+        enum_repeated=[1, 0],
+        string_repeated=["a", ""],
+    )
+    proto_msg.message_repeated.add(first_name="a")
+    proto_msg.message_repeated.add()
+    proto_msg.sint32_map_key[-3] = "x"
+    proto_msg.enum_map_value["e"] = 1
+    proto_msg.message_map_value["m"].first_name = "b"
+    model = Collections(
+        int32_repeated=[1, -1],
+        enum_repeated=["ACTIVE", "UNSPECIFIED"],
+        string_repeated=["a", ""],
+        message_repeated=[{"first_name": "a"}, {}],
+        sint32_map_key={-3: "x"},
+        enum_map_value={"e": "ACTIVE"},
+        message_map_value={"m": {"first_name": "b"}},
+    )
+    _assert_pb2_compatible(model, proto_msg)
+
+
+def test_pb2_oneof():
+    _assert_pb2_compatible(Oneofs(a=0), oneofs_pb2.Oneofs(a=0))
+    _assert_pb2_compatible(Oneofs(b="x"), oneofs_pb2.Oneofs(b="x"))
+
+
+def test_pb2_self_reference():
+    proto_msg = ProtoTreeNode(name="root")
+    proto_msg.children.add(name="leaf")
+    proto_msg.parent.name = "up"
+    model = TreeNode(
+        name="root", children=[TreeNode(name="leaf")], parent=TreeNode(name="up")
+    )
+    _assert_pb2_compatible(model, proto_msg)
+
+
+def test_pb2_well_known_types():
+    proto_msg = ProtoWKT()
+    proto_msg.wkt_timestamp.FromDatetime(
+        datetime.datetime(2024, 1, 15, 10, 30, 0, 250000)
+    )
+    proto_msg.wkt_duration.FromTimedelta(
+        datetime.timedelta(seconds=-1, microseconds=-500000)
+    )
+    proto_msg.wkt_struct.update({"k": {"nested": [True]}})
+    proto_msg.wkt_list_value.extend([1, "a", None])
+    proto_msg.wkt_field_mask.paths.extend(["a.b", "c"])
+    proto_msg.wkt_bool.value = False
+    proto_msg.wkt_uint64.value = 2**64 - 1
+    model = WellKnownTypes(
+        wkt_timestamp=datetime.datetime(
+            2024, 1, 15, 10, 30, 0, 250000, tzinfo=datetime.timezone.utc
+        ),
+        wkt_duration=datetime.timedelta(seconds=-1.5),
+        wkt_struct={"k": {"nested": [True]}},
+        wkt_list_value=[1.0, "a", None],
+        wkt_field_mask=["a.b", "c"],
+        wkt_bool=False,
+        wkt_uint64=2**64 - 1,
+    )
+    _assert_pb2_compatible(model, proto_msg)
+
+
+@pytest.fixture(scope="module")
+def nanos_wkt(gen_options_runtime):
+    """WellKnownTypes generated with use_integer_nanos_for_time=true."""
+    pkg_dir = Path(__file__).resolve().parent.parent / "gen_options" / "api" / "v1"
+    spec = importlib.util.spec_from_file_location(
+        "gen_options_interop_api_v1",
+        pkg_dir / "__init__.py",
+        submodule_search_locations=[str(pkg_dir)],
+    )
+    pkg = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = pkg
+    spec.loader.exec_module(pkg)
+    return pkg.WellKnownTypes
+
+
+def test_integer_nanos_compatible(nanos_wkt):
+    """Integer nanoseconds survive the wire, pb2 and ProtoJSON formats exactly."""
+    proto_msg = ProtoWKT()
+    proto_msg.wkt_timestamp.seconds = -1
+    proto_msg.wkt_timestamp.nanos = 999_999_999
+    proto_msg.wkt_duration.seconds = -1
+    proto_msg.wkt_duration.nanos = -1
+    model = nanos_wkt(wktTimestamp=-1, wktDuration=-1_000_000_001)
+    _assert_wire_compatible(model, proto_msg)
+    _assert_pb2_compatible(model, proto_msg)
+    assert json.loads(model.to_proto_json()) == json.loads(MessageToJson(proto_msg))
+
+
+def test_wire_length_delimited_stream():
+    """iter_proto_delimited reads the writeDelimitedTo framing."""
+    protos = [scalars_pb2.Scalars(string="x" * 200), scalars_pb2.Scalars(int32=1)]
+    stream = b"".join(
+        _VarintBytes(p.ByteSize()) + p.SerializeToString() for p in protos
+    )
+    models = list(Scalars.iter_proto_delimited(io.BytesIO(stream), chunk_size=16))
+    assert models == [Scalars(string="x" * 200), Scalars(int32=1)]
+    out = io.BytesIO()
+    Scalars.write_proto_delimited(out, models)
+    assert out.getvalue() == stream
@@ -25,3 +25,13 @@ def test_reserved_field_names_roundtrip():
     data = obj.model_dump()
     restored = ReservedFieldNames(**data)
     assert restored == obj
+
+
+def test_reserved_member_name_keeps_method():
+    """A field named after a _ProtoModel method is renamed, keeping the method."""
+    obj = ReservedFieldNames(merge_from_="a")
+    assert obj.merge_from_ == "a"
+    obj.merge_from(ReservedFieldNames(model_dump_="c"))
+    assert obj.model_dump_ == "c"
+    assert obj.to_proto_dict() == {"merge_from": "a", "model_dump": "c"}
+    assert ReservedFieldNames.from_proto_bytes(obj.to_proto_bytes()) == obj
@@ -1,4 +1,7 @@
-from api.v1.self_reference_pydantic import TreeNode
+import inspect
+
+import api.v1.self_reference_pydantic as self_reference
+from api.v1.self_reference_pydantic import Forest, TreeNode
 
 
 def test_tree_node_leaf():
@@ -35,3 +38,26 @@ def test_tree_node_json_roundtrip():
     json_str = tree.model_dump_json()
     restored = TreeNode.model_validate_json(json_str)
     assert restored == tree
+
+
+def test_tree_node_cycle_keeps_forward_refs():
+    """Only the self-referencing fields are string forward references."""
+    source = inspect.getsource(self_reference)
+    assert "name: str = " in source
+    assert 'children: "list[TreeNode]" = ' in source
+    assert 'parent: "TreeNode | None" = ' in source
+
+
+def test_forest_defined_after_tree_node():
+    """Messages are emitted after the messages they refer to."""
+    source = inspect.getsource(self_reference)
+    assert source.index("class TreeNode(") < source.index("class Forest(")
+    assert "trees: list[TreeNode] = " in source
+    assert Forest.__annotations__["trees"] == list[TreeNode]
+
+
+def test_forest_validates_trees():
+    forest = Forest.model_validate(
+        {"trees": [{"name": "oak", "children": [{"name": "acorn"}]}]}
+    )
+    assert forest.trees[0].children[0].name == "acorn"
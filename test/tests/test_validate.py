@@ -1,3 +1,4 @@
+import sys
 from pathlib import Path
 
 import pytest
@@ -7,6 +8,7 @@ import datetime
 
 from api.v1.validate_pydantic import (
     ValidatedBytes,
+    ValidatedCel,
     ValidatedConst,
     ValidatedDropped,
     ValidatedDuration,
@@ -125,6 +127,15 @@ def test_validated_strings_valid():
     assert s.tag == "ok"
 
 
+def test_validated_strings_trusted_skips_constraints():
+    # from_proto_dict_trusted does not run constraint checks
+    s = ValidatedStrings.from_proto_dict_trusted({"code": "abc", "tag": "x"})
+    assert s.code == "abc"
+    assert s.tag == "x"
+    with pytest.raises(ValidationError):
+        ValidatedStrings.from_proto_dict({"code": "abc", "tag": "x"})
+
+
 def test_validated_strings_name_min_length():
     # name: min_length=1 → empty string fails
     with pytest.raises(ValidationError):
@@ -400,7 +411,7 @@ _GEN_OPTIONS_VALIDATE = Path(__file__).parent.parent / "gen_options" / "api" / "
 
 
 @pytest.fixture(scope="module")
-def opts_validate(load_module):
+def opts_validate(load_module, gen_options_runtime):
     return load_module(
         "validate_pydantic", _GEN_OPTIONS_VALIDATE / "validate_pydantic.py"
     )
@@ -434,6 +445,30 @@ def test_gen_options_map_constraints_enforced(opts_validate):
         VM(labels={})
 
 
+def test_gen_options_format_validator_cache(opts_validate):
+    """format_validator_cache_size memoizes values that passed a format check."""
+    proto_types = sys.modules[opts_validate._validate_uuid.__module__]
+    proto_types.format_validator_cache_clear()
+    VF = opts_validate.ValidatedFormats
+    token = "123e4567-e89b-12d3-a456-426614174000"
+    for _ in range(3):
+        VF(token=token)
+    info = proto_types.format_validator_cache_info()["uuid"]
+    assert (info.hits, info.misses, info.maxsize) == (2, 1, 1024)
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            VF(token="not-a-uuid")
+    assert proto_types.format_validator_cache_info()["uuid"].currsize == 1
+
+
+def test_format_validator_cache_off_by_default():
+    proto_types = sys.modules[
+        ValidatedFormats.__module__.rpartition(".")[0] + "._proto_types"
+    ]
+    assert not hasattr(proto_types, "format_validator_cache_info")
+    assert not hasattr(proto_types._validate_uuid, "cache_info")
+
+
 # ---------------------------------------------------------------------------
 # ValidatedDuration / ValidatedTimestamp — no panic on message-typed bounds
 # ---------------------------------------------------------------------------
@@ -747,8 +782,14 @@ def test_validated_const_score_enforced():
         ValidatedConst(score=9.9)
 
 
+def test_validated_const_score_from_json():
+    assert ValidatedConst.model_validate_json('{"score": 3.14}').score == 3.14
+    with pytest.raises(ValidationError):
+        ValidatedConst.model_validate_json('{"score": 3}')
+
+
 # ---------------------------------------------------------------------------
-# ValidatedIn — in and not_in constraints translated to AfterValidator
+# ValidatedIn — in checked by pydantic-core, not_in translated to AfterValidator
 # ---------------------------------------------------------------------------
 
 
@@ -783,10 +824,37 @@ def test_validated_in_priority_invalid():
 
 
 def test_validated_in_default_accepted():
-    # AfterValidator does not run on defaults in Pydantic v2 — no error expected.
+    # Validators do not run on defaults in Pydantic v2 — no error expected.
     ValidatedIn()
 
 
+def test_validated_in_compiled_to_core_schema():
+    text = _GEN_VALIDATE.read_text()
+    assert "_Annotated[int, _InValues(1, 2, 3)]" in text
+    assert "_Annotated[str, _InValues('active', 'inactive')]" in text
+    assert "_make_in_validator" not in text
+
+
+def test_validated_in_long_annotation_unquoted():
+    """An annotation too long for one line is wrapped, not made a forward ref."""
+    text = _GEN_VALIDATE.read_text()
+    assert "    code: _Annotated[\n        str, _AfterValidator(" in text
+    assert not isinstance(ValidatedIn.__annotations__["code"], str)
+
+
+def test_validated_in_priority_accepts_proto_json_string():
+    """The int schema runs before the set check, so ProtoJSON "2" is accepted."""
+    assert ValidatedIn.from_proto_json('{"priority": "2"}').priority == 2
+    with pytest.raises(ValidationError):
+        ValidatedIn.from_proto_json('{"priority": "5"}')
+
+
+def test_validated_in_json_schema_lists_values():
+    props = ValidatedIn.model_json_schema()["properties"]
+    assert props["status"]["enum"] == ["active", "inactive"]
+    assert props["priority"]["enum"] == [1, 2, 3]
+
+
 # ---------------------------------------------------------------------------
 # ValidatedUnique — repeated.unique translated to AfterValidator
 # ---------------------------------------------------------------------------
@@ -807,9 +875,52 @@ def test_validated_unique_empty_allowed():
     assert m.tags == []
 
 
+def test_validated_unique_reports_first_duplicate_index():
+    with pytest.raises(ValidationError, match="item 3 repeats item 1"):
+        ValidatedUnique(scores=[1, 2, 3, 2, 1])
+
+
+def test_validated_unique_bytes():
+    ValidatedUnique(digests=[b"a", b"b"])
+    with pytest.raises(ValidationError, match="item 1 repeats item 0"):
+        ValidatedUnique(digests=[b"a", b"a"])
+
+
+def test_validated_unique_floats():
+    assert ValidatedUnique(ratios=[0.5, 1.5]).ratios == [0.5, 1.5]
+    with pytest.raises(ValidationError, match="item 1 repeats item 0"):
+        ValidatedUnique(ratios=[0.0, -0.0])
+
+
+def test_validated_unique_floats_nan_is_never_a_duplicate():
+    nan = float("nan")
+    m = ValidatedUnique(ratios=[nan, nan, float("nan")])
+    assert len(m.ratios) == 3
+    with pytest.raises(ValidationError, match="item 3 repeats item 1"):
+        ValidatedUnique(ratios=[nan, 1.0, nan, 1.0])
+
+
+def test_validated_unique_messages():
+    m = ValidatedUnique(
+        entries=[ValidatedMap(labels={"a": "1"}), ValidatedMap(labels={"a": "2"})]
+    )
+    assert len(m.entries) == 2
+    with pytest.raises(ValidationError, match="item 1 repeats item 0"):
+        ValidatedUnique(entries=[{"labels": {"a": "1"}}, {"labels": {"a": "1"}}])
+
+
+def test_validated_unique_messages_ignores_map_order():
+    first = ValidatedMap(labels={"a": "1", "b": "2"})
+    second = ValidatedMap(labels={"b": "2", "a": "1"})
+    with pytest.raises(ValidationError, match="item 1 repeats item 0"):
+        ValidatedUnique(entries=[first, second])
+
+
 def test_validated_unique_in_generated_file():
     text = _GEN_VALIDATE.read_text()
     assert "_AfterValidator(_require_unique)" in text
+    assert "_AfterValidator(_require_unique_floats)" in text
+    assert "_AfterValidator(_require_unique_messages)" in text
 
 
 # ---------------------------------------------------------------------------
@@ -911,8 +1022,8 @@ def test_validated_required_plain_scalar_accepts_default():
 
 def test_validated_required_annotations_in_generated_file():
     text = _GEN_VALIDATE.read_text()
-    assert 'required_name: "str"' in text
-    assert 'required_detail: "ValidatedRequired.Detail | None"' in text
+    assert "required_name: str" in text
+    assert "required_detail: Detail | None" in text
     assert "# buf.validate: required (not translated)" in text
 
 
@@ -920,3 +1031,83 @@ def test_validated_required_field_is_required_in_pydantic():
     assert ValidatedRequired.model_fields["required_name"].is_required()
     assert ValidatedRequired.model_fields["required_score"].is_required()
     assert not ValidatedRequired.model_fields["plain_name"].is_required()
+
+
+# ---------------------------------------------------------------------------
+# ValidatedCel — buf.validate CEL rules compiled into validators
+# ---------------------------------------------------------------------------
+
+
+def _cel(**kwargs):
+    return ValidatedCel(**{"quantity": 1, "code": "ABC", **kwargs})
+
+
+def test_validated_cel_valid():
+    m = _cel(tags=["a"], level="HIGH", limits={"default": 3}, note="#x")
+    assert m.quantity == 1
+    assert m.level == "HIGH"
+
+
+def test_validated_cel_field_rule():
+    with pytest.raises(ValidationError, match="quantity must be positive"):
+        _cel(quantity=-1)
+
+
+def test_validated_cel_macro():
+    assert _cel(tags=["12345678"]).tags == ["12345678"]
+    with pytest.raises(ValidationError, match="tags must be short"):
+        _cel(tags=["ok", "123456789"])
+
+
+def test_validated_cel_string_rule_uses_returned_message():
+    with pytest.raises(ValidationError, match="code must be three capitals"):
+        _cel(code="abc")
+
+
+def test_validated_cel_enum_in_list():
+    assert _cel(level="LOW").level == "LOW"
+    with pytest.raises(ValidationError, match="level must be set"):
+        _cel(level="UNSPECIFIED")
+
+
+def test_validated_cel_missing_map_key_fails():
+    with pytest.raises(ValidationError, match="limits need a positive default"):
+        _cel(limits={"other": 1})
+    with pytest.raises(ValidationError, match="limits need a positive default"):
+        _cel(limits={"default": 0})
+
+
+def test_validated_cel_message_rule_reads_unset_message_as_default():
+    assert _cel().window is None
+    assert _cel(window={"start": 1, "end": 2}).window.end == 2
+    with pytest.raises(ValidationError, match="must not precede its start"):
+        _cel(window={"start": 2, "end": 1})
+
+
+def test_validated_cel_has_and_default_message():
+    assert _cel(note="#tag").note == "#tag"
+    with pytest.raises(ValidationError, match="note.prefix"):
+        _cel(note="tag")
+
+
+def test_validated_cel_message_rule_across_fields():
+    assert _cel(level="HIGH", tags=["a"]).level == "HIGH"
+    with pytest.raises(ValidationError, match="high level needs a tag"):
+        _cel(level="HIGH")
+
+
+def test_validated_cel_untranslated_rules_stay_comments():
+    assert _cel(legacy=3).legacy == 3
+    assert _cel(quantity=3).quantity == 3
+    text = _GEN_VALIDATE.read_text()
+    assert "# buf.validate: cel (not translated)" in text
+    assert "def _validate_cel(self):" in text
+
+
+def test_gen_options_cel_uses_enum_numbers(opts_validate):
+    VC = opts_validate.ValidatedCel
+    assert VC(quantity=1, code="ABC", level=2, tags=["a"]).level == 2
+    with pytest.raises(ValidationError, match="high level needs a tag"):
+        VC(quantity=1, code="ABC", level=2)
+    with pytest.raises(ValidationError, match="level must be set"):
+        VC(quantity=1, code="ABC", level=0)
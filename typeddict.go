@@ -0,0 +1,128 @@
+package main
+
+import (
+	"strconv"
+	"strings"
+
+	"google.golang.org/protobuf/reflect/protoreflect"
+)
+
+// This file holds the typed_dicts renderer. Each message gets a TypedDict
+// mirror keyed by its ProtoJSON names, which Model.proto_dict_adapter()
+// validates into plain dicts without building a model per message. The
+// mirrors reuse the field types built for the models, constraint validators
+// included, with message classes swapped for their mirrors and the _Field()
+// constraints moved into the annotation.
+
+// dictName returns the name of the TypedDict mirror of the message class
+// qualName, e.g. "Scalars.NestedMessage" → "ScalarsNestedMessageDict".
+func dictName(qualName string) string {
+	return strings.ReplaceAll(qualName, ".", "") + "Dict"
+}
+
+// setDictType sets f.DictType, the type of field in the TypedDict mirror of
+// its message, and imports the mirrors it refers to from other files.
+func (e *generator) setDictType(f *Field, field protoreflect.FieldDescriptor) error {
+	typ := f.Type
+	if f.WireType != "" && strings.HasSuffix(f.WireKind, "message") {
+		target := field.Message()
+		if field.IsMap() {
+			target = field.MapValue().Message()
+		}
+		name := dictName(f.WireType)
+		typ = matchAnnotationToken.ReplaceAllStringFunc(typ, func(tok string) string {
+			if tok == f.WireType {
+				return name
+			}
+			return tok
+		})
+		if err := e.addCrossFileImport(field.ParentFile(), target.ParentFile(), name); err != nil {
+			return err
+		}
+		if f.Constraints != nil && f.Constraints.UniqueValidator == "_require_unique" {
+			// Frozen models hash themselves; dicts do not.
+			typ = strings.Replace(typ, "_AfterValidator(_require_unique)", "_AfterValidator(_require_unique_messages)", 1)
+			e.addRuntimeImport("_require_unique_messages")
+		}
+	}
+	// MetaArgs are the _Field() bounds, with strings single-quoted as the
+	// annotation may be quoted.
+	if args := f.Constraints.MetaArgs(); len(args) > 0 {
+		typ = wrapWithAnnotated(typ, []string{"_Field(" + strings.Join(args, ", ") + ")"})
+		e.addStdImport("_Annotated")
+	}
+	f.DictType = typ
+	return nil
+}
+
+// dictMessages returns the messages of the file that get a TypedDict
+// mirror, nested messages before their parent. Branch models of
+// discriminated unions have none: the mirror lists the oneof members.
+func (e *generator) dictMessages() []Message {
+	if !e.config.TypedDicts || e.config.Backend != backendPydantic {
+		return nil
+	}
+	var out []Message
+	var walk func(m Message)
+	walk = func(m Message) {
+		for _, nested := range m.NestedMessages {
+			if !nested.Branch {
+				walk(nested)
+			}
+		}
+		out = append(out, m)
+	}
+	for _, m := range e.messages {
+		walk(m)
+	}
+	return out
+}
+
+// typedDicts renders the TypedDict mirrors of the file's messages, or ""
+// when there are none. A mirror defined further down is referenced by a
+// string forward reference.
+func (e *generator) typedDicts() string {
+	messages := e.dictMessages()
+	pending := map[string]bool{}
+	for _, m := range messages {
+		pending[dictName(m.QualName)] = true
+	}
+	blocks := make([]string, len(messages))
+	for i, m := range messages {
+		blocks[i] = renderTypedDict(m, pending)
+		delete(pending, dictName(m.QualName))
+	}
+	return strings.Join(blocks, "\n\n")
+}
+
+// renderTypedDict renders the mirror of m, laid out the way ruff format
+// lays it out. Fields without a default are required keys, the others are
+// NotRequired.
+func renderTypedDict(m Message, pending map[string]bool) string {
+	name := dictName(m.QualName)
+	head := name + " = _with_config(_ProtoModel.model_config)("
+	if len(m.DictFields) == 0 {
+		call := "_TypedDict(" + strconv.Quote(name) + ", {})"
+		if len(head+call+")") <= 88 {
+			return head + call + ")"
+		}
+		return head + "\n    " + call + "\n)"
+	}
+	const indent = "            "
+	var b strings.Builder
+	b.WriteString(head + "\n    _TypedDict(\n        " + strconv.Quote(name) + ",\n        {\n")
+	for _, f := range m.DictFields {
+		key := f.Name
+		if f.Alias != "" {
+			key = f.Alias
+		}
+		typ := resolveAnnotation(f.DictType, "", nil, nil, pending)
+		if f.Default != "default=..." {
+			typ = "_NotRequired[" + typ + "]"
+		}
+		entry := indent + strconv.Quote(key) + ": "
+		b.WriteString(entry + layoutExpr(typ, indent, len(entry), ",") + ",\n")
+	}
+	b.WriteString("        },\n    )\n)")
+	return b.String()
+}